@@ -0,0 +1,96 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks import stub
+from benchmarks.frames_in_flight import _spin
+from benchmarks.mapped_buffers import HostMemory
+from benchmarks.upload_streaming import GRAPHICS_FAMILY, PROPERTIES, TRANSFER_FAMILY, QueuesGpu
+from vkproject.graphics.memory import MemoryAllocator
+from vkproject.graphics.upload import UploadManager
+from vkproject.resources.meshes import MeshLoader
+from vkproject.resources.streaming import ResourceStreamer
+
+MESHES = 48
+VERTICES = 40_000
+CPU_MS = 4.0
+VERTEX = np.dtype([("position", "<f4", 3), ("normal", "<i2", 4), ("uv", "<f2", 2)])
+
+
+def _write_meshes(directory):
+    rng = np.random.default_rng(11)
+    paths = []
+    for i in range(MESHES):
+        vertices = np.zeros(VERTICES, VERTEX)
+        vertices["position"] = rng.random((VERTICES, 3), dtype=np.float32)
+        vertices["uv"] = rng.random((VERTICES, 2), dtype=np.float32)
+        path = os.path.join(directory, f"mesh{i}.npz")
+        np.savez_compressed(path, vertices=vertices, indices=rng.integers(0, VERTICES, VERTICES * 3, dtype=np.uint32))
+        paths.append(path)
+    return paths
+
+def _uploads(device, allocator, gpu):
+    uploads = UploadManager(device, allocator, stub.fake_handle("VkQueue", 2), TRANSFER_FAMILY, gpu.graphics_queue, GRAPHICS_FAMILY)
+    uploads.create()
+    return uploads
+
+def blocking(paths, device, allocator, gpu):
+    # what Resources.load does: every file read, decoded and uploaded before the first frame
+    uploads = _uploads(device, allocator, gpu)
+    loader = MeshLoader()
+    streamer = ResourceStreamer(device, allocator, uploads)
+    start = time.perf_counter()
+    for path in paths:
+        upload_id = loader.finish(loader.decode(path, path), path, streamer)[1]
+    uploads.wait(upload_id)
+    first_frame = time.perf_counter() - start
+    loader.destroy()
+    uploads.destroy()
+    return first_frame, first_frame, 0
+
+def streamed(paths, device, allocator, gpu, processes):
+    uploads = _uploads(device, allocator, gpu)
+    loader = MeshLoader()
+    streamer = ResourceStreamer(device, allocator, uploads, processes=processes)
+    start = time.perf_counter()
+    futures = [streamer.request(loader, path, path) for path in paths]
+    frames = 0
+    while not all(future.done() for future in futures):
+        # a frame's cpu work, then the per frame streaming steps VkApp runs
+        _spin(CPU_MS / 1e3)
+        uploads.flush()
+        uploads.update()
+        streamer.update()
+        frames += 1
+    loaded = time.perf_counter() - start
+    failed = [future.exception() for future in futures if future.exception() is not None]
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(futures)} meshes failed to stream") from failed[0]
+    streamer.destroy()
+    loader.destroy()
+    uploads.destroy()
+    return 0.0, loaded, frames
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = _write_meshes(directory)
+        print(f"{MESHES} compressed meshes of {VERTICES} vertices, {CPU_MS} ms of cpu work per frame, {os.cpu_count()} cpus")
+        for label, run in (("load everything before the first frame", blocking),
+                           ("stream on a thread pool", lambda *args: streamed(*args, False)),
+                           ("stream on a process pool", lambda *args: streamed(*args, True))):
+            memory = HostMemory()
+            gpu = QueuesGpu(stub.fake_handle("VkQueue", 1))
+            _, original = stub.install(dict(memory.impls, **gpu.impls))
+            try:
+                device = stub.fake_handle("VkDevice")
+                allocator = MemoryAllocator(device, PROPERTIES)
+                first_frame, loaded, frames = run(paths, device, allocator, gpu)
+                allocator.destroy()
+            finally:
+                stub.uninstall(original)
+            print(f"{label:<48} {first_frame * 1e3:8.1f} ms to first frame {loaded * 1e3:8.1f} ms to all loaded {frames:5d} frames meanwhile")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import _vulkan, ffi, vkCmdDraw, vkCmdBindPipeline, vkCmdSetViewport, VkViewport, VK_PIPELINE_BIND_POINT_GRAPHICS
+
+CALLS = 100_000
+
+
+def _per_argument_call(fn, *args):
+    # marshalling as it was done before call plans, for comparison
+    fn_args = [_vulkan._auto_handle(i, j) for i, j in zip(args, ffi.typeof(fn).args)]
+    return fn(*fn_args)
+
+def _time(func, *args):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        func(*args)
+
+    return time.perf_counter() - start
+
+def main():
+    lib, original = stub.install()
+    try:
+        command_buffer = stub.fake_handle("VkCommandBuffer")
+        pipeline = stub.fake_handle("VkPipeline")
+        viewports = [VkViewport(x=0.0, y=0.0, width=800.0, height=800.0, minDepth=0.0, maxDepth=1.0)]
+
+        print(f"{CALLS} calls each")
+        stub.report("raw cffi vkCmdDraw", CALLS, _time(lib.vkCmdDraw, command_buffer, 3, 1, 0, 0))
+        stub.report("per-argument marshalling vkCmdDraw", CALLS, _time(_per_argument_call, lib.vkCmdDraw, command_buffer, 3, 1, 0, 0))
+        stub.report("vkCmdDraw", CALLS, _time(vkCmdDraw, command_buffer, 3, 1, 0, 0))
+        stub.report("raw cffi vkCmdBindPipeline", CALLS, _time(lib.vkCmdBindPipeline, command_buffer, VK_PIPELINE_BIND_POINT_GRAPHICS, pipeline))
+        stub.report("per-argument marshalling vkCmdBindPipeline", CALLS, _time(_per_argument_call, lib.vkCmdBindPipeline, command_buffer, VK_PIPELINE_BIND_POINT_GRAPHICS, pipeline))
+        stub.report("vkCmdBindPipeline", CALLS, _time(vkCmdBindPipeline, command_buffer, VK_PIPELINE_BIND_POINT_GRAPHICS, pipeline))
+        stub.report("per-argument marshalling vkCmdSetViewport", CALLS, _time(_per_argument_call, lib.vkCmdSetViewport, command_buffer, 0, 1, viewports))
+        stub.report("vkCmdSetViewport", CALLS, _time(vkCmdSetViewport, command_buffer, 0, 1, viewports))
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import vkGetDeviceProcAddr, VkPresentInfoKHR
+from vkproject.graphics.vulkan.extensions.dispatch import DeviceDispatch
+from vkproject.graphics.vulkan.extensions.khr import KHR_DEVICE_FUNCTIONS
+
+FRAMES = 50_000
+
+
+def per_call_lookup(device, swapchain, queue, present_info):
+    # what every frame paid before the dispatch table: two loader lookups, casts and wrappers
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        vkGetDeviceProcAddr(device, "vkAcquireNextImageKHR")(device, swapchain, 0, None, None)
+        vkGetDeviceProcAddr(device, "vkQueuePresentKHR")(queue, present_info)
+
+    return time.perf_counter() - start
+
+def dispatch_table(device, swapchain, queue, present_info):
+    dispatch = DeviceDispatch(device).load(KHR_DEVICE_FUNCTIONS)
+    acquire = dispatch.vkAcquireNextImageKHR
+    present = dispatch.vkQueuePresentKHR
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        acquire(device, swapchain, 0, None, None)
+        present(queue, present_info)
+
+    return time.perf_counter() - start
+
+def main():
+    _, original = stub.install()
+    try:
+        device = stub.fake_handle("VkDevice")
+        swapchain = stub.fake_handle("VkSwapchainKHR")
+        queue = stub.fake_handle("VkQueue")
+        present_info = VkPresentInfoKHR(swapchainCount=1, pSwapchains=[swapchain], pImageIndices=[0])
+
+        print(f"acquire + present, {FRAMES} frames")
+        stub.report("vkGetDeviceProcAddr per call", FRAMES, per_call_lookup(device, swapchain, queue, present_info), unit="frame")
+        stub.report("DeviceDispatch", FRAMES, dispatch_table(device, swapchain, queue, present_info), unit="frame")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import gc
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import *
+
+FRAMES = 20_000
+
+
+class GcPauses:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self._start = None
+
+    def __call__(self, phase, _):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            pause = time.perf_counter() - self._start
+            self.count += 1
+            self.total += pause
+            self.longest = max(self.longest, pause)
+
+def _frame(handles, clear_values, extent):
+    # structs with child allocations, built the way a frame is recorded without per-frame struct caching
+    semaphore, command_buffer, swapchain, render_pass, framebuffer = handles
+    VkRenderPassBeginInfo(
+        renderPass=render_pass,
+        framebuffer=framebuffer,
+        renderArea=VkRect2D(offset=VkOffset2D(0, 0), extent=extent),
+        pClearValues=clear_values,
+    )
+    VkSubmitInfo(
+        pWaitSemaphores=[semaphore],
+        pWaitDstStageMask=[VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT],
+        pCommandBuffers=[command_buffer],
+        pSignalSemaphores=[semaphore],
+    )
+    VkPresentInfoKHR(pWaitSemaphores=[semaphore], pSwapchains=[swapchain], pImageIndices=[0])
+    VkDeviceCreateInfo(ppEnabledExtensionNames=[VK_KHR_SWAPCHAIN_EXTENSION_NAME], ppEnabledLayerNames=["VK_LAYER_KHRONOS_validation"])
+
+def run(label, arena):
+    handles = tuple(stub.fake_handle(name) for name in ("VkSemaphore", "VkCommandBuffer", "VkSwapchainKHR", "VkRenderPass", "VkFramebuffer"))
+    clear_values = [VkClearValue(VkClearColorValue(float32=[0.0, 0.0, 0.0, 1.0]))]
+    extent = VkExtent2D(800, 800)
+
+    gc.collect()
+    pauses = GcPauses()
+    gc.callbacks.append(pauses)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        with arena if arena is not None else nullcontext():
+            _frame(handles, clear_values, extent)
+    elapsed = time.perf_counter() - start
+    gc.callbacks.remove(pauses)
+
+    # allocation volume per frame, measured separately so tracing doesn't skew the timings
+    tracemalloc.start()
+    for _ in range(1000):
+        with arena if arena is not None else nullcontext():
+            _frame(handles, clear_values, extent)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    stub.report(label, FRAMES, elapsed, unit="frame")
+    print(f"{'':<48} {pauses.count / FRAMES * 1000:10.2f} gc runs/1k frames, {pauses.total / FRAMES * 1e6:8.3f} us gc/frame, longest {pauses.longest * 1e6:8.1f} us")
+    print(f"{'':<48} {peak / 1024:10.1f} KiB peak traced, {blocks} live blocks after 1k frames")
+
+def main():
+    print(f"{FRAMES} frames of per-frame struct construction")
+    run("weak key dictionary keep-alive", None)
+    run("frame arena", Arena())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import time
+
+from benchmarks import stub
+from benchmarks.frames_in_flight import SimulatedGpu, _spin
+from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.synchronization import FramePacer
+from vkproject.graphics.vulkan import *
+
+FRAMES = 120
+# (cpu ms, gpu ms) per frame, with a single frame in flight
+GPU_MS = 6.0
+RENDER_MS = 1.0
+# cpu work per frame that does not depend on the frame (streaming, simulation, ...)
+BACKGROUND_MS = 4.0
+SLICE_MS = 0.5
+
+
+class BackgroundWork:
+    """A frame's worth of cpu work split into slices"""
+    def __init__(self):
+        self.pending = 0
+
+    def queue(self, slices):
+        self.pending += slices
+
+    def step(self):
+        if not self.pending:
+            return False
+        _spin(SLICE_MS / 1e3)
+        self.pending -= 1
+        return True
+
+def run(overlap, target_fps=None):
+    gpu = SimulatedGpu(GPU_MS / 1e3)
+    _, original = stub.install(gpu.impls)
+    try:
+        device = stub.fake_handle("VkDevice")
+        queue = stub.fake_handle("VkQueue")
+        pool = CommandPool(device, 0)
+        pool.create()
+        ring = FrameRing(device, pool, 1)
+        ring.create()
+        work = BackgroundWork()
+        pacer = FramePacer(target_fps)
+        if overlap:
+            pacer.add_idle_work(work.step)
+
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            work.queue(int(BACKGROUND_MS / SLICE_MS))
+            slot = ring.slot()
+            pacer.limit()
+            pacer.wait(slot.sync_handler)
+            # whatever the idle time did not cover still has to run on the frame
+            while work.step():
+                pass
+            _spin(RENDER_MS / 1e3)
+            slot.sync_handler.submit(queue, [slot.command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
+            ring.advance()
+        elapsed = max(gpu.busy_until, time.perf_counter()) - start
+
+        ring.destroy()
+        pool.destroy()
+        return FRAMES / elapsed
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"{FRAMES} frames, 1 frame in flight, gpu {GPU_MS} ms, render {RENDER_MS} ms, background {BACKGROUND_MS} ms per frame")
+    for label, overlap, target_fps in (
+            ("block on the fence, then background work", False, None),
+            ("background work while the gpu runs", True, None),
+            ("background work while the gpu runs, 60 fps cap", True, 60)):
+        print(f"{label:<56} {run(overlap, target_fps):10.1f} fps")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import itertools
+import statistics
+import time
+
+from benchmarks import stub
+from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.vulkan import *
+
+FRAMES = 120
+# (cpu ms, gpu ms) per frame
+WORKLOADS = ((4.0, 6.0), (6.0, 4.0))
+
+
+def _spin(seconds):
+    # recording is cpu work, sleeping would let the scheduler hide it
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+class SimulatedGpu:
+    """A queue that runs one submission at a time, each taking gpu_time, with fences signalled on completion"""
+    def __init__(self, gpu_time):
+        self.gpu_time = gpu_time
+        self.busy_until = 0.0
+        self.completions = {}
+        self._fences = itertools.count(1)
+        self.impls = {
+            "vkCreateFence": self._create_fence,
+            "vkQueueSubmit": self._submit,
+            "vkWaitForFences": self._wait,
+            "vkGetFenceStatus": self._status,
+        }
+
+    @staticmethod
+    def _key(fence):
+        return int(ffi.cast("uintptr_t", fence))
+
+    def _create_fence(self, device, info, allocator, fence):
+        fence[0] = ffi.cast("VkFence", next(self._fences))
+        self.completions[self._key(fence[0])] = 0.0
+        return VK_SUCCESS
+
+    def _submit(self, queue, count, infos, fence):
+        start = max(time.perf_counter(), self.busy_until)
+        self.busy_until = start + self.gpu_time
+        self.completions[self._key(fence)] = self.busy_until
+        return VK_SUCCESS
+
+    def _status(self, device, fence):
+        done = self.completions[self._key(fence)] <= time.perf_counter()
+        return VK_SUCCESS if done else VK_NOT_READY
+
+    def _wait(self, device, count, fences, wait_all, timeout):
+        done = max(self.completions[self._key(fences[i])] for i in range(count))
+        remaining = done - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        return VK_SUCCESS
+
+def run(frames_in_flight, cpu_time, gpu_time):
+    gpu = SimulatedGpu(gpu_time)
+    _, original = stub.install(gpu.impls)
+    try:
+        device = stub.fake_handle("VkDevice")
+        queue = stub.fake_handle("VkQueue")
+        pool = CommandPool(device, 0)
+        pool.create()
+        ring = FrameRing(device, pool, frames_in_flight)
+        ring.create()
+
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            slot = ring.slot()
+            slot.sync_handler.wait_for_fence()
+            frame_start = time.perf_counter()
+            _spin(cpu_time)
+            slot.sync_handler.reset_fence()
+            submit_info = slot.sync_handler.buffer_submission_info([slot.command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
+            vkQueueSubmit(queue, 1, submit_info, slot.sync_handler.in_flight_fence)
+            # cpu start of the frame until the gpu has finished it
+            latencies.append(gpu.busy_until - frame_start)
+            ring.advance()
+        elapsed = max(gpu.busy_until, time.perf_counter()) - start
+
+        ring.destroy()
+        pool.destroy()
+        return FRAMES / elapsed, statistics.median(latencies)
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"{FRAMES} frames against a simulated gpu queue")
+    for cpu_ms, gpu_ms in WORKLOADS:
+        print(f"cpu {cpu_ms} ms, gpu {gpu_ms} ms per frame")
+        for frames_in_flight in range(FrameRing.MIN_FRAMES_IN_FLIGHT, FrameRing.MAX_FRAMES_IN_FLIGHT + 1):
+            fps, latency = run(frames_in_flight, cpu_ms / 1e3, gpu_ms / 1e3)
+            print(f"  {frames_in_flight} frames in flight {fps:10.1f} fps {latency * 1e3:10.2f} ms median latency")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 15
+MODULE = "vkproject.graphics.vulkan"
+
+# runs in a fresh interpreter so every sample starts from an empty sys.modules
+_PROBE = f"""
+import resource, time
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {MODULE}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+"""
+
+
+def _run(env, *args):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, cwd=os.getcwd(), env=env)
+
+def _sample(env):
+    elapsed, rss = _run(env, "-c", _PROBE).stdout.split()
+    return float(elapsed), int(rss)
+
+def import_times(env):
+    # -X importtime reports self/cumulative microseconds per module on stderr
+    result = _run(env, "-X", "importtime", "-c", f"import {MODULE}")
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)", line)
+        if match and match.group(3).startswith("vkproject"):
+            modules[match.group(3)] = (int(match.group(1)), int(match.group(2)))
+
+    return modules
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # a private bytecode cache: the first import compiles, the rest load .pyc files like a normal launch
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        cold_time, cold_rss = _sample(env)
+        warm = [_sample(env) for _ in range(RUNS)]
+        warm_time = statistics.median(s[0] for s in warm)
+        warm_rss = statistics.median(s[1] for s in warm)
+
+        print(f"import {MODULE}")
+        print(f"{'cold (compiles bytecode)':<32} {cold_time * 1e3:10.2f} ms {cold_rss:10d} KiB resident")
+        print(f"{f'warm (median of {RUNS})':<32} {warm_time * 1e3:10.2f} ms {warm_rss:10.0f} KiB resident")
+        print()
+        print(f"{'module':<48} {'self':>10} {'cumulative':>12}")
+        for module, (self_us, cumulative_us) in import_times(env).items():
+            print(f"{module:<48} {self_us:8d}us {cumulative_us:10d}us")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+import struct
+import time
+
+import numpy as np
+
+from benchmarks import stub
+from vkproject.graphics.buffer import Buffer
+from vkproject.graphics.memory import MemoryAllocator, MemoryProperties
+from vkproject.graphics.vulkan import *
+
+FRAMES = 60
+INSTANCES = 10_000
+INSTANCE = np.dtype([("position", "<f4", 3), ("scale", "<f4"), ("color", "<f4", 4)])
+PROPERTIES = MemoryProperties(
+    [(VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT | VK_MEMORY_PROPERTY_HOST_COHERENT_BIT, 0)],
+    [1 << 30],
+)
+
+
+class HostMemory:
+    """vkAllocateMemory backed by host memory so mapped writes land somewhere real"""
+    def __init__(self):
+        self.memories = {}
+        self.buffer_sizes = {}
+        self.impls = {
+            "vkAllocateMemory": self._allocate,
+            "vkMapMemory": self._map,
+            "vkCreateBuffer": self._create_buffer,
+            "vkGetBufferMemoryRequirements": self._requirements,
+        }
+
+    @staticmethod
+    def _key(handle):
+        return int(ffi.cast("uintptr_t", handle))
+
+    def _allocate(self, device, info, allocator, memory):
+        key = len(self.memories) + 1
+        self.memories[key] = ffi.new("char[]", info.allocationSize)
+        memory[0] = ffi.cast("VkDeviceMemory", key)
+        return VK_SUCCESS
+
+    def _map(self, device, memory, offset, size, flags, data):
+        data[0] = self.memories[self._key(memory)] + offset
+        return VK_SUCCESS
+
+    def _create_buffer(self, device, info, allocator, buffer):
+        key = len(self.buffer_sizes) + 1
+        self.buffer_sizes[key] = info.size
+        buffer[0] = ffi.cast("VkBuffer", key)
+        return VK_SUCCESS
+
+    def _requirements(self, device, buffer, requirements):
+        requirements.size = self.buffer_sizes[self._key(buffer)]
+        requirements.alignment = 256
+        requirements.memoryTypeBits = 1
+
+def _scene():
+    rng = np.random.default_rng(3)
+    positions = rng.random((INSTANCES, 3), dtype=np.float32)
+    velocities = rng.random((INSTANCES, 3), dtype=np.float32)
+    colors = rng.random((INSTANCES, 4), dtype=np.float32)
+    return positions, velocities, colors
+
+def mapped_per_frame(device, memory, positions, velocities, colors):
+    # map, pack every instance from python, unmap
+    pack = struct.Struct("<3ff4f").pack_into
+    for frame in range(FRAMES):
+        moved = (positions + velocities * frame).tolist()
+        color_rows = colors.tolist()
+        mapping = vkMapMemory(device, memory, 0, INSTANCES * INSTANCE.itemsize, 0)
+        for i in range(INSTANCES):
+            x, y, z = moved[i]
+            r, g, b, a = color_rows[i]
+            pack(mapping, i * INSTANCE.itemsize, x, y, z, 1.0, r, g, b, a)
+        vkUnmapMemory(device, memory)
+
+def persistent_numpy(buffer, positions, velocities, colors):
+    instances = buffer.data
+    for frame in range(FRAMES):
+        np.multiply(velocities, frame, out=instances["position"])
+        instances["position"] += positions
+        instances["scale"] = 1.0
+        instances["color"] = colors
+        buffer.flush()
+
+def main():
+    memory = HostMemory()
+    _, original = stub.install(memory.impls)
+    try:
+        device = stub.fake_handle("VkDevice")
+        allocator = MemoryAllocator(device, PROPERTIES)
+        buffer = Buffer(device, allocator, INSTANCE, INSTANCES, VK_BUFFER_USAGE_VERTEX_BUFFER_BIT)
+        buffer.create()
+        scene = _scene()
+        print(f"{INSTANCES} instances of {INSTANCE.itemsize} bytes written per frame, {FRAMES} frames")
+
+        start = time.perf_counter()
+        mapped_per_frame(device, buffer.allocation.memory, *scene)
+        stub.report("map per frame, struct.pack per instance", FRAMES, time.perf_counter() - start, unit="frame")
+        expected = buffer.data.copy()
+
+        start = time.perf_counter()
+        persistent_numpy(buffer, *scene)
+        stub.report("persistent mapping, numpy stores", FRAMES, time.perf_counter() - start, unit="frame")
+        assert np.array_equal(buffer.data, expected)
+
+        buffer.destroy()
+        allocator.destroy()
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
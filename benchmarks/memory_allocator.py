@@ -0,0 +1,85 @@
+import random
+import time
+
+from benchmarks import stub
+from vkproject.graphics.memory import MemoryAllocator, MemoryProperties
+from vkproject.graphics.vulkan import *
+
+RESOURCES = 10_000
+# what a driver spends in vkAllocateMemory, it zeroes and maps pages for every call
+ALLOCATE_US = 20.0
+
+# a discrete GPU: device local VRAM, host visible system memory and a small BAR window
+PROPERTIES = MemoryProperties(
+    [
+        (VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT, 0),
+        (VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT | VK_MEMORY_PROPERTY_HOST_COHERENT_BIT, 1),
+        (VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT | VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT | VK_MEMORY_PROPERTY_HOST_COHERENT_BIT, 2),
+    ],
+    [8 << 30, 16 << 30, 256 << 20],
+    buffer_image_granularity=1024,
+    max_allocations=4096,
+)
+
+
+def _allocate(device, info, allocator, memory):
+    end = time.perf_counter() + ALLOCATE_US / 1e6
+    while time.perf_counter() < end:
+        pass
+    memory[0] = ffi.cast("VkDeviceMemory", 1)
+    return VK_SUCCESS
+
+def _resources():
+    # mostly small buffers (uniforms, meshes) and textures, a few large render targets
+    rng = random.Random(7)
+    resources = []
+    for _ in range(RESOURCES):
+        kind = rng.random()
+        if kind < 0.6:
+            resources.append((rng.randint(64, 64 * 1024), 256, True, VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT))
+        elif kind < 0.95:
+            resources.append((rng.choice((64, 128, 256, 512)) ** 2 * 4, 4096, False, VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT))
+        else:
+            resources.append((rng.randint(256, 4096) * 16, 256, True, VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT))
+    return resources
+
+def per_resource(device, resources):
+    memories = []
+    for size, alignment, linear, required in resources:
+        allocate_info = VkMemoryAllocateInfo(allocationSize=size, memoryTypeIndex=PROPERTIES.find_memory_type(0b111, required))
+        memories.append(vkAllocateMemory(device, allocate_info, None))
+    for memory in memories:
+        vkFreeMemory(device, memory, None)
+    return len(memories)
+
+def sub_allocated(device, resources):
+    allocator = MemoryAllocator(device, PROPERTIES)
+    allocations = [allocator.allocate(size, alignment, 0b111, required, linear=linear) for size, alignment, linear, required in resources]
+    stats = allocator.stats()
+    for allocation in allocations:
+        allocation.free()
+    allocator.destroy()
+    return stats
+
+def main():
+    _, original = stub.install({"vkAllocateMemory": _allocate})
+    try:
+        device = stub.fake_handle("VkDevice")
+        resources = _resources()
+        print(f"{RESOURCES} buffers and images, {ALLOCATE_US} us per vkAllocateMemory")
+
+        start = time.perf_counter()
+        count = per_resource(device, resources)
+        stub.report("vkAllocateMemory per resource", RESOURCES, time.perf_counter() - start, unit="resource")
+        print(f"{'':<48} {count:10d} device allocations, limit {PROPERTIES.max_allocations}")
+
+        start = time.perf_counter()
+        stats = sub_allocated(device, resources)
+        stub.report("buddy sub-allocation", RESOURCES, time.perf_counter() - start, unit="resource")
+        print(f"{'':<48} {stats['device_allocations']:10d} device allocations, {stats['dedicated']} dedicated")
+        print(f"{'':<48} {stats['reserved_bytes'] / stats['requested_bytes']:10.2f} reserved/requested bytes")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
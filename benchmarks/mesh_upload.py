@@ -0,0 +1,90 @@
+import struct
+import time
+
+import numpy as np
+
+from benchmarks import stub
+from benchmarks.mapped_buffers import HostMemory, PROPERTIES
+from benchmarks.pipeline_cache import _RenderPass
+from vkproject.graphics.buffer import Buffer
+from vkproject.graphics.memory import MemoryAllocator
+from vkproject.graphics.pipeline import PipelineDescription, PipelineRegistry
+from vkproject.graphics.rendering import BufferRenderer
+from vkproject.graphics.vertex import VertexLayout, vertex_input
+from vkproject.graphics.vulkan import *
+from vkproject.resources.shaders import Shader, ShaderType
+
+VERTICES = 100_000
+ROUNDS = 5
+VERTEX = np.dtype([("position", "<f4", 3), ("normal", "<i2", 4), ("uv", "<f2", 2)])
+
+
+class _CommandBuffer:
+    handle = stub.fake_handle("VkCommandBuffer")
+
+def _mesh():
+    rng = np.random.default_rng(5)
+    positions = rng.random((VERTICES, 3), dtype=np.float32)
+    normals = rng.random((VERTICES, 3), dtype=np.float32) * 2 - 1
+    uvs = rng.random((VERTICES, 2), dtype=np.float32)
+    indices = rng.integers(0, VERTICES, VERTICES * 2, dtype=np.uint32)
+    return positions, normals, uvs, indices
+
+def per_vertex(vertices, positions, normals, uvs):
+    # interleave the mesh from python, one vertex at a time
+    pack = struct.Struct("<3f4h2e").pack_into
+    mapping = vertices.allocation.map()
+    for i, ((x, y, z), (nx, ny, nz), (u, v)) in enumerate(zip(positions.tolist(), (normals * 32767).tolist(), uvs.tolist())):
+        pack(mapping, i * VERTEX.itemsize, x, y, z, round(nx), round(ny), round(nz), 0, u, v)
+
+def vectorized(vertices, positions, normals, uvs):
+    data = vertices.data
+    data["position"] = positions
+    data["normal"][:, :3] = np.rint(normals * 32767)
+    data["normal"][:, 3] = 0
+    data["uv"] = uvs
+
+def main():
+    memory = HostMemory()
+    lib, original = stub.install(memory.impls)
+    try:
+        device = stub.fake_handle("VkDevice")
+        allocator = MemoryAllocator(device, PROPERTIES)
+        vertices = Buffer(device, allocator, VERTEX, VERTICES, VK_BUFFER_USAGE_VERTEX_BUFFER_BIT)
+        indices = Buffer(device, allocator, np.uint32, VERTICES * 2, VK_BUFFER_USAGE_INDEX_BUFFER_BIT)
+        vertices.create()
+        indices.create()
+        positions, normals, uvs, mesh_indices = _mesh()
+        print(f"{VERTICES} vertices of {VERTEX.itemsize} bytes, {ROUNDS} rounds")
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            per_vertex(vertices, positions, normals, np.round(uvs, 3))
+        stub.report("struct.pack per vertex", ROUNDS, time.perf_counter() - start, unit="upload")
+        expected = vertices.data.copy()
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            vectorized(vertices, positions, normals, np.round(uvs, 3))
+            indices.data[:] = mesh_indices
+        stub.report("structured dtype stores", ROUNDS, time.perf_counter() - start, unit="upload")
+        assert np.array_equal(vertices.data, expected)
+
+        registry = PipelineRegistry(device)
+        shaders = {ShaderType.VERTEX: Shader(ShaderType.VERTEX, b"\x01" * 64), ShaderType.FRAGMENT: Shader(ShaderType.FRAGMENT, b"\x02" * 64)}
+        pipeline = registry.get(PipelineDescription(shaders, *vertex_input(VertexLayout(VERTEX, normalized=("normal",)))), _RenderPass())
+        lib.calls = 0
+        renderer = BufferRenderer(_CommandBuffer())
+        renderer.bind_pipeline(pipeline)
+        renderer.draw_mesh(vertices, indices)
+        print(f"{'':<48} {lib.calls:10d} driver calls to draw it")
+
+        registry.destroy()
+        vertices.destroy()
+        indices.destroy()
+        allocator.destroy()
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import os
+import time
+
+from benchmarks import stub
+from vkproject.graphics.commands import CommandBuffer
+from vkproject.graphics.parallel import ParallelRecorder
+from vkproject.graphics.rendering import BufferRenderer
+from vkproject.graphics.vulkan import *
+from vkproject.math import Vec2, Rect2D, Viewport
+
+FRAMES = 200
+DRAWS = 5_000
+
+
+def _draws(count):
+    def draw(renderer):
+        renderer.draw(3, 1, 0, 0)
+
+    return [draw] * count
+
+def _setup(pipeline, viewport, scissor):
+    def setup(renderer):
+        vkCmdBindPipeline(renderer.buffer.handle, VK_PIPELINE_BIND_POINT_GRAPHICS, pipeline)
+        renderer.set_viewport(viewport)
+        renderer.set_scissor(scissor)
+
+    return setup
+
+def _serial(primary, setup, draws):
+    renderer = BufferRenderer(primary)
+    setup(renderer)
+    for draw in draws:
+        draw(renderer)
+
+def main():
+    _, original = stub.install()
+    try:
+        device = stub.fake_handle("VkDevice")
+        render_pass = stub.fake_handle("VkRenderPass")
+        framebuffer = stub.fake_handle("VkFramebuffer")
+        primary = CommandBuffer(device, None, stub.fake_handle("VkCommandBuffer"))
+        setup = _setup(stub.fake_handle("VkPipeline"), Viewport(Vec2(0, 0), Vec2(800, 800), 0.0, 1.0), Rect2D(Vec2(0, 0), Vec2(800, 800)))
+        draws = _draws(DRAWS)
+
+        print(f"{FRAMES} frames of {DRAWS} draws, {os.cpu_count()} cpus")
+        print("the stub driver runs python callbacks that take the GIL, a real driver call releases it")
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            _serial(primary, setup, draws)
+        stub.report("inline on the main thread", FRAMES, time.perf_counter() - start, unit="frame")
+
+        for workers in (1, 2, 4, 8):
+            recorder = ParallelRecorder(device, 0, 2, workers)
+            recorder.create()
+            start = time.perf_counter()
+            for frame in range(FRAMES):
+                recorder.record(primary, frame % 2, render_pass, framebuffer, setup, draws)
+            stub.report(f"secondary buffers, {workers} workers", FRAMES, time.perf_counter() - start, unit="frame")
+            recorder.destroy()
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import time
+
+from benchmarks import stub
+from vkproject.graphics.pipeline import PipelineCache, PipelineDescription, PipelineRegistry
+from vkproject.graphics.vulkan import *
+from vkproject.resources.shaders import Shader, ShaderType
+
+PIPELINES = 8
+# what a driver spends turning SPIR-V into GPU code, and loading it back from its cache
+COMPILE_MS = 20.0
+CACHE_HIT_MS = 0.5
+VENDOR_ID = 0x10de
+DEVICE_ID = 0x2204
+UUID = bytes(range(16))
+
+
+class CachingDriver:
+    """Pipeline creation that only compiles what the pipeline cache it is given has not seen"""
+    def __init__(self):
+        self.caches = {}
+        self.compiled = 0
+        self.pipeline_key = 0
+        self.impls = {
+            "vkGetPhysicalDeviceProperties": self._properties,
+            "vkCreatePipelineCache": self._create_cache,
+            "vkGetPipelineCacheData": self._cache_data,
+            "vkCreateGraphicsPipelines": self._create_pipelines,
+        }
+
+    @staticmethod
+    def _properties(physical_device, properties):
+        properties.vendorID = VENDOR_ID
+        properties.deviceID = DEVICE_ID
+        properties.driverVersion = 1
+        ffi.memmove(properties.pipelineCacheUUID, UUID, len(UUID))
+
+    def _create_cache(self, device, info, allocator, cache):
+        handle = len(self.caches) + 1
+        data = bytes(ffi.buffer(ffi.cast("char*", info.pInitialData), info.initialDataSize)) if info.initialDataSize else b""
+        # the payload after the header is one byte per cached pipeline
+        self.caches[handle] = set(data[32:])
+        cache[0] = ffi.cast("VkPipelineCache", handle)
+        return VK_SUCCESS
+
+    def _cache_data(self, device, cache, size, data):
+        payload = PipelineCache._HEADER.pack(32, VK_PIPELINE_CACHE_HEADER_VERSION_ONE, VENDOR_ID, DEVICE_ID, UUID) + bytes(sorted(self.caches[int(ffi.cast("uintptr_t", cache))]))
+        if data != ffi.NULL:
+            ffi.memmove(data, payload, len(payload))
+        size[0] = len(payload)
+        return VK_SUCCESS
+
+    def _create_pipelines(self, device, cache, count, infos, allocator, pipelines):
+        # set by the benchmark, stands in for the hash a driver computes over the create info
+        key = self.pipeline_key
+        entries = self.caches.get(int(ffi.cast("uintptr_t", cache)))
+        if entries is not None and key in entries:
+            time.sleep(CACHE_HIT_MS / 1e3)
+        else:
+            time.sleep(COMPILE_MS / 1e3)
+            self.compiled += 1
+            if entries is not None:
+                entries.add(key)
+        pipelines[0] = ffi.cast("VkPipeline", key + 1)
+        return VK_SUCCESS
+
+class _RenderPass:
+    def __init__(self):
+        self.handle = stub.fake_handle("VkRenderPass")
+
+    @staticmethod
+    def compatibility_key():
+        return (VK_FORMAT_B8G8R8A8_SRGB, VK_SAMPLE_COUNT_1_BIT)
+
+def startup(driver, directory):
+    # everything between device creation and the first frame that touches pipelines
+    start = time.perf_counter()
+    device = stub.fake_handle("VkDevice")
+    pipeline_cache = None
+    if directory is not None:
+        pipeline_cache = PipelineCache(device, stub.fake_handle("VkPhysicalDevice"), directory)
+        pipeline_cache.create()
+    registry = PipelineRegistry(device, pipeline_cache)
+    render_pass = _RenderPass()
+    for i in range(PIPELINES):
+        driver.pipeline_key = i
+        shaders = {ShaderType.VERTEX: Shader(ShaderType.VERTEX, bytes([i]) * 16), ShaderType.FRAGMENT: Shader(ShaderType.FRAGMENT, b"\0" * 16)}
+        registry.get(PipelineDescription(shaders), render_pass)
+    elapsed = time.perf_counter() - start
+    registry.destroy()
+    if pipeline_cache is not None:
+        pipeline_cache.save()
+        pipeline_cache.destroy()
+    return elapsed
+
+def main():
+    driver = CachingDriver()
+    _, original = stub.install(driver.impls)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"startup creating {PIPELINES} pipelines, {COMPILE_MS} ms to compile one, {CACHE_HIT_MS} ms from cache")
+            for label, cache_directory in (("no pipeline cache", None), ("cold cache", directory), ("warm cache", directory)):
+                driver.compiled = 0
+                elapsed = startup(driver, cache_directory)
+                print(f"{label:<48} {elapsed * 1e3:10.2f} ms {driver.compiled:4d} pipelines compiled")
+            print(f"cache file {os.path.getsize(os.path.join(directory, os.listdir(directory)[0]))} bytes")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
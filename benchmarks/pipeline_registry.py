@@ -0,0 +1,62 @@
+import time
+
+from benchmarks import stub
+from benchmarks.pipeline_cache import _RenderPass
+from vkproject.graphics.pipeline import PipelineDescription, PipelineRegistry
+from vkproject.graphics.vulkan import *
+from vkproject.resources.shaders import Shader, ShaderType
+
+MATERIALS = 1_000
+# a scene's materials mostly differ in textures and constants, only a few in pipeline state
+SHADER_VARIANTS = 4
+BLEND_MODES = (True, False)
+CULL_MODES = (VK_CULL_MODE_BACK_BIT, VK_CULL_MODE_NONE)
+
+
+def _descriptions():
+    fragments = [Shader(ShaderType.FRAGMENT, bytes([i]) * 64) for i in range(SHADER_VARIANTS)]
+    descriptions = []
+    for material in range(MATERIALS):
+        # materials load their own copy of the shader, identical code still has to share a module
+        shaders = {
+            ShaderType.VERTEX: Shader(ShaderType.VERTEX, b"\xff" * 64),
+            ShaderType.FRAGMENT: Shader(ShaderType.FRAGMENT, fragments[material % SHADER_VARIANTS].data),
+        }
+        # every combination of shader, blend and cull mode shows up
+        blend = BLEND_MODES[material // SHADER_VARIANTS % len(BLEND_MODES)]
+        cull_mode = CULL_MODES[material // (SHADER_VARIANTS * len(BLEND_MODES)) % len(CULL_MODES)]
+        descriptions.append(PipelineDescription(shaders, blend=blend, cull_mode=cull_mode))
+    return descriptions
+
+def main():
+    lib, original = stub.install()
+    try:
+        device = stub.fake_handle("VkDevice")
+        render_pass = _RenderPass()
+        print(f"{MATERIALS} materials over {SHADER_VARIANTS * len(BLEND_MODES) * len(CULL_MODES)} distinct pipeline states")
+
+        descriptions = _descriptions()
+        lib.calls = 0
+        start = time.perf_counter()
+        for description in descriptions:
+            # what a pipeline per material costs
+            registry = PipelineRegistry(device)
+            registry.get(description, render_pass)
+            registry.destroy()
+        stub.report("pipeline per material", MATERIALS, time.perf_counter() - start, unit="material")
+        print(f"{'':<48} {lib.calls / MATERIALS:10.2f} driver calls/material")
+
+        descriptions = _descriptions()
+        lib.calls = 0
+        start = time.perf_counter()
+        registry = PipelineRegistry(device)
+        for description in descriptions:
+            registry.get(description, render_pass)
+        stub.report("shared registry", MATERIALS, time.perf_counter() - start, unit="material")
+        print(f"{'':<48} {lib.calls / MATERIALS:10.2f} driver calls/material {registry.stats()}")
+        registry.destroy()
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+import statistics
+import time
+
+from benchmarks import stub
+from benchmarks.frames_in_flight import _spin
+from benchmarks.resize_events import _Window, _app
+from benchmarks.swapchain_recreate import SurfaceGpu
+from vkproject.graphics.swapchain import PresentPolicy
+from vkproject.graphics.vulkan import *
+
+FRAMES = 90
+REFRESH_HZ = 60
+# input handling and simulation before the frame is drawn
+CPU_MS = 3.0
+GPU_MS = 5.0
+
+
+class _InputWindow(_Window):
+    def __init__(self):
+        super().__init__()
+        self.polled_at = None
+
+    def events_polled_at(self):
+        return self.polled_at
+
+class PresentationEngine(SurfaceGpu):
+    """SimulatedGpu presenting to a display refreshing at REFRESH_HZ.
+
+    FIFO shows one queued image per vblank, MAILBOX the newest one and IMMEDIATE
+    shows an image as soon as its rendering is done. Only images that are neither
+    queued nor on screen can be acquired, acquire blocks until a vblank frees one.
+    """
+    def __init__(self, gpu_time):
+        super().__init__(gpu_time)
+        self.period = 1 / REFRESH_HZ
+        self.window = None
+        self.display_latencies = []
+        self.impls.update({
+            "vkCreateSwapchainKHR": self._create_swap_chain,
+            "vkAcquireNextImageKHR": self._acquire,
+            "vkQueuePresentKHR": self._present,
+        })
+
+    @staticmethod
+    def _capabilities(device, surface, capabilities):
+        SurfaceGpu._capabilities(device, surface, capabilities)
+        capabilities.minImageCount = 2
+        capabilities.maxImageCount = 8
+        return VK_SUCCESS
+
+    @staticmethod
+    def _present_modes(device, surface, count, modes):
+        available = (VK_PRESENT_MODE_FIFO_KHR, VK_PRESENT_MODE_MAILBOX_KHR, VK_PRESENT_MODE_IMMEDIATE_KHR, VK_PRESENT_MODE_FIFO_RELAXED_KHR)
+        count[0] = len(available)
+        if modes != ffi.NULL:
+            for i, mode in enumerate(available):
+                modes[i] = mode
+        return VK_SUCCESS
+
+    def _create_swap_chain(self, device, info, allocator, swap_chain):
+        swap_chain[0] = ffi.cast("VkSwapchainKHR", next(self._handles))
+        self.mode = info.presentMode
+        self.image_count = info.minImageCount
+        self.free = list(range(self.image_count))
+        # (image, rendering done, input time)
+        self.queued = []
+        self.displayed = None
+        self.next_vblank = time.perf_counter() + self.period
+        return VK_SUCCESS
+
+    def _images(self, device, swap_chain, count, images):
+        if images == ffi.NULL:
+            count[0] = self.image_count
+        else:
+            for i in range(count[0]):
+                images[i] = ffi.cast("VkImage", next(self._handles))
+        return VK_SUCCESS
+
+    def _show(self, entry, at):
+        if self.displayed is not None:
+            self.free.append(self.displayed)
+        self.displayed = entry[0]
+        self.display_latencies.append(at - entry[2])
+
+    def _advance(self, now):
+        if self.mode == VK_PRESENT_MODE_IMMEDIATE_KHR:
+            while self.queued and self.queued[0][1] <= now:
+                entry = self.queued.pop(0)
+                self._show(entry, entry[1])
+
+        while self.next_vblank <= now:
+            vblank = self.next_vblank
+            ready = [entry for entry in self.queued if entry[1] <= vblank]
+            if ready and self.mode == VK_PRESENT_MODE_MAILBOX_KHR:
+                # the newest finished image replaces the ones queued before it
+                for entry in ready:
+                    self.queued.remove(entry)
+                self.free += [entry[0] for entry in ready[:-1]]
+                self._show(ready[-1], vblank)
+            elif ready and self.mode != VK_PRESENT_MODE_IMMEDIATE_KHR:
+                self.queued.remove(ready[0])
+                self._show(ready[0], vblank)
+            self.next_vblank += self.period
+
+        if self.mode == VK_PRESENT_MODE_MAILBOX_KHR:
+            # between vblanks a finished image frees the one waiting before it right away
+            while len(self.queued) > 1 and self.queued[1][1] <= now:
+                self.free.append(self.queued.pop(0)[0])
+
+    def _acquire(self, device, swap_chain, timeout, semaphore, fence, image_index):
+        while True:
+            self._advance(time.perf_counter())
+            if self.free:
+                image_index[0] = self.free.pop(0)
+                return VK_SUCCESS
+            time.sleep(max(0.0, self.next_vblank - time.perf_counter()))
+
+    def _present(self, queue, info):
+        self._advance(time.perf_counter())
+        self.queued.append((info.pImageIndices[0], self.busy_until, self.window.polled_at))
+        return VK_SUCCESS
+
+def run(policy):
+    window = _InputWindow()
+    gpu = PresentationEngine(GPU_MS / 1e3)
+    gpu.window = window
+    _, original = stub.install(gpu.impls)
+    try:
+        app = _app(window)
+        app.set_present_policy(policy)
+        app.enable_latency_tracking(FRAMES)
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            window.polled_at = time.perf_counter()
+            _spin(CPU_MS / 1e3)
+            app.draw_frame()
+        elapsed = time.perf_counter() - start
+
+        summary = app.present_timings.summary()
+        app.frame_ring.destroy()
+        return FRAMES / elapsed, summary, statistics.median(gpu.display_latencies)
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"{FRAMES} frames on a {REFRESH_HZ} Hz display, cpu {CPU_MS} ms, gpu {GPU_MS} ms per frame")
+    print(f"{'policy':<14} {'fps':>8} {'input->present':>15} {'acquire':>9} {'input->display':>15}")
+    for policy in PresentPolicy:
+        fps, summary, display = run(policy)
+        print(f"{policy.value:<14} {fps:8.1f} {summary['input_to_present'] * 1e3:12.2f} ms {summary['acquire'] * 1e3:6.2f} ms {display * 1e3:12.2f} ms")
+
+if __name__ == '__main__':
+    main()
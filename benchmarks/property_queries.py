@@ -0,0 +1,88 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import *
+
+ROUNDS = 200
+DEVICES = 8
+EXTENSIONS = 200
+LAYERS = 30
+REQUIRED = [VK_KHR_SWAPCHAIN_EXTENSION_NAME, "VK_KHR_timeline_semaphore"]
+
+
+class PropertiesStubLib(stub.StubLib):
+    # a machine with several drivers exposing a long extension list and many layers
+    def __init__(self):
+        self.extensions = [f"VK_VENDOR_extension_{i}".encode() for i in range(EXTENSIONS - len(REQUIRED))] + [name.encode() for name in REQUIRED]
+        self.layers = [f"VK_LAYER_VENDOR_{i}".encode() for i in range(LAYERS - 1)] + [b"VK_LAYER_KHRONOS_validation"]
+        super().__init__({
+            "vkEnumerateDeviceExtensionProperties": lambda device, layer, count, properties: self._fill(count, properties, self.extensions, "extensionName"),
+            "vkEnumerateInstanceLayerProperties": lambda count, properties: self._fill(count, properties, self.layers, "layerName"),
+        })
+
+    @staticmethod
+    def _fill(count, properties, names, field):
+        if properties == ffi.NULL:
+            count[0] = len(names)
+            return VK_SUCCESS
+
+        written = min(count[0], len(names))
+        for i in range(written):
+            setattr(properties[i], field, names[i])
+        count[0] = written
+        return VK_SUCCESS if written == len(names) else VK_INCOMPLETE
+
+def _strwrap_selection(devices, layers):
+    # the loops device selection ran before the bulk decoder
+    for device in devices:
+        extensions = set(REQUIRED)
+        for supported_extension in vkEnumerateDeviceExtensionProperties(device, None):
+            ext_name = supported_extension.extensionName
+            if ext_name in extensions:
+                extensions.remove(ext_name)
+
+    available_layers = list(vkEnumerateInstanceLayerProperties())
+    for layer in layers:
+        for available_layer in available_layers:
+            if available_layer.layerName == layer:
+                break
+
+def _bulk_selection(devices, layers, buffer, cache):
+    for device in devices:
+        names = cache.get(device)
+        if names is None:
+            names = cache[device] = extension_names(vkEnumerateDeviceExtensionPropertiesInto(device, None, buffer))
+        set(REQUIRED) <= names
+
+    set(layers) <= layer_names(vkEnumerateInstanceLayerPropertiesInto(EnumerationBuffer("VkLayerProperties")))
+
+def main():
+    lib = PropertiesStubLib()
+    original = stub._vulkan.lib
+    stub._vulkan.lib = lib
+    try:
+        devices = [stub.fake_handle("VkPhysicalDevice", i + 1) for i in range(DEVICES)]
+        layers = ["VK_LAYER_KHRONOS_validation"]
+        print(f"device selection over {DEVICES} devices with {EXTENSIONS} extensions each and {LAYERS} layers, {ROUNDS} rounds")
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            _strwrap_selection(devices, layers)
+        stub.report("StrWrap per extension", ROUNDS, time.perf_counter() - start, unit="selection")
+
+        buffer = EnumerationBuffer("VkExtensionProperties")
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            _bulk_selection(devices, layers, buffer, {})
+        stub.report("bulk decode", ROUNDS, time.perf_counter() - start, unit="selection")
+
+        cache = {}
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            _bulk_selection(devices, layers, buffer, cache)
+        stub.report("bulk decode, cached per device", ROUNDS, time.perf_counter() - start, unit="selection")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
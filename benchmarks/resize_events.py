@@ -0,0 +1,134 @@
+import time
+
+from benchmarks import stub
+from benchmarks.static_frames import _Pipeline, _NothingStreamed
+from benchmarks.swapchain_recreate import SurfaceGpu
+from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.framebuffer import FrameBuffers
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.renderpass import RenderPass
+from vkproject.graphics.swapchain import SwapChain
+from vkproject.graphics.synchronization import FramePacer
+from vkproject.graphics.vk_app import VkApp, QueueFamilyIndices
+from vkproject.graphics.vulkan import *
+from vkproject.graphics.vulkan.extensions.dispatch import InstanceDispatch, DeviceDispatch
+from vkproject.graphics.vulkan.extensions.khr import KHR_INSTANCE_FUNCTIONS, KHR_DEVICE_FUNCTIONS
+
+# a one second drag resize at 120 Hz, the window grows by a pixel every event
+DRAG_EVENTS = 120
+EVENT_INTERVAL = 1 / 120
+SETTLE_FRAMES = 30
+GPU_MS = 2.0
+
+
+class _Window:
+    def __init__(self):
+        self.size = (800, 600)
+        self.listeners = []
+
+    def minimized(self):
+        return False
+
+    def framebuffer_size(self):
+        return self.size
+
+    def resize(self, width, height):
+        self.size = (width, height)
+        for listener in self.listeners:
+            listener(width, height)
+
+class DraggedSurfaceGpu(SurfaceGpu):
+    """Surface following the window size, swapchains of any other size are out of date"""
+    def __init__(self, gpu_time, window):
+        super().__init__(gpu_time)
+        self.window = window
+        self.extents = {}
+        self.impls.update({
+            "vkCreateSwapchainKHR": self._create_swap_chain,
+            "vkAcquireNextImageKHR": self._acquire,
+        })
+
+    def _capabilities(self, device, surface, capabilities):
+        super()._capabilities(device, surface, capabilities)
+        capabilities.currentExtent.width, capabilities.currentExtent.height = self.window.size
+        return VK_SUCCESS
+
+    def _create_swap_chain(self, device, info, allocator, swap_chain):
+        swap_chain[0] = ffi.cast("VkSwapchainKHR", next(self._handles))
+        self.extents[self._key(swap_chain[0])] = (info.imageExtent.width, info.imageExtent.height)
+        return VK_SUCCESS
+
+    def _acquire(self, device, swap_chain, timeout, semaphore, fence, image_index):
+        if self.extents[self._key(swap_chain)] != self.window.size:
+            return VK_ERROR_OUT_OF_DATE_KHR
+        image_index[0] = 0
+        return VK_SUCCESS
+
+def _app(window):
+    app = VkApp.__new__(VkApp)
+    app.window = window
+    app.device = stub.fake_handle("VkDevice")
+    app.command_pool = CommandPool(app.device, 0)
+    app.command_pool.create()
+    app.frame_ring = FrameRing(app.device, app.command_pool, VkApp.DEFAULT_FRAMES_IN_FLIGHT)
+    app.frame_ring.create()
+    app._graphics_queue = stub.fake_handle("VkQueue")
+    app._present_queue = stub.fake_handle("VkQueue", 2)
+    app.device_dispatch = DeviceDispatch(app.device).load(KHR_DEVICE_FUNCTIONS)
+    instance_dispatch = InstanceDispatch(stub.fake_handle("VkInstance")).load(KHR_INSTANCE_FUNCTIONS)
+    app.swap_chain = SwapChain(instance_dispatch, stub.fake_handle("VkPhysicalDevice"), window, stub.fake_handle("VkSurfaceKHR"), QueueFamilyIndices(0, 0), app.device_dispatch, None)
+    app.swap_chain.create()
+    app.swap_chain.create_image_views()
+    app.swap_chain.retire = app.frame_ring.retire
+    app.render_pass = RenderPass(app.device, app.swap_chain)
+    app.render_pass.create()
+    app.frame_buffers = FrameBuffers(app.device, app.render_pass, app.swap_chain)
+    app.frame_buffers.create()
+    app.pipeline = _Pipeline()
+    app.draw_list = [VkApp._sample_draw]
+    app.pacer = FramePacer()
+    app.uploads = _NothingStreamed()
+    app.streamer = _NothingStreamed()
+    app._parallel_recorder = None
+    app._recorded_commands = None
+    app._resized_at = None
+    app.frames_in_flight = VkApp.DEFAULT_FRAMES_IN_FLIGHT
+    app.present_policy = None
+    app.present_timings = None
+    window.listeners.append(app._on_framebuffer_resize)
+    return app
+
+def run(settle_time):
+    window = _Window()
+    gpu = DraggedSurfaceGpu(GPU_MS / 1e3, window)
+    _, original = stub.install(gpu.impls)
+    try:
+        app = _app(window)
+        app.resize_settle_time = settle_time
+        start = time.perf_counter()
+        for event in range(DRAG_EVENTS):
+            window.resize(800 + event, 600)
+            app.draw_frame()
+            # the rest of the event interval, as the window system would pace it
+            remaining = start + (event + 1) * EVENT_INTERVAL - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+        time.sleep(settle_time)
+        for _ in range(SETTLE_FRAMES):
+            app.draw_frame()
+
+        swap_chains = len(gpu.extents) - 1
+        final = app.swap_chain.extent.width
+        app.frame_ring.destroy()
+        return swap_chains, final
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"drag resize of {DRAG_EVENTS} framebuffer size events at {1 / EVENT_INTERVAL:.0f} Hz")
+    for label, settle_time in (("rebuild on every size", 0.0), (f"rebuild once settled ({VkApp.DEFAULT_RESIZE_SETTLE_TIME * 1e3:.0f} ms)", VkApp.DEFAULT_RESIZE_SETTLE_TIME)):
+        swap_chains, final = run(settle_time)
+        print(f"{label:<48} {swap_chains:6d} swapchain rebuilds, final width {final}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from vkproject.resources import ResourceLoader, Resources
+
+# 10 x 10 x 10 directories under the root, 10 files in each
+FANOUT = 10
+FILE_SIZE = 4096
+# what one read costs on storage that isn't in the page cache, a cold disk or a network share
+READ_LATENCY_MS = 0.1
+
+
+class HashLoader(ResourceLoader):
+    """Reads every file and keeps its digest, optionally paying READ_LATENCY_MS per read"""
+    def __init__(self, latency=0.0, incremental=False):
+        self.latency = latency
+        self.incremental = incremental
+        self.digests = {}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def load_resource(self, resource_path, resource_id):
+        if self.latency:
+            time.sleep(self.latency)
+        with open(resource_path, "rb") as file:
+            self.digests[resource_id] = hashlib.blake2b(file.read(), digest_size=16).digest()
+        with self._lock:
+            self.calls += 1
+
+    def accepts_resource(self, resource_path, resource_id) -> bool:
+        return resource_path.endswith(".bin")
+
+def _write_tree(root):
+    payload = os.urandom(FILE_SIZE)
+    for a in range(FANOUT):
+        for b in range(FANOUT):
+            for c in range(FANOUT):
+                directory = os.path.join(root, f"a{a}", f"b{b}", f"c{c}")
+                os.makedirs(directory)
+                for i in range(FANOUT):
+                    with open(os.path.join(directory, f"r{i}.bin"), "wb") as file:
+                        file.write(payload)
+    return FANOUT ** 4
+
+def _legacy_load(loaders, directory):
+    # Resources.load before the manifest: os.walk plus a recursive call per subdirectory
+    tree = os.walk(directory)
+    is_root = True
+    for root, dirs, files in tree:
+        if is_root:
+            is_root = False
+            continue
+
+        for file in files:
+            path = f"{root}/{file}"
+            resource_id = os.path.splitext(path.removeprefix(directory + "/"))[0]
+            for loader in loaders:
+                if loader.accepts_resource(path, resource_id):
+                    loader.load_resource(path, resource_id)
+        for sub_dir in dirs:
+            _legacy_load(loaders, directory + "/" + sub_dir)
+
+def _launch(root, loader, legacy=False):
+    # a fresh process: no loaders, nothing loaded yet
+    Resources._loaders = [loader]
+    Resources._manifests = {}
+    start = time.perf_counter()
+    if legacy:
+        _legacy_load(Resources._loaders, root)
+    else:
+        Resources.load(root)
+    return time.perf_counter() - start
+
+def _reload(root):
+    start = time.perf_counter()
+    Resources.load(root)
+    return time.perf_counter() - start
+
+def main():
+    loaders, manifest_path, manifests = Resources._loaders, Resources.manifest_path, Resources._manifests
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            root = os.path.join(directory, "res")
+            files = _write_tree(root)
+            Resources.manifest_path = os.path.join(directory, "cache", "resources.json")
+            print(f"{files} resources, {FANOUT ** 3} directories three levels deep, {FILE_SIZE} bytes each")
+
+            for latency, label in ((0.0, "page cache"), (READ_LATENCY_MS / 1e3, f"{READ_LATENCY_MS} ms per read")):
+                print(f"-- {label}")
+                if os.path.exists(Resources.manifest_path):
+                    os.remove(Resources.manifest_path)
+
+                loader = HashLoader(latency)
+                elapsed = _launch(root, loader, legacy=True)
+                print(f"{'walk + recursion (before)':<48} {elapsed * 1e3:10.2f} ms {loader.calls:7d} loads")
+
+                loader = HashLoader(latency)
+                elapsed = _launch(root, loader)
+                print(f"{'manifest scan, {} workers'.format(Resources.DEFAULT_WORKERS):<48} {elapsed * 1e3:10.2f} ms {loader.calls:7d} loads")
+
+                os.utime(os.path.join(root, "a3", "b1", "c4", "r2.bin"))
+                loader.calls = 0
+                elapsed = _reload(root)
+                print(f"{'reload, one file touched':<48} {elapsed * 1e3:10.2f} ms {loader.calls:7d} loads")
+
+                loader = HashLoader(latency, incremental=True)
+                elapsed = _launch(root, loader)
+                print(f"{'next launch, incremental loader':<48} {elapsed * 1e3:10.2f} ms {loader.calls:7d} loads")
+            print(f"manifest file {os.path.getsize(Resources.manifest_path)} bytes")
+    finally:
+        Resources._loaders, Resources.manifest_path, Resources._manifests = loaders, manifest_path, manifests
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.commands import CommandPool, RecordedCommandBuffers
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.renderpass import RenderPass
+from vkproject.graphics.synchronization import FramePacer
+from vkproject.graphics.vk_app import VkApp
+from vkproject.graphics.vulkan import *
+from vkproject.graphics.vulkan.extensions.dispatch import DeviceDispatch
+from vkproject.graphics.vulkan.extensions.khr import KHR_DEVICE_FUNCTIONS
+from vkproject.math import Vec2, Rect2D, Viewport
+
+FRAMES = 20_000
+IMAGES = 3
+
+
+class _SwapChain:
+    # just enough of SwapChain for VkApp._draw_frame, without a surface
+    def __init__(self):
+        self.handle = stub.fake_handle("VkSwapchainKHR")
+        self.surface_format = VkSurfaceFormatKHR(format=VK_FORMAT_B8G8R8A8_SRGB, colorSpace=VK_COLOR_SPACE_SRGB_NONLINEAR_KHR)
+        self.extent = VkExtent2D(800, 800)
+        self.viewport = Viewport(Vec2(0, 0), Vec2(800, 800), 0.0, 1.0)
+        self.scissor = Rect2D(Vec2(0, 0), Vec2(800, 800))
+        self.image_count = IMAGES
+        self.generation = 1
+        self.out_of_date = False
+        self._next_image = 0
+
+    def acquire(self, semaphore, frame_buffers, recreate=True):
+        image_idx = self._next_image
+        self._next_image = (image_idx + 1) % IMAGES
+        return image_idx
+
+class _FrameBuffers:
+    def __init__(self):
+        self.handles = [stub.fake_handle("VkFramebuffer", i + 1) for i in range(IMAGES)]
+
+class _Window:
+    @staticmethod
+    def minimized():
+        return False
+
+class _NothingStreamed:
+    # nothing is streamed in these scenes
+    @staticmethod
+    def flush():
+        return None
+
+    @staticmethod
+    def update():
+        return False
+
+class _Pipeline:
+    def __init__(self):
+        self.handle = stub.fake_handle("VkPipeline")
+
+def _app(cache_commands):
+    app = VkApp.__new__(VkApp)
+    app.device = stub.fake_handle("VkDevice")
+    app.command_pool = CommandPool(app.device, 0)
+    app.command_pool.create()
+    app.frame_ring = FrameRing(app.device, app.command_pool, VkApp.DEFAULT_FRAMES_IN_FLIGHT)
+    app.frame_ring.create()
+    app._graphics_queue = stub.fake_handle("VkQueue")
+    app._present_queue = stub.fake_handle("VkQueue", 2)
+    app.device_dispatch = DeviceDispatch(app.device).load(KHR_DEVICE_FUNCTIONS)
+    app.swap_chain = _SwapChain()
+    app.render_pass = RenderPass(app.device, app.swap_chain)
+    app.render_pass.create()
+    app.frame_buffers = _FrameBuffers()
+    app.pipeline = _Pipeline()
+    app.draw_list = [VkApp._sample_draw]
+    app.pacer = FramePacer()
+    app.uploads = _NothingStreamed()
+    app.streamer = _NothingStreamed()
+    app.window = _Window()
+    app._resized_at = None
+    app.present_timings = None
+    app.resize_settle_time = VkApp.DEFAULT_RESIZE_SETTLE_TIME
+    app._parallel_recorder = None
+    app._recorded_commands = RecordedCommandBuffers(app.command_pool, app.swap_chain, app.record_command_buffer) if cache_commands else None
+    return app
+
+def main():
+    lib, original = stub.install()
+    try:
+        print(f"{FRAMES} frames of a static scene, {IMAGES} swapchain images")
+        for label, cache_commands in (("re-record every frame", False), ("record once, replay", True)):
+            app = _app(cache_commands)
+            lib.calls = 0
+            start = time.perf_counter()
+            for _ in range(FRAMES):
+                app.draw_frame()
+            stub.report(label, FRAMES, time.perf_counter() - start, unit="frame")
+            print(f"{'':<48} {lib.calls / FRAMES:10.2f} driver calls/frame")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import *
+
+ITERATIONS = 20_000
+
+
+def _cases():
+    semaphore = stub.fake_handle("VkSemaphore")
+    command_buffer = stub.fake_handle("VkCommandBuffer")
+    swapchain = stub.fake_handle("VkSwapchainKHR")
+    render_pass = stub.fake_handle("VkRenderPass")
+    framebuffer = stub.fake_handle("VkFramebuffer")
+    extent = VkExtent2D(800, 800)
+    clear_value = VkClearValue(VkClearColorValue(float32=[0.0, 0.0, 0.0, 1.0]))
+    color_attachment_ref = VkAttachmentReference(attachment=0, layout=VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL)
+
+    # per frame - vk_app.py, rendering.py, renderpass.py, synchronization.py
+    yield "VkViewport", lambda: VkViewport(x=0.0, y=0.0, width=800.0, height=800.0, minDepth=0.0, maxDepth=1.0)
+    yield "VkOffset2D", lambda: VkOffset2D(0, 0)
+    yield "VkExtent2D", lambda: VkExtent2D(width=800, height=800)
+    yield "VkRect2D", lambda: VkRect2D(offset=VkOffset2D(0, 0), extent=extent)
+    yield "VkClearColorValue", lambda: VkClearColorValue(float32=[0.0, 0.0, 0.0, 1.0])
+    yield "VkCommandBufferBeginInfo", lambda: VkCommandBufferBeginInfo(flags=0, pInheritanceInfo=None)
+    yield "VkRenderPassBeginInfo", lambda: VkRenderPassBeginInfo(
+        renderPass=render_pass,
+        framebuffer=framebuffer,
+        renderArea=VkRect2D(offset=VkOffset2D(0, 0), extent=extent),
+        clearValueCount=1,
+        pClearValues=[clear_value],
+    )
+    yield "VkSubmitInfo", lambda: VkSubmitInfo(
+        pWaitSemaphores=[semaphore],
+        pWaitDstStageMask=[VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT],
+        pCommandBuffers=[command_buffer],
+        pSignalSemaphores=[semaphore],
+    )
+    yield "VkPresentInfoKHR", lambda: VkPresentInfoKHR(
+        pWaitSemaphores=[semaphore],
+        pSwapchains=[swapchain],
+        pImageIndices=[0],
+        pResults=None,
+    )
+
+    # create time
+    yield "VkSemaphoreCreateInfo", lambda: VkSemaphoreCreateInfo()
+    yield "VkFenceCreateInfo", lambda: VkFenceCreateInfo(flags=VK_FENCE_CREATE_SIGNALED_BIT)
+    yield "VkApplicationInfo", lambda: VkApplicationInfo(pApplicationName="bench", applicationVersion=VK_MAKE_VERSION(1, 0, 0), apiVersion=VK_API_VERSION_1_0)
+    yield "VkDeviceQueueCreateInfo", lambda: VkDeviceQueueCreateInfo(queueFamilyIndex=0, queueCount=1, pQueuePriorities=[1.0])
+    yield "VkAttachmentDescription", lambda: VkAttachmentDescription(
+        format=VK_FORMAT_B8G8R8A8_SRGB,
+        samples=VK_SAMPLE_COUNT_1_BIT,
+        loadOp=VK_ATTACHMENT_LOAD_OP_CLEAR,
+        storeOp=VK_ATTACHMENT_STORE_OP_STORE,
+        finalLayout=VK_IMAGE_LAYOUT_PRESENT_SRC_KHR,
+    )
+    yield "VkSubpassDescription", lambda: VkSubpassDescription(
+        pipelineBindPoint=VK_PIPELINE_BIND_POINT_GRAPHICS,
+        colorAttachmentCount=1,
+        pColorAttachments=[color_attachment_ref],
+    )
+
+def main():
+    print(f"struct construction, {ITERATIONS} iterations each")
+    for name, construct in _cases():
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            construct()
+        stub.report(name, ITERATIONS, time.perf_counter() - start, unit="struct")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from vkproject.graphics.vulkan import _vulkan, ffi
+
+
+class StubLib:
+    """Stand-in for the loaded Vulkan library so binding overhead can be measured without a GPU.
+
+    Each ``vk*`` attribute is a cffi callback with the real ``PFN_vk*`` signature that does
+    nothing and reports ``VK_SUCCESS``. ``vkGet*ProcAddr`` hands out the same callbacks, so
+    extension wrappers resolve exactly like they do against a driver.
+    ``impls`` maps function names to python implementations for the few calls a benchmark
+    needs to behave like a driver.
+    The Vulkan loader still has to be installed for the binding to import.
+    """
+    def __init__(self, impls=None):
+        self._functions = {}
+        self._impls = impls or {}
+        self.calls = 0
+
+    def _proc_addr(self, _, name):
+        return ffi.cast("PFN_vkVoidFunction", getattr(self, ffi.string(name).decode("ascii")))
+
+    def __getattr__(self, name):
+        if not name.startswith("vk"):
+            raise AttributeError(name)
+
+        func = self._functions.get(name)
+        if func is None:
+            ctype = ffi.typeof("PFN_" + name)
+            if name in self._impls:
+                impl = self._impls[name]
+            elif name in ("vkGetInstanceProcAddr", "vkGetDeviceProcAddr"):
+                impl = self._proc_addr
+            elif ctype.result.cname == "void":
+                impl = self._void
+            else:
+                impl = self._success
+
+            func = ffi.callback(ctype, impl)
+            self._functions[name] = func
+
+        return func
+
+    def _void(self, *_):
+        self.calls += 1
+
+    def _success(self, *_):
+        self.calls += 1
+        return 0
+
+def install(impls=None):
+    stub = StubLib(impls)
+    original = _vulkan.lib
+    _vulkan.lib = stub
+    return stub, original
+
+def uninstall(original):
+    _vulkan.lib = original
+
+def fake_handle(type_name, value=1):
+    return ffi.cast(type_name, value)
+
+def report(name, iterations, seconds, unit="call"):
+    print(f"{name:<48} {seconds / iterations * 1e6:10.3f} us/{unit} {iterations / seconds:14,.0f} {unit}s/s")
@@ -0,0 +1,76 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.swapchain import SwapChain, SurfaceQueryCache
+from vkproject.graphics.vulkan import *
+from vkproject.graphics.vulkan.extensions.dispatch import InstanceDispatch
+from vkproject.graphics.vulkan.extensions.khr import *
+
+RECREATES = 20_000
+FORMATS = 8
+PRESENT_MODES = 4
+
+
+class SurfaceStubLib(stub.StubLib):
+    # a surface with a realistic number of formats and present modes
+    def __init__(self):
+        super().__init__({
+            "vkGetPhysicalDeviceSurfaceFormatsKHR": lambda device, surface, count, formats: self._fill(count, formats, FORMATS),
+            "vkGetPhysicalDeviceSurfacePresentModesKHR": lambda device, surface, count, modes: self._fill(count, modes, PRESENT_MODES),
+        })
+
+    def _fill(self, count, array, available):
+        self.calls += 1
+        if array == ffi.NULL:
+            count[0] = available
+            return VK_SUCCESS
+
+        written = min(count[0], available)
+        count[0] = written
+        return VK_SUCCESS if written == available else VK_INCOMPLETE
+
+def _uncached(instance_dispatch, device, surface, surface_queries):
+    # what every recreate did before the surface query cache
+    vkGetPhysicalDeviceSurfaceCapabilitiesKHR(instance_dispatch, device, surface)
+    vkGetPhysicalDeviceSurfaceFormatsKHR(instance_dispatch, device, surface)
+    vkGetPhysicalDeviceSurfacePresentModesKHR(instance_dispatch, device, surface)
+
+def _cached(instance_dispatch, device, surface, surface_queries):
+    SwapChain.query_swap_chain_support_details(instance_dispatch, device, surface, surface_queries)
+
+def _time(lib, func, *args):
+    lib.calls = 0
+    start = time.perf_counter()
+    for _ in range(RECREATES):
+        func(*args)
+
+    return time.perf_counter() - start, lib.calls / RECREATES
+
+def main():
+    lib = SurfaceStubLib()
+    original = stub._vulkan.lib
+    stub._vulkan.lib = lib
+    try:
+        instance_dispatch = InstanceDispatch(stub.fake_handle("VkInstance")).load(KHR_INSTANCE_FUNCTIONS)
+        device = stub.fake_handle("VkPhysicalDevice")
+        surface = stub.fake_handle("VkSurfaceKHR")
+        surface_queries = SurfaceQueryCache()
+
+        print(f"{RECREATES} swapchain support queries, {FORMATS} formats and {PRESENT_MODES} present modes")
+        for label, func in (("re-enumerate on every recreate", _uncached), ("surface query cache", _cached)):
+            elapsed, calls = _time(lib, func, instance_dispatch, device, surface, surface_queries)
+            stub.report(label, RECREATES, elapsed, unit="recreate")
+            print(f"{'':<48} {calls:10.2f} enumerate calls/recreate")
+
+        formats = EnumerationBuffer("VkSurfaceFormatKHR", FORMATS)
+        elapsed, calls = _time(lib, vkGetPhysicalDeviceSurfaceFormatsKHRInto, instance_dispatch, device, surface, formats)
+        stub.report("formats into a reused buffer", RECREATES, elapsed)
+        print(f"{'':<48} {calls:10.2f} driver calls/query")
+        elapsed, calls = _time(lib, vkGetPhysicalDeviceSurfaceFormatsKHR, instance_dispatch, device, surface)
+        stub.report("formats into a new array", RECREATES, elapsed)
+        print(f"{'':<48} {calls:10.2f} driver calls/query")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import itertools
+import time
+
+from benchmarks import stub
+from benchmarks.frames_in_flight import SimulatedGpu, _spin
+from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.framebuffer import FrameBuffers
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.swapchain import SwapChain
+from vkproject.graphics.vk_app import QueueFamilyIndices
+from vkproject.graphics.vulkan import *
+from vkproject.graphics.vulkan.extensions.dispatch import InstanceDispatch, DeviceDispatch
+from vkproject.graphics.vulkan.extensions.khr import KHR_INSTANCE_FUNCTIONS, KHR_DEVICE_FUNCTIONS
+
+FRAMES = 240
+FRAMES_IN_FLIGHT = 2
+# a window being dragged, recreating the swapchain every few frames
+RECREATE_EVERY = 4
+CPU_MS = 2.0
+GPU_MS = 6.0
+IMAGES = 3
+
+
+class SurfaceGpu(SimulatedGpu):
+    """SimulatedGpu with a surface to build swapchains for, vkDeviceWaitIdle drains the queue"""
+    def __init__(self, gpu_time):
+        super().__init__(gpu_time)
+        self._handles = itertools.count(1)
+        self.impls.update({
+            "vkDeviceWaitIdle": self._wait_idle,
+            "vkGetPhysicalDeviceSurfaceCapabilitiesKHR": self._capabilities,
+            "vkGetPhysicalDeviceSurfaceFormatsKHR": self._formats,
+            "vkGetPhysicalDeviceSurfacePresentModesKHR": self._present_modes,
+            "vkGetSwapchainImagesKHR": self._images,
+        })
+
+    def _wait_idle(self, device):
+        remaining = self.busy_until - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        return VK_SUCCESS
+
+    @staticmethod
+    def _capabilities(device, surface, capabilities):
+        capabilities.minImageCount = IMAGES - 1
+        capabilities.maxImageCount = IMAGES
+        capabilities.currentExtent.width = 800
+        capabilities.currentExtent.height = 600
+        return VK_SUCCESS
+
+    @staticmethod
+    def _formats(device, surface, count, formats):
+        count[0] = 1
+        if formats != ffi.NULL:
+            formats[0].format = VK_FORMAT_B8G8R8A8_SRGB
+            formats[0].colorSpace = VK_COLOR_SPACE_SRGB_NONLINEAR_KHR
+        return VK_SUCCESS
+
+    @staticmethod
+    def _present_modes(device, surface, count, modes):
+        count[0] = 1
+        if modes != ffi.NULL:
+            modes[0] = VK_PRESENT_MODE_FIFO_KHR
+        return VK_SUCCESS
+
+    def _images(self, device, swap_chain, count, images):
+        if images == ffi.NULL:
+            count[0] = IMAGES
+        else:
+            for i in range(count[0]):
+                images[i] = ffi.cast("VkImage", next(self._handles))
+        return VK_SUCCESS
+
+class _RenderPass:
+    def __init__(self):
+        self.handle = stub.fake_handle("VkRenderPass")
+
+    @staticmethod
+    def compatibility_key():
+        # the surface format never changes here, so the render pass is never rebuilt
+        return (VK_FORMAT_B8G8R8A8_SRGB, VK_SAMPLE_COUNT_1_BIT)
+
+def run(deferred):
+    gpu = SurfaceGpu(GPU_MS / 1e3)
+    _, original = stub.install(gpu.impls)
+    try:
+        instance_dispatch = InstanceDispatch(stub.fake_handle("VkInstance")).load(KHR_INSTANCE_FUNCTIONS)
+        device = stub.fake_handle("VkDevice")
+        queue = stub.fake_handle("VkQueue")
+        pool = CommandPool(device, 0)
+        pool.create()
+        ring = FrameRing(device, pool, FRAMES_IN_FLIGHT)
+        ring.create()
+        swap_chain = SwapChain(instance_dispatch, stub.fake_handle("VkPhysicalDevice"), None, stub.fake_handle("VkSurfaceKHR"), QueueFamilyIndices(0, 0), DeviceDispatch(device).load(KHR_DEVICE_FUNCTIONS), None)
+        swap_chain.create()
+        swap_chain.create_image_views()
+        if deferred:
+            swap_chain.retire = ring.retire
+        frame_buffers = FrameBuffers(device, _RenderPass(), swap_chain)
+        frame_buffers.create()
+
+        recreating = 0.0
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            slot = ring.slot()
+            slot.sync_handler.wait()
+            ring.frame_completed()
+            if frame % RECREATE_EVERY == 0:
+                recreate_start = time.perf_counter()
+                swap_chain.recreate(frame_buffers)
+                recreating += time.perf_counter() - recreate_start
+            _spin(CPU_MS / 1e3)
+            slot.sync_handler.submit(queue, [slot.command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
+            ring.advance()
+        elapsed = max(gpu.busy_until, time.perf_counter()) - start
+
+        frame_buffers.destroy()
+        swap_chain.destroy()
+        ring.destroy()
+        pool.destroy()
+        return FRAMES / elapsed, recreating / (FRAMES // RECREATE_EVERY)
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"{FRAMES} frames, swapchain recreated every {RECREATE_EVERY} frames, cpu {CPU_MS} ms, gpu {GPU_MS} ms, {FRAMES_IN_FLIGHT} frames in flight")
+    for label, deferred in (("wait idle, destroy, create", False), ("oldSwapchain handoff, deferred destroy", True)):
+        fps, recreate = run(deferred)
+        print(f"{label:<48} {fps:10.1f} fps {recreate * 1e3:10.2f} ms/recreate")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+import itertools
+import time
+
+import numpy as np
+
+from benchmarks import stub
+from benchmarks.frames_in_flight import _spin
+from benchmarks.mapped_buffers import HostMemory
+from vkproject.graphics.buffer import DeviceBuffer
+from vkproject.graphics.commands import CommandPool, CommandBufferRecordingType
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.memory import MemoryAllocator, MemoryProperties
+from vkproject.graphics.upload import UploadManager
+from vkproject.graphics.vulkan import *
+
+FRAMES = 120
+CPU_MS = 3.0
+GPU_MS = 5.0
+# a level streaming in: a few meshes and textures arrive every frame
+UPLOADS_PER_FRAME = 4
+UPLOAD_BYTES = 1024 * 1024
+COPY_GB_PER_S = 4.0
+SUBMIT_US = 20.0
+GRAPHICS_FAMILY = 0
+TRANSFER_FAMILY = 1
+PROPERTIES = MemoryProperties(
+    [(VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT | VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT | VK_MEMORY_PROPERTY_HOST_COHERENT_BIT, 0)],
+    [8 << 30],
+)
+
+
+class QueuesGpu:
+    """A graphics and a transfer queue running side by side.
+
+    Submits that recorded copies take their bytes over COPY_GB_PER_S, ownership
+    acquires waiting on them only run barriers, the rest are frames taking
+    GPU_MS. Fences and semaphores signal when their submit ends.
+    """
+    def __init__(self, graphics_queue):
+        self.graphics_queue = graphics_queue
+        self.busy_until = {}
+        self.signals = {}
+        self.copy_bytes = 0
+        # time the graphics queue spent on copies or waiting for them
+        self.graphics_copy_time = 0.0
+        self._copy_semaphores = set()
+        self._handles = itertools.count(1)
+        self.impls = {
+            "vkCreateFence": self._create("VkFence"),
+            "vkCreateSemaphore": self._create("VkSemaphore"),
+            "vkCmdCopyBuffer": self._copy,
+            "vkQueueSubmit": self._submit,
+            "vkGetFenceStatus": self._status,
+            "vkWaitForFences": self._wait,
+            "vkQueueWaitIdle": self._wait_idle,
+        }
+
+    @staticmethod
+    def _key(handle):
+        return int(ffi.cast("uintptr_t", handle))
+
+    def _create(self, type_name):
+        def create(device, info, allocator, handle):
+            handle[0] = ffi.cast(type_name, next(self._handles))
+            self.signals[self._key(handle[0])] = 0.0
+            return VK_SUCCESS
+        return create
+
+    def _copy(self, command_buffer, src, dst, count, regions):
+        self.copy_bytes += sum(regions[i].size for i in range(count))
+
+    def _submit(self, queue, count, infos, fence):
+        queue_key = self._key(queue)
+        start = max(time.perf_counter(), self.busy_until.get(queue_key, 0.0))
+        waits = [self._key(infos[0].pWaitSemaphores[i]) for i in range(infos[0].waitSemaphoreCount)]
+        ready = max([start] + [self.signals[semaphore] for semaphore in waits])
+
+        copies = self.copy_bytes > 0
+        # an ownership acquire waits on a copy submit and only runs barriers
+        acquire = any(semaphore in self._copy_semaphores for semaphore in waits)
+        if copies:
+            work = SUBMIT_US / 1e6 + self.copy_bytes / (COPY_GB_PER_S * 1e9)
+            self.copy_bytes = 0
+        elif acquire:
+            work = SUBMIT_US / 1e6
+        else:
+            work = GPU_MS / 1e3
+        end = ready + work
+
+        if queue_key == self._key(self.graphics_queue) and (copies or acquire):
+            self.graphics_copy_time += end - start
+        self.busy_until[queue_key] = end
+        for i in range(infos[0].signalSemaphoreCount):
+            semaphore = self._key(infos[0].pSignalSemaphores[i])
+            self.signals[semaphore] = end
+            if copies:
+                self._copy_semaphores.add(semaphore)
+        if fence:
+            self.signals[self._key(fence)] = end
+        return VK_SUCCESS
+
+    def _status(self, device, fence):
+        return VK_SUCCESS if self.signals[self._key(fence)] <= time.perf_counter() else VK_NOT_READY
+
+    def _sleep_until(self, end):
+        remaining = end - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _wait(self, device, count, fences, wait_all, timeout):
+        self._sleep_until(max(self.signals[self._key(fences[i])] for i in range(count)))
+        return VK_SUCCESS
+
+    def _wait_idle(self, queue):
+        self._sleep_until(self.busy_until.get(self._key(queue), 0.0))
+        return VK_SUCCESS
+
+def _one_shot_upload(device, pool, queue, staging, buffer, data):
+    # what the tutorials do: stage, copy in a command buffer of its own, wait for the queue to go idle
+    staging[:data.nbytes] = data
+    command_buffer = pool.create_command_buffers(1)[0]
+    command_buffer.begin_recording(CommandBufferRecordingType.ONE_TIME_SUBMIT)
+    vkCmdCopyBuffer(command_buffer.handle, staging.handle, buffer.handle, 1, [VkBufferCopy(size=data.nbytes)])
+    command_buffer.end_recording()
+    vkQueueSubmit(queue, 1, VkSubmitInfo(pCommandBuffers=[command_buffer.handle]), VK_NULL_HANDLE)
+    vkQueueWaitIdle(queue)
+    pool.free_command_buffers([command_buffer])
+
+class _Staging:
+    # a host visible buffer the one shot path stages through
+    def __init__(self, device, allocator):
+        self.buffer = DeviceBuffer(device, allocator, np.uint8, UPLOAD_BYTES, VK_BUFFER_USAGE_TRANSFER_SRC_BIT)
+        self.buffer.create()
+        self.handle = self.buffer.handle
+        self.data = np.frombuffer(self.buffer.allocation.map(), np.uint8)
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+
+def run(batched):
+    graphics_queue = stub.fake_handle("VkQueue", 1)
+    transfer_queue = stub.fake_handle("VkQueue", 2)
+    gpu = QueuesGpu(graphics_queue)
+    memory = HostMemory()
+    _, original = stub.install(dict(memory.impls, **gpu.impls))
+    try:
+        device = stub.fake_handle("VkDevice")
+        allocator = MemoryAllocator(device, PROPERTIES)
+        pool = CommandPool(device, GRAPHICS_FAMILY)
+        pool.create()
+        ring = FrameRing(device, pool, 2)
+        ring.create()
+        target = DeviceBuffer(device, allocator, np.uint8, UPLOAD_BYTES, VK_BUFFER_USAGE_VERTEX_BUFFER_BIT)
+        target.create()
+        data = np.ones(UPLOAD_BYTES, np.uint8)
+        if batched:
+            uploads = UploadManager(device, allocator, transfer_queue, TRANSFER_FAMILY, graphics_queue, GRAPHICS_FAMILY)
+            uploads.create()
+        else:
+            staging = _Staging(device, allocator)
+
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            slot = ring.slot()
+            slot.sync_handler.wait_for_fence()
+            _spin(CPU_MS / 1e3)
+            for _ in range(UPLOADS_PER_FRAME):
+                if batched:
+                    uploads.upload_buffer(target, data)
+                else:
+                    _one_shot_upload(device, pool, graphics_queue, staging, target, data)
+            if batched:
+                uploads.flush()
+                uploads.update()
+            slot.sync_handler.reset_fence()
+            submit_info = slot.sync_handler.buffer_submission_info([slot.command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
+            vkQueueSubmit(graphics_queue, 1, submit_info, slot.sync_handler.in_flight_fence)
+            ring.advance()
+        elapsed = max(gpu.busy_until.values()) - start
+        return FRAMES / elapsed, gpu.graphics_copy_time / FRAMES
+    finally:
+        stub.uninstall(original)
+
+def main():
+    print(f"{FRAMES} frames, cpu {CPU_MS} ms, gpu {GPU_MS} ms, {UPLOADS_PER_FRAME} uploads of {UPLOAD_BYTES >> 20} MiB per frame at {COPY_GB_PER_S} GB/s")
+    for label, batched in (("one shot upload, wait idle", False), ("staging ring, transfer queue", True)):
+        fps, copy_time = run(batched)
+        print(f"{label:<48} {fps:10.1f} fps {copy_time * 1e3:10.2f} ms/frame of graphics queue spent on uploads")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import time
+
+from benchmarks import stub
+from vkproject.graphics.vulkan import *
+from vkproject.math import Vec2, Rect2D, Viewport
+
+UPDATES = 100_000
+
+
+class _DictVec2:
+    # the dict backed value types and per call structs from before
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+def _struct_per_call(command_buffer, i):
+    pos = _DictVec2(0, 0)
+    size = _DictVec2(800 + (i & 7), 600)
+    viewport = VkViewport(x=pos.x, y=pos.y, width=size.x, height=size.y, minDepth=0.0, maxDepth=1.0)
+    vkCmdSetViewport(command_buffer, 0, 1, [viewport])
+    scissor = VkRect2D(VkOffset2D(x=pos.x, y=pos.y), VkExtent2D(width=size.x, height=size.y))
+    vkCmdSetScissor(command_buffer, 0, 1, [scissor])
+
+def _preallocated(command_buffer, i, viewport=Viewport(Vec2(0, 0), Vec2(0, 0), 0.0, 1.0), scissor=Rect2D(Vec2(0, 0), Vec2(0, 0))):
+    viewport.update(0, 0, 800 + (i & 7), 600)
+    vkCmdSetViewport(command_buffer, 0, 1, viewport.vk_array())
+    scissor.update(0, 0, 800 + (i & 7), 600)
+    vkCmdSetScissor(command_buffer, 0, 1, scissor.vk_array())
+
+def main():
+    _, original = stub.install()
+    try:
+        command_buffer = stub.fake_handle("VkCommandBuffer")
+        print(f"{UPDATES} viewport + scissor updates")
+        for label, update in (("new VkViewport/VkRect2D per call", _struct_per_call), ("preallocated Viewport/Rect2D", _preallocated)):
+            start = time.perf_counter()
+            for i in range(UPDATES):
+                update(command_buffer, i)
+            stub.report(label, UPDATES, time.perf_counter() - start, unit="update")
+    finally:
+        stub.uninstall(original)
+
+if __name__ == '__main__':
+    main()
@@ -3,21 +3,40 @@ import sys
 
 import glfw
 
+from vkproject.graphics.swapchain import PresentPolicy
 from vkproject.graphics.vk_app import VkApp
 from vkproject.resources import Resources
+from vkproject.resources.meshes import MeshLoader
 from vkproject.resources.shaders import ShaderLoader
 from vkproject.windowing import Window
 
 
 def main():
-    args, values = getopt.getopt(sys.argv[1:], "v", ["validate"])
+    args, values = getopt.getopt(sys.argv[1:], "vf:p:lc", ["validate", "fps=", "present=", "latency", "pipeline-cache"])
 
     enable_validation = False
+    target_fps = None
+    present_policy = None
+    track_latency = False
+    pipeline_cache = False
     for arg, value in args:
         if arg in ("-v", "--validate"):
             enable_validation = True
+        elif arg in ("-f", "--fps"):
+            target_fps = int(value)
+        elif arg in ("-p", "--present"):
+            # low_latency, vsync, uncapped or power_saver
+            present_policy = PresentPolicy(value)
+        elif arg in ("-l", "--latency"):
+            track_latency = True
+        elif arg in ("-c", "--pipeline-cache"):
+            # keeps compiled pipelines under the user cache directory for the next launch
+            pipeline_cache = True
 
     Resources.register_loader(ShaderLoader())
+    # meshes are found now but streamed in once the device exists, startup doesn't wait on them
+    meshes = MeshLoader()
+    Resources.register_loader(meshes)
     Resources.load()
 
     glfw.init()
@@ -31,12 +50,28 @@ def main():
         vk_app.default_validation_layers()
         vk_app.enable_validation() # comment out this line to run without validation enabled, removes vulkan SDK dependency
 
+    # the scene is static, record the command buffers once and replay them
+    vk_app.enable_command_caching()
+    vk_app.pacer.target_fps = target_fps
+    if present_policy is not None:
+        vk_app.set_present_policy(present_policy)
+    if track_latency:
+        vk_app.enable_latency_tracking()
+    if pipeline_cache:
+        vk_app.enable_pipeline_cache()
     vk_app.init()
+    # the meshes are in the app's device memory, they go before it
+    vk_app.add_cleanup_hook(meshes.destroy)
+    Resources.stream(vk_app.streamer)
 
     while not window.should_close():
         window.update()
         vk_app.draw_frame()
 
+    if track_latency and vk_app.present_timings.summary() is not None:
+        for name, seconds in vk_app.present_timings.summary().items():
+            print(f"{name}: {seconds * 1e3:.2f} ms")
+
     glfw.terminate()
     vk_app.cleanup()
 
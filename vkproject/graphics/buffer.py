@@ -0,0 +1,93 @@
+import numpy as np
+
+from vkproject.graphics.vulkan import *
+
+
+class Buffer:
+    """A VkBuffer in host visible memory, mapped once for its whole lifetime.
+
+    The mapping is exposed as data, a numpy array of count elements of dtype, so
+    per frame uniform and instance data is written with vectorized stores. On
+    memory that isn't host coherent writes have to be flushed before the GPU
+    reads them, and GPU writes invalidated before the host reads them.
+    """
+    def __init__(self, device, allocator, dtype, count, usage, preferred=0):
+        self.device = device
+        self.allocator = allocator
+        self.dtype = np.dtype(dtype)
+        self.count = count
+        self.size = self.dtype.itemsize * count
+        self.usage = usage
+        # e.g. DEVICE_LOCAL for data the GPU reads every frame, when the device has memory that is both
+        self.preferred = preferred
+        self.handle = None
+        self.allocation = None
+        self.data = None
+
+    def create(self):
+        buffer_info = VkBufferCreateInfo(
+            size=self.size,
+            usage=self.usage,
+            sharingMode=VK_SHARING_MODE_EXCLUSIVE,
+        )
+
+        self.handle = vkCreateBuffer(self.device, buffer_info, None)
+        self.allocation = self.allocator.allocate_buffer(self.handle, VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT, self.preferred)
+        self.data = self.array(self.dtype)
+
+    def host_coherent(self):
+        return self.allocation.host_coherent()
+
+    def array(self, dtype=np.uint8, count=None, offset=0):
+        """Another view of the mapping, count elements of dtype starting at byte offset"""
+        dtype = np.dtype(dtype)
+        if count is None:
+            count = (self.size - offset) // dtype.itemsize
+        return np.frombuffer(self.allocation.map(), dtype, count, offset)
+
+    def flush(self, first=0, count=None):
+        """Make host writes to elements [first, first + count) visible to the GPU"""
+        offset, size = self._byte_range(first, count)
+        self.allocation.flush(offset, size)
+
+    def invalidate(self, first=0, count=None):
+        """Make GPU writes to elements [first, first + count) visible to the host"""
+        offset, size = self._byte_range(first, count)
+        self.allocation.invalidate(offset, size)
+
+    def _byte_range(self, first, count):
+        if count is None:
+            count = self.count - first
+        return first * self.dtype.itemsize, count * self.dtype.itemsize
+
+    def destroy(self):
+        # drop the views before the memory behind them goes away
+        self.data = None
+        vkDestroyBuffer(self.device, self.handle, None)
+        self.allocation.free()
+
+class DeviceBuffer:
+    """A VkBuffer in device local memory, the host fills it through an UploadManager"""
+    def __init__(self, device, allocator, dtype, count, usage):
+        self.device = device
+        self.allocator = allocator
+        self.dtype = np.dtype(dtype)
+        self.count = count
+        self.size = self.dtype.itemsize * count
+        self.usage = usage | VK_BUFFER_USAGE_TRANSFER_DST_BIT
+        self.handle = None
+        self.allocation = None
+
+    def create(self):
+        buffer_info = VkBufferCreateInfo(
+            size=self.size,
+            usage=self.usage,
+            sharingMode=VK_SHARING_MODE_EXCLUSIVE,
+        )
+
+        self.handle = vkCreateBuffer(self.device, buffer_info, None)
+        self.allocation = self.allocator.allocate_buffer(self.handle, VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT)
+
+    def destroy(self):
+        vkDestroyBuffer(self.device, self.handle, None)
+        self.allocation.free()
\ No newline at end of file
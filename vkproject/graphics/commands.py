@@ -55,13 +55,21 @@ class CommandPool:
 
         return buffers
 
+    def free_command_buffers(self, buffers):
+        if buffers:
+            vkFreeCommandBuffers(self._device, self.handle, len(buffers), [buffer.handle for buffer in buffers])
+
+    def reset(self):
+        # returns every buffer allocated from the pool to the initial state in one call
+        vkResetCommandPool(self._device, self.handle, 0)
+
     def destroy(self):
         vkDestroyCommandPool(self._device, self.handle, None)
 
 class CommandBufferRecordingType(enum.Enum):
     NONE = 0
     ONE_TIME_SUBMIT = VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT
-    RENDER_PASS_CONTINUE = VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT,
+    RENDER_PASS_CONTINUE = VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT
     SIMULTANEOUS = VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT
 
 class CommandBuffer:
@@ -70,6 +78,8 @@ class CommandBuffer:
         self._pool = pool
         self._primary = True
         self.handle = handle
+        self._inheritance_info = None
+        self._secondary_begin_info = None
 
     def primary(self):
         self._primary = True
@@ -95,8 +105,62 @@ class CommandBuffer:
         begin_info = VkCommandBufferBeginInfo(flags=recording_type.value, pInheritanceInfo=None)
         vkBeginCommandBuffer(self.handle, begin_info)
 
+    def begin_secondary(self, render_pass, framebuffer, recording_type=CommandBufferRecordingType.RENDER_PASS_CONTINUE):
+        # secondaries are begun every frame, so the begin and inheritance info are built once and patched
+        if self._secondary_begin_info is None:
+            self._inheritance_info = VkCommandBufferInheritanceInfo(subpass=0)
+            self._secondary_begin_info = VkCommandBufferBeginInfo(flags=0, pInheritanceInfo=self._inheritance_info)
+
+        self._inheritance_info.renderPass = render_pass
+        self._inheritance_info.framebuffer = framebuffer
+        self._secondary_begin_info.flags = recording_type.value | VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT
+        vkBeginCommandBuffer(self.handle, self._secondary_begin_info)
+
     def reset(self):
         vkResetCommandBuffer(self.handle, 0)
 
     def end_recording(self):
-        vkEndCommandBuffer(self.handle)
\ No newline at end of file
+        vkEndCommandBuffer(self.handle)
+
+class RecordedCommandBuffers:
+    """One command buffer per swapchain image, recorded once and resubmitted every frame.
+
+    record(buffer, image_idx) is called the first time an image is drawn and
+    again only after invalidate() or a swapchain recreate, the buffers are
+    recorded for simultaneous use so a replay can be queued while the previous
+    submission of the same image is still executing.
+    With retire (see FrameRing.retire) a recreate swaps in fresh buffers and frees
+    the old ones once their submissions finish, instead of re-recording buffers
+    the GPU may still be executing.
+    """
+    def __init__(self, pool, swap_chain, record, retire=None):
+        self._pool = pool
+        self._swap_chain = swap_chain
+        self._record = record
+        self._retire = retire
+        self._buffers = []
+        self._recorded = []
+        self._generation = None
+
+    def invalidate(self):
+        self._recorded = [False] * len(self._buffers)
+
+    def get(self, image_idx):
+        if self._generation != self._swap_chain.generation:
+            # swapchain was recreated, the framebuffers and extent baked into the buffers are gone
+            if self._retire is not None and self._generation is not None and self._buffers:
+                self._retire(lambda buffers=self._buffers: self._pool.free_command_buffers(buffers))
+                self._buffers = []
+            self._generation = self._swap_chain.generation
+            missing = self._swap_chain.image_count - len(self._buffers)
+            if missing > 0:
+                self._buffers += self._pool.create_command_buffers(missing)
+            self.invalidate()
+
+        buffer = self._buffers[image_idx]
+        if not self._recorded[image_idx]:
+            buffer.reset()
+            self._record(buffer, image_idx, CommandBufferRecordingType.SIMULTANEOUS)
+            self._recorded[image_idx] = True
+
+        return buffer
\ No newline at end of file
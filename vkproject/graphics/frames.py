@@ -0,0 +1,122 @@
+from vkproject.graphics.synchronization import SyncHandler
+from vkproject.graphics.vulkan import *
+
+
+class FrameSlot:
+    """Everything a single frame in flight owns.
+
+    A slot is only reused after its fence has signalled, so anything in it can be
+    overwritten or reset without waiting on the GPU again.
+    """
+    def __init__(self, index, command_buffer, sync_handler):
+        self.index = index
+        self.command_buffer = command_buffer
+        self.sync_handler = sync_handler
+        # transient cffi allocations made while recording and submitting the frame
+        self.arena = Arena()
+        # uniform buffers, descriptor sets... registered through FrameRing.register
+        self.resources = {}
+
+class FrameRing:
+    MIN_FRAMES_IN_FLIGHT = 1
+    MAX_FRAMES_IN_FLIGHT = 4
+
+    def __init__(self, device, command_pool, frames_in_flight, sync_factory=None):
+        FrameRing.validate_frames_in_flight(frames_in_flight)
+        self.device = device
+        self.command_pool = command_pool
+        # builds the SyncHandler (or TimelineSyncHandler) of a new slot
+        self.sync_factory = sync_factory or (lambda: SyncHandler(device))
+        self.frames_in_flight = frames_in_flight
+        self.slots = []
+        self.current = 0
+        # name -> (create(slot_index), destroy(resource))
+        self._factories = {}
+        # [slot waits left, destroy] for objects the GPU may still be using
+        self._retired = []
+
+    @staticmethod
+    def validate_frames_in_flight(frames_in_flight):
+        if not FrameRing.MIN_FRAMES_IN_FLIGHT <= frames_in_flight <= FrameRing.MAX_FRAMES_IN_FLIGHT:
+            raise ValueError(f"frames in flight must be between {FrameRing.MIN_FRAMES_IN_FLIGHT} and {FrameRing.MAX_FRAMES_IN_FLIGHT}, got {frames_in_flight}")
+
+    def create(self):
+        self._add_slots(self.frames_in_flight)
+
+    def _add_slots(self, count):
+        command_buffers = self.command_pool.create_command_buffers(count)
+        for command_buffer in command_buffers:
+            sync_handler = self.sync_factory()
+            sync_handler.create()
+            slot = FrameSlot(len(self.slots), command_buffer, sync_handler)
+            for name, (create, _) in self._factories.items():
+                slot.resources[name] = create(slot.index)
+            self.slots.append(slot)
+
+    def _destroy_slot(self, slot):
+        for name, (_, destroy) in self._factories.items():
+            if destroy is not None:
+                destroy(slot.resources[name])
+        slot.resources = {}
+        slot.sync_handler.destroy()
+        self.command_pool.free_command_buffers([slot.command_buffer])
+
+    def register(self, name, create, destroy=None):
+        """Give every slot its own copy of a resource, create is called with the slot index"""
+        self._factories[name] = (create, destroy)
+        for slot in self.slots:
+            slot.resources[name] = create(slot.index)
+
+    def resize(self, frames_in_flight):
+        FrameRing.validate_frames_in_flight(frames_in_flight)
+        if frames_in_flight == self.frames_in_flight:
+            return
+
+        # slots may still be in use by the GPU
+        SyncHandler.wait_idle(self.device)
+        self._destroy_retired()
+        if frames_in_flight > len(self.slots):
+            self._add_slots(frames_in_flight - len(self.slots))
+        else:
+            for slot in self.slots[frames_in_flight:]:
+                self._destroy_slot(slot)
+            del self.slots[frames_in_flight:]
+
+        self.frames_in_flight = frames_in_flight
+        self.current = 0
+
+    def slot(self):
+        return self.slots[self.current]
+
+    def retire(self, destroy):
+        """Call destroy once every frame submitted so far has finished, without waiting for the device"""
+        self._retired.append([self.frames_in_flight, destroy])
+
+    def frame_completed(self):
+        # the current slot has been waited on, one frame closer to releasing what was retired
+        if not self._retired:
+            return
+
+        pending = []
+        for retired in self._retired:
+            retired[0] -= 1
+            if retired[0] > 0:
+                pending.append(retired)
+            else:
+                retired[1]()
+        self._retired = pending
+
+    def _destroy_retired(self):
+        for _, destroy in self._retired:
+            destroy()
+        self._retired = []
+
+    def advance(self):
+        self.current = (self.current + 1) % self.frames_in_flight
+
+    def destroy(self):
+        self._destroy_retired()
+        for slot in self.slots:
+            self._destroy_slot(slot)
+        self.slots = []
+        self.current = 0
\ No newline at end of file
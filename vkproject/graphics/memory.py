@@ -0,0 +1,334 @@
+from vkproject.graphics.vulkan import *
+
+
+class MemoryProperties:
+    """Memory types, heaps and the limits an allocator needs, as plain python.
+
+    query() reads them from a physical device, building one by hand stands in
+    for a device when exercising an allocator.
+    """
+    def __init__(self, memory_types, heap_sizes, buffer_image_granularity=1, max_allocations=4096, non_coherent_atom_size=1):
+        # (property flags, heap index) per memory type, in the driver's order
+        self.memory_types = [tuple(memory_type) for memory_type in memory_types]
+        self.heap_sizes = list(heap_sizes)
+        self.buffer_image_granularity = buffer_image_granularity
+        self.max_allocations = max_allocations
+        self.non_coherent_atom_size = non_coherent_atom_size
+
+    @staticmethod
+    def query(physical_device):
+        memory = vkGetPhysicalDeviceMemoryProperties(physical_device, ffi.new("VkPhysicalDeviceMemoryProperties*"))
+        properties = ffi.new("VkPhysicalDeviceProperties*")
+        vkGetPhysicalDeviceProperties(physical_device, properties)
+        limits = properties.limits
+        return MemoryProperties(
+            [(memory.memoryTypes[i].propertyFlags, memory.memoryTypes[i].heapIndex) for i in range(memory.memoryTypeCount)],
+            [memory.memoryHeaps[i].size for i in range(memory.memoryHeapCount)],
+            limits.bufferImageGranularity,
+            limits.maxMemoryAllocationCount,
+            limits.nonCoherentAtomSize,
+        )
+
+    def flags(self, memory_type):
+        return self.memory_types[memory_type][0]
+
+    def heap_size(self, memory_type):
+        return self.heap_sizes[self.memory_types[memory_type][1]]
+
+    def find_memory_type(self, type_bits, required, preferred=0):
+        """First memory type allowed by type_bits with the required flags, one that also has preferred wins"""
+        fallback = None
+        for memory_type, (flags, _) in enumerate(self.memory_types):
+            if not type_bits & (1 << memory_type) or flags & required != required:
+                continue
+            if flags & preferred == preferred:
+                return memory_type
+            if fallback is None:
+                fallback = memory_type
+
+        if fallback is None:
+            raise RuntimeError(f"No memory type in {type_bits:#x} has flags {required:#x}")
+        return fallback
+
+class BuddyBlock:
+    """Buddy allocator bookkeeping for one range of memory.
+
+    Allocations are rounded up to a power of two no smaller than MIN_SIZE and
+    placed at an offset aligned to their own size, which satisfies any power of
+    two alignment up to that size. Freed ranges merge back with their buddy.
+    """
+    MIN_SIZE = 256
+
+    def __init__(self, size):
+        if size & (size - 1) or size < BuddyBlock.MIN_SIZE:
+            raise ValueError(f"block size must be a power of two of at least {BuddyBlock.MIN_SIZE}, got {size}")
+
+        self.size = size
+        self._min_order = BuddyBlock.MIN_SIZE.bit_length() - 1
+        self._max_order = size.bit_length() - 1
+        # order -> offsets of free ranges of 2**order bytes
+        self._free = {order: set() for order in range(self._min_order, self._max_order + 1)}
+        self._free[self._max_order].add(0)
+        # offset -> order of every live allocation
+        self._allocated = {}
+        # bytes handed out, after rounding
+        self.used = 0
+
+    def _order(self, size, alignment):
+        return max(self._min_order, (max(size, alignment) - 1).bit_length())
+
+    def allocate(self, size, alignment=1):
+        """Offset of a new allocation, None if no free range is large enough"""
+        order = self._order(size, alignment)
+        for found in range(order, self._max_order + 1):
+            if self._free[found]:
+                break
+        else:
+            return None
+
+        offset = self._free[found].pop()
+        # split down to the size asked for, the upper halves become free
+        while found > order:
+            found -= 1
+            self._free[found].add(offset + (1 << found))
+
+        self._allocated[offset] = order
+        self.used += 1 << order
+        return offset
+
+    def free(self, offset):
+        order = self._allocated.pop(offset)
+        self.used -= 1 << order
+        while order < self._max_order:
+            buddy = offset ^ (1 << order)
+            if buddy not in self._free[order]:
+                break
+            self._free[order].remove(buddy)
+            offset = min(offset, buddy)
+            order += 1
+
+        self._free[order].add(offset)
+
+    def largest_free(self):
+        for order in range(self._max_order, self._min_order - 1, -1):
+            if self._free[order]:
+                return 1 << order
+        return 0
+
+    def empty(self):
+        return not self._allocated
+
+    def __len__(self):
+        return len(self._allocated)
+
+class MemoryBlock:
+    def __init__(self, memory, memory_type, size):
+        self.memory = memory
+        self.memory_type = memory_type
+        self.size = size
+        self.buddy = BuddyBlock(size)
+        # host visible blocks are mapped once, on first use, and stay mapped
+        self.mapped = None
+
+class Allocation:
+    """A range of a VkDeviceMemory handed out by a MemoryAllocator"""
+    def __init__(self, allocator, memory, offset, size, memory_type, block=None):
+        self._allocator = allocator
+        self.memory = memory
+        self.offset = offset
+        self.size = size
+        self.memory_type = memory_type
+        # None for dedicated allocations that own their VkDeviceMemory
+        self.block = block
+        self._mapped = None
+
+    def host_coherent(self):
+        return bool(self._allocator.properties.flags(self.memory_type) & VK_MEMORY_PROPERTY_HOST_COHERENT_BIT)
+
+    def map(self):
+        """Writable memoryview over the allocation, the memory stays mapped until it is freed"""
+        if self._mapped is None:
+            self._mapped = self._allocator.map(self)
+        return self._mapped
+
+    def flush(self, offset=0, size=None):
+        self._allocator.flush(self, offset, size)
+
+    def invalidate(self, offset=0, size=None):
+        self._allocator.invalidate(self, offset, size)
+
+    def free(self):
+        self._allocator.free(self)
+
+class MemoryAllocator:
+    """Sub-allocates buffers and images out of large per memory type VkDeviceMemory blocks.
+
+    Drivers cap the number of live allocations (maxMemoryAllocationCount, often
+    4096) and allocating is slow, so resources share blocks managed by a
+    BuddyBlock. Anything larger than half a block gets a dedicated allocation.
+    """
+    DEFAULT_BLOCK_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, device, properties, block_size=DEFAULT_BLOCK_SIZE):
+        self.device = device
+        self.properties = properties
+        self.block_size = block_size
+        # memory type -> [MemoryBlock]
+        self._blocks = {}
+        self._dedicated = set()
+        # live vkAllocateMemory results, blocks and dedicated
+        self.device_allocations = 0
+        self.requested_bytes = 0
+        # patched for every flush and invalidate
+        self._range = VkMappedMemoryRange()
+
+    def _block_size(self, memory_type):
+        # small heaps (BAR memory, integrated GPUs) would be eaten by a few full sized blocks
+        size = self.block_size
+        while size > self.properties.heap_size(memory_type) // 8 and size > BuddyBlock.MIN_SIZE:
+            size //= 2
+        return size
+
+    def _allocate_memory(self, size, memory_type):
+        allocate_info = VkMemoryAllocateInfo(
+            allocationSize=size,
+            memoryTypeIndex=memory_type,
+        )
+        memory = vkAllocateMemory(self.device, allocate_info, None)
+        self.device_allocations += 1
+        return memory
+
+    def _free_memory(self, memory):
+        vkFreeMemory(self.device, memory, None)
+        self.device_allocations -= 1
+
+    def _non_coherent(self, memory_type):
+        flags = self.properties.flags(memory_type)
+        return flags & VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT and not flags & VK_MEMORY_PROPERTY_HOST_COHERENT_BIT
+
+    def allocate(self, size, alignment, type_bits, required, preferred=0, linear=True):
+        """Allocate memory for a resource's VkMemoryRequirements.
+
+        linear is False for optimally tiled images, they are kept on their own
+        bufferImageGranularity pages so they never share one with a buffer.
+        """
+        memory_type = self.properties.find_memory_type(type_bits, required, preferred)
+        if not linear:
+            granularity = self.properties.buffer_image_granularity
+            alignment = max(alignment, granularity)
+            size = max(size, granularity)
+        if self._non_coherent(memory_type):
+            # flushes round out to whole atoms, they must not reach into a neighbour
+            atom = self.properties.non_coherent_atom_size
+            alignment = max(alignment, atom)
+            size = -(-size // atom) * atom
+        self.requested_bytes += size
+
+        block_size = self._block_size(memory_type)
+        if size > block_size // 2:
+            allocation = Allocation(self, self._allocate_memory(size, memory_type), 0, size, memory_type)
+            self._dedicated.add(allocation)
+            return allocation
+
+        blocks = self._blocks.setdefault(memory_type, [])
+        for block in blocks:
+            offset = block.buddy.allocate(size, alignment)
+            if offset is not None:
+                return Allocation(self, block.memory, offset, size, memory_type, block)
+
+        block = MemoryBlock(self._allocate_memory(block_size, memory_type), memory_type, block_size)
+        blocks.append(block)
+        return Allocation(self, block.memory, block.buddy.allocate(size, alignment), size, memory_type, block)
+
+    def allocate_buffer(self, buffer, required, preferred=0):
+        requirements = vkGetBufferMemoryRequirements(self.device, buffer)
+        allocation = self.allocate(requirements.size, requirements.alignment, requirements.memoryTypeBits, required, preferred)
+        vkBindBufferMemory(self.device, buffer, allocation.memory, allocation.offset)
+        return allocation
+
+    def allocate_image(self, image, required, preferred=0, linear=False):
+        requirements = vkGetImageMemoryRequirements(self.device, image)
+        allocation = self.allocate(requirements.size, requirements.alignment, requirements.memoryTypeBits, required, preferred, linear)
+        vkBindImageMemory(self.device, image, allocation.memory, allocation.offset)
+        return allocation
+
+    def map(self, allocation):
+        if not self.properties.flags(allocation.memory_type) & VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT:
+            raise RuntimeError(f"Memory type {allocation.memory_type} is not host visible")
+
+        block = allocation.block
+        if block is None:
+            return memoryview(vkMapMemory(self.device, allocation.memory, 0, allocation.size, 0))
+
+        if block.mapped is None:
+            block.mapped = memoryview(vkMapMemory(self.device, block.memory, 0, block.size, 0))
+        return block.mapped[allocation.offset:allocation.offset + allocation.size]
+
+    def _memory_range(self, allocation, offset, size):
+        if size is None:
+            size = allocation.size - offset
+        atom = self.properties.non_coherent_atom_size
+        start = (allocation.offset + offset) // atom * atom
+        end = -(-(allocation.offset + offset + size) // atom) * atom
+
+        self._range.memory = allocation.memory
+        self._range.offset = start
+        self._range.size = end - start
+        return self._range
+
+    def flush(self, allocation, offset=0, size=None):
+        """Make host writes to a range of a mapped allocation visible to the device, a no-op on coherent memory"""
+        if self._non_coherent(allocation.memory_type):
+            vkFlushMappedMemoryRanges(self.device, 1, self._memory_range(allocation, offset, size))
+
+    def invalidate(self, allocation, offset=0, size=None):
+        """Make device writes to a range of a mapped allocation visible to the host, a no-op on coherent memory"""
+        if self._non_coherent(allocation.memory_type):
+            vkInvalidateMappedMemoryRanges(self.device, 1, self._memory_range(allocation, offset, size))
+
+    def free(self, allocation):
+        self.requested_bytes -= allocation.size
+        block = allocation.block
+        if block is None:
+            self._dedicated.remove(allocation)
+            self._free_memory(allocation.memory)
+            return
+
+        block.buddy.free(allocation.offset)
+        blocks = self._blocks[block.memory_type]
+        # keep one empty block around so a free/allocate pattern doesn't thrash the driver
+        if block.buddy.empty() and sum(1 for other in blocks if other.buddy.empty()) > 1:
+            blocks.remove(block)
+            self._free_memory(block.memory)
+
+    def stats(self):
+        per_type = {}
+        for memory_type, blocks in self._blocks.items():
+            per_type[memory_type] = {
+                "blocks": len(blocks),
+                "allocations": sum(len(block.buddy) for block in blocks),
+                "reserved_bytes": sum(block.size for block in blocks),
+                "used_bytes": sum(block.buddy.used for block in blocks),
+                "largest_free": max((block.buddy.largest_free() for block in blocks), default=0),
+            }
+
+        return {
+            "device_allocations": self.device_allocations,
+            "max_device_allocations": self.properties.max_allocations,
+            "dedicated": len(self._dedicated),
+            "allocations": sum(entry["allocations"] for entry in per_type.values()) + len(self._dedicated),
+            "requested_bytes": self.requested_bytes,
+            "reserved_bytes": sum(entry["reserved_bytes"] for entry in per_type.values()) + sum(allocation.size for allocation in self._dedicated),
+            "memory_types": per_type,
+        }
+
+    def destroy(self):
+        for blocks in self._blocks.values():
+            for block in blocks:
+                self._free_memory(block.memory)
+        for allocation in self._dedicated:
+            self._free_memory(allocation.memory)
+
+        self._blocks = {}
+        self._dedicated = set()
+        self.requested_bytes = 0
\ No newline at end of file
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.rendering import BufferRenderer
+from vkproject.graphics.vulkan import *
+
+
+class ParallelRecorder:
+    """Records a frame's draw list into secondary command buffers on a thread pool.
+
+    Every worker slot owns a transient CommandPool and one secondary buffer per
+    frame in flight, so no two threads ever touch the same pool. The pools of a
+    frame are reset in one call when that frame is recorded again, which is safe
+    because its fence has been waited on by then. cffi releases the GIL for the
+    duration of every Vulkan call. The secondaries are one time submit and only
+    live until their frame records again, so the primaries executing them can't
+    be cached and replayed.
+    """
+    def __init__(self, device, queue_family, frames_in_flight, workers, min_draws_per_worker=64):
+        self.device = device
+        self.queue_family = queue_family
+        self.frames_in_flight = frames_in_flight
+        self.workers = workers
+        # splitting a short draw list costs more in thread handoff than it saves
+        self.min_draws_per_worker = min_draws_per_worker
+        self._pools = []
+        self._buffers = []
+        self._handles = []
+        self._executor = None
+
+    def create(self):
+        for _ in range(self.frames_in_flight):
+            pools = []
+            buffers = []
+            for _ in range(self.workers):
+                pool = CommandPool(self.device, self.queue_family)
+                pool.transient()
+                pool.create()
+                pools.append(pool)
+                buffers.append(pool.create_command_buffers(1, primary=False)[0])
+
+            self._pools.append(pools)
+            self._buffers.append(buffers)
+            self._handles.append(ffi.new("VkCommandBuffer[]", [buffer.handle for buffer in buffers]))
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vk-record")
+
+    def record(self, primary, frame, render_pass, framebuffer, setup, draws):
+        """Record draws into the render pass that primary has begun with secondary contents
+
+        setup(renderer) runs at the start of every secondary buffer, pipeline and
+        dynamic state aren't inherited from the primary. Every draw is a callable
+        taking a BufferRenderer.
+        """
+        count = max(1, min(self.workers, len(draws) // self.min_draws_per_worker))
+        chunk = -(-len(draws) // count)
+        for pool in self._pools[frame][:count]:
+            pool.reset()
+
+        buffers = self._buffers[frame]
+        if count == 1:
+            self._record_chunk(buffers[0], render_pass, framebuffer, setup, draws)
+        else:
+            futures = [
+                self._executor.submit(self._record_chunk, buffers[i], render_pass, framebuffer, setup, draws[i * chunk:(i + 1) * chunk])
+                for i in range(count)
+            ]
+            for future in futures:
+                future.result()
+
+        vkCmdExecuteCommands(primary.handle, count, self._handles[frame])
+
+    @staticmethod
+    def _record_chunk(buffer, render_pass, framebuffer, setup, draws):
+        buffer.begin_secondary(render_pass, framebuffer)
+        renderer = BufferRenderer(buffer)
+        setup(renderer)
+        for draw in draws:
+            draw(renderer)
+        buffer.end_recording()
+
+    def destroy(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        for pools in self._pools:
+            for pool in pools:
+                pool.destroy()
+
+        self._pools = []
+        self._buffers = []
+        self._handles = []
\ No newline at end of file
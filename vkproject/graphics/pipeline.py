@@ -1,26 +1,235 @@
+import os
+import struct
+import tempfile
+
 from vkproject.graphics.vulkan import *
 from vkproject.resources.shaders import Shader, ShaderType
 
 
-class GraphicsPipeline:
-    def __init__(self, app, shaders: dict[ShaderType, Shader]):
-        self._app = app
-        self._shaders = shaders
-        self._layout = None
+class PipelineCache:
+    """A VkPipelineCache shared by every pipeline on the device and kept on disk between runs.
+
+    The file is named after the vendor, device, driver version and pipeline cache
+    UUID, so a driver update or another GPU starts cold instead of handing the
+    driver data it would throw away.
+    """
+    DEFAULT_DIRECTORY = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "vkproject")
+    # VkPipelineCacheHeaderVersionOne, every cache blob starts with it
+    _HEADER = struct.Struct("=IIII16s")
+
+    def __init__(self, device, physical_device, directory=DEFAULT_DIRECTORY):
+        self.device = device
+        self.directory = directory
+        properties = ffi.new("VkPhysicalDeviceProperties*")
+        vkGetPhysicalDeviceProperties(physical_device, properties)
+        self._vendor_id = properties.vendorID
+        self._device_id = properties.deviceID
+        self._uuid = bytes(ffi.buffer(properties.pipelineCacheUUID))
+        self.path = os.path.join(directory, f"pipelines-{self._vendor_id:04x}-{self._device_id:04x}-{properties.driverVersion:08x}-{self._uuid.hex()}.bin")
         self.handle = None
+        # what the cache was seeded with, None for a cold start
+        self._loaded = None
+
+    @property
+    def warm(self):
+        return self._loaded is not None
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < PipelineCache._HEADER.size:
+            return None
+        header_size, version, vendor_id, device_id, uuid = PipelineCache._HEADER.unpack_from(data)
+        if version != VK_PIPELINE_CACHE_HEADER_VERSION_ONE or (vendor_id, device_id, uuid) != (self._vendor_id, self._device_id, self._uuid):
+            return None
+
+        return data
 
     def create(self):
-        modules = []
-        stages = []
+        self._loaded = self._load()
+        if self._loaded is None:
+            create_info = VkPipelineCacheCreateInfo(initialDataSize=0, pInitialData=None)
+        else:
+            create_info = VkPipelineCacheCreateInfo(initialDataSize=len(self._loaded), pInitialData=ffi.from_buffer(self._loaded))
+
+        self.handle = vkCreatePipelineCache(self.device, create_info, None)
+
+    def save(self):
+        """Atomically replace the file with the current cache, returns False if it couldn't be written"""
+        data = vkGetPipelineCacheData(self.device, self.handle)
+        if data == self._loaded:
+            return True
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # written next to the target so the rename never crosses filesystems
+            fd, temp_path = tempfile.mkstemp(prefix=".pipelines-", suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # a missing cache only costs startup time
+            return False
+
+        self._loaded = data
+        return True
+
+    def destroy(self):
+        vkDestroyPipelineCache(self.device, self.handle, None)
+
+class PipelineDescription:
+    """Everything a graphics pipeline is built from, hashable so identical descriptions share one VkPipeline.
+
+    Vertex bindings are (binding, stride, input_rate) and attributes are
+    (location, binding, format, offset) tuples, vertex.vertex_input() builds
+    both from VertexLayouts. Viewport and scissor are dynamic
+    state, the extent is not part of a pipeline.
+    """
+    def __init__(self, shaders: dict[ShaderType, Shader],
+                 vertex_bindings=(), vertex_attributes=(),
+                 topology=VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST,
+                 polygon_mode=VK_POLYGON_MODE_FILL,
+                 cull_mode=VK_CULL_MODE_BACK_BIT,
+                 front_face=VK_FRONT_FACE_CLOCKWISE,
+                 blend=True,
+                 push_constant_ranges=()):
+        self.shaders = shaders
+        self.vertex_bindings = tuple(vertex_bindings)
+        self.vertex_attributes = tuple(vertex_attributes)
+        self.topology = topology
+        self.polygon_mode = polygon_mode
+        self.cull_mode = cull_mode
+        self.front_face = front_face
+        self.blend = blend
+        # (stage flags, offset, size)
+        self.push_constant_ranges = tuple(push_constant_ranges)
+        self._key = None
+
+    def layout_key(self):
+        return self.push_constant_ranges
+
+    def key(self):
+        if self._key is None:
+            self._key = (
+                tuple(sorted((shader_type.value, shader.digest()) for shader_type, shader in self.shaders.items())),
+                self.vertex_bindings,
+                self.vertex_attributes,
+                self.topology,
+                self.polygon_mode,
+                self.cull_mode,
+                self.front_face,
+                self.blend,
+                self.layout_key(),
+            )
+        return self._key
+
+    def __eq__(self, other):
+        return isinstance(other, PipelineDescription) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+class GraphicsPipeline:
+    """A VkPipeline and its layout, owned and destroyed by the PipelineRegistry that built it"""
+    def __init__(self, handle, layout, description):
+        self.handle = handle
+        self.layout = layout
+        self.description = description
+
+class PipelineRegistry:
+    """Builds each distinct pipeline once and shares layouts and shader modules between them.
 
-        for shader_type, shader in self._shaders.items():
-            module = self._create_shader_module(shader)
+    Pipelines are keyed by their description and the render pass compatibility
+    key, so a recreated but compatible render pass keeps its pipelines.
+    """
+    def __init__(self, device, pipeline_cache=None):
+        self.device = device
+        self.pipeline_cache = pipeline_cache
+        # shader digest -> VkShaderModule
+        self._modules = {}
+        # PipelineDescription.layout_key() -> VkPipelineLayout
+        self._layouts = {}
+        # (description key, render pass key) -> GraphicsPipeline
+        self._pipelines = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, description, render_pass):
+        key = (description.key(), render_pass.compatibility_key())
+        pipeline = self._pipelines.get(key)
+        if pipeline is not None:
+            self.hits += 1
+            return pipeline
+
+        self.misses += 1
+        # the create info tree is only needed until vkCreateGraphicsPipelines returns
+        with Arena():
+            pipeline = self._create(description, render_pass)
+        self._pipelines[key] = pipeline
+        return pipeline
+
+    def discard(self, render_pass_key, retire=None):
+        """Drop the pipelines made for render passes with render_pass_key, e.g. after the surface format changed.
+
+        They are destroyed right away, or through retire (usually FrameRing.retire)
+        once the frames that may still use them are done.
+        """
+        stale = [key for key in self._pipelines if key[1] == render_pass_key]
+        handles = [self._pipelines.pop(key).handle for key in stale]
+
+        def destroy():
+            for handle in handles:
+                vkDestroyPipeline(self.device, handle, None)
+
+        if retire is None:
+            destroy()
+        else:
+            retire(destroy)
+
+    def shader_module(self, shader: Shader):
+        module = self._modules.get(shader.digest())
+        if module is None:
+            create_info = VkShaderModuleCreateInfo(
+                codeSize = len(shader.data),
+                pCode = shader.data
+            )
+            module = self._modules[shader.digest()] = vkCreateShaderModule(self.device, create_info, None)
+
+        return module
+
+    def layout(self, description):
+        key = description.layout_key()
+        layout = self._layouts.get(key)
+        if layout is None:
+            push_constant_ranges = [VkPushConstantRange(stageFlags=stages, offset=offset, size=size) for stages, offset, size in key]
+            pipeline_layout = VkPipelineLayoutCreateInfo(
+                setLayoutCount=0,
+                pSetLayouts=None,
+                pushConstantRangeCount=len(push_constant_ranges),
+                pPushConstantRanges=push_constant_ranges or None,
+            )
+            layout = self._layouts[key] = vkCreatePipelineLayout(self.device, pipeline_layout, None)
+
+        return layout
+
+    def _create(self, description, render_pass):
+        stages = []
+        for shader_type, shader in description.shaders.items():
             stage_info = VkPipelineShaderStageCreateInfo(
                 stage = shader_type.stage(),
-                module=module,
+                module=self.shader_module(shader),
                 pName="main" # entrypoint name
             )
-            modules.append(module)
             stages.append(stage_info)
 
         #Values that are likely to change so that the graphics pipeline doesn't have to be recreated on render
@@ -33,46 +242,35 @@ class GraphicsPipeline:
             pDynamicStates=dynamic_states,
         )
 
+        bindings = [VkVertexInputBindingDescription(binding=binding, stride=stride, inputRate=input_rate) for binding, stride, input_rate in description.vertex_bindings]
+        attributes = [VkVertexInputAttributeDescription(location=location, binding=binding, format=attribute_format, offset=offset) for location, binding, attribute_format, offset in description.vertex_attributes]
         vertex_input_info = VkPipelineVertexInputStateCreateInfo(
-            vertexBindingDescriptionCount=0,
-            pVertexBindingDescriptions=None,
-            vertexAttributeDescriptionCount=0,
-            pVertexAttributeDescriptions=None,
+            vertexBindingDescriptionCount=len(bindings),
+            pVertexBindingDescriptions=bindings or None,
+            vertexAttributeDescriptionCount=len(attributes),
+            pVertexAttributeDescriptions=attributes or None,
         )
 
         input_assembly_info = VkPipelineInputAssemblyStateCreateInfo(
-            topology=VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST, # 3 vertices per triangle with no reuse
+            topology=description.topology,
             primitiveRestartEnable=VK_FALSE, # when this is true it allows the element buffer to use the special indices 0xFFFF and 0xFFFFFFFF to breakup lines and triangles in STRIP modes
         )
 
-        viewport = VkViewport(
-            x=0.0,
-            y=0.0,
-            width=self._app.swap_chain.extent.width,
-            height=self._app.swap_chain.extent.height,
-            minDepth=0.0,
-            maxDepth=1.0
-        )
-
-        scissor = VkRect2D(
-            offset=VkOffset2D(0.0, 0.0),
-            extent=self._app.swap_chain.extent,
-        )
-
+        # viewport and scissor are dynamic, only their count is baked into the pipeline
         viewport_state = VkPipelineViewportStateCreateInfo(
             viewportCount=1,
             scissorCount=1,
-            pViewports=[viewport],
-            pScissors=[scissor],
+            pViewports=None,
+            pScissors=None,
         )
 
         rasterizer = VkPipelineRasterizationStateCreateInfo(
             depthClampEnable=VK_FALSE, # enabling this clamps depth values outside the viewport's range instead of discarding them
             rasterizerDiscardEnable=VK_FALSE, # if this is true geometry never passes through rasterization effectively disabling framebuffer output
-            polygonMode=VK_POLYGON_MODE_FILL,
+            polygonMode=description.polygon_mode,
             lineWidth=1.0,
-            cullMode=VK_CULL_MODE_BACK_BIT,
-            frontFace=VK_FRONT_FACE_CLOCKWISE,
+            cullMode=description.cull_mode,
+            frontFace=description.front_face,
             depthBiasEnable=VK_FALSE,
             depthBiasConstantFactor=0.0,
             depthBiasClamp=0.0,
@@ -93,7 +291,7 @@ class GraphicsPipeline:
         # finalColor.a = newAlpha.a;
         color_blend_attachment = VkPipelineColorBlendAttachmentState(
             colorWriteMask=VK_COLOR_COMPONENT_R_BIT | VK_COLOR_COMPONENT_G_BIT | VK_COLOR_COMPONENT_B_BIT | VK_COLOR_COMPONENT_A_BIT,
-            blendEnable=VK_TRUE,
+            blendEnable=VK_TRUE if description.blend else VK_FALSE,
             srcColorBlendFactor=VK_BLEND_FACTOR_SRC_ALPHA,
             dstColorBlendFactor=VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA,
             colorBlendOp=VK_BLEND_OP_ADD,
@@ -110,17 +308,9 @@ class GraphicsPipeline:
             blendConstants=[0.0, 0.0, 0.0, 0.0],
         )
 
-        pipeline_layout = VkPipelineLayoutCreateInfo(
-            setLayoutCount=0,
-            pSetLayouts=None,
-            pushConstantRangeCount=0,
-            pPushConstantRanges=None,
-        )
-
-        self._layout = vkCreatePipelineLayout(self._app.device, pipeline_layout, None)
-
+        layout = self.layout(description)
         create_info = VkGraphicsPipelineCreateInfo(
-            stageCount=len(self._shaders),
+            stageCount=len(stages),
             pStages=stages,
             pVertexInputState=vertex_input_info,
             pInputAssemblyState=input_assembly_info,
@@ -130,26 +320,34 @@ class GraphicsPipeline:
             pDepthStencilState=None,
             pColorBlendState=color_blending,
             pDynamicState=dynamic_state_info,
-            layout=self._layout,
-            renderPass=self._app.render_pass.handle,
+            layout=layout,
+            renderPass=render_pass.handle,
             subpass=0,
             basePipelineHandle=VK_NULL_HANDLE,
             basePipelineIndex=-1
         )
 
-        self.handle = vkCreateGraphicsPipelines(self._app.device, VK_NULL_HANDLE, 1, [create_info], None)[0]
-
-        for module in modules:
-            vkDestroyShaderModule(self._app.device, module, None)
+        pipeline_cache = VK_NULL_HANDLE if self.pipeline_cache is None else self.pipeline_cache.handle
+        handle = vkCreateGraphicsPipelines(self.device, pipeline_cache, 1, [create_info], None)[0]
+        return GraphicsPipeline(handle, layout, description)
 
-    def _create_shader_module(self, shader: Shader):
-        create_info = VkShaderModuleCreateInfo(
-            codeSize = len(shader.data),
-            pCode = shader.data
-        )
-
-        return vkCreateShaderModule(self._app.device, create_info, None)
+    def stats(self):
+        return {
+            "pipelines": len(self._pipelines),
+            "layouts": len(self._layouts),
+            "shader_modules": len(self._modules),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
 
     def destroy(self):
-        vkDestroyPipeline(self._app.device, self.handle, None)
-        vkDestroyPipelineLayout(self._app.device, self._layout, None)
+        for pipeline in self._pipelines.values():
+            vkDestroyPipeline(self.device, pipeline.handle, None)
+        for layout in self._layouts.values():
+            vkDestroyPipelineLayout(self.device, layout, None)
+        for module in self._modules.values():
+            vkDestroyShaderModule(self.device, module, None)
+
+        self._pipelines = {}
+        self._layouts = {}
+        self._modules = {}
\ No newline at end of file
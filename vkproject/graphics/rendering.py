@@ -1,5 +1,6 @@
+from vkproject.graphics.vertex import index_type
 from vkproject.graphics.vulkan import *
-from vkproject.math import Viewport, Rect2D, Vec2
+from vkproject.math import Viewport, Rect2D
 
 
 class BufferRenderer:
@@ -10,21 +11,41 @@ class BufferRenderer:
         vkCmdBindPipeline(self.buffer.handle, VK_PIPELINE_BIND_POINT_GRAPHICS, pipeline.handle)
 
     def set_viewport(self, viewport: Viewport):
-        vk_vp = viewport.vk()
-        vkCmdSetViewport(self.buffer.handle, 0, 1, [vk_vp])
+        vkCmdSetViewport(self.buffer.handle, 0, 1, viewport.vk_array())
 
     def set_scissor(self, scissor: Rect2D):
-        vk_rect = scissor.vk()
-        vkCmdSetScissor(self.buffer.handle, 0, 1, [vk_rect])
+        vkCmdSetScissor(self.buffer.handle, 0, 1, scissor.vk_array())
 
     def no_scissor(self, swap_chain):
-        ext = Vec2.from_vk_extent(swap_chain.extent)
-        self.set_scissor(Rect2D(Vec2(0, 0), ext))
+        self.set_scissor(swap_chain.scissor)
+
+    def bind_vertex_buffers(self, buffers, first_binding=0, offsets=None):
+        """Bind Buffers to consecutive bindings, offsets are in bytes"""
+        handles = ffi.new("VkBuffer[]", [buffer.handle for buffer in buffers])
+        vk_offsets = ffi.new("VkDeviceSize[]", offsets or len(buffers))
+        vkCmdBindVertexBuffers(self.buffer.handle, first_binding, len(buffers), handles, vk_offsets)
+
+    def bind_index_buffer(self, buffer, offset=0):
+        """Bind a Buffer of uint16 or uint32 indices, the index type comes from its dtype"""
+        vkCmdBindIndexBuffer(self.buffer.handle, buffer.handle, offset, index_type(buffer.dtype))
 
     def draw(self, vertex_count, instance_count, first_vertex, first_instance):
         vkCmdDraw(self.buffer.handle, vertex_count, instance_count, first_vertex, first_instance)
 
+    def draw_indexed(self, index_count, instance_count=1, first_index=0, vertex_offset=0, first_instance=0):
+        vkCmdDrawIndexed(self.buffer.handle, index_count, instance_count, first_index, vertex_offset, first_instance)
+
+    def draw_mesh(self, vertices, indices=None, instance_count=1, first_instance=0):
+        """Draw a whole vertex Buffer, through an index Buffer if there is one"""
+        self.bind_vertex_buffers([vertices])
+        if indices is None:
+            self.draw(vertices.count, instance_count, 0, first_instance)
+            return
+
+        self.bind_index_buffer(indices)
+        self.draw_indexed(indices.count, instance_count, 0, 0, first_instance)
+
     def sample_render(self, swap_chain):
-        self.set_viewport(Viewport(pos=Vec2(0, 0), size=Vec2.from_vk_extent(swap_chain.extent), min_depth=0.0, max_depth=1.0))
+        self.set_viewport(swap_chain.viewport)
         self.no_scissor(swap_chain)
         self.draw(3, 1, 0, 0)
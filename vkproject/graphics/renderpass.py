@@ -7,6 +7,9 @@ class RenderPass:
         self.device = device
         self.swap_chain = swap_chain
         self.handle = None
+        self._clear_values = None
+        # begin info per swap chain image, rebuilt only when its framebuffer or extent changes
+        self._begin_infos = {}
 
     def create(self):
         color_attachment = VkAttachmentDescription(
@@ -51,21 +54,32 @@ class RenderPass:
 
         self.handle = vkCreateRenderPass(self.device, create_info, None)
 
-    def begin(self, command_buffer, frame_buffers, image_idx):
         clear_color = VkClearColorValue(float32=[0.0, 0.0, 0.0, 1.0])
-        clear_value = VkClearValue(clear_color)
-        info = VkRenderPassBeginInfo(
-            renderPass=self.handle,
-            framebuffer=frame_buffers.handles[image_idx],
-            renderArea=VkRect2D(
-                offset=VkOffset2D(0.0, 0.0),
-                extent=self.swap_chain.extent
-            ),
-            clearValueCount=1,
-            pClearValues=[clear_value],
-        )
+        self._clear_values = ffi.new("VkClearValue[]", [VkClearValue(clear_color)])
+        self._begin_infos = {}
+
+    def compatibility_key(self):
+        # render passes with the same attachment formats and sample counts can share pipelines
+        return (self.swap_chain.surface_format.format, VK_SAMPLE_COUNT_1_BIT)
+
+    def begin(self, command_buffer, frame_buffers, image_idx, contents=VK_SUBPASS_CONTENTS_INLINE):
+        framebuffer = frame_buffers.handles[image_idx]
+        extent = self.swap_chain.extent
+        info = self._begin_infos.get(image_idx)
+        if info is None or info.framebuffer != framebuffer or info.renderArea.extent.width != extent.width or info.renderArea.extent.height != extent.height:
+            info = VkRenderPassBeginInfo(
+                renderPass=self.handle,
+                framebuffer=framebuffer,
+                renderArea=VkRect2D(
+                    offset=VkOffset2D(0.0, 0.0),
+                    extent=extent
+                ),
+                clearValueCount=1,
+                pClearValues=self._clear_values,
+            )
+            self._begin_infos[image_idx] = info
 
-        vkCmdBeginRenderPass(command_buffer.handle, info, VK_SUBPASS_CONTENTS_INLINE)
+        vkCmdBeginRenderPass(command_buffer.handle, info, contents)
 
     def end(self, command_buffer):
         vkCmdEndRenderPass(command_buffer.handle)
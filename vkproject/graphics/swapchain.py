@@ -1,10 +1,84 @@
+import collections
+import enum
+import statistics
+
 import glfw
 
 from vkproject.graphics.synchronization import SyncHandler
 from vkproject.graphics.vulkan import *
 from vkproject.graphics.vulkan.extensions.khr import *
-from vkproject.math import Vec2
+from vkproject.math import Vec2, Rect2D, Viewport
+
+
+class PresentPolicy(enum.Enum):
+    """Trades latency against power and throughput.
+
+    A policy picks the present mode, how many images beyond the surface
+    minimum to ask for and how many frames the CPU may queue ahead.
+    """
+    LOW_LATENCY = "low_latency"
+    VSYNC = "vsync"
+    UNCAPPED = "uncapped"
+    POWER_SAVER = "power_saver"
+
+    def present_modes(self):
+        # in order of preference, FIFO is always supported
+        return _PRESENT_POLICY_SETTINGS[self][0]
+
+    def extra_images(self):
+        return _PRESENT_POLICY_SETTINGS[self][1]
+
+    def frames_in_flight(self):
+        return _PRESENT_POLICY_SETTINGS[self][2]
+
+_PRESENT_POLICY_SETTINGS = {
+    # newest frame replaces the queued one and the CPU never runs ahead of the GPU
+    PresentPolicy.LOW_LATENCY: ((VK_PRESENT_MODE_MAILBOX_KHR, VK_PRESENT_MODE_IMMEDIATE_KHR, VK_PRESENT_MODE_FIFO_KHR), 1, 1),
+    PresentPolicy.VSYNC: ((VK_PRESENT_MODE_FIFO_KHR,), 1, 2),
+    # tearing is fine, keep the GPU busy at all times
+    PresentPolicy.UNCAPPED: ((VK_PRESENT_MODE_IMMEDIATE_KHR, VK_PRESENT_MODE_MAILBOX_KHR, VK_PRESENT_MODE_FIFO_RELAXED_KHR, VK_PRESENT_MODE_FIFO_KHR), 2, 3),
+    # block on vblank as early as possible and do no work that never gets shown
+    PresentPolicy.POWER_SAVER: ((VK_PRESENT_MODE_FIFO_KHR,), 0, 1),
+}
+
+class PresentTimings:
+    """CPU timestamps of the last frames, from the input being polled to present returning.
+
+    Only the CPU side is visible here, time spent blocked in acquire and the
+    fence waits before it is what a present policy changes.
+    """
+    def __init__(self, capacity=240):
+        # (input to present, time blocked in acquire) per frame
+        self._samples = collections.deque(maxlen=capacity)
 
+    def record(self, input_time, acquire_start, acquired, presented):
+        if input_time is None:
+            input_time = acquire_start
+        self._samples.append((presented - input_time, acquired - acquire_start))
+
+    def clear(self):
+        self._samples.clear()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def summary(self):
+        """Median and 95th percentile of both latencies in seconds, None without samples"""
+        if not self._samples:
+            return None
+
+        latencies, acquires = zip(*self._samples)
+        return {
+            "input_to_present": statistics.median(latencies),
+            "input_to_present_p95": PresentTimings._p95(latencies),
+            "acquire": statistics.median(acquires),
+            "acquire_p95": PresentTimings._p95(acquires),
+        }
+
+    @staticmethod
+    def _p95(values):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
 
 class SwapChainSupportDetails:
     def __init__(self):
@@ -12,16 +86,61 @@ class SwapChainSupportDetails:
         self.formats = None
         self.presentModes = None
 
+class SurfaceQueryCache:
+    """Surface formats and present modes per physical device and surface.
+
+    Neither changes while the surface lives, so a recreate only has to
+    re-query the capabilities. The output arrays are reused when a surface
+    is queried again after being invalidated. Owned by whoever owns the
+    surface, a VkApp, or a SwapChain created without one.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def _entry(self, instance_dispatch, device, surface):
+        key = (device, surface)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {
+                "formats": EnumerationBuffer("VkSurfaceFormatKHR"),
+                "present_modes": EnumerationBuffer("VkPresentModeKHR"),
+                "valid": False,
+            }
+
+        if not entry["valid"]:
+            vkGetPhysicalDeviceSurfaceFormatsKHRInto(instance_dispatch, device, surface, entry["formats"])
+            vkGetPhysicalDeviceSurfacePresentModesKHRInto(instance_dispatch, device, surface, entry["present_modes"])
+            entry["valid"] = True
+
+        return entry
+
+    def formats(self, instance_dispatch, device, surface):
+        return self._entry(instance_dispatch, device, surface)["formats"].view()
+
+    def present_modes(self, instance_dispatch, device, surface):
+        return self._entry(instance_dispatch, device, surface)["present_modes"].view()
+
+    def invalidate(self, surface):
+        for (_, cached_surface), entry in self._entries.items():
+            if cached_surface == surface:
+                entry["valid"] = False
+
+    def clear(self):
+        self._entries.clear()
+
 class SwapChain:
-    def __init__(self, instance, physical_device, window, surface, queue_family_indices, device, command_pool, render_pass, max_frames_in_flight):
-        self.instance = instance
+    def __init__(self, instance_dispatch, physical_device, window, surface, queue_family_indices, device_dispatch, render_pass, surface_queries=None):
+        # InstanceDispatch and DeviceDispatch of the owner's instance and device
+        self.instance_dispatch = instance_dispatch
         self.physical_device = physical_device
         self.window = window
         self.surface = surface
         self.queue_family_indices = queue_family_indices
-        self.device = device
-        self.command_pool = command_pool
+        self.device = device_dispatch.handle
+        self.dispatch = device_dispatch
         self.render_pass = render_pass
+        self.surface_queries = surface_queries if surface_queries is not None else SurfaceQueryCache()
 
         self.surface_format = None
         self.present_mode = None
@@ -29,19 +148,34 @@ class SwapChain:
         self.handle = None
         self._images = None
         self.image_views = []
-        self.frames_in_flight = max_frames_in_flight
-        self.command_buffers = []
-        self.sync_handlers = [SyncHandler(device) for _ in range(max_frames_in_flight)]
         self.support_details = None
         self.image_count = 0
+        # bumped on every create so anything recorded against the old images knows it is stale
+        self.generation = 0
+        # full extent viewport and scissor, updated in place on recreate
+        self.viewport = Viewport(Vec2(0, 0), Vec2(0, 0), 0.0, 1.0)
+        self.scissor = Rect2D(Vec2(0, 0), Vec2(0, 0))
+        # takes a callable destroying the retired swapchain once the GPU is done with it,
+        # usually FrameRing.retire. without one recreate waits for the device to go idle
+        self.retire = None
+        # called with the old render pass compatibility key when a recreate changed the surface format
+        # and rebuilt the render pass, the owner fetches pipelines matching the new one
+        self.on_format_change = None
+        # PresentPolicy, None keeps mailbox if available and one image over the minimum
+        self.policy = None
+        # set when the surface no longer matches, the owner decides when to recreate
+        self.out_of_date = False
+        self._image_index = ffi.new("uint32_t*")
 
-    def create(self):
-        self.support_details = SwapChain.query_swap_chain_support_details(self.instance, self.physical_device, self.surface)
+    def create(self, old_swap_chain=VK_NULL_HANDLE):
+        self.support_details = SwapChain.query_swap_chain_support_details(self.instance_dispatch, self.physical_device, self.surface, self.surface_queries)
         self.surface_format = SwapChain._choose_surface_format(self.support_details.formats)
-        self.present_mode = SwapChain._choose_present_mode(self.support_details.presentModes)
+        self.present_mode = SwapChain._choose_present_mode(self.support_details.presentModes, self.policy)
         self.extent = SwapChain._choose_extent(self.support_details.capabilities, self.window)
+        self.viewport.size = Vec2.from_vk_extent(self.extent)
+        self.scissor.size = Vec2.from_vk_extent(self.extent)
         # requesting the minimum usually leaves you waiting on the driver for more images to render to
-        self.image_count = self.support_details.capabilities.minImageCount + 1
+        self.image_count = self.support_details.capabilities.minImageCount + (1 if self.policy is None else self.policy.extra_images())
         if 0 < self.support_details.capabilities.maxImageCount < self.image_count:
             self.image_count = self.support_details.capabilities.maxImageCount
 
@@ -66,15 +200,16 @@ class SwapChain:
             compositeAlpha=VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR,
             presentMode=self.present_mode,
             clipped=VK_TRUE,
-            oldSwapchain=VK_NULL_HANDLE
+            # lets the driver hand over images still being presented instead of stalling
+            oldSwapchain=old_swap_chain
         )
 
-        self.handle = vkCreateSwapchainKHR(self.device, create_info, None)
-        self._images = vkGetSwapchainImagesKHR(self.device, self.handle)
-
-        self.command_buffers = self.command_pool.create_command_buffers(self.frames_in_flight)
-        for sync_handler in self.sync_handlers:
-            sync_handler.create()
+        self.handle = vkCreateSwapchainKHR(self.dispatch, create_info, None)
+        self._images = vkGetSwapchainImagesKHR(self.dispatch, self.handle)
+        # the driver may hand out more images than requested
+        self.image_count = len(self._images)
+        self.generation += 1
+        self.out_of_date = False
 
     def create_image_views(self):
         for image in self._images:
@@ -96,46 +231,80 @@ class SwapChain:
             self.image_views.append(image_view)
 
     def recreate(self, frame_buffers):
-        SyncHandler.wait_idle(self.device)
-        self.destroy()
-        frame_buffers.destroy()
-        self.create()
+        # the pipeline sets viewport and scissor dynamically, so only the image views and framebuffers
+        # are rebuilt, and the render pass too if the surface format changed
+        render_pass = frame_buffers.render_pass
+        old_key = render_pass.compatibility_key()
+        retired_render_pass = None
+        retired = (self.handle, self.image_views, frame_buffers.handles)
+        self.image_views = []
+        frame_buffers.handles = []
+        if self.retire is None:
+            SyncHandler.wait_idle(self.device)
+
+        self.create(self.handle)
+        format_changed = render_pass.compatibility_key() != old_key
+        if format_changed:
+            retired_render_pass = render_pass.handle
+            render_pass.create()
         self.create_image_views()
         frame_buffers.create()
 
-    def acquire(self, frame, frame_buffers):
+        destroy = lambda: self._destroy_retired(*retired, retired_render_pass)
+        if self.retire is None:
+            destroy()
+        else:
+            self.retire(destroy)
+        if format_changed and self.on_format_change is not None:
+            self.on_format_change(old_key)
+
+    def _destroy_retired(self, handle, image_views, frame_buffer_handles, render_pass=None):
+        for frame_buffer in frame_buffer_handles:
+            vkDestroyFramebuffer(self.device, frame_buffer, None)
+        for view in image_views:
+            vkDestroyImageView(self.device, view, None)
+        vkDestroySwapchainKHR(self.dispatch, handle, None)
+        if render_pass is not None:
+            vkDestroyRenderPass(self.device, render_pass, None)
+
+    def acquire(self, semaphore, frame_buffers, recreate=True):
+        """Acquire the next image, returns None if the swapchain is out of date.
+
+        An out of date swapchain is recreated right away unless recreate is False,
+        a suboptimal one still hands out the image and is only flagged out_of_date.
+        """
         try:
-            return vkAcquireNextImageKHR(self.device, self.handle, UINT64_MAX, self.sync_handlers[frame].image_available_semaphore, VK_NULL_HANDLE)
-        except (VkErrorOutOfDateKhr, VkSuboptimalKhr) as _:
-            self.recreate(frame_buffers)
+            self.dispatch.vkAcquireNextImageKHR(self.device, self.handle, UINT64_MAX, semaphore, VK_NULL_HANDLE, self._image_index)
+        except VkSuboptimalKhr:
+            # the image was acquired and semaphore will be signalled, it has to be presented
+            self.out_of_date = True
+        except VkErrorOutOfDateKhr:
+            self.out_of_date = True
+            if recreate:
+                self.recreate(frame_buffers)
             return None
 
-    def get_buffer(self, frame):
-        return self.command_buffers[frame]
-
-    def get_sync_handler(self, frame):
-        return self.sync_handlers[frame]
+        return self._image_index[0]
 
     @staticmethod
-    def query_swap_chain_support_details(instance, device, surface):
+    def query_swap_chain_support_details(instance_dispatch, device, surface, surface_queries=None):
+        if surface_queries is None:
+            surface_queries = SurfaceQueryCache()
         details = SwapChainSupportDetails()
-        details.capabilities = vkGetPhysicalDeviceSurfaceCapabilitiesKHR(instance, device, surface)
-        details.formats = vkGetPhysicalDeviceSurfaceFormatsKHR(instance, device, surface)
-        details.presentModes = vkGetPhysicalDeviceSurfacePresentModesKHR(instance, device, surface)
+        details.capabilities = vkGetPhysicalDeviceSurfaceCapabilitiesKHR(instance_dispatch, device, surface)
+        details.formats = surface_queries.formats(instance_dispatch, device, surface)
+        details.presentModes = surface_queries.present_modes(instance_dispatch, device, surface)
 
         return details
 
 
     def destroy(self):
-        for sync_handler in self.sync_handlers:
-            sync_handler.destroy()
-
         for view in self.image_views:
             vkDestroyImageView(self.device, view, None)
 
         self.image_views = []
 
-        vkDestroySwapchainKHR(self.device, self.handle, None)
+        vkDestroySwapchainKHR(self.dispatch, self.handle, None)
 
     @staticmethod
     def _choose_surface_format(available_formats):
@@ -146,9 +315,11 @@ class SwapChain:
         return available_formats[0]
 
     @staticmethod
-    def _choose_present_mode(available_present_modes):
-        for present_mode in available_present_modes:
-            if present_mode == VK_PRESENT_MODE_MAILBOX_KHR:
+    def _choose_present_mode(available_present_modes, policy=None):
+        preferred = (VK_PRESENT_MODE_MAILBOX_KHR,) if policy is None else policy.present_modes()
+        available_present_modes = list(available_present_modes)
+        for present_mode in preferred:
+            if present_mode in available_present_modes:
                 return present_mode
 
         #Gaurenteed to be present
@@ -1,5 +1,6 @@
+import time
+
 from vkproject.graphics.vulkan import *
-from vkproject.graphics.vulkan.extensions.khr import vkAcquireNextImageKHR
 
 
 class SyncHandler:
@@ -8,6 +9,18 @@ class SyncHandler:
         self.image_available_semaphore = None
         self.render_finished_semaphore = None
         self.in_flight_fence = None
+        # per frame structs and their backing arrays, allocated once and patched every frame
+        self._fences = None
+        self._wait_semaphores = None
+        self._signal_semaphores = None
+        self._present_wait_semaphores = None
+        self._submit_next = None
+        self._command_buffers = None
+        self._wait_stages = None
+        self._submit_info = None
+        self._swap_chains = None
+        self._image_indices = None
+        self._present_info = None
 
     def create(self):
         semaphore_info = VkSemaphoreCreateInfo()
@@ -19,33 +32,256 @@ class SyncHandler:
         self.render_finished_semaphore = vkCreateSemaphore(self.device, semaphore_info, None)
         self.in_flight_fence = vkCreateFence(self.device, fence_info, None)
 
+        self._fences = ffi.new("VkFence[]", [self.in_flight_fence])
+        self._wait_semaphores = ffi.new("VkSemaphore[]", [self.image_available_semaphore])
+        self._signal_semaphores = ffi.new("VkSemaphore[]", [self.render_finished_semaphore])
+        self._present_wait_semaphores = self._signal_semaphores
+        self._submit_info = None
+        self._present_info = None
+
     def buffer_submission_info(self, buffer_handles, wait_stages):
-        return VkSubmitInfo(
-            pWaitSemaphores=[self.image_available_semaphore],
-            pWaitDstStageMask=wait_stages,
-            pCommandBuffers=buffer_handles,
-            pSignalSemaphores=[self.render_finished_semaphore],
-        )
+        if self._submit_info is None or len(self._command_buffers) != len(buffer_handles) or len(self._wait_stages) != len(wait_stages):
+            self._command_buffers = ffi.new("VkCommandBuffer[]", len(buffer_handles))
+            self._wait_stages = ffi.new("VkPipelineStageFlags[]", len(wait_stages))
+            self._submit_info = VkSubmitInfo(
+                pNext=self._submit_next,
+                pWaitSemaphores=self._wait_semaphores,
+                pWaitDstStageMask=self._wait_stages,
+                pCommandBuffers=self._command_buffers,
+                pSignalSemaphores=self._signal_semaphores,
+            )
+
+        for i, handle in enumerate(buffer_handles):
+            self._command_buffers[i] = handle
+        for i, stage in enumerate(wait_stages):
+            self._wait_stages[i] = stage
+
+        return self._submit_info
 
     def presentation_info(self, swap_chain_handles, image_idx):
-        return VkPresentInfoKHR(
-            pWaitSemaphores=[self.render_finished_semaphore],
-            pSwapchains=swap_chain_handles,
-            pImageIndices=[image_idx],
-            pResults=None
-        )
+        if self._present_info is None or len(self._swap_chains) != len(swap_chain_handles):
+            self._swap_chains = ffi.new("VkSwapchainKHR[]", len(swap_chain_handles))
+            self._image_indices = ffi.new("uint32_t[]", len(swap_chain_handles))
+            self._present_info = VkPresentInfoKHR(
+                pWaitSemaphores=self._present_wait_semaphores,
+                pSwapchains=self._swap_chains,
+                pImageIndices=self._image_indices,
+                pResults=None
+            )
+
+        for i, handle in enumerate(swap_chain_handles):
+            self._swap_chains[i] = handle
+            self._image_indices[i] = image_idx
+
+        return self._present_info
+
+    def submit(self, queue, buffer_handles, wait_stages):
+        submit_info = self.buffer_submission_info(buffer_handles, wait_stages)
+        self.reset_fence()
+        vkQueueSubmit(queue, 1, submit_info, self.in_flight_fence)
+
+    def poll(self):
+        """Whether the last submit of this frame has finished, never blocks"""
+        try:
+            vkGetFenceStatus(self.device, self.in_flight_fence)
+        except VkNotReady:
+            return False
+        return True
+
+    def wait(self, timeout=UINT64_MAX):
+        """Wait for the last submit of this frame, returns False if timeout (ns) ran out first"""
+        try:
+            vkWaitForFences(self.device, 1, self._fences, VK_TRUE, timeout)
+        except VkTimeout:
+            return False
+        return True
 
     @staticmethod
     def wait_idle(device):
         vkDeviceWaitIdle(device)
 
     def wait_for_fence(self):
-        vkWaitForFences(self.device, 1, [self.in_flight_fence], VK_TRUE, UINT64_MAX)
+        vkWaitForFences(self.device, 1, self._fences, VK_TRUE, UINT64_MAX)
 
     def reset_fence(self):
-        vkResetFences(self.device, 1, [self.in_flight_fence])
+        vkResetFences(self.device, 1, self._fences)
 
     def destroy(self):
         vkDestroySemaphore(self.device, self.image_available_semaphore, None)
         vkDestroySemaphore(self.device, self.render_finished_semaphore, None)
-        vkDestroyFence(self.device, self.in_flight_fence, None)
\ No newline at end of file
+        vkDestroyFence(self.device, self.in_flight_fence, None)
+
+class Timeline:
+    """A timeline semaphore counting the submits made to one queue.
+
+    value is the last value handed to a submit, completed() is how far the GPU
+    has got. Anything tagged with a value can be reused once completed() reaches it.
+    """
+    def __init__(self, device):
+        self.device = device
+        self.handle = None
+        self.value = 0
+        # the wait info and the arrays it points at, they have to live as long as it does
+        self._semaphores = None
+        self._values = None
+        self._wait_info = None
+
+    def create(self):
+        type_info = VkSemaphoreTypeCreateInfo(
+            semaphoreType=VK_SEMAPHORE_TYPE_TIMELINE,
+            initialValue=0,
+        )
+        self.handle = vkCreateSemaphore(self.device, VkSemaphoreCreateInfo(pNext=type_info), None)
+        self.value = 0
+        self._semaphores = ffi.new("VkSemaphore[]", [self.handle])
+        self._values = ffi.new("uint64_t[]", 1)
+        self._wait_info = VkSemaphoreWaitInfo(
+            pSemaphores=self._semaphores,
+            pValues=self._values,
+        )
+
+    def completed(self):
+        return vkGetSemaphoreCounterValue(self.device, self.handle)
+
+    def poll(self, value):
+        return self.completed() >= value
+
+    def wait(self, value, timeout=UINT64_MAX):
+        """Wait until the GPU reaches value, returns False if timeout (ns) ran out first"""
+        if value <= 0:
+            return True
+
+        self._values[0] = value
+        try:
+            vkWaitSemaphores(self.device, self._wait_info, timeout)
+        except VkTimeout:
+            return False
+        return True
+
+    def destroy(self):
+        vkDestroySemaphore(self.device, self.handle, None)
+
+class TimelineSyncHandler(SyncHandler):
+    """Frame synchronization on a queue Timeline instead of a fence per frame.
+
+    Every submit signals the next timeline value next to the binary semaphore
+    presentation waits on, waiting for the frame is waiting for that value and
+    there is nothing to reset.
+    """
+    def __init__(self, device, timeline):
+        super().__init__(device)
+        self.timeline = timeline
+        self.frame_value = 0
+        self._wait_values = None
+        self._signal_values = None
+
+    def create(self):
+        semaphore_info = VkSemaphoreCreateInfo()
+
+        self.image_available_semaphore = vkCreateSemaphore(self.device, semaphore_info, None)
+        self.render_finished_semaphore = vkCreateSemaphore(self.device, semaphore_info, None)
+
+        self._wait_semaphores = ffi.new("VkSemaphore[]", [self.image_available_semaphore])
+        self._signal_semaphores = ffi.new("VkSemaphore[]", [self.render_finished_semaphore, self.timeline.handle])
+        self._present_wait_semaphores = ffi.new("VkSemaphore[]", [self.render_finished_semaphore])
+        # values for binary semaphores are ignored, but the counts have to match
+        self._wait_values = ffi.new("uint64_t[]", 1)
+        self._signal_values = ffi.new("uint64_t[]", 2)
+        self._submit_next = VkTimelineSemaphoreSubmitInfo(
+            pWaitSemaphoreValues=self._wait_values,
+            pSignalSemaphoreValues=self._signal_values,
+        )
+        self._submit_info = None
+        self._present_info = None
+
+    def submit(self, queue, buffer_handles, wait_stages):
+        submit_info = self.buffer_submission_info(buffer_handles, wait_stages)
+        value = self.timeline.value + 1
+        self._signal_values[1] = value
+        vkQueueSubmit(queue, 1, submit_info, VK_NULL_HANDLE)
+        self.timeline.value = self.frame_value = value
+
+    def poll(self):
+        return self.timeline.poll(self.frame_value)
+
+    def wait(self, timeout=UINT64_MAX):
+        return self.timeline.wait(self.frame_value, timeout)
+
+    def wait_for_fence(self):
+        self.timeline.wait(self.frame_value)
+
+    def reset_fence(self):
+        pass
+
+    def destroy(self):
+        vkDestroySemaphore(self.device, self.image_available_semaphore, None)
+        vkDestroySemaphore(self.device, self.render_finished_semaphore, None)
+
+class FramePacer:
+    """Fills the time the CPU would spend blocked on the GPU with other work, and caps the frame rate.
+
+    Idle work is a callable that does one small slice of work per call and returns
+    True if it did anything. Slices are run round robin whenever the pacer would
+    otherwise block, once none of them has anything left to do the pacer blocks in
+    the driver (or sleeps) for the rest of the wait. All times are in seconds.
+    """
+    def __init__(self, target_fps=None):
+        self.target_fps = target_fps
+        self._idle_work = []
+        self._next_frame = None
+
+    def add_idle_work(self, work):
+        self._idle_work.append(work)
+
+    def remove_idle_work(self, work):
+        self._idle_work.remove(work)
+
+    def _run_idle_work(self):
+        did_work = False
+        for work in tuple(self._idle_work):
+            if work():
+                did_work = True
+
+        return did_work
+
+    @staticmethod
+    def poll(sync_handler):
+        return sync_handler.poll()
+
+    def wait(self, sync_handler, timeout=None):
+        """Wait for the frame of sync_handler, returns False if timeout ran out first"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while not sync_handler.poll():
+            if self._run_idle_work():
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return False
+                continue
+
+            # nothing left to overlap with the GPU
+            if deadline is None:
+                return sync_handler.wait()
+            remaining = deadline - time.perf_counter()
+            return remaining > 0 and sync_handler.wait(int(remaining * 1e9))
+
+        return True
+
+    def limit(self):
+        """Hold the next frame back until target_fps allows it"""
+        if not self.target_fps:
+            return
+
+        interval = 1.0 / self.target_fps
+        now = time.perf_counter()
+        # after a stall start over instead of rendering a burst of frames to catch up
+        if self._next_frame is None or now - self._next_frame > interval:
+            self._next_frame = now
+
+        while True:
+            remaining = self._next_frame - time.perf_counter()
+            if remaining <= 0:
+                break
+            if not self._run_idle_work():
+                time.sleep(remaining)
+                break
+
+        self._next_frame += interval
\ No newline at end of file
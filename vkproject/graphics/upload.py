@@ -0,0 +1,371 @@
+import collections
+import enum
+
+import numpy as np
+
+from vkproject.graphics.buffer import Buffer
+from vkproject.graphics.commands import CommandPool, CommandBufferRecordingType
+from vkproject.graphics.vulkan import *
+
+
+class StagingRing:
+    """A persistently mapped host visible buffer handed out front to back.
+
+    Space comes back in the order it was handed out: release(mark) frees
+    everything allocated before mark() returned it. head == tail means empty, a
+    full ring always keeps one byte between them.
+    """
+    def __init__(self, device, allocator, size):
+        self.size = size
+        self.buffer = Buffer(device, allocator, np.uint8, size, VK_BUFFER_USAGE_TRANSFER_SRC_BIT)
+        self._head = 0
+        self._tail = 0
+
+    def create(self):
+        self.buffer.create()
+
+    def allocate(self, size, alignment):
+        """Offset of size free bytes, None until enough space is released"""
+        offset = -(-self._head // alignment) * alignment
+        if self._head >= self._tail:
+            if offset + size <= self.size:
+                self._head = offset + size
+                return offset
+            # wrap around, the space left at the end is lost until the tail passes it
+            if size < self._tail:
+                self._head = size
+                return 0
+            return None
+
+        if offset + size < self._tail:
+            self._head = offset + size
+            return offset
+        return None
+
+    def mark(self):
+        return self._head
+
+    def release(self, mark):
+        self._tail = mark
+        if self._tail == self._head:
+            # empty, start over at the front for the largest contiguous space
+            self._head = self._tail = 0
+
+    def empty(self):
+        return self._head == self._tail
+
+    def destroy(self):
+        self.buffer.destroy()
+
+class UploadState(enum.Enum):
+    FREE = 0
+    RECORDING = 1
+    # copies submitted to the transfer queue
+    TRANSFERRING = 2
+    # ownership acquire submitted to the graphics queue
+    ACQUIRING = 3
+
+class UploadBatch:
+    """One transient command buffer worth of copies, and what it takes to submit and retire it"""
+    def __init__(self, device, transfer_family, graphics_family):
+        self.device = device
+        self.dedicated = transfer_family != graphics_family
+        self.transfer_pool = CommandPool(device, transfer_family)
+        self.transfer_pool.transient()
+        self.acquire_pool = CommandPool(device, graphics_family) if self.dedicated else None
+        if self.acquire_pool is not None:
+            self.acquire_pool.transient()
+        self.transfer_buffer = None
+        self.acquire_buffer = None
+        self.transfer_fence = None
+        # signalled once the graphics queue can use the batch, by the acquire submit or the transfer submit without one
+        self.fence = None
+        self.semaphore = None
+        # submit infos built once, with the arrays they point at kept alongside
+        self._transfer_handles = None
+        self._acquire_handles = None
+        self._signal_semaphores = None
+        self._wait_stages = None
+        self.transfer_submit = None
+        self.acquire_submit = None
+        self.state = UploadState.FREE
+        self.upload_id = 0
+        self.copies = 0
+        self.ring_mark = 0
+        # queue family ownership transfers, recorded as releases at flush and acquired on the graphics queue
+        self.buffer_barriers = []
+        self.image_barriers = []
+
+    def create(self):
+        fence_info = VkFenceCreateInfo()
+        self.transfer_pool.create()
+        self.transfer_buffer = self.transfer_pool.create_command_buffers(1)[0]
+        self.fence = vkCreateFence(self.device, fence_info, None)
+        if not self.dedicated:
+            self.transfer_fence = self.fence
+            self._transfer_handles = ffi.new("VkCommandBuffer[]", [self.transfer_buffer.handle])
+            self.transfer_submit = VkSubmitInfo(pCommandBuffers=self._transfer_handles)
+            return
+
+        self.acquire_pool.create()
+        self.acquire_buffer = self.acquire_pool.create_command_buffers(1)[0]
+        self.transfer_fence = vkCreateFence(self.device, fence_info, None)
+        self.semaphore = vkCreateSemaphore(self.device, VkSemaphoreCreateInfo(), None)
+        self._transfer_handles = ffi.new("VkCommandBuffer[]", [self.transfer_buffer.handle])
+        self._acquire_handles = ffi.new("VkCommandBuffer[]", [self.acquire_buffer.handle])
+        # the transfer submit signals the semaphore the acquire submit waits on
+        self._signal_semaphores = ffi.new("VkSemaphore[]", [self.semaphore])
+        self._wait_stages = ffi.new("VkPipelineStageFlags[]", [VK_PIPELINE_STAGE_ALL_COMMANDS_BIT])
+        self.transfer_submit = VkSubmitInfo(pCommandBuffers=self._transfer_handles, pSignalSemaphores=self._signal_semaphores)
+        self.acquire_submit = VkSubmitInfo(
+            pWaitSemaphores=self._signal_semaphores,
+            pWaitDstStageMask=self._wait_stages,
+            pCommandBuffers=self._acquire_handles,
+        )
+
+    def begin(self, upload_id):
+        self.transfer_pool.reset()
+        self.transfer_buffer.begin_recording(CommandBufferRecordingType.ONE_TIME_SUBMIT)
+        self.state = UploadState.RECORDING
+        self.upload_id = upload_id
+        self.copies = 0
+        self.buffer_barriers = []
+        self.image_barriers = []
+
+    def destroy(self):
+        vkDestroyFence(self.device, self.fence, None)
+        self.transfer_pool.destroy()
+        if self.dedicated:
+            vkDestroyFence(self.device, self.transfer_fence, None)
+            vkDestroySemaphore(self.device, self.semaphore, None)
+            self.acquire_pool.destroy()
+
+class UploadManager:
+    """Copies data into device local buffers and images through a StagingRing.
+
+    upload_buffer and upload_image stage the data right away and record the
+    copy into the current batch, flush() (once per frame) submits everything
+    recorded since in one transient command buffer. With a dedicated transfer
+    queue family the batch runs there and signals a semaphore, once update()
+    sees it finished the ownership acquire is submitted to the graphics queue
+    waiting on that semaphore, so the graphics queue never sits waiting on a copy.
+    Without one the batch is submitted to the graphics queue directly.
+
+    Uploads are identified by the id of their batch, they are usable by work
+    submitted to the graphics queue once done(upload_id) is True.
+    """
+    DEFAULT_STAGING_SIZE = 64 * 1024 * 1024
+    DEFAULT_BATCHES = 3
+    # covers every texel size, and the 4 byte multiple vkCmdCopyBufferToImage wants
+    COPY_ALIGNMENT = 16
+
+    def __init__(self, device, allocator, transfer_queue, transfer_family, graphics_queue, graphics_family,
+                 staging_size=DEFAULT_STAGING_SIZE, batches=DEFAULT_BATCHES):
+        self.device = device
+        self.transfer_queue = transfer_queue
+        self.transfer_family = transfer_family
+        self.graphics_queue = graphics_queue
+        self.graphics_family = graphics_family
+        self.ring = StagingRing(device, allocator, staging_size)
+        self._batches = [UploadBatch(device, transfer_family, graphics_family) for _ in range(batches)]
+        self._current = None
+        # submitted batches, oldest first
+        self._in_flight = collections.deque()
+        self._next_id = 1
+        self.completed_id = 0
+
+    def create(self):
+        self.ring.create()
+        for batch in self._batches:
+            batch.create()
+
+    def dedicated(self):
+        return self.transfer_family != self.graphics_family
+
+    def done(self, upload_id):
+        return upload_id <= self.completed_id
+
+    def pending(self):
+        return self._current is not None or bool(self._in_flight)
+
+    def _batch(self):
+        if self._current is not None:
+            return self._current
+
+        while True:
+            for batch in self._batches:
+                if batch.state == UploadState.FREE:
+                    batch.begin(self._next_id)
+                    self._next_id += 1
+                    self._current = batch
+                    return batch
+            self._wait_oldest()
+
+    def _stage(self, data):
+        data = np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+        if data.nbytes == 0:
+            raise ValueError("Nothing to upload")
+        if data.nbytes >= self.ring.size:
+            raise ValueError(f"Upload of {data.nbytes} bytes doesn't fit a {self.ring.size} byte staging ring")
+
+        offset = self.ring.allocate(data.nbytes, UploadManager.COPY_ALIGNMENT)
+        while offset is None:
+            # out of staging space, push out what is recorded and wait for the oldest batch
+            self.flush()
+            self._wait_oldest()
+            offset = self.ring.allocate(data.nbytes, UploadManager.COPY_ALIGNMENT)
+
+        self.ring.buffer.data[offset:offset + data.nbytes] = data
+        return offset, data.nbytes
+
+    def upload_buffer(self, buffer, data, offset=0):
+        """Copy data (anything numpy can view as bytes) into buffer at byte offset, returns the upload id"""
+        staging_offset, size = self._stage(data)
+        batch = self._batch()
+        vkCmdCopyBuffer(batch.transfer_buffer.handle, self.ring.buffer.handle, buffer.handle, 1, [VkBufferCopy(srcOffset=staging_offset, dstOffset=offset, size=size)])
+        batch.copies += 1
+        batch.buffer_barriers.append(VkBufferMemoryBarrier(
+            srcAccessMask=VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=VK_ACCESS_MEMORY_READ_BIT,
+            srcQueueFamilyIndex=self._src_family(),
+            dstQueueFamilyIndex=self._dst_family(),
+            buffer=buffer.handle,
+            offset=offset,
+            size=size,
+        ))
+        return batch.upload_id
+
+    def upload_image(self, image, data, width, height, aspect=VK_IMAGE_ASPECT_COLOR_BIT, layout=VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL):
+        """Copy tightly packed texels into mip 0 of a single layer image, which ends up in layout. Returns the upload id"""
+        staging_offset, _ = self._stage(data)
+        batch = self._batch()
+        subresource_range = VkImageSubresourceRange(aspectMask=aspect, baseMipLevel=0, levelCount=1, baseArrayLayer=0, layerCount=1)
+        vkCmdPipelineBarrier(batch.transfer_buffer.handle, VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT, VK_PIPELINE_STAGE_TRANSFER_BIT, 0, 0, None, 0, None, 1, [VkImageMemoryBarrier(
+            srcAccessMask=0,
+            dstAccessMask=VK_ACCESS_TRANSFER_WRITE_BIT,
+            oldLayout=VK_IMAGE_LAYOUT_UNDEFINED,
+            newLayout=VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,
+            srcQueueFamilyIndex=VK_QUEUE_FAMILY_IGNORED,
+            dstQueueFamilyIndex=VK_QUEUE_FAMILY_IGNORED,
+            image=image,
+            subresourceRange=subresource_range,
+        )])
+        region = VkBufferImageCopy(
+            bufferOffset=staging_offset,
+            imageSubresource=VkImageSubresourceLayers(aspectMask=aspect, mipLevel=0, baseArrayLayer=0, layerCount=1),
+            imageExtent=VkExtent3D(width=width, height=height, depth=1),
+        )
+        vkCmdCopyBufferToImage(batch.transfer_buffer.handle, self.ring.buffer.handle, image, VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL, 1, [region])
+        batch.copies += 1
+        batch.image_barriers.append(VkImageMemoryBarrier(
+            srcAccessMask=VK_ACCESS_TRANSFER_WRITE_BIT,
+            dstAccessMask=VK_ACCESS_MEMORY_READ_BIT,
+            oldLayout=VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL,
+            newLayout=layout,
+            srcQueueFamilyIndex=self._src_family(),
+            dstQueueFamilyIndex=self._dst_family(),
+            image=image,
+            subresourceRange=subresource_range,
+        ))
+        return batch.upload_id
+
+    def _src_family(self):
+        return self.transfer_family if self.dedicated() else VK_QUEUE_FAMILY_IGNORED
+
+    def _dst_family(self):
+        return self.graphics_family if self.dedicated() else VK_QUEUE_FAMILY_IGNORED
+
+    @staticmethod
+    def _barriers(command_buffer, src_stage, dst_stage, batch):
+        vkCmdPipelineBarrier(command_buffer.handle, src_stage, dst_stage, 0, 0, None,
+                             len(batch.buffer_barriers), batch.buffer_barriers or None,
+                             len(batch.image_barriers), batch.image_barriers or None)
+
+    def flush(self):
+        """Submit everything recorded since the last flush, returns its upload id or None if there was nothing"""
+        batch = self._current
+        if batch is None or batch.copies == 0:
+            return None
+
+        # the release half of the ownership transfer, or the plain barrier making the copies visible
+        self._barriers(batch.transfer_buffer, VK_PIPELINE_STAGE_TRANSFER_BIT, VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT if batch.dedicated else VK_PIPELINE_STAGE_ALL_COMMANDS_BIT, batch)
+        batch.transfer_buffer.end_recording()
+        vkResetFences(self.device, 1, [batch.transfer_fence])
+        vkQueueSubmit(self.transfer_queue if batch.dedicated else self.graphics_queue, 1, batch.transfer_submit, batch.transfer_fence)
+
+        batch.state = UploadState.TRANSFERRING
+        batch.ring_mark = self.ring.mark()
+        self._in_flight.append(batch)
+        self._current = None
+        return batch.upload_id
+
+    def _signalled(self, fence):
+        try:
+            vkGetFenceStatus(self.device, fence)
+        except VkNotReady:
+            return False
+        return True
+
+    def _acquire(self, batch):
+        # the copies are done, the graphics queue takes the resources over
+        for barrier in batch.buffer_barriers:
+            barrier.srcAccessMask = 0
+        for barrier in batch.image_barriers:
+            barrier.srcAccessMask = 0
+
+        batch.acquire_pool.reset()
+        batch.acquire_buffer.begin_recording(CommandBufferRecordingType.ONE_TIME_SUBMIT)
+        self._barriers(batch.acquire_buffer, VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT, VK_PIPELINE_STAGE_ALL_COMMANDS_BIT, batch)
+        batch.acquire_buffer.end_recording()
+        vkResetFences(self.device, 1, [batch.fence])
+        vkQueueSubmit(self.graphics_queue, 1, batch.acquire_submit, batch.fence)
+        batch.state = UploadState.ACQUIRING
+
+    def update(self):
+        """Move submitted batches along without blocking, returns True if any of them did.
+
+        Fits FramePacer idle work, call it at least once per frame.
+        """
+        progressed = False
+        for batch in self._in_flight:
+            if batch.state == UploadState.TRANSFERRING and batch.dedicated and self._signalled(batch.transfer_fence):
+                self._acquire(batch)
+                progressed = True
+
+        # batches retire in submission order, the staging ring is released front to back
+        while self._in_flight:
+            batch = self._in_flight[0]
+            if batch.state == UploadState.TRANSFERRING and batch.dedicated or not self._signalled(batch.fence):
+                break
+            self._in_flight.popleft()
+            self.ring.release(batch.ring_mark)
+            self.completed_id = batch.upload_id
+            batch.state = UploadState.FREE
+            progressed = True
+
+        return progressed
+
+    def _wait_oldest(self):
+        if not self._in_flight:
+            return
+
+        batch = self._in_flight[0]
+        if batch.state == UploadState.TRANSFERRING:
+            vkWaitForFences(self.device, 1, [batch.transfer_fence], VK_TRUE, UINT64_MAX)
+            self.update()
+        if batch.state == UploadState.ACQUIRING:
+            vkWaitForFences(self.device, 1, [batch.fence], VK_TRUE, UINT64_MAX)
+            self.update()
+
+    def wait(self, upload_id):
+        """Block until upload_id is done, flushing it first if it is still being recorded"""
+        if self._current is not None and self._current.upload_id <= upload_id:
+            self.flush()
+        while not self.done(upload_id) and self._in_flight:
+            self._wait_oldest()
+
+    def destroy(self):
+        # the caller waits for the device to go idle first
+        for batch in self._batches:
+            batch.destroy()
+        self.ring.destroy()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import numpy as np
+
+from vkproject.graphics import vulkan
+from vkproject.graphics.vulkan import *
+
+# numpy (kind, itemsize) -> bits per component and the VkFormat numeric type, plain and normalized
+_COMPONENT_FORMATS = {
+    ("f", 4): ("32", "SFLOAT", None),
+    ("f", 2): ("16", "SFLOAT", None),
+    ("i", 4): ("32", "SINT", None),
+    ("u", 4): ("32", "UINT", None),
+    ("i", 2): ("16", "SINT", "SNORM"),
+    ("u", 2): ("16", "UINT", "UNORM"),
+    ("i", 1): ("8", "SINT", "SNORM"),
+    ("u", 1): ("8", "UINT", "UNORM"),
+}
+_INDEX_TYPES = {
+    np.dtype(np.uint16): VK_INDEX_TYPE_UINT16,
+    np.dtype(np.uint32): VK_INDEX_TYPE_UINT32,
+}
+
+
+def vertex_format(dtype, normalized=False):
+    """VkFormat of one shader input location holding a numpy scalar or vector (shape (n,), n <= 4) dtype"""
+    dtype = np.dtype(dtype)
+    base, shape = dtype.subdtype or (dtype, ())
+    components = shape[0] if shape else 1
+    if len(shape) > 1 or not 1 <= components <= 4:
+        raise ValueError(f"{dtype} does not fit one vertex input location")
+
+    bits, numeric, normalized_numeric = _COMPONENT_FORMATS.get((base.kind, base.itemsize), (None, None, None))
+    if normalized:
+        numeric = normalized_numeric
+    if numeric is None:
+        raise ValueError(f"No{' normalized' if normalized else ''} vertex format for {base}")
+
+    return getattr(vulkan, f"VK_FORMAT_{''.join(channel + bits for channel in 'RGBA'[:components])}_{numeric}")
+
+def index_type(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in _INDEX_TYPES:
+        raise ValueError(f"Indices have to be uint16 or uint32, got {dtype}")
+    return _INDEX_TYPES[dtype]
+
+class VertexLayout:
+    """Vertex input descriptions for one binding, derived from a numpy structured dtype.
+
+    Every field becomes an attribute in declaration order, starting at
+    first_location, at its offset in the dtype, which is also where padding
+    from align=True ends up. Matrix fields (shape (columns, rows)) take one
+    location per column like they do in GLSL. Integer fields named in
+    normalized read as floats in [0, 1] or [-1, 1].
+    """
+    def __init__(self, dtype, binding=0, input_rate=VK_VERTEX_INPUT_RATE_VERTEX, first_location=0, normalized=()):
+        self.dtype = np.dtype(dtype)
+        if self.dtype.names is None:
+            raise ValueError(f"Vertex layouts are built from structured dtypes, got {self.dtype}")
+
+        self.binding = binding
+        self.input_rate = input_rate
+        self.first_location = first_location
+        self.normalized = frozenset(normalized)
+        self.attributes = self._attributes()
+
+    def _attributes(self):
+        attributes = []
+        location = self.first_location
+        for name in self.dtype.names:
+            field, offset = self.dtype.fields[name][:2]
+            columns = [(field, offset)]
+            if field.subdtype and len(field.subdtype[1]) == 2:
+                base, (count, rows) = field.subdtype
+                column = np.dtype((base, (rows,)))
+                columns = [(column, offset + i * column.itemsize) for i in range(count)]
+
+            for column, column_offset in columns:
+                attributes.append((location, self.binding, vertex_format(column, name in self.normalized), column_offset))
+                location += 1
+
+        return tuple(attributes)
+
+    @property
+    def stride(self):
+        return self.dtype.itemsize
+
+    @property
+    def locations(self):
+        return len(self.attributes)
+
+    def binding_description(self):
+        return self.binding, self.stride, self.input_rate
+
+def vertex_input(*layouts):
+    """(vertex_bindings, vertex_attributes) for a PipelineDescription, one binding per layout"""
+    bindings = tuple(layout.binding_description() for layout in layouts)
+    attributes = tuple(attribute for layout in layouts for attribute in layout.attributes)
+
+    if len({binding for binding, _, _ in bindings}) != len(bindings):
+        raise ValueError("Vertex layouts share a binding")
+    if len({location for location, _, _, _ in attributes}) != len(attributes):
+        raise ValueError("Vertex layouts overlap in shader locations")
+    return bindings, attributes
\ No newline at end of file
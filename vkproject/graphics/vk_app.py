@@ -1,66 +1,168 @@
-from vkproject.graphics.commands import CommandPool
+from vkproject.graphics.commands import CommandPool, CommandBufferRecordingType, RecordedCommandBuffers
 from vkproject.graphics.framebuffer import FrameBuffers
-from vkproject.graphics.pipeline import GraphicsPipeline
+from vkproject.graphics.frames import FrameRing
+from vkproject.graphics.memory import MemoryAllocator, MemoryProperties
+from vkproject.graphics.parallel import ParallelRecorder
+from vkproject.graphics.pipeline import PipelineCache, PipelineDescription, PipelineRegistry
 from vkproject.graphics.rendering import BufferRenderer
 from vkproject.graphics.renderpass import RenderPass
+import time
+
 import glfw
 
-from vkproject.graphics.swapchain import SwapChain
-from vkproject.graphics.synchronization import SyncHandler
+from vkproject.graphics.swapchain import SwapChain, PresentPolicy, PresentTimings, SurfaceQueryCache
+from vkproject.graphics.synchronization import SyncHandler, Timeline, TimelineSyncHandler, FramePacer
+from vkproject.graphics.upload import UploadManager
 from vkproject.graphics.vulkan import *
+from vkproject.graphics.vulkan.extensions.dispatch import InstanceDispatch, DeviceDispatch
 from vkproject.graphics.vulkan.extensions.ext import *
 from vkproject.graphics.vulkan.extensions.khr import *
 from vkproject.resources import Resources
 from vkproject.resources.shaders import ShaderType, ShaderLoader
+from vkproject.resources.streaming import ResourceStreamer
 from vkproject.windowing import Window
 
 
 class VkApp:
-    MAX_FRAMES_IN_FLIGHT = 2
+    DEFAULT_FRAMES_IN_FLIGHT = 2
+    # seconds without a new framebuffer size before the swapchain is rebuilt
+    DEFAULT_RESIZE_SETTLE_TIME = 0.1
 
-    def __init__(self, window: Window):
+    def __init__(self, window: Window, frames_in_flight=DEFAULT_FRAMES_IN_FLIGHT):
+        FrameRing.validate_frames_in_flight(frames_in_flight)
         # window will be needed later in surface creation
         self.window = window
         self._validation_layers = []
         # SwapChain extension is required
         self._device_extensions = [VK_KHR_SWAPCHAIN_EXTENSION_NAME]
+        self._supported_device_extensions = {}
+        self._extension_properties = EnumerationBuffer("VkExtensionProperties")
         self._enable_validation = False
         self.instance = None
         self._physical_device = None
         self.device = None
         self.queue_family_indices = QueueFamilyIndices()
         self.surface = None
+        # formats and present modes of self.surface, queried once per physical device
+        self.surface_queries = SurfaceQueryCache()
         self._graphics_queue = None
         self._present_queue = None
+        # the graphics queue when there is no dedicated transfer family
+        self._transfer_queue = None
         self.swap_chain = None
         self.render_pass = None
         self._shaders = Resources.get_loader(ShaderLoader)
         self.pipeline = None
+        self._pipeline_description = None
+        self.pipeline_cache = None
+        self.pipelines = None
+        self.allocator = None
+        self.uploads = None
+        self.streamer = None
+        self._streaming_workers = ResourceStreamer.DEFAULT_WORKERS
+        self._streaming_processes = False
+        # called by cleanup once the device is idle, for GPU resources owned outside the app
+        self._cleanup_hooks = []
+        # where the pipeline cache is kept between runs, None compiles every pipeline from scratch
+        self._pipeline_cache_directory = None
         self.frame_buffers = None
         self.command_pool = None
         self._debug_messenger = None
-        self.current_frame = 0
-        self.frames_in_flight = VkApp.MAX_FRAMES_IN_FLIGHT
+        self.instance_dispatch = None
+        self.device_dispatch = None
+        self.frame_ring = None
+        self.frames_in_flight = frames_in_flight
+        self._prefer_timeline = True
+        self.pacer = FramePacer()
+        self.resize_settle_time = VkApp.DEFAULT_RESIZE_SETTLE_TIME
+        # time of the last framebuffer size event not yet applied to the swapchain
+        self._resized_at = None
+        self.present_policy = None
+        # PresentTimings while latency tracking is enabled
+        self.present_timings = None
+        self._instance_api_version = VK_API_VERSION_1_0
+        # graphics queue timeline, None when the device can't do timeline semaphores
+        self.timeline = None
+        self._cache_commands = False
+        self._recorded_commands = None
+        self._recording_workers = 0
+        self._parallel_recorder = None
+        # callables taking a BufferRenderer, recorded after the pipeline, viewport and scissor are set
+        self.draw_list = [VkApp._sample_draw]
 
     def init(self):
+        if self._cache_commands and self._recording_workers > 0:
+            # cached primaries are replayed forever, the per-frame one time secondaries they'd execute are not
+            raise RuntimeError("Command caching and parallel recording can't be enabled together")
         self._create_instance()
         self._setup_debug_messenger()
         self._create_surface()
         self._select_physical_device()
         self._create_logical_device()
+        self.allocator = MemoryAllocator(self.device, MemoryProperties.query(self._physical_device))
+        self.uploads = UploadManager(self.device, self.allocator, self._transfer_queue, self.queue_family_indices.upload_family(), self._graphics_queue, self.queue_family_indices.graphics_family)
+        self.uploads.create()
+        # copies finishing while the cpu waits on the gpu are handed over to the graphics queue right away
+        self.pacer.add_idle_work(self.uploads.update)
+        self.streamer = ResourceStreamer(self.device, self.allocator, self.uploads, self._streaming_workers, self._streaming_processes)
+        self.pacer.add_idle_work(self.streamer.update)
+        if self._pipeline_cache_directory is not None:
+            self.pipeline_cache = PipelineCache(self.device, self._physical_device, self._pipeline_cache_directory)
+            self.pipeline_cache.create()
         self.command_pool = CommandPool(self.device, self.queue_family_indices.graphics_family)
         self.command_pool.create()
-        self.swap_chain = SwapChain(self.instance, self._physical_device, self.window, self.surface, self.queue_family_indices, self.device, self.command_pool, self.render_pass, VkApp.MAX_FRAMES_IN_FLIGHT)
+        self.swap_chain = SwapChain(self.instance_dispatch, self._physical_device, self.window, self.surface, self.queue_family_indices, self.device_dispatch, self.render_pass, self.surface_queries)
+        self.swap_chain.policy = self.present_policy
         self.swap_chain.create()
         self.swap_chain.create_image_views()
-        #Make sure we don't try to render more frames than images we have
-        self.frames_in_flight = min(self.swap_chain.image_count, VkApp.MAX_FRAMES_IN_FLIGHT)
+        if self.timeline is not None:
+            self.timeline.create()
+            self.frame_ring = FrameRing(self.device, self.command_pool, self._ring_size(), lambda: TimelineSyncHandler(self.device, self.timeline))
+        else:
+            self.frame_ring = FrameRing(self.device, self.command_pool, self._ring_size())
+        self.frame_ring.create()
+        # a resize hands the old swapchain over and frees it once its frames are done
+        self.swap_chain.retire = self.frame_ring.retire
+        self.window.add_resize_listener(self._on_framebuffer_resize)
         self.render_pass = RenderPass(self.device, self.swap_chain)
         self.render_pass.create()
         self.frame_buffers = FrameBuffers(self.device, self.render_pass, self.swap_chain)
         self.frame_buffers.create()
-        self.pipeline = GraphicsPipeline(self, { ShaderType.VERTEX: self._shaders.default_vertex, ShaderType.FRAGMENT: self._shaders.default_frag })
-        self.pipeline.create()
+        self.pipelines = PipelineRegistry(self.device, self.pipeline_cache)
+        self._pipeline_description = PipelineDescription({ ShaderType.VERTEX: self._shaders.default_vertex, ShaderType.FRAGMENT: self._shaders.default_frag })
+        self.pipeline = self.pipelines.get(self._pipeline_description, self.render_pass)
+        self.swap_chain.on_format_change = self._on_surface_format_change
+        if self._cache_commands:
+            self._recorded_commands = RecordedCommandBuffers(self.command_pool, self.swap_chain, self.record_command_buffer, self.frame_ring.retire)
+        elif self._recording_workers > 0:
+            self._create_parallel_recorder()
+
+    def _ring_size(self):
+        #Make sure we don't try to render more frames than images we have
+        return min(self.swap_chain.image_count, self.frames_in_flight)
+
+    def _create_parallel_recorder(self):
+        self._parallel_recorder = ParallelRecorder(self.device, self.queue_family_indices.graphics_family, self.frame_ring.frames_in_flight, self._recording_workers)
+        self._parallel_recorder.create()
+
+    def set_frames_in_flight(self, frames_in_flight):
+        FrameRing.validate_frames_in_flight(frames_in_flight)
+        self.frames_in_flight = frames_in_flight
+        if self.frame_ring is None:
+            return
+
+        self.frame_ring.resize(self._ring_size())
+        if self._parallel_recorder is not None and self._parallel_recorder.frames_in_flight != self.frame_ring.frames_in_flight:
+            self._parallel_recorder.destroy()
+            self._create_parallel_recorder()
+
+    def set_present_policy(self, policy):
+        """Pick present mode, swapchain image count and frames in flight through a PresentPolicy"""
+        self.present_policy = policy
+        if self.swap_chain is not None:
+            self.swap_chain.policy = policy
+            self.swap_chain.recreate(self.frame_buffers)
+        self.set_frames_in_flight(policy.frames_in_flight())
 
     def _create_instance(self):
         # Vulkan app info - capital V indicates creation of C struct
@@ -71,7 +173,7 @@ class VkApp:
             applicationVersion=VK_MAKE_VERSION(1, 0, 0),
             pEngineName=self.window.name(),
             engineVersion=VK_MAKE_VERSION(1, 0, 0),
-            apiVersion=VK_API_VERSION_1_0,
+            apiVersion=self._query_instance_api_version(),
         )
 
         extensions = self._get_extensions()
@@ -98,6 +200,10 @@ class VkApp:
         )
 
         self.instance = vkCreateInstance(create_info, None)
+        # resolve extension entry points once instead of on every call
+        self.instance_dispatch = InstanceDispatch(self.instance).load(KHR_INSTANCE_FUNCTIONS)
+        if self._enable_validation:
+            self.instance_dispatch.load(EXT_DEBUG_UTILS_FUNCTIONS)
 
     def _setup_debug_messenger(self):
         if self._enable_validation:
@@ -106,7 +212,7 @@ class VkApp:
                 messageType=VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT | VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT | VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT,
                 pfnUserCallback=VkApp._debug_callback
             )
-            self._debug_messenger = vkCreateDebugUtilsMessengerEXT(self.instance, debug_create_info, None)
+            self._debug_messenger = vkCreateDebugUtilsMessengerEXT(self.instance_dispatch, debug_create_info, None)
 
     @staticmethod
     def _debug_callback(message_severity, message_type, p_callback_data, _):
@@ -155,7 +261,7 @@ class VkApp:
 
     def _get_queue_info(self):
         queue_info = []
-        for idx in self.queue_family_indices.unique_indices():
+        for idx in self.queue_family_indices.queue_indices():
             queue_create_info = VkDeviceQueueCreateInfo(
                 queueFamilyIndex=idx,
                 queueCount=1,
@@ -164,8 +270,31 @@ class VkApp:
             queue_info.append(queue_create_info)
         return queue_info
 
+    def _query_instance_api_version(self):
+        # 1.0 loaders don't export vkEnumerateInstanceVersion, nothing past 1.2 is needed
+        try:
+            self._instance_api_version = min(vkEnumerateInstanceVersion(), VK_API_VERSION_1_2)
+        except AttributeError:
+            self._instance_api_version = VK_API_VERSION_1_0
+
+        return self._instance_api_version
+
+    def _supports_timeline_semaphores(self):
+        if self._instance_api_version < VK_API_VERSION_1_2:
+            return False
+        if vkGetPhysicalDeviceProperties(self._physical_device).apiVersion < VK_API_VERSION_1_2:
+            return False
+
+        timeline_features = VkPhysicalDeviceTimelineSemaphoreFeatures()
+        vkGetPhysicalDeviceFeatures2(self._physical_device, VkPhysicalDeviceFeatures2(pNext=timeline_features))
+        return timeline_features.timelineSemaphore == VK_TRUE
+
     def _create_logical_device(self):
         device_features = VkPhysicalDeviceFeatures()
+        if self._prefer_timeline and self._supports_timeline_semaphores():
+            features_next = VkPhysicalDeviceTimelineSemaphoreFeatures(timelineSemaphore=VK_TRUE)
+        else:
+            features_next = None
 
         if self._enable_validation:
             layers = self._validation_layers
@@ -177,12 +306,17 @@ class VkApp:
             pEnabledFeatures=[device_features],
             ppEnabledLayerNames=layers,
             ppEnabledExtensionNames=self._device_extensions,
+            pNext=features_next,
             flags=0
         )
 
         self.device = vkCreateDevice(self._physical_device, device_create_info, None) # VkDevice*
+        if features_next is not None:
+            self.timeline = Timeline(self.device)
+        self.device_dispatch = DeviceDispatch(self.device).load(KHR_DEVICE_FUNCTIONS)
         self._graphics_queue = vkGetDeviceQueue(self.device, self.queue_family_indices.graphics_family, 0)
         self._present_queue = vkGetDeviceQueue(self.device, self.queue_family_indices.present_family, 0)
+        self._transfer_queue = vkGetDeviceQueue(self.device, self.queue_family_indices.upload_family(), 0)
 
     def _create_surface(self):
         # allocate surface ptr to mem using vulkan's FFI obj
@@ -194,49 +328,129 @@ class VkApp:
         # deref the ptr
         self.surface = surface_ptr[0]
 
-    def record_command_buffer(self, buffer, image_idx):
-        buffer.begin_recording()
-        self.render_pass.begin(buffer, self.frame_buffers, image_idx)
-        renderer = BufferRenderer(buffer)
-        renderer.bind_pipeline(self.pipeline)
-        renderer.sample_render(self.swap_chain)
+    def record_command_buffer(self, buffer, image_idx, recording_type=CommandBufferRecordingType.NONE):
+        buffer.begin_recording(recording_type)
+        if self._parallel_recorder is not None:
+            self.render_pass.begin(buffer, self.frame_buffers, image_idx, VK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS)
+            self._parallel_recorder.record(buffer, self.frame_ring.current, self.render_pass.handle, self.frame_buffers.handles[image_idx], self._record_setup, self.draw_list)
+        else:
+            self.render_pass.begin(buffer, self.frame_buffers, image_idx)
+            renderer = BufferRenderer(buffer)
+            self._record_setup(renderer)
+            for draw in self.draw_list:
+                draw(renderer)
         self.render_pass.end(buffer)
         buffer.end_recording()
 
+    def _record_setup(self, renderer):
+        renderer.bind_pipeline(self.pipeline)
+        renderer.set_viewport(self.swap_chain.viewport)
+        renderer.no_scissor(self.swap_chain)
+
+    @staticmethod
+    def _sample_draw(renderer):
+        renderer.draw(3, 1, 0, 0)
+
+    def frame_ready(self):
+        # lets the main loop do other work instead of blocking in draw_frame
+        return self.pacer.poll(self.frame_ring.slot().sync_handler)
+
+    def _on_surface_format_change(self, old_render_pass_key):
+        # pipelines of the old format are destroyed once no frame in flight uses them,
+        # cached command buffers re-record with the new one since the swapchain generation moved on
+        self.pipelines.discard(old_render_pass_key, self.frame_ring.retire)
+        self.pipeline = self.pipelines.get(self._pipeline_description, self.render_pass)
+
+    def _on_framebuffer_resize(self, width, height):
+        self._resized_at = time.perf_counter()
+
+    def _resizing(self):
+        return self._resized_at is not None and time.perf_counter() - self._resized_at < self.resize_settle_time
+
+    def _update_swap_chain(self):
+        # a drag resize sends a size every frame, rebuild once it has settled
+        if self._resized_at is None and not self.swap_chain.out_of_date:
+            return True
+        if self._resizing():
+            return not self.swap_chain.out_of_date
+
+        self._resized_at = None
+        width, height = self.window.framebuffer_size()
+        extent = self.swap_chain.extent
+        if self.swap_chain.out_of_date or extent.width != width or extent.height != height:
+            self.swap_chain.recreate(self.frame_buffers)
+        return True
+
     def draw_frame(self):
-        sync_handler = self.swap_chain.get_sync_handler(self.current_frame)
-        sync_handler.wait_for_fence()
-        image_idx = self.swap_chain.acquire(self.current_frame, self.frame_buffers)
-        if image_idx is None:
+        # nothing to present to, and no point rendering frames nobody sees
+        if self.window.minimized() or not self._update_swap_chain():
             return
 
-        sync_handler.reset_fence()
-
-        command_buffer = self.swap_chain.get_buffer(image_idx)
+        slot = self.frame_ring.slot()
+        # everything allocated while recording and submitting the frame is released when it ends
+        with slot.arena:
+            self._draw_frame(slot)
+
+    def _draw_frame(self, slot):
+        sync_handler = slot.sync_handler
+        self.pacer.limit()
+        self.pacer.wait(sync_handler)
+        self.frame_ring.frame_completed()
+        # copies recorded since the last frame go out in one submit
+        self.uploads.flush()
+        self.uploads.update()
+        self.streamer.update()
+        timings = self.present_timings
+        if timings is not None:
+            acquire_start = time.perf_counter()
+        image_idx = self.swap_chain.acquire(sync_handler.image_available_semaphore, self.frame_buffers, recreate=self._resized_at is None)
+        if timings is not None:
+            acquired = time.perf_counter()
+        if image_idx is None:
+            return
 
-        command_buffer.reset()
-        self.record_command_buffer(command_buffer, image_idx)
-        submit_info = sync_handler.buffer_submission_info([command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
-        vkQueueSubmit(self._graphics_queue, 1, [submit_info], sync_handler.in_flight_fence)
+        if self._recorded_commands is not None:
+            # static scene, replay what was recorded for this image
+            command_buffer = self._recorded_commands.get(image_idx)
+        else:
+            command_buffer = slot.command_buffer
+            command_buffer.reset()
+            self.record_command_buffer(command_buffer, image_idx)
+        sync_handler.submit(self._graphics_queue, [command_buffer.handle], [VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT])
         presentation_info = sync_handler.presentation_info([self.swap_chain.handle], image_idx)
-        vkQueuePresentKHR(self.device, self._present_queue, presentation_info)
+        try:
+            self.device_dispatch.vkQueuePresentKHR(self._present_queue, presentation_info)
+        except (VkErrorOutOfDateKhr, VkSuboptimalKhr):
+            # rebuilt at the start of the next frame, or once a resize settles
+            self.swap_chain.out_of_date = True
+        if timings is not None:
+            timings.record(self.window.events_polled_at(), acquire_start, acquired, time.perf_counter())
 
-        self.current_frame = (self.current_frame + 1) % self.frames_in_flight
+        self.frame_ring.advance()
 
     def _find_queue_families(self, device):
         queue_families = vkGetPhysicalDeviceQueueFamilyProperties(device)
         queue_family_indices = QueueFamilyIndices()
 
         idx = 0
+        transfer_only = None
         for queue_family in queue_families:
             if queue_family.queueFlags & VK_QUEUE_GRAPHICS_BIT != 0:
                 queue_family_indices.graphics_family = idx
-
-            if vkGetPhysicalDeviceSurfaceSupportKHR(self.instance, device, idx, self.surface) > VK_FALSE:
+            elif queue_family.queueFlags & VK_QUEUE_TRANSFER_BIT != 0:
+                # DMA engines copy without taking time from the graphics queue, async compute families come second
+                if queue_family.queueFlags & VK_QUEUE_COMPUTE_BIT == 0 and transfer_only is None:
+                    transfer_only = idx
+                elif queue_family_indices.transfer_family is None:
+                    queue_family_indices.transfer_family = idx
+
+            if vkGetPhysicalDeviceSurfaceSupportKHR(self.instance_dispatch, device, idx, self.surface) > VK_FALSE:
                 queue_family_indices.present_family = idx
 
             idx += 1
 
+        if transfer_only is not None:
+            queue_family_indices.transfer_family = transfer_only
         return queue_family_indices
 
     def _is_device_suitable(self, device):
@@ -246,7 +460,7 @@ class VkApp:
 
         adequate_swap_chain = False
         if supports_extensions:
-            swap_chain_support_details = SwapChain.query_swap_chain_support_details(self.instance, device, self.surface)
+            swap_chain_support_details = SwapChain.query_swap_chain_support_details(self.instance_dispatch, device, self.surface, self.surface_queries)
             adequate_swap_chain = len(swap_chain_support_details.formats) > 0 and len(swap_chain_support_details.presentModes) > 0
 
 
@@ -254,15 +468,16 @@ class VkApp:
         return (queue_family_indices.is_complete() and supports_extensions and adequate_swap_chain), queue_family_indices
 
     def _check_device_extension_support(self, device):
-        supported_extensions = vkEnumerateDeviceExtensionProperties(device, None)
-        extensions = set(self._device_extensions)
+        return set(self._device_extensions) <= self.supported_device_extensions(device)
 
-        for supported_extension in supported_extensions:
-            ext_name = supported_extension.extensionName
-            if ext_name in extensions:
-                extensions.remove(ext_name)
+    def supported_device_extensions(self, device):
+        # decoded once per physical device, every later check is a set lookup
+        names = self._supported_device_extensions.get(device)
+        if names is None:
+            names = extension_names(vkEnumerateDeviceExtensionPropertiesInto(device, None, self._extension_properties))
+            self._supported_device_extensions[device] = names
 
-        return len(extensions) == 0
+        return names
 
     # separate extensions as they will be needed on the device later
     def _get_extensions(self):
@@ -275,21 +490,9 @@ class VkApp:
 
     @staticmethod
     def _check_for_layers(layers):
-        # get available system layers
-        available_layers = list(vkEnumerateInstanceLayerProperties())
-
-        # loop over layers making sure all the requested layers are present on system
-        for layer in layers:
-            layer_found = False
-            for available_layer in available_layers:
-                if available_layer.layerName == layer:
-                    layer_found = True
-                    break
-
-            if not layer_found:
-                return False
-
-        return True
+        # get available system layers and make sure all the requested layers are present on system
+        available_layers = layer_names(vkEnumerateInstanceLayerPropertiesInto(EnumerationBuffer("VkLayerProperties")))
+        return set(layers) <= available_layers
 
     def validation_layer(self, layer):
         self._validation_layers.append(layer)
@@ -303,28 +506,98 @@ class VkApp:
     def disable_validation(self):
         self._enable_validation = False
 
+    def enable_timeline_semaphores(self):
+        self._prefer_timeline = True
+
+    def disable_timeline_semaphores(self):
+        self._prefer_timeline = False
+
+    def enable_command_caching(self):
+        self._cache_commands = True
+
+    def disable_command_caching(self):
+        self._cache_commands = False
+
+    def enable_parallel_recording(self, workers):
+        self._recording_workers = workers
+
+    def disable_parallel_recording(self):
+        self._recording_workers = 0
+
+    def enable_latency_tracking(self, frames=240):
+        self.present_timings = PresentTimings(frames)
+
+    def disable_latency_tracking(self):
+        self.present_timings = None
+
+    def enable_pipeline_cache(self, directory=PipelineCache.DEFAULT_DIRECTORY):
+        self._pipeline_cache_directory = directory
+
+    def disable_pipeline_cache(self):
+        self._pipeline_cache_directory = None
+
+    def enable_streaming_processes(self, workers=ResourceStreamer.DEFAULT_WORKERS):
+        # decoders that hold the GIL only run in parallel in processes
+        self._streaming_workers = workers
+        self._streaming_processes = True
+
+    def disable_streaming_processes(self):
+        self._streaming_workers = ResourceStreamer.DEFAULT_WORKERS
+        self._streaming_processes = False
+
+    def add_cleanup_hook(self, hook):
+        self._cleanup_hooks.append(hook)
+
+    def remove_cleanup_hook(self, hook):
+        self._cleanup_hooks.remove(hook)
+
+    def invalidate_commands(self):
+        # the scene changed, re-record every image on its next draw
+        if self._recorded_commands is not None:
+            SyncHandler.wait_idle(self.device)
+            self._recorded_commands.invalidate()
+
     def device_extension(self, extension):
         self._device_extensions.append(extension)
 
     def cleanup(self):
         SyncHandler.wait_idle(self.device)
+        self.window.remove_resize_listener(self._on_framebuffer_resize)
+        if self._parallel_recorder is not None:
+            self._parallel_recorder.destroy()
+        self.frame_ring.destroy()
+        if self.timeline is not None:
+            self.timeline.destroy()
         self.command_pool.destroy()
-        self.pipeline.destroy()
+        self.pipelines.destroy()
+        if self.pipeline_cache is not None:
+            self.pipeline_cache.save()
+            self.pipeline_cache.destroy()
         self.frame_buffers.destroy()
         self.render_pass.destroy()
         self.swap_chain.destroy()
+        self.pacer.remove_idle_work(self.streamer.update)
+        self.streamer.destroy()
+        for hook in self._cleanup_hooks:
+            hook()
+        self.pacer.remove_idle_work(self.uploads.update)
+        self.uploads.destroy()
+        self.allocator.destroy()
         vkDestroyDevice(self.device, None)
-        vkDestroySurfaceKHR(self.instance, self.surface, None)
+        self.surface_queries.clear()
+        vkDestroySurfaceKHR(self.instance_dispatch, self.surface, None)
 
         if self._enable_validation:
-            vkDestroyDebugUtilsMessengerEXT(self.instance, self._debug_messenger, None)
+            vkDestroyDebugUtilsMessengerEXT(self.instance_dispatch, self._debug_messenger, None)
 
         vkDestroyInstance(self.instance, None)
 
 class QueueFamilyIndices:
-    def __init__(self, graphics_family=None, present_family=None):
+    def __init__(self, graphics_family=None, present_family=None, transfer_family=None):
         self.graphics_family = graphics_family
         self.present_family = present_family
+        # a family that only copies, None when uploads share the graphics queue
+        self.transfer_family = transfer_family
 
     def indices(self):
         return [ self.graphics_family, self.present_family ]
@@ -332,5 +605,14 @@ class QueueFamilyIndices:
     def unique_indices(self):
         return set(self.indices())
 
+    def queue_indices(self):
+        # every family the device needs a queue from, the swapchain only cares about unique_indices
+        if self.transfer_family is None:
+            return self.unique_indices()
+        return self.unique_indices() | {self.transfer_family}
+
+    def upload_family(self):
+        return self.graphics_family if self.transfer_family is None else self.transfer_family
+
     def is_complete(self) -> bool:
         return self.graphics_family is not None and self.present_family is not None
@@ -1,4 +1,8 @@
 from collections.abc import Iterable
+import os as _os
+import re as _re
+import struct as _struct
+import threading as _threading
 import weakref as _weakref
 import sys
 
@@ -9,6 +13,60 @@ _weakkey_dict = _weakref.WeakKeyDictionary()
 PY3 = sys.version_info >= (3, 0)
 
 
+class _ArenaState(_threading.local):
+    arena = None
+
+
+_arena_state = _ArenaState()
+
+
+class Arena(object):
+    """Owner of the temporary C allocations made while building structs
+
+    While an arena is active on the current thread, the arrays and strings
+    that struct construction and pointer casting allocate are kept alive by
+    the arena instead of being tied to their parent through the weak key
+    dictionary, and all of them are released together when the with block
+    exits or reset() is called. Structs built inside an arena must not be
+    used after that. Arenas nest; the innermost one owns the allocations.
+
+    Only wrap code whose structs are thrown away before the block ends,
+    create info trees and per-frame recording. Structs that are kept and
+    reused have to be built outside of any arena, or point only at arrays
+    their owner keeps in attributes.
+    """
+    def __init__(self):
+        self._refs = []
+        self._previous = None
+
+    def __len__(self):
+        return len(self._refs)
+
+    def keep(self, ref):
+        self._refs.append(ref)
+
+    def reset(self):
+        self._refs.clear()
+
+    def __enter__(self):
+        self._previous = _arena_state.arena
+        _arena_state.arena = self
+        return self
+
+    def __exit__(self, *exc_info):
+        _arena_state.arena = self._previous
+        self._previous = None
+        self.reset()
+
+
+def _keep_alive(owner, refs):
+    arena = _arena_state.arena
+    if arena is None:
+        _weakkey_dict[owner] = refs
+    else:
+        arena.keep(refs)
+
+
 class ProcedureNotFoundError(Exception):
     pass
 
@@ -17,12 +75,18 @@ class ExtensionNotSupportedError(Exception):
     pass
 
 
+_char_types = {}
+
+
 def _cstr(x):
     if not isinstance(x, ffi.CData):
         return x
 
     t = ffi.typeof(x)
-    if 'item' not in dir(t) or t.item.cname != 'char':
+    is_char = _char_types.get(t)
+    if is_char is None:
+        is_char = _char_types[t] = t.kind in ('array', 'pointer') and t.item.cname == 'char'
+    if not is_char:
         return x
 
     if PY3:
@@ -66,7 +130,104 @@ class StrWrap(object):
         return _cstr(attr)
 
 
-def _cast_ptr2(x, _type):
+_FLOAT_FORMATS = frozenset('efd')
+_SIGNED_FORMATS = frozenset('bhilqn')
+_UNSIGNED_FORMATS = frozenset('BHILQN?')
+# integer item type -> whether it is signed
+_signed_types = {}
+# struct or function name -> its pointer fields or argument indices that are not const in vulkan.cdef.h,
+# the driver writes through them. parsed on the first read-only buffer
+_writable_pointers = None
+
+
+def _signed(item):
+    signed = _signed_types.get(item)
+    if signed is None:
+        signed = _signed_types[item] = int(ffi.cast(item, -1)) < 0
+    return signed
+
+
+def _buffer_matches(view, item):
+    """Check that a buffer can be read as an array of item in place"""
+    if not view.c_contiguous:
+        return False
+    if item.cname == 'void':
+        return True
+    try:
+        if view.itemsize != ffi.sizeof(item):
+            return False
+    except ffi.error:
+        return False
+    if item.kind in ('primitive', 'enum'):
+        fmt = view.format.lstrip('@=<')
+        if len(fmt) != 1:
+            return False
+        if item.cname in ('float', 'double'):
+            return fmt in _FLOAT_FORMATS
+        if fmt in _FLOAT_FORMATS:
+            return False
+        # enums take either, char* fields are text or bytes
+        if item.kind == 'enum' or item.cname == 'char':
+            return True
+        return fmt in (_SIGNED_FORMATS if _signed(item) else _UNSIGNED_FORMATS)
+    # structs, unions and handles only need a matching element size
+    return True
+
+
+def _parse_writable_pointers():
+    with open(_os.path.join(_os.path.dirname(__file__), 'vulkan.cdef.h')) as f:
+        cdef = f.read()
+
+    def written(declaration, arrays):
+        # array arguments are pointers too, array fields are stored inline
+        declaration = declaration.strip()
+        return ('*' in declaration or (arrays and '[' in declaration)) and not declaration.startswith('const ')
+
+    writable = {}
+    for name, body in _re.findall(r'typedef (?:struct|union) (\w+) \{([^{}]*)\}', cdef):
+        fields = [field.split()[-1] for field in body.split(';') if written(field, False)]
+        if fields:
+            writable[name] = frozenset(fields)
+    for name, params in _re.findall(r'typedef \w+ \( \*PFN_(\w+)\)\((.*?)\);', cdef):
+        args = [i for i, param in enumerate(params.split(',')) if written(param, True)]
+        if args:
+            writable[name] = frozenset(args)
+
+    return writable
+
+
+def _check_writable(owner, name):
+    global _writable_pointers
+    if _writable_pointers is None:
+        _writable_pointers = _parse_writable_pointers()
+    if name in _writable_pointers.get(owner, ()):
+        where = f"argument {name} of {owner}" if isinstance(name, int) else f"{owner}.{name}"
+        raise TypeError(f"{where} is written by the driver, got a read-only buffer")
+
+
+def _from_buffer(x, _type, owner=None, name=None):
+    """Zero-copy view of a buffer protocol object, or None
+
+    owner and name are the struct and field or the function and argument
+    index the pointer is for, read-only buffers are refused where the
+    driver writes through it.
+    """
+    if isinstance(x, (list, tuple, bytes, str)):
+        return None
+    try:
+        view = memoryview(x)
+    except TypeError:
+        return None
+    if view.readonly and owner is not None:
+        _check_writable(owner, name)
+    if not _buffer_matches(view, _type.item):
+        return None
+    if _type.item.cname == 'void':
+        return ffi.from_buffer(x)
+    return ffi.from_buffer(_type.item.cname + '[]', x)
+
+
+def _cast_ptr2(x, _type, owner=None, name=None):
     if isinstance(x, ffi.CData):
         if (_type.item == ffi.typeof(x) or
             (_type.item.cname == 'void' and ffi.typeof(x).kind in
@@ -74,12 +235,21 @@ def _cast_ptr2(x, _type):
             return ffi.addressof(x), x
         return x, x
 
+    # numpy arrays, memoryviews, bytearrays... are passed without copying
+    # when their layout matches the pointed type
+    ret = _from_buffer(x, _type, owner, name)
+    if ret is not None:
+        return ret, ret
+
     if isinstance(x, Iterable):
         if _type.item.kind == 'pointer':
             ptrs = [_cast_ptr(i, _type.item) for i in x]
             ret = ffi.new(_type.item.cname+'[]', [i for i, _ in ptrs])
-            _weakkey_dict[ret] = tuple(i for _, i in ptrs if i != ffi.NULL)
+            _keep_alive(ret, tuple(i for _, i in ptrs if i != ffi.NULL))
         else:
+            if not isinstance(x, (list, tuple, bytes)):
+                # buffers with a different layout and other iterables are copied element by element
+                x = list(x)
             ret = ffi.new(_type.item.cname+'[]', x)
 
         return ret, ret
@@ -87,13 +257,13 @@ def _cast_ptr2(x, _type):
     return ffi.cast(_type, x), x
 
 
-def _cast_ptr3(x, _type):
+def _cast_ptr3(x, _type, owner=None, name=None):
     if isinstance(x, str):
         try:
             x = x.encode('ascii')
         except UnicodeEncodeError:
             x = x.encode('utf-8')
-    return _cast_ptr2(x, _type)
+    return _cast_ptr2(x, _type, owner, name)
 
 
 _cast_ptr = _cast_ptr3 if PY3 else _cast_ptr2
@@ -2590,6 +2760,9 @@ def VK_VERSION_PATCH(version):
 
 VK_API_VERSION = VK_MAKE_VERSION(1, 0, 0)
 VK_API_VERSION_1_0 = VK_MAKE_VERSION(1, 0, 0)
+VK_API_VERSION_1_1 = VK_MAKE_VERSION(1, 1, 0)
+VK_API_VERSION_1_2 = VK_MAKE_VERSION(1, 2, 0)
+VK_API_VERSION_1_3 = VK_MAKE_VERSION(1, 3, 0)
 VK_NULL_HANDLE = 0
 _UINT64_MAX = ffi.new('unsigned long long int*', 18446744073709551615)
 UINT64_MAX = _UINT64_MAX[0]
@@ -6254,41 +6427,86 @@ def _get_pfn_name(struct_name):
         return 'vkGetInstanceProcAddrLUNARG'
 
 
-def _new(ctype, **kwargs):
-    _type = ffi.typeof(ctype)
+_FIELD_VALUE = 0
+_FIELD_POINTER = 1
+_FIELD_PFN = 2
+_FIELD_CODE = 3
+
+
+class _StructPlan(object):
+    """Constructor plan for one struct type
+
+    Field kinds, pointer types and the pfn callback are worked out once from
+    the cffi type so that building the same struct again skips all
+    reflection.
+    """
+    __slots__ = ('cname', 'kinds', 'types', 'pfn_global', 'pfn_callback')
+
+    def __init__(self, ctype):
+        _type = ffi.typeof(ctype)
+        self.cname = _type.cname + '*'
+        self.kinds = {}
+        self.types = {}
+        self.pfn_global = None
+        self.pfn_callback = None
+
+        for name, field in _type.fields:
+            if name == 'pCode':
+                self.kinds[name] = _FIELD_CODE
+            elif name.startswith('pfn'):
+                self.kinds[name] = _FIELD_PFN
+                pfn_name = _get_pfn_name(ctype)
+                self.pfn_global = '_internal_' + pfn_name
+                self.pfn_callback = globals()['_external_' + pfn_name]
+            elif field.type.kind == 'pointer':
+                self.kinds[name] = _FIELD_POINTER
+                self.types[name] = field.type
+            else:
+                self.kinds[name] = _FIELD_VALUE
+
+
+_struct_plans = {}
+
 
-    # keep only valued kwargs
-    kwargs = {k: kwargs[k] for k in kwargs if kwargs[k]}
+def _new(ctype, **kwargs):
+    plan = _struct_plans.get(ctype)
+    if plan is None:
+        plan = _struct_plans[ctype] = _StructPlan(ctype)
 
-    # cast pointer
-    ptrs = {}
-    pfns = {}
-    pcs = {}
+    kinds = plan.kinds
+    init = {}
+    refs = []
     for k, v in kwargs.items():
-        # convert tuple pair to dict
-        ktype = dict(_type.fields)[k].type
-
-        if k == 'pCode':
-            pcs[k] = ffi.cast('uint32_t*', ffi.from_buffer(v))
-        elif k.startswith('pfn'):
-            pfn_name = _get_pfn_name(ctype)
-            mod = sys.modules[__name__]
-            setattr(mod, '_internal_' + pfn_name, v)
-            pfns[k] = getattr(mod, '_external_' + pfn_name)
-        elif ktype.kind == 'pointer':
-            ptrs[k] = _cast_ptr(v, ktype)
-
-    # init object
-    init = dict(kwargs,  **{k: v for k, (v, _) in ptrs.items()})
-    init.update(pfns)
-    init.update(pcs)
-
-    ret = ffi.new(_type.cname + '*', init)[0]
-
-    # reference created pointer in the object
-    _weakkey_dict[ret] = [v for _, v in ptrs.values() if v != ffi.NULL]
-    if pcs:
-        _weakkey_dict[ret].extend([x for x in pcs.values()])
+        # keep only valued kwargs, buffers are never truth tested (a one element array of 0 is falsy)
+        if v is None:
+            continue
+
+        kind = kinds[k]
+        if kind == _FIELD_VALUE:
+            # fields start zeroed, which also lets 0.0 stand in for integer fields
+            if isinstance(v, (int, float)) and not v:
+                continue
+            init[k] = v
+        elif kind == _FIELD_POINTER:
+            if isinstance(v, (list, tuple, str, bytes)) and not v:
+                continue
+            ptr, ref = _cast_ptr(v, plan.types[k], ctype, k)
+            init[k] = ptr
+            if ref != ffi.NULL:
+                refs.append(ref)
+        elif kind == _FIELD_CODE:
+            buf = ffi.from_buffer(v)
+            init[k] = ffi.cast('uint32_t*', buf)
+            refs.append(buf)
+        else:
+            globals()[plan.pfn_global] = v
+            init[k] = plan.pfn_callback
+
+    ret = ffi.new(plan.cname, init)[0]
+
+    # reference created pointer in the object, or in the active arena
+    if refs:
+        _keep_alive(ret, refs)
 
     return ret
 
@@ -11010,17 +11228,68 @@ def VkRenderPassStripeSubmitInfoARM(sType=VK_STRUCTURE_TYPE_RENDER_PASS_STRIPE_S
 
 
 
-def _auto_handle(x, _type):
+def _auto_handle(x, _type, owner=None, name=None):
     if x is None:
         return ffi.NULL
     if _type.kind == 'pointer':
-        ptr, _ = _cast_ptr(x, _type)
+        ptr, _ = _cast_ptr(x, _type, owner, name)
         return ptr
     return x
 
 
+def _is_handle(_type):
+    # dispatchable and non-dispatchable handles are pointers to opaque structs
+    if _type.kind != 'pointer' or _type.item.kind != 'struct':
+        return False
+    try:
+        ffi.sizeof(_type.item)
+    except ffi.error:
+        return True
+    return False
+
+
+def _call_plan(fn, name):
+    """Split the parameters of a function into handle and pointer slots
+
+    Handles are passed through untouched when they already are cdata,
+    pointers always go through the conversion, everything else is handed
+    to cffi as is. name is the Vulkan function the pointers belong to.
+    """
+    handles = []
+    pointers = []
+    for i, _type in enumerate(ffi.typeof(fn).args):
+        if _is_handle(_type):
+            handles.append((i, _type))
+        elif _type.kind == 'pointer':
+            pointers.append((i, _type))
+
+    return tuple(handles), tuple(pointers), name
+
+
+_call_plans = {}
+_CData = ffi.CData
+
+
 def _callApi(fn, *args):
-    fn_args = [_auto_handle(i, j) for i, j in zip(args, ffi.typeof(fn).args)]
+    plan = _call_plans.get(fn)
+    if plan is None:
+        # the generated wrappers are named after the function they call
+        plan = _call_plans[fn] = _call_plan(fn, sys._getframe(1).f_code.co_name)
+
+    handles, pointers, name = plan
+    fn_args = args
+    for i, _type in handles:
+        if not isinstance(args[i], _CData):
+            if fn_args is args:
+                fn_args = list(args)
+            fn_args[i] = _auto_handle(args[i], _type)
+
+    if pointers:
+        if fn_args is args:
+            fn_args = list(args)
+        for i, _type in pointers:
+            fn_args[i] = _auto_handle(args[i], _type, name, i)
+
     return fn(*fn_args)
 
 
@@ -11814,17 +12083,6 @@ device
     result = _callApi(lib.vkResetQueryPool, device,queryPool,firstQuery,queryCount)
 
 
-def _wrap_vkResetQueryPool(fn):
-    def vkResetQueryPool(
-    device
-            ,queryPool
-            ,firstQuery
-            ,queryCount
-            ,):
-        result = _callApi(fn, device,queryPool,firstQuery,queryCount)
-
-
-    return vkResetQueryPool
 def vkCreateBuffer(
 device
         ,pCreateInfo
@@ -12166,30 +12424,6 @@ device
 
 
 
-def _wrap_vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI(fn):
-    def vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI(
-    device
-            ,renderpass
-            ,pMaxWorkgroupSize=None
-            ,):
-
-        custom_return = True
-        if not pMaxWorkgroupSize:
-            pMaxWorkgroupSize = ffi.new('VkExtent2D*')
-            custom_return = False
-
-        result = _callApi(fn, device,renderpass,pMaxWorkgroupSize)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMaxWorkgroupSize
-
-        return pMaxWorkgroupSize[0]
-
-
-
-    return vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI
 def vkDestroyPipeline(
 device
         ,pipeline
@@ -12457,28 +12691,6 @@ device
 
 
 
-def _wrap_vkGetRenderingAreaGranularityKHR(fn):
-    def vkGetRenderingAreaGranularityKHR(
-    device
-            ,pRenderingAreaInfo
-            ,pGranularity=None
-            ,):
-
-        custom_return = True
-        if not pGranularity:
-            pGranularity = ffi.new('VkExtent2D*')
-            custom_return = False
-
-        result = _callApi(fn, device,pRenderingAreaInfo,pGranularity)
-
-        if custom_return:
-            return pGranularity
-
-        return pGranularity[0]
-
-
-
-    return vkGetRenderingAreaGranularityKHR
 def vkCreateCommandPool(
 device
         ,pCreateInfo
@@ -12585,15 +12797,6 @@ commandBuffer
     result = _callApi(lib.vkCmdBindPipeline, commandBuffer,pipelineBindPoint,pipeline)
 
 
-def _wrap_vkCmdSetAttachmentFeedbackLoopEnableEXT(fn):
-    def vkCmdSetAttachmentFeedbackLoopEnableEXT(
-    commandBuffer
-            ,aspectMask
-            ,):
-        result = _callApi(fn, commandBuffer,aspectMask)
-
-
-    return vkCmdSetAttachmentFeedbackLoopEnableEXT
 def vkCmdSetViewport(
 commandBuffer
         ,firstViewport
@@ -12720,33 +12923,6 @@ commandBuffer
     result = _callApi(lib.vkCmdDrawIndexed, commandBuffer,indexCount,instanceCount,firstIndex,vertexOffset,firstInstance)
 
 
-def _wrap_vkCmdDrawMultiEXT(fn):
-    def vkCmdDrawMultiEXT(
-    commandBuffer
-            ,drawCount
-            ,pVertexInfo
-            ,instanceCount
-            ,firstInstance
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,drawCount,pVertexInfo,instanceCount,firstInstance,stride)
-
-
-    return vkCmdDrawMultiEXT
-def _wrap_vkCmdDrawMultiIndexedEXT(fn):
-    def vkCmdDrawMultiIndexedEXT(
-    commandBuffer
-            ,drawCount
-            ,pIndexInfo
-            ,instanceCount
-            ,firstInstance
-            ,stride
-            ,pVertexOffset
-            ,):
-        result = _callApi(fn, commandBuffer,drawCount,pIndexInfo,instanceCount,firstInstance,stride,pVertexOffset)
-
-
-    return vkCmdDrawMultiIndexedEXT
 def vkCmdDrawIndirect(
 commandBuffer
         ,buffer
@@ -12784,45 +12960,6 @@ commandBuffer
     result = _callApi(lib.vkCmdDispatchIndirect, commandBuffer,buffer,offset)
 
 
-def _wrap_vkCmdSubpassShadingHUAWEI(fn):
-    def vkCmdSubpassShadingHUAWEI(
-    commandBuffer
-            ,):
-        result = _callApi(fn, commandBuffer)
-
-
-    return vkCmdSubpassShadingHUAWEI
-def _wrap_vkCmdDrawClusterHUAWEI(fn):
-    def vkCmdDrawClusterHUAWEI(
-    commandBuffer
-            ,groupCountX
-            ,groupCountY
-            ,groupCountZ
-            ,):
-        result = _callApi(fn, commandBuffer,groupCountX,groupCountY,groupCountZ)
-
-
-    return vkCmdDrawClusterHUAWEI
-def _wrap_vkCmdDrawClusterIndirectHUAWEI(fn):
-    def vkCmdDrawClusterIndirectHUAWEI(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset)
-
-
-    return vkCmdDrawClusterIndirectHUAWEI
-def _wrap_vkCmdUpdatePipelineIndirectBufferNV(fn):
-    def vkCmdUpdatePipelineIndirectBufferNV(
-    commandBuffer
-            ,pipelineBindPoint
-            ,pipeline
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineBindPoint,pipeline)
-
-
-    return vkCmdUpdatePipelineIndirectBufferNV
 def vkCmdCopyBuffer(
 commandBuffer
         ,srcBuffer
@@ -12880,31 +13017,6 @@ commandBuffer
     result = _callApi(lib.vkCmdCopyImageToBuffer, commandBuffer,srcImage,srcImageLayout,dstBuffer,regionCount,pRegions)
 
 
-def _wrap_vkCmdCopyMemoryIndirectNV(fn):
-    def vkCmdCopyMemoryIndirectNV(
-    commandBuffer
-            ,copyBufferAddress
-            ,copyCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,copyBufferAddress,copyCount,stride)
-
-
-    return vkCmdCopyMemoryIndirectNV
-def _wrap_vkCmdCopyMemoryToImageIndirectNV(fn):
-    def vkCmdCopyMemoryToImageIndirectNV(
-    commandBuffer
-            ,copyBufferAddress
-            ,copyCount
-            ,stride
-            ,dstImage
-            ,dstImageLayout
-            ,pImageSubresources
-            ,):
-        result = _callApi(fn, commandBuffer,copyBufferAddress,copyCount,stride,dstImage,dstImageLayout,pImageSubresources)
-
-
-    return vkCmdCopyMemoryToImageIndirectNV
 def vkCmdUpdateBuffer(
 commandBuffer
         ,dstBuffer
@@ -13033,23 +13145,6 @@ commandBuffer
     result = _callApi(lib.vkCmdEndQuery, commandBuffer,queryPool,query)
 
 
-def _wrap_vkCmdBeginConditionalRenderingEXT(fn):
-    def vkCmdBeginConditionalRenderingEXT(
-    commandBuffer
-            ,pConditionalRenderingBegin
-            ,):
-        result = _callApi(fn, commandBuffer,pConditionalRenderingBegin)
-
-
-    return vkCmdBeginConditionalRenderingEXT
-def _wrap_vkCmdEndConditionalRenderingEXT(fn):
-    def vkCmdEndConditionalRenderingEXT(
-    commandBuffer
-            ,):
-        result = _callApi(fn, commandBuffer)
-
-
-    return vkCmdEndConditionalRenderingEXT
 def vkCmdResetQueryPool(
 commandBuffer
         ,queryPool
@@ -13121,9433 +13216,1192 @@ commandBuffer
     result = _callApi(lib.vkCmdExecuteCommands, commandBuffer,commandBufferCount,pCommandBuffers)
 
 
-def _wrap_vkCreateAndroidSurfaceKHR(fn):
-    def vkCreateAndroidSurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
+def vkGetPhysicalDeviceFeatures2(
+physicalDevice
+        ,pFeatures=None
+        ,):
 
-        return pSurface[0]
+    custom_return = True
+    if not pFeatures:
+        pFeatures = ffi.new('VkPhysicalDeviceFeatures2*')
+        custom_return = False
 
+    result = _callApi(lib.vkGetPhysicalDeviceFeatures2, physicalDevice,pFeatures)
 
+    if custom_return:
+        return pFeatures
 
-    return vkCreateAndroidSurfaceKHR
-def _wrap_vkGetPhysicalDeviceDisplayPropertiesKHR(fn):
-    def vkGetPhysicalDeviceDisplayPropertiesKHR(
-    physicalDevice
-            ,):
+    return pFeatures[0]
 
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
 
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        pProperties = ffi.new('VkDisplayPropertiesKHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkGetPhysicalDeviceProperties2(
+physicalDevice
+        ,pProperties=None
+        ,):
 
-        result = (StrWrap(x) for x in pProperties)
-        _weakkey_dict[result] = pProperties
-        return result
+    custom_return = True
+    if not pProperties:
+        pProperties = ffi.new('VkPhysicalDeviceProperties2*')
+        custom_return = False
 
+    result = _callApi(lib.vkGetPhysicalDeviceProperties2, physicalDevice,pProperties)
 
-    return vkGetPhysicalDeviceDisplayPropertiesKHR
-def _wrap_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(fn):
-    def vkGetPhysicalDeviceDisplayPlanePropertiesKHR(
-    physicalDevice
-            ,):
+    if custom_return:
+        return pProperties
 
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
+    return pProperties[0]
 
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        pProperties = ffi.new('VkDisplayPlanePropertiesKHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pProperties
+def vkGetPhysicalDeviceFormatProperties2(
+physicalDevice
+        ,format
+        ,pFormatProperties=None
+        ,):
 
+    custom_return = True
+    if not pFormatProperties:
+        pFormatProperties = ffi.new('VkFormatProperties2*')
+        custom_return = False
 
-    return vkGetPhysicalDeviceDisplayPlanePropertiesKHR
-def _wrap_vkGetDisplayPlaneSupportedDisplaysKHR(fn):
-    def vkGetDisplayPlaneSupportedDisplaysKHR(
-    physicalDevice
-            ,planeIndex
-            ,):
+    result = _callApi(lib.vkGetPhysicalDeviceFormatProperties2, physicalDevice,format,pFormatProperties)
 
-        pDisplayCount = ffi.new('uint32_t*')
-        pDisplays = ffi.NULL
+    if custom_return:
+        return pFormatProperties
 
-        result = _callApi(fn, physicalDevice,planeIndex,pDisplayCount,pDisplays)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pFormatProperties[0]
 
-        pDisplays = ffi.new('VkDisplayKHR[]', pDisplayCount[0])
-        result = _callApi(fn, physicalDevice,planeIndex,pDisplayCount,pDisplays)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pDisplays
 
+def vkGetPhysicalDeviceImageFormatProperties2(
+physicalDevice
+        ,pImageFormatInfo
+        ,pImageFormatProperties=None
+        ,):
 
-    return vkGetDisplayPlaneSupportedDisplaysKHR
-def _wrap_vkGetDisplayModePropertiesKHR(fn):
-    def vkGetDisplayModePropertiesKHR(
-    physicalDevice
-            ,display
-            ,):
+    custom_return = True
+    if not pImageFormatProperties:
+        pImageFormatProperties = ffi.new('VkImageFormatProperties2*')
+        custom_return = False
 
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
+    result = _callApi(lib.vkGetPhysicalDeviceImageFormatProperties2, physicalDevice,pImageFormatInfo,pImageFormatProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        result = _callApi(fn, physicalDevice,display,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    if custom_return:
+        return pImageFormatProperties
 
-        pProperties = ffi.new('VkDisplayModePropertiesKHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,display,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pImageFormatProperties[0]
 
-        return pProperties
 
 
-    return vkGetDisplayModePropertiesKHR
-def _wrap_vkCreateDisplayModeKHR(fn):
-    def vkCreateDisplayModeKHR(
-    physicalDevice
-            ,display
-            ,pCreateInfo
-            ,pAllocator
-            ,pMode=None
-            ,):
+def vkGetPhysicalDeviceQueueFamilyProperties2(
+physicalDevice
+        ,):
 
-        custom_return = True
-        if not pMode:
-            pMode = ffi.new('VkDisplayModeKHR*')
-            custom_return = False
+    pQueueFamilyPropertyCount = ffi.new('uint32_t*')
+    pQueueFamilyProperties = ffi.NULL
 
-        result = _callApi(fn, physicalDevice,display,pCreateInfo,pAllocator,pMode)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkGetPhysicalDeviceQueueFamilyProperties2, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
 
-        if custom_return:
-            return pMode
+    pQueueFamilyProperties = ffi.new('VkQueueFamilyProperties2[]', pQueueFamilyPropertyCount[0])
+    result = _callApi(lib.vkGetPhysicalDeviceQueueFamilyProperties2, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
 
-        return pMode[0]
+    return pQueueFamilyProperties
 
 
+def vkGetPhysicalDeviceMemoryProperties2(
+physicalDevice
+        ,pMemoryProperties=None
+        ,):
 
-    return vkCreateDisplayModeKHR
-def _wrap_vkGetDisplayPlaneCapabilitiesKHR(fn):
-    def vkGetDisplayPlaneCapabilitiesKHR(
-    physicalDevice
-            ,mode
-            ,planeIndex
-            ,pCapabilities=None
-            ,):
+    custom_return = True
+    if not pMemoryProperties:
+        pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties2*')
+        custom_return = False
 
-        custom_return = True
-        if not pCapabilities:
-            pCapabilities = ffi.new('VkDisplayPlaneCapabilitiesKHR*')
-            custom_return = False
+    result = _callApi(lib.vkGetPhysicalDeviceMemoryProperties2, physicalDevice,pMemoryProperties)
 
-        result = _callApi(fn, physicalDevice,mode,planeIndex,pCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    if custom_return:
+        return pMemoryProperties
 
-        if custom_return:
-            return pCapabilities
+    return pMemoryProperties[0]
 
-        return pCapabilities[0]
 
 
+def vkGetPhysicalDeviceSparseImageFormatProperties2(
+physicalDevice
+        ,pFormatInfo
+        ,):
 
-    return vkGetDisplayPlaneCapabilitiesKHR
-def _wrap_vkCreateDisplayPlaneSurfaceKHR(fn):
-    def vkCreateDisplayPlaneSurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+    pPropertyCount = ffi.new('uint32_t*')
+    pProperties = ffi.NULL
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    result = _callApi(lib.vkGetPhysicalDeviceSparseImageFormatProperties2, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    pProperties = ffi.new('VkSparseImageFormatProperties2[]', pPropertyCount[0])
+    result = _callApi(lib.vkGetPhysicalDeviceSparseImageFormatProperties2, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
 
-        if custom_return:
-            return pSurface
+    return pProperties
 
-        return pSurface[0]
 
+def vkTrimCommandPool(
+device
+        ,commandPool
+        ,flags
+        ,):
+    result = _callApi(lib.vkTrimCommandPool, device,commandPool,flags)
 
 
-    return vkCreateDisplayPlaneSurfaceKHR
-def _wrap_vkCreateSharedSwapchainsKHR(fn):
-    def vkCreateSharedSwapchainsKHR(
-    device
-            ,swapchainCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pSwapchains=None
-            ,):
+def vkGetPhysicalDeviceExternalBufferProperties(
+physicalDevice
+        ,pExternalBufferInfo
+        ,pExternalBufferProperties=None
+        ,):
 
-        custom_return = True
-        if not pSwapchains:
-            pSwapchains = ffi.new('VkSwapchainKHR[%d]' % swapchainCount)
-            custom_return = False
+    custom_return = True
+    if not pExternalBufferProperties:
+        pExternalBufferProperties = ffi.new('VkExternalBufferProperties*')
+        custom_return = False
 
-        result = _callApi(fn, device,swapchainCount,pCreateInfos,pAllocator,pSwapchains)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkGetPhysicalDeviceExternalBufferProperties, physicalDevice,pExternalBufferInfo,pExternalBufferProperties)
 
-        if custom_return:
-            return pSwapchains
+    if custom_return:
+        return pExternalBufferProperties
 
-        return pSwapchains
+    return pExternalBufferProperties[0]
 
 
 
-    return vkCreateSharedSwapchainsKHR
-def _wrap_vkDestroySurfaceKHR(fn):
-    def vkDestroySurfaceKHR(
-    instance
-            ,surface
-            ,pAllocator
-            ,):
-        result = _callApi(fn, instance,surface,pAllocator)
+def vkGetPhysicalDeviceExternalSemaphoreProperties(
+physicalDevice
+        ,pExternalSemaphoreInfo
+        ,pExternalSemaphoreProperties=None
+        ,):
 
+    custom_return = True
+    if not pExternalSemaphoreProperties:
+        pExternalSemaphoreProperties = ffi.new('VkExternalSemaphoreProperties*')
+        custom_return = False
 
-    return vkDestroySurfaceKHR
-def _wrap_vkGetPhysicalDeviceSurfaceSupportKHR(fn):
-    def vkGetPhysicalDeviceSurfaceSupportKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,surface
-            ,pSupported=None
-            ,):
+    result = _callApi(lib.vkGetPhysicalDeviceExternalSemaphoreProperties, physicalDevice,pExternalSemaphoreInfo,pExternalSemaphoreProperties)
 
-        custom_return = True
-        if not pSupported:
-            pSupported = ffi.new('VkBool32*')
-            custom_return = False
+    if custom_return:
+        return pExternalSemaphoreProperties
 
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,surface,pSupported)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pExternalSemaphoreProperties[0]
 
-        if custom_return:
-            return pSupported
 
-        return pSupported[0]
 
+def vkGetPhysicalDeviceExternalFenceProperties(
+physicalDevice
+        ,pExternalFenceInfo
+        ,pExternalFenceProperties=None
+        ,):
 
+    custom_return = True
+    if not pExternalFenceProperties:
+        pExternalFenceProperties = ffi.new('VkExternalFenceProperties*')
+        custom_return = False
 
-    return vkGetPhysicalDeviceSurfaceSupportKHR
-def _wrap_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(fn):
-    def vkGetPhysicalDeviceSurfaceCapabilitiesKHR(
-    physicalDevice
-            ,surface
-            ,pSurfaceCapabilities=None
-            ,):
+    result = _callApi(lib.vkGetPhysicalDeviceExternalFenceProperties, physicalDevice,pExternalFenceInfo,pExternalFenceProperties)
 
-        custom_return = True
-        if not pSurfaceCapabilities:
-            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilitiesKHR*')
-            custom_return = False
+    if custom_return:
+        return pExternalFenceProperties
 
-        result = _callApi(fn, physicalDevice,surface,pSurfaceCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pExternalFenceProperties[0]
 
-        if custom_return:
-            return pSurfaceCapabilities
 
-        return pSurfaceCapabilities[0]
 
+def vkEnumeratePhysicalDeviceGroups(
+instance
+        ,):
 
+    pPhysicalDeviceGroupCount = ffi.new('uint32_t*')
+    pPhysicalDeviceGroupProperties = ffi.NULL
 
-    return vkGetPhysicalDeviceSurfaceCapabilitiesKHR
-def _wrap_vkGetPhysicalDeviceSurfaceFormatsKHR(fn):
-    def vkGetPhysicalDeviceSurfaceFormatsKHR(
-    physicalDevice
-            ,surface
-            ,):
+    result = _callApi(lib.vkEnumeratePhysicalDeviceGroups, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        pSurfaceFormatCount = ffi.new('uint32_t*')
-        pSurfaceFormats = ffi.NULL
+    pPhysicalDeviceGroupProperties = ffi.new('VkPhysicalDeviceGroupProperties[]', pPhysicalDeviceGroupCount[0])
+    result = _callApi(lib.vkEnumeratePhysicalDeviceGroups, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        result = _callApi(fn, physicalDevice,surface,pSurfaceFormatCount,pSurfaceFormats)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pPhysicalDeviceGroupProperties
 
-        pSurfaceFormats = ffi.new('VkSurfaceFormatKHR[]', pSurfaceFormatCount[0])
-        result = _callApi(fn, physicalDevice,surface,pSurfaceFormatCount,pSurfaceFormats)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pSurfaceFormats
+def vkGetDeviceGroupPeerMemoryFeatures(
+device
+        ,heapIndex
+        ,localDeviceIndex
+        ,remoteDeviceIndex
+        ,pPeerMemoryFeatures=None
+        ,):
 
+    custom_return = True
+    if not pPeerMemoryFeatures:
+        pPeerMemoryFeatures = ffi.new('VkPeerMemoryFeatureFlags*')
+        custom_return = False
 
-    return vkGetPhysicalDeviceSurfaceFormatsKHR
-def _wrap_vkGetPhysicalDeviceSurfacePresentModesKHR(fn):
-    def vkGetPhysicalDeviceSurfacePresentModesKHR(
-    physicalDevice
-            ,surface
-            ,):
+    result = _callApi(lib.vkGetDeviceGroupPeerMemoryFeatures, device,heapIndex,localDeviceIndex,remoteDeviceIndex,pPeerMemoryFeatures)
 
-        pPresentModeCount = ffi.new('uint32_t*')
-        pPresentModes = ffi.NULL
+    if custom_return:
+        return pPeerMemoryFeatures
 
-        result = _callApi(fn, physicalDevice,surface,pPresentModeCount,pPresentModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pPeerMemoryFeatures[0]
 
-        pPresentModes = ffi.new('VkPresentModeKHR[]', pPresentModeCount[0])
-        result = _callApi(fn, physicalDevice,surface,pPresentModeCount,pPresentModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pPresentModes
 
+def vkBindBufferMemory2(
+device
+        ,bindInfoCount
+        ,pBindInfos
+        ,):
+    result = _callApi(lib.vkBindBufferMemory2, device,bindInfoCount,pBindInfos)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-    return vkGetPhysicalDeviceSurfacePresentModesKHR
-def _wrap_vkCreateSwapchainKHR(fn):
-    def vkCreateSwapchainKHR(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pSwapchain=None
-            ,):
 
-        custom_return = True
-        if not pSwapchain:
-            pSwapchain = ffi.new('VkSwapchainKHR*')
-            custom_return = False
+def vkBindImageMemory2(
+device
+        ,bindInfoCount
+        ,pBindInfos
+        ,):
+    result = _callApi(lib.vkBindImageMemory2, device,bindInfoCount,pBindInfos)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pSwapchain)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pSwapchain
+def vkCmdSetDeviceMask(
+commandBuffer
+        ,deviceMask
+        ,):
+    result = _callApi(lib.vkCmdSetDeviceMask, commandBuffer,deviceMask)
 
-        return pSwapchain[0]
 
+def vkCmdDispatchBase(
+commandBuffer
+        ,baseGroupX
+        ,baseGroupY
+        ,baseGroupZ
+        ,groupCountX
+        ,groupCountY
+        ,groupCountZ
+        ,):
+    result = _callApi(lib.vkCmdDispatchBase, commandBuffer,baseGroupX,baseGroupY,baseGroupZ,groupCountX,groupCountY,groupCountZ)
 
 
-    return vkCreateSwapchainKHR
-def _wrap_vkDestroySwapchainKHR(fn):
-    def vkDestroySwapchainKHR(
-    device
-            ,swapchain
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,swapchain,pAllocator)
+def vkCreateDescriptorUpdateTemplate(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pDescriptorUpdateTemplate=None
+        ,):
 
+    custom_return = True
+    if not pDescriptorUpdateTemplate:
+        pDescriptorUpdateTemplate = ffi.new('VkDescriptorUpdateTemplate*')
+        custom_return = False
 
-    return vkDestroySwapchainKHR
-def _wrap_vkGetSwapchainImagesKHR(fn):
-    def vkGetSwapchainImagesKHR(
-    device
-            ,swapchain
-            ,):
+    result = _callApi(lib.vkCreateDescriptorUpdateTemplate, device,pCreateInfo,pAllocator,pDescriptorUpdateTemplate)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        pSwapchainImageCount = ffi.new('uint32_t*')
-        pSwapchainImages = ffi.NULL
+    if custom_return:
+        return pDescriptorUpdateTemplate
 
-        result = _callApi(fn, device,swapchain,pSwapchainImageCount,pSwapchainImages)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pDescriptorUpdateTemplate[0]
 
-        pSwapchainImages = ffi.new('VkImage[]', pSwapchainImageCount[0])
-        result = _callApi(fn, device,swapchain,pSwapchainImageCount,pSwapchainImages)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pSwapchainImages
 
+def vkDestroyDescriptorUpdateTemplate(
+device
+        ,descriptorUpdateTemplate
+        ,pAllocator
+        ,):
+    result = _callApi(lib.vkDestroyDescriptorUpdateTemplate, device,descriptorUpdateTemplate,pAllocator)
 
-    return vkGetSwapchainImagesKHR
-def _wrap_vkAcquireNextImageKHR(fn):
-    def vkAcquireNextImageKHR(
-    device
-            ,swapchain
-            ,timeout
-            ,semaphore
-            ,fence
-            ,pImageIndex=None
-            ,):
 
-        custom_return = True
-        if not pImageIndex:
-            pImageIndex = ffi.new('uint32_t*')
-            custom_return = False
+def vkUpdateDescriptorSetWithTemplate(
+device
+        ,descriptorSet
+        ,descriptorUpdateTemplate
+        ,pData
+        ,):
+    result = _callApi(lib.vkUpdateDescriptorSetWithTemplate, device,descriptorSet,descriptorUpdateTemplate,pData)
 
-        result = _callApi(fn, device,swapchain,timeout,semaphore,fence,pImageIndex)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pImageIndex
+def vkGetBufferMemoryRequirements2(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
 
-        return pImageIndex[0]
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
 
+    result = _callApi(lib.vkGetBufferMemoryRequirements2, device,pInfo,pMemoryRequirements)
 
+    if custom_return:
+        return pMemoryRequirements
 
-    return vkAcquireNextImageKHR
-def _wrap_vkQueuePresentKHR(fn):
-    def vkQueuePresentKHR(
-    queue
-            ,pPresentInfo
-            ,):
-        result = _callApi(fn, queue,pPresentInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pMemoryRequirements[0]
 
 
-    return vkQueuePresentKHR
-def _wrap_vkCreateViSurfaceNN(fn):
-    def vkCreateViSurfaceNN(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+def vkGetImageMemoryRequirements2(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
 
-        if custom_return:
-            return pSurface
+    result = _callApi(lib.vkGetImageMemoryRequirements2, device,pInfo,pMemoryRequirements)
 
-        return pSurface[0]
+    if custom_return:
+        return pMemoryRequirements
 
+    return pMemoryRequirements[0]
 
 
-    return vkCreateViSurfaceNN
-def _wrap_vkCreateWaylandSurfaceKHR(fn):
-    def vkCreateWaylandSurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+def vkGetImageSparseMemoryRequirements2(
+device
+        ,pInfo
+        ,):
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+    pSparseMemoryRequirements = ffi.NULL
 
-        if custom_return:
-            return pSurface
+    result = _callApi(lib.vkGetImageSparseMemoryRequirements2, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
 
-        return pSurface[0]
+    pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+    result = _callApi(lib.vkGetImageSparseMemoryRequirements2, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
 
+    return pSparseMemoryRequirements
 
 
-    return vkCreateWaylandSurfaceKHR
-def _wrap_vkGetPhysicalDeviceWaylandPresentationSupportKHR(fn):
-    def vkGetPhysicalDeviceWaylandPresentationSupportKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,display
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,display)
+def vkGetDeviceBufferMemoryRequirements(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
 
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
 
-    return vkGetPhysicalDeviceWaylandPresentationSupportKHR
-def _wrap_vkCreateWin32SurfaceKHR(fn):
-    def vkCreateWin32SurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+    result = _callApi(lib.vkGetDeviceBufferMemoryRequirements, device,pInfo,pMemoryRequirements)
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    if custom_return:
+        return pMemoryRequirements
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pMemoryRequirements[0]
 
-        if custom_return:
-            return pSurface
 
-        return pSurface[0]
 
+def vkGetDeviceImageMemoryRequirements(
+device
+        ,pInfo
+        ,pMemoryRequirements=None
+        ,):
 
+    custom_return = True
+    if not pMemoryRequirements:
+        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
+        custom_return = False
 
-    return vkCreateWin32SurfaceKHR
-def _wrap_vkGetPhysicalDeviceWin32PresentationSupportKHR(fn):
-    def vkGetPhysicalDeviceWin32PresentationSupportKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex)
+    result = _callApi(lib.vkGetDeviceImageMemoryRequirements, device,pInfo,pMemoryRequirements)
 
+    if custom_return:
+        return pMemoryRequirements
 
-    return vkGetPhysicalDeviceWin32PresentationSupportKHR
-def _wrap_vkCreateXlibSurfaceKHR(fn):
-    def vkCreateXlibSurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+    return pMemoryRequirements[0]
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pSurface
+def vkGetDeviceImageSparseMemoryRequirements(
+device
+        ,pInfo
+        ,):
 
-        return pSurface[0]
+    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
+    pSparseMemoryRequirements = ffi.NULL
 
+    result = _callApi(lib.vkGetDeviceImageSparseMemoryRequirements, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
 
+    pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
+    result = _callApi(lib.vkGetDeviceImageSparseMemoryRequirements, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
 
-    return vkCreateXlibSurfaceKHR
-def _wrap_vkGetPhysicalDeviceXlibPresentationSupportKHR(fn):
-    def vkGetPhysicalDeviceXlibPresentationSupportKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,dpy
-            ,visualID
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,dpy,visualID)
+    return pSparseMemoryRequirements
 
 
-    return vkGetPhysicalDeviceXlibPresentationSupportKHR
-def _wrap_vkCreateXcbSurfaceKHR(fn):
-    def vkCreateXcbSurfaceKHR(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+def vkCreateSamplerYcbcrConversion(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pYcbcrConversion=None
+        ,):
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    custom_return = True
+    if not pYcbcrConversion:
+        pYcbcrConversion = ffi.new('VkSamplerYcbcrConversion*')
+        custom_return = False
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkCreateSamplerYcbcrConversion, device,pCreateInfo,pAllocator,pYcbcrConversion)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        if custom_return:
-            return pSurface
+    if custom_return:
+        return pYcbcrConversion
 
-        return pSurface[0]
+    return pYcbcrConversion[0]
 
 
 
-    return vkCreateXcbSurfaceKHR
-def _wrap_vkGetPhysicalDeviceXcbPresentationSupportKHR(fn):
-    def vkGetPhysicalDeviceXcbPresentationSupportKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,connection
-            ,visual_id
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,connection,visual_id)
+def vkDestroySamplerYcbcrConversion(
+device
+        ,ycbcrConversion
+        ,pAllocator
+        ,):
+    result = _callApi(lib.vkDestroySamplerYcbcrConversion, device,ycbcrConversion,pAllocator)
 
 
-    return vkGetPhysicalDeviceXcbPresentationSupportKHR
-def _wrap_vkCreateDirectFBSurfaceEXT(fn):
-    def vkCreateDirectFBSurfaceEXT(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+def vkGetDeviceQueue2(
+device
+        ,pQueueInfo
+        ,pQueue=None
+        ,):
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    custom_return = True
+    if not pQueue:
+        pQueue = ffi.new('VkQueue*')
+        custom_return = False
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkGetDeviceQueue2, device,pQueueInfo,pQueue)
 
-        if custom_return:
-            return pSurface
+    if custom_return:
+        return pQueue
 
-        return pSurface[0]
+    return pQueue[0]
 
 
 
-    return vkCreateDirectFBSurfaceEXT
-def _wrap_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(fn):
-    def vkGetPhysicalDeviceDirectFBPresentationSupportEXT(
-    physicalDevice
-            ,queueFamilyIndex
-            ,dfb
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,dfb)
+def vkGetDescriptorSetLayoutSupport(
+device
+        ,pCreateInfo
+        ,pSupport=None
+        ,):
 
+    custom_return = True
+    if not pSupport:
+        pSupport = ffi.new('VkDescriptorSetLayoutSupport*')
+        custom_return = False
 
-    return vkGetPhysicalDeviceDirectFBPresentationSupportEXT
-def _wrap_vkCreateImagePipeSurfaceFUCHSIA(fn):
-    def vkCreateImagePipeSurfaceFUCHSIA(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+    result = _callApi(lib.vkGetDescriptorSetLayoutSupport, device,pCreateInfo,pSupport)
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    if custom_return:
+        return pSupport
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pSupport[0]
 
-        if custom_return:
-            return pSurface
 
-        return pSurface[0]
 
+def vkCreateRenderPass2(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pRenderPass=None
+        ,):
 
+    custom_return = True
+    if not pRenderPass:
+        pRenderPass = ffi.new('VkRenderPass*')
+        custom_return = False
 
-    return vkCreateImagePipeSurfaceFUCHSIA
-def _wrap_vkCreateStreamDescriptorSurfaceGGP(fn):
-    def vkCreateStreamDescriptorSurfaceGGP(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
+    result = _callApi(lib.vkCreateRenderPass2, device,pCreateInfo,pAllocator,pRenderPass)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
+    if custom_return:
+        return pRenderPass
 
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pRenderPass[0]
 
-        if custom_return:
-            return pSurface
 
-        return pSurface[0]
 
+def vkCmdBeginRenderPass2(
+commandBuffer
+        ,pRenderPassBegin
+        ,pSubpassBeginInfo
+        ,):
+    result = _callApi(lib.vkCmdBeginRenderPass2, commandBuffer,pRenderPassBegin,pSubpassBeginInfo)
 
 
-    return vkCreateStreamDescriptorSurfaceGGP
-def _wrap_vkCreateScreenSurfaceQNX(fn):
-    def vkCreateScreenSurfaceQNX(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
-
-        return pSurface[0]
-
-
-
-    return vkCreateScreenSurfaceQNX
-def _wrap_vkGetPhysicalDeviceScreenPresentationSupportQNX(fn):
-    def vkGetPhysicalDeviceScreenPresentationSupportQNX(
-    physicalDevice
-            ,queueFamilyIndex
-            ,window
-            ,):
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,window)
-
-
-    return vkGetPhysicalDeviceScreenPresentationSupportQNX
-def _wrap_vkCreateDebugReportCallbackEXT(fn):
-    def vkCreateDebugReportCallbackEXT(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pCallback=None
-            ,):
-
-        custom_return = True
-        if not pCallback:
-            pCallback = ffi.new('VkDebugReportCallbackEXT*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pCallback)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCallback
-
-        return pCallback[0]
-
-
-
-    return vkCreateDebugReportCallbackEXT
-def _wrap_vkDestroyDebugReportCallbackEXT(fn):
-    def vkDestroyDebugReportCallbackEXT(
-    instance
-            ,callback
-            ,pAllocator
-            ,):
-        result = _callApi(fn, instance,callback,pAllocator)
-
-
-    return vkDestroyDebugReportCallbackEXT
-def _wrap_vkDebugReportMessageEXT(fn):
-    def vkDebugReportMessageEXT(
-    instance
-            ,flags
-            ,objectType
-            ,object
-            ,location
-            ,messageCode
-            ,pLayerPrefix
-            ,pMessage
-            ,):
-        result = _callApi(fn, instance,flags,objectType,object,location,messageCode,pLayerPrefix,pMessage)
-
-
-    return vkDebugReportMessageEXT
-def _wrap_vkDebugMarkerSetObjectNameEXT(fn):
-    def vkDebugMarkerSetObjectNameEXT(
-    device
-            ,pNameInfo
-            ,):
-        result = _callApi(fn, device,pNameInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkDebugMarkerSetObjectNameEXT
-def _wrap_vkDebugMarkerSetObjectTagEXT(fn):
-    def vkDebugMarkerSetObjectTagEXT(
-    device
-            ,pTagInfo
-            ,):
-        result = _callApi(fn, device,pTagInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkDebugMarkerSetObjectTagEXT
-def _wrap_vkCmdDebugMarkerBeginEXT(fn):
-    def vkCmdDebugMarkerBeginEXT(
-    commandBuffer
-            ,pMarkerInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pMarkerInfo)
-
-
-    return vkCmdDebugMarkerBeginEXT
-def _wrap_vkCmdDebugMarkerEndEXT(fn):
-    def vkCmdDebugMarkerEndEXT(
-    commandBuffer
-            ,):
-        result = _callApi(fn, commandBuffer)
-
-
-    return vkCmdDebugMarkerEndEXT
-def _wrap_vkCmdDebugMarkerInsertEXT(fn):
-    def vkCmdDebugMarkerInsertEXT(
-    commandBuffer
-            ,pMarkerInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pMarkerInfo)
-
-
-    return vkCmdDebugMarkerInsertEXT
-def _wrap_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(fn):
-    def vkGetPhysicalDeviceExternalImageFormatPropertiesNV(
-    physicalDevice
-            ,format
-            ,type
-            ,tiling
-            ,usage
-            ,flags
-            ,externalHandleType
-            ,pExternalImageFormatProperties=None
-            ,):
-
-        custom_return = True
-        if not pExternalImageFormatProperties:
-            pExternalImageFormatProperties = ffi.new('VkExternalImageFormatPropertiesNV*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,format,type,tiling,usage,flags,externalHandleType,pExternalImageFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pExternalImageFormatProperties
-
-        return pExternalImageFormatProperties[0]
-
-
-
-    return vkGetPhysicalDeviceExternalImageFormatPropertiesNV
-def _wrap_vkGetMemoryWin32HandleNV(fn):
-    def vkGetMemoryWin32HandleNV(
-    device
-            ,memory
-            ,handleType
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('HANDLE*')
-            custom_return = False
-
-        result = _callApi(fn, device,memory,handleType,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetMemoryWin32HandleNV
-def _wrap_vkCmdExecuteGeneratedCommandsNV(fn):
-    def vkCmdExecuteGeneratedCommandsNV(
-    commandBuffer
-            ,isPreprocessed
-            ,pGeneratedCommandsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,isPreprocessed,pGeneratedCommandsInfo)
-
-
-    return vkCmdExecuteGeneratedCommandsNV
-def _wrap_vkCmdPreprocessGeneratedCommandsNV(fn):
-    def vkCmdPreprocessGeneratedCommandsNV(
-    commandBuffer
-            ,pGeneratedCommandsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pGeneratedCommandsInfo)
-
+def vkCmdNextSubpass2(
+commandBuffer
+        ,pSubpassBeginInfo
+        ,pSubpassEndInfo
+        ,):
+    result = _callApi(lib.vkCmdNextSubpass2, commandBuffer,pSubpassBeginInfo,pSubpassEndInfo)
 
-    return vkCmdPreprocessGeneratedCommandsNV
-def _wrap_vkCmdBindPipelineShaderGroupNV(fn):
-    def vkCmdBindPipelineShaderGroupNV(
-    commandBuffer
-            ,pipelineBindPoint
-            ,pipeline
-            ,groupIndex
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineBindPoint,pipeline,groupIndex)
 
+def vkCmdEndRenderPass2(
+commandBuffer
+        ,pSubpassEndInfo
+        ,):
+    result = _callApi(lib.vkCmdEndRenderPass2, commandBuffer,pSubpassEndInfo)
 
-    return vkCmdBindPipelineShaderGroupNV
-def _wrap_vkGetGeneratedCommandsMemoryRequirementsNV(fn):
-    def vkGetGeneratedCommandsMemoryRequirementsNV(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
 
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
+def vkGetSemaphoreCounterValue(
+device
+        ,semaphore
+        ,pValue=None
+        ,):
 
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
+    custom_return = True
+    if not pValue:
+        pValue = ffi.new('uint64_t*')
+        custom_return = False
 
-        if custom_return:
-            return pMemoryRequirements
+    result = _callApi(lib.vkGetSemaphoreCounterValue, device,semaphore,pValue)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        return pMemoryRequirements[0]
+    if custom_return:
+        return pValue
 
+    return pValue[0]
 
 
-    return vkGetGeneratedCommandsMemoryRequirementsNV
-def _wrap_vkCreateIndirectCommandsLayoutNV(fn):
-    def vkCreateIndirectCommandsLayoutNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pIndirectCommandsLayout=None
-            ,):
 
-        custom_return = True
-        if not pIndirectCommandsLayout:
-            pIndirectCommandsLayout = ffi.new('VkIndirectCommandsLayoutNV*')
-            custom_return = False
+def vkWaitSemaphores(
+device
+        ,pWaitInfo
+        ,timeout
+        ,):
+    result = _callApi(lib.vkWaitSemaphores, device,pWaitInfo,timeout)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pIndirectCommandsLayout)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pIndirectCommandsLayout
+def vkSignalSemaphore(
+device
+        ,pSignalInfo
+        ,):
+    result = _callApi(lib.vkSignalSemaphore, device,pSignalInfo)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        return pIndirectCommandsLayout[0]
 
+def vkCmdDrawIndirectCount(
+commandBuffer
+        ,buffer
+        ,offset
+        ,countBuffer
+        ,countBufferOffset
+        ,maxDrawCount
+        ,stride
+        ,):
+    result = _callApi(lib.vkCmdDrawIndirectCount, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
 
 
-    return vkCreateIndirectCommandsLayoutNV
-def _wrap_vkDestroyIndirectCommandsLayoutNV(fn):
-    def vkDestroyIndirectCommandsLayoutNV(
-    device
-            ,indirectCommandsLayout
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,indirectCommandsLayout,pAllocator)
+def vkCmdDrawIndexedIndirectCount(
+commandBuffer
+        ,buffer
+        ,offset
+        ,countBuffer
+        ,countBufferOffset
+        ,maxDrawCount
+        ,stride
+        ,):
+    result = _callApi(lib.vkCmdDrawIndexedIndirectCount, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
 
 
-    return vkDestroyIndirectCommandsLayoutNV
-def vkGetPhysicalDeviceFeatures2(
-physicalDevice
-        ,pFeatures=None
+def vkGetBufferOpaqueCaptureAddress(
+device
+        ,pInfo=None
         ,):
 
     custom_return = True
-    if not pFeatures:
-        pFeatures = ffi.new('VkPhysicalDeviceFeatures2*')
+    if not pInfo:
+        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
         custom_return = False
 
-    result = _callApi(lib.vkGetPhysicalDeviceFeatures2, physicalDevice,pFeatures)
+    result = _callApi(lib.vkGetBufferOpaqueCaptureAddress, device,pInfo)
 
     if custom_return:
-        return pFeatures
-
-    return pFeatures[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceFeatures2(fn):
-    def vkGetPhysicalDeviceFeatures2(
-    physicalDevice
-            ,pFeatures=None
-            ,):
-
-        custom_return = True
-        if not pFeatures:
-            pFeatures = ffi.new('VkPhysicalDeviceFeatures2*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pFeatures)
-
-        if custom_return:
-            return pFeatures
+        return pInfo
 
-        return pFeatures[0]
+    return pInfo[0]
 
 
 
-    return vkGetPhysicalDeviceFeatures2
-def vkGetPhysicalDeviceProperties2(
-physicalDevice
-        ,pProperties=None
+def vkGetBufferDeviceAddress(
+device
+        ,pInfo=None
         ,):
 
     custom_return = True
-    if not pProperties:
-        pProperties = ffi.new('VkPhysicalDeviceProperties2*')
+    if not pInfo:
+        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
         custom_return = False
 
-    result = _callApi(lib.vkGetPhysicalDeviceProperties2, physicalDevice,pProperties)
+    result = _callApi(lib.vkGetBufferDeviceAddress, device,pInfo)
 
     if custom_return:
-        return pProperties
-
-    return pProperties[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceProperties2(fn):
-    def vkGetPhysicalDeviceProperties2(
-    physicalDevice
-            ,pProperties=None
-            ,):
-
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkPhysicalDeviceProperties2*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pProperties)
-
-        if custom_return:
-            return pProperties
+        return pInfo
 
-        return pProperties[0]
+    return pInfo[0]
 
 
 
-    return vkGetPhysicalDeviceProperties2
-def vkGetPhysicalDeviceFormatProperties2(
-physicalDevice
-        ,format
-        ,pFormatProperties=None
+def vkGetDeviceMemoryOpaqueCaptureAddress(
+device
+        ,pInfo=None
         ,):
 
     custom_return = True
-    if not pFormatProperties:
-        pFormatProperties = ffi.new('VkFormatProperties2*')
+    if not pInfo:
+        pInfo = ffi.new('VkDeviceMemoryOpaqueCaptureAddressInfo*')
         custom_return = False
 
-    result = _callApi(lib.vkGetPhysicalDeviceFormatProperties2, physicalDevice,format,pFormatProperties)
+    result = _callApi(lib.vkGetDeviceMemoryOpaqueCaptureAddress, device,pInfo)
 
     if custom_return:
-        return pFormatProperties
-
-    return pFormatProperties[0]
+        return pInfo
 
+    return pInfo[0]
 
 
-def _wrap_vkGetPhysicalDeviceFormatProperties2(fn):
-    def vkGetPhysicalDeviceFormatProperties2(
-    physicalDevice
-            ,format
-            ,pFormatProperties=None
-            ,):
 
-        custom_return = True
-        if not pFormatProperties:
-            pFormatProperties = ffi.new('VkFormatProperties2*')
-            custom_return = False
+def vkGetFaultData(
+device
+        ,faultQueryBehavior
+        ,pUnrecordedFaults
+        ,):
 
-        result = _callApi(fn, physicalDevice,format,pFormatProperties)
+    pFaultCount = ffi.new('uint32_t*')
+    pFaults = ffi.NULL
 
-        if custom_return:
-            return pFormatProperties
+    result = _callApi(lib.vkGetFaultData, device,faultQueryBehavior,pUnrecordedFaults,pFaultCount,pFaults)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        return pFormatProperties[0]
+    pFaults = ffi.new('VkFaultData[]', pFaultCount[0])
+    result = _callApi(lib.vkGetFaultData, device,faultQueryBehavior,pUnrecordedFaults,pFaultCount,pFaults)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
+    return pFaults
 
 
-    return vkGetPhysicalDeviceFormatProperties2
-def vkGetPhysicalDeviceImageFormatProperties2(
+def vkGetPhysicalDeviceToolProperties(
 physicalDevice
-        ,pImageFormatInfo
-        ,pImageFormatProperties=None
         ,):
 
-    custom_return = True
-    if not pImageFormatProperties:
-        pImageFormatProperties = ffi.new('VkImageFormatProperties2*')
-        custom_return = False
+    pToolCount = ffi.new('uint32_t*')
+    pToolProperties = ffi.NULL
 
-    result = _callApi(lib.vkGetPhysicalDeviceImageFormatProperties2, physicalDevice,pImageFormatInfo,pImageFormatProperties)
+    result = _callApi(lib.vkGetPhysicalDeviceToolProperties, physicalDevice,pToolCount,pToolProperties)
     if result != VK_SUCCESS:
         raise exception_codes[result]
 
-    if custom_return:
-        return pImageFormatProperties
-
-    return pImageFormatProperties[0]
-
+    pToolProperties = ffi.new('VkPhysicalDeviceToolProperties[]', pToolCount[0])
+    result = _callApi(lib.vkGetPhysicalDeviceToolProperties, physicalDevice,pToolCount,pToolProperties)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
+    result = (StrWrap(x) for x in pToolProperties)
+    _weakkey_dict[result] = pToolProperties
+    return result
 
-def _wrap_vkGetPhysicalDeviceImageFormatProperties2(fn):
-    def vkGetPhysicalDeviceImageFormatProperties2(
-    physicalDevice
-            ,pImageFormatInfo
-            ,pImageFormatProperties=None
-            ,):
 
-        custom_return = True
-        if not pImageFormatProperties:
-            pImageFormatProperties = ffi.new('VkImageFormatProperties2*')
-            custom_return = False
+def vkCmdSetCullMode(
+commandBuffer
+        ,cullMode
+        ,):
+    result = _callApi(lib.vkCmdSetCullMode, commandBuffer,cullMode)
 
-        result = _callApi(fn, physicalDevice,pImageFormatInfo,pImageFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pImageFormatProperties
+def vkCmdSetFrontFace(
+commandBuffer
+        ,frontFace
+        ,):
+    result = _callApi(lib.vkCmdSetFrontFace, commandBuffer,frontFace)
 
-        return pImageFormatProperties[0]
 
+def vkCmdSetPrimitiveTopology(
+commandBuffer
+        ,primitiveTopology
+        ,):
+    result = _callApi(lib.vkCmdSetPrimitiveTopology, commandBuffer,primitiveTopology)
 
 
-    return vkGetPhysicalDeviceImageFormatProperties2
-def vkGetPhysicalDeviceQueueFamilyProperties2(
-physicalDevice
+def vkCmdSetViewportWithCount(
+commandBuffer
+        ,viewportCount
+        ,pViewports
         ,):
+    result = _callApi(lib.vkCmdSetViewportWithCount, commandBuffer,viewportCount,pViewports)
 
-    pQueueFamilyPropertyCount = ffi.new('uint32_t*')
-    pQueueFamilyProperties = ffi.NULL
-
-    result = _callApi(lib.vkGetPhysicalDeviceQueueFamilyProperties2, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
 
-    pQueueFamilyProperties = ffi.new('VkQueueFamilyProperties2[]', pQueueFamilyPropertyCount[0])
-    result = _callApi(lib.vkGetPhysicalDeviceQueueFamilyProperties2, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
+def vkCmdSetScissorWithCount(
+commandBuffer
+        ,scissorCount
+        ,pScissors
+        ,):
+    result = _callApi(lib.vkCmdSetScissorWithCount, commandBuffer,scissorCount,pScissors)
 
-    return pQueueFamilyProperties
 
+def vkCmdBindVertexBuffers2(
+commandBuffer
+        ,firstBinding
+        ,bindingCount
+        ,pBuffers
+        ,pOffsets
+        ,pSizes
+        ,pStrides
+        ,):
+    result = _callApi(lib.vkCmdBindVertexBuffers2, commandBuffer,firstBinding,bindingCount,pBuffers,pOffsets,pSizes,pStrides)
 
-def _wrap_vkGetPhysicalDeviceQueueFamilyProperties2(fn):
-    def vkGetPhysicalDeviceQueueFamilyProperties2(
-    physicalDevice
-            ,):
 
-        pQueueFamilyPropertyCount = ffi.new('uint32_t*')
-        pQueueFamilyProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
-
-        pQueueFamilyProperties = ffi.new('VkQueueFamilyProperties2[]', pQueueFamilyPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pQueueFamilyPropertyCount,pQueueFamilyProperties)
-
-        return pQueueFamilyProperties
-
-
-    return vkGetPhysicalDeviceQueueFamilyProperties2
-def vkGetPhysicalDeviceMemoryProperties2(
-physicalDevice
-        ,pMemoryProperties=None
-        ,):
-
-    custom_return = True
-    if not pMemoryProperties:
-        pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties2*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetPhysicalDeviceMemoryProperties2, physicalDevice,pMemoryProperties)
-
-    if custom_return:
-        return pMemoryProperties
-
-    return pMemoryProperties[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceMemoryProperties2(fn):
-    def vkGetPhysicalDeviceMemoryProperties2(
-    physicalDevice
-            ,pMemoryProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemoryProperties:
-            pMemoryProperties = ffi.new('VkPhysicalDeviceMemoryProperties2*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pMemoryProperties)
-
-        if custom_return:
-            return pMemoryProperties
-
-        return pMemoryProperties[0]
-
-
-
-    return vkGetPhysicalDeviceMemoryProperties2
-def vkGetPhysicalDeviceSparseImageFormatProperties2(
-physicalDevice
-        ,pFormatInfo
-        ,):
-
-    pPropertyCount = ffi.new('uint32_t*')
-    pProperties = ffi.NULL
-
-    result = _callApi(lib.vkGetPhysicalDeviceSparseImageFormatProperties2, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
-
-    pProperties = ffi.new('VkSparseImageFormatProperties2[]', pPropertyCount[0])
-    result = _callApi(lib.vkGetPhysicalDeviceSparseImageFormatProperties2, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
-
-    return pProperties
-
-
-def _wrap_vkGetPhysicalDeviceSparseImageFormatProperties2(fn):
-    def vkGetPhysicalDeviceSparseImageFormatProperties2(
-    physicalDevice
-            ,pFormatInfo
-            ,):
-
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
-
-        pProperties = ffi.new('VkSparseImageFormatProperties2[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pFormatInfo,pPropertyCount,pProperties)
-
-        return pProperties
-
-
-    return vkGetPhysicalDeviceSparseImageFormatProperties2
-def _wrap_vkCmdPushDescriptorSetKHR(fn):
-    def vkCmdPushDescriptorSetKHR(
-    commandBuffer
-            ,pipelineBindPoint
-            ,layout
-            ,set
-            ,descriptorWriteCount
-            ,pDescriptorWrites
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineBindPoint,layout,set,descriptorWriteCount,pDescriptorWrites)
-
-
-    return vkCmdPushDescriptorSetKHR
-def vkTrimCommandPool(
-device
-        ,commandPool
-        ,flags
-        ,):
-    result = _callApi(lib.vkTrimCommandPool, device,commandPool,flags)
-
-
-def _wrap_vkTrimCommandPool(fn):
-    def vkTrimCommandPool(
-    device
-            ,commandPool
-            ,flags
-            ,):
-        result = _callApi(fn, device,commandPool,flags)
-
-
-    return vkTrimCommandPool
-def vkGetPhysicalDeviceExternalBufferProperties(
-physicalDevice
-        ,pExternalBufferInfo
-        ,pExternalBufferProperties=None
-        ,):
-
-    custom_return = True
-    if not pExternalBufferProperties:
-        pExternalBufferProperties = ffi.new('VkExternalBufferProperties*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetPhysicalDeviceExternalBufferProperties, physicalDevice,pExternalBufferInfo,pExternalBufferProperties)
-
-    if custom_return:
-        return pExternalBufferProperties
-
-    return pExternalBufferProperties[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceExternalBufferProperties(fn):
-    def vkGetPhysicalDeviceExternalBufferProperties(
-    physicalDevice
-            ,pExternalBufferInfo
-            ,pExternalBufferProperties=None
-            ,):
-
-        custom_return = True
-        if not pExternalBufferProperties:
-            pExternalBufferProperties = ffi.new('VkExternalBufferProperties*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pExternalBufferInfo,pExternalBufferProperties)
-
-        if custom_return:
-            return pExternalBufferProperties
-
-        return pExternalBufferProperties[0]
-
-
-
-    return vkGetPhysicalDeviceExternalBufferProperties
-def _wrap_vkGetMemoryWin32HandleKHR(fn):
-    def vkGetMemoryWin32HandleKHR(
-    device
-            ,pGetWin32HandleInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('HANDLE*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetWin32HandleInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetMemoryWin32HandleKHR
-def _wrap_vkGetMemoryWin32HandlePropertiesKHR(fn):
-    def vkGetMemoryWin32HandlePropertiesKHR(
-    device
-            ,handleType
-            ,handle
-            ,pMemoryWin32HandleProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemoryWin32HandleProperties:
-            pMemoryWin32HandleProperties = ffi.new('VkMemoryWin32HandlePropertiesKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,handleType,handle,pMemoryWin32HandleProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMemoryWin32HandleProperties
-
-        return pMemoryWin32HandleProperties[0]
-
-
-
-    return vkGetMemoryWin32HandlePropertiesKHR
-def _wrap_vkGetMemoryFdKHR(fn):
-    def vkGetMemoryFdKHR(
-    device
-            ,pGetFdInfo
-            ,pFd=None
-            ,):
-
-        custom_return = True
-        if not pFd:
-            pFd = ffi.new('int*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetFdInfo,pFd)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pFd
-
-        return pFd[0]
-
-
-
-    return vkGetMemoryFdKHR
-def _wrap_vkGetMemoryFdPropertiesKHR(fn):
-    def vkGetMemoryFdPropertiesKHR(
-    device
-            ,handleType
-            ,fd
-            ,pMemoryFdProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemoryFdProperties:
-            pMemoryFdProperties = ffi.new('VkMemoryFdPropertiesKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,handleType,fd,pMemoryFdProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMemoryFdProperties
-
-        return pMemoryFdProperties[0]
-
-
-
-    return vkGetMemoryFdPropertiesKHR
-def _wrap_vkGetMemoryZirconHandleFUCHSIA(fn):
-    def vkGetMemoryZirconHandleFUCHSIA(
-    device
-            ,pGetZirconHandleInfo
-            ,pZirconHandle=None
-            ,):
-
-        custom_return = True
-        if not pZirconHandle:
-            pZirconHandle = ffi.new('zx_handle_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetZirconHandleInfo,pZirconHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pZirconHandle
-
-        return pZirconHandle[0]
-
-
-
-    return vkGetMemoryZirconHandleFUCHSIA
-def _wrap_vkGetMemoryZirconHandlePropertiesFUCHSIA(fn):
-    def vkGetMemoryZirconHandlePropertiesFUCHSIA(
-    device
-            ,handleType
-            ,zirconHandle
-            ,pMemoryZirconHandleProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemoryZirconHandleProperties:
-            pMemoryZirconHandleProperties = ffi.new('VkMemoryZirconHandlePropertiesFUCHSIA*')
-            custom_return = False
-
-        result = _callApi(fn, device,handleType,zirconHandle,pMemoryZirconHandleProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMemoryZirconHandleProperties
-
-        return pMemoryZirconHandleProperties[0]
-
-
-
-    return vkGetMemoryZirconHandlePropertiesFUCHSIA
-def _wrap_vkGetMemoryRemoteAddressNV(fn):
-    def vkGetMemoryRemoteAddressNV(
-    device
-            ,pMemoryGetRemoteAddressInfo
-            ,pAddress=None
-            ,):
-
-        custom_return = True
-        if not pAddress:
-            pAddress = ffi.new('VkRemoteAddressNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pMemoryGetRemoteAddressInfo,pAddress)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pAddress
-
-        return pAddress[0]
-
-
-
-    return vkGetMemoryRemoteAddressNV
-def _wrap_vkGetMemorySciBufNV(fn):
-    def vkGetMemorySciBufNV(
-    device
-            ,pGetSciBufInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('NvSciBufObj*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetSciBufInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetMemorySciBufNV
-def _wrap_vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV(fn):
-    def vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV(
-    physicalDevice
-            ,handleType
-            ,handle
-            ,pMemorySciBufProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemorySciBufProperties:
-            pMemorySciBufProperties = ffi.new('VkMemorySciBufPropertiesNV*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,handleType,handle,pMemorySciBufProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMemorySciBufProperties
-
-        return pMemorySciBufProperties[0]
-
-
-
-    return vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV
-def _wrap_vkGetPhysicalDeviceSciBufAttributesNV(fn):
-    def vkGetPhysicalDeviceSciBufAttributesNV(
-    physicalDevice
-            ,pAttributes=None
-            ,):
-
-        custom_return = True
-        if not pAttributes:
-            pAttributes = ffi.new('NvSciBufAttrList*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pAttributes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pAttributes
-
-        return pAttributes[0]
-
-
-
-    return vkGetPhysicalDeviceSciBufAttributesNV
-def vkGetPhysicalDeviceExternalSemaphoreProperties(
-physicalDevice
-        ,pExternalSemaphoreInfo
-        ,pExternalSemaphoreProperties=None
-        ,):
-
-    custom_return = True
-    if not pExternalSemaphoreProperties:
-        pExternalSemaphoreProperties = ffi.new('VkExternalSemaphoreProperties*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetPhysicalDeviceExternalSemaphoreProperties, physicalDevice,pExternalSemaphoreInfo,pExternalSemaphoreProperties)
-
-    if custom_return:
-        return pExternalSemaphoreProperties
-
-    return pExternalSemaphoreProperties[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceExternalSemaphoreProperties(fn):
-    def vkGetPhysicalDeviceExternalSemaphoreProperties(
-    physicalDevice
-            ,pExternalSemaphoreInfo
-            ,pExternalSemaphoreProperties=None
-            ,):
-
-        custom_return = True
-        if not pExternalSemaphoreProperties:
-            pExternalSemaphoreProperties = ffi.new('VkExternalSemaphoreProperties*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pExternalSemaphoreInfo,pExternalSemaphoreProperties)
-
-        if custom_return:
-            return pExternalSemaphoreProperties
-
-        return pExternalSemaphoreProperties[0]
-
-
-
-    return vkGetPhysicalDeviceExternalSemaphoreProperties
-def _wrap_vkGetSemaphoreWin32HandleKHR(fn):
-    def vkGetSemaphoreWin32HandleKHR(
-    device
-            ,pGetWin32HandleInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('HANDLE*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetWin32HandleInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetSemaphoreWin32HandleKHR
-def _wrap_vkImportSemaphoreWin32HandleKHR(fn):
-    def vkImportSemaphoreWin32HandleKHR(
-    device
-            ,pImportSemaphoreWin32HandleInfo
-            ,):
-        result = _callApi(fn, device,pImportSemaphoreWin32HandleInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportSemaphoreWin32HandleKHR
-def _wrap_vkGetSemaphoreFdKHR(fn):
-    def vkGetSemaphoreFdKHR(
-    device
-            ,pGetFdInfo
-            ,pFd=None
-            ,):
-
-        custom_return = True
-        if not pFd:
-            pFd = ffi.new('int*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetFdInfo,pFd)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pFd
-
-        return pFd[0]
-
-
-
-    return vkGetSemaphoreFdKHR
-def _wrap_vkImportSemaphoreFdKHR(fn):
-    def vkImportSemaphoreFdKHR(
-    device
-            ,pImportSemaphoreFdInfo
-            ,):
-        result = _callApi(fn, device,pImportSemaphoreFdInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportSemaphoreFdKHR
-def _wrap_vkGetSemaphoreZirconHandleFUCHSIA(fn):
-    def vkGetSemaphoreZirconHandleFUCHSIA(
-    device
-            ,pGetZirconHandleInfo
-            ,pZirconHandle=None
-            ,):
-
-        custom_return = True
-        if not pZirconHandle:
-            pZirconHandle = ffi.new('zx_handle_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetZirconHandleInfo,pZirconHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pZirconHandle
-
-        return pZirconHandle[0]
-
-
-
-    return vkGetSemaphoreZirconHandleFUCHSIA
-def _wrap_vkImportSemaphoreZirconHandleFUCHSIA(fn):
-    def vkImportSemaphoreZirconHandleFUCHSIA(
-    device
-            ,pImportSemaphoreZirconHandleInfo
-            ,):
-        result = _callApi(fn, device,pImportSemaphoreZirconHandleInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportSemaphoreZirconHandleFUCHSIA
-def vkGetPhysicalDeviceExternalFenceProperties(
-physicalDevice
-        ,pExternalFenceInfo
-        ,pExternalFenceProperties=None
-        ,):
-
-    custom_return = True
-    if not pExternalFenceProperties:
-        pExternalFenceProperties = ffi.new('VkExternalFenceProperties*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetPhysicalDeviceExternalFenceProperties, physicalDevice,pExternalFenceInfo,pExternalFenceProperties)
-
-    if custom_return:
-        return pExternalFenceProperties
-
-    return pExternalFenceProperties[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceExternalFenceProperties(fn):
-    def vkGetPhysicalDeviceExternalFenceProperties(
-    physicalDevice
-            ,pExternalFenceInfo
-            ,pExternalFenceProperties=None
-            ,):
-
-        custom_return = True
-        if not pExternalFenceProperties:
-            pExternalFenceProperties = ffi.new('VkExternalFenceProperties*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pExternalFenceInfo,pExternalFenceProperties)
-
-        if custom_return:
-            return pExternalFenceProperties
-
-        return pExternalFenceProperties[0]
-
-
-
-    return vkGetPhysicalDeviceExternalFenceProperties
-def _wrap_vkGetFenceWin32HandleKHR(fn):
-    def vkGetFenceWin32HandleKHR(
-    device
-            ,pGetWin32HandleInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('HANDLE*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetWin32HandleInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetFenceWin32HandleKHR
-def _wrap_vkImportFenceWin32HandleKHR(fn):
-    def vkImportFenceWin32HandleKHR(
-    device
-            ,pImportFenceWin32HandleInfo
-            ,):
-        result = _callApi(fn, device,pImportFenceWin32HandleInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportFenceWin32HandleKHR
-def _wrap_vkGetFenceFdKHR(fn):
-    def vkGetFenceFdKHR(
-    device
-            ,pGetFdInfo
-            ,pFd=None
-            ,):
-
-        custom_return = True
-        if not pFd:
-            pFd = ffi.new('int*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetFdInfo,pFd)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pFd
-
-        return pFd[0]
-
-
-
-    return vkGetFenceFdKHR
-def _wrap_vkImportFenceFdKHR(fn):
-    def vkImportFenceFdKHR(
-    device
-            ,pImportFenceFdInfo
-            ,):
-        result = _callApi(fn, device,pImportFenceFdInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportFenceFdKHR
-def _wrap_vkGetFenceSciSyncFenceNV(fn):
-    def vkGetFenceSciSyncFenceNV(
-    device
-            ,pGetSciSyncHandleInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetSciSyncHandleInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetFenceSciSyncFenceNV
-def _wrap_vkGetFenceSciSyncObjNV(fn):
-    def vkGetFenceSciSyncObjNV(
-    device
-            ,pGetSciSyncHandleInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetSciSyncHandleInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetFenceSciSyncObjNV
-def _wrap_vkImportFenceSciSyncFenceNV(fn):
-    def vkImportFenceSciSyncFenceNV(
-    device
-            ,pImportFenceSciSyncInfo
-            ,):
-        result = _callApi(fn, device,pImportFenceSciSyncInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportFenceSciSyncFenceNV
-def _wrap_vkImportFenceSciSyncObjNV(fn):
-    def vkImportFenceSciSyncObjNV(
-    device
-            ,pImportFenceSciSyncInfo
-            ,):
-        result = _callApi(fn, device,pImportFenceSciSyncInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportFenceSciSyncObjNV
-def _wrap_vkGetSemaphoreSciSyncObjNV(fn):
-    def vkGetSemaphoreSciSyncObjNV(
-    device
-            ,pGetSciSyncInfo
-            ,pHandle=None
-            ,):
-
-        custom_return = True
-        if not pHandle:
-            pHandle = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pGetSciSyncInfo,pHandle)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pHandle
-
-        return pHandle[0]
-
-
-
-    return vkGetSemaphoreSciSyncObjNV
-def _wrap_vkImportSemaphoreSciSyncObjNV(fn):
-    def vkImportSemaphoreSciSyncObjNV(
-    device
-            ,pImportSemaphoreSciSyncInfo
-            ,):
-        result = _callApi(fn, device,pImportSemaphoreSciSyncInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkImportSemaphoreSciSyncObjNV
-def _wrap_vkGetPhysicalDeviceSciSyncAttributesNV(fn):
-    def vkGetPhysicalDeviceSciSyncAttributesNV(
-    physicalDevice
-            ,pSciSyncAttributesInfo
-            ,pAttributes=None
-            ,):
-
-        custom_return = True
-        if not pAttributes:
-            pAttributes = ffi.new('NvSciSyncAttrList*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pSciSyncAttributesInfo,pAttributes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pAttributes
-
-        return pAttributes[0]
-
-
-
-    return vkGetPhysicalDeviceSciSyncAttributesNV
-def _wrap_vkCreateSemaphoreSciSyncPoolNV(fn):
-    def vkCreateSemaphoreSciSyncPoolNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pSemaphorePool=None
-            ,):
-
-        custom_return = True
-        if not pSemaphorePool:
-            pSemaphorePool = ffi.new('VkSemaphoreSciSyncPoolNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pSemaphorePool)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSemaphorePool
-
-        return pSemaphorePool[0]
-
-
-
-    return vkCreateSemaphoreSciSyncPoolNV
-def _wrap_vkDestroySemaphoreSciSyncPoolNV(fn):
-    def vkDestroySemaphoreSciSyncPoolNV(
-    device
-            ,semaphorePool
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,semaphorePool,pAllocator)
-
-
-    return vkDestroySemaphoreSciSyncPoolNV
-def _wrap_vkReleaseDisplayEXT(fn):
-    def vkReleaseDisplayEXT(
-    physicalDevice
-            ,display
-            ,):
-        result = _callApi(fn, physicalDevice,display)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkReleaseDisplayEXT
-def _wrap_vkAcquireXlibDisplayEXT(fn):
-    def vkAcquireXlibDisplayEXT(
-    physicalDevice
-            ,dpy
-            ,display=None
-            ,):
-
-        custom_return = True
-        if not display:
-            display = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,dpy,display)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return display
-
-        return display[0]
-
-
-
-    return vkAcquireXlibDisplayEXT
-def _wrap_vkGetRandROutputDisplayEXT(fn):
-    def vkGetRandROutputDisplayEXT(
-    physicalDevice
-            ,dpy
-            ,rrOutput
-            ,pDisplay=None
-            ,):
-
-        custom_return = True
-        if not pDisplay:
-            pDisplay = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,dpy,rrOutput,pDisplay)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDisplay
-
-        return pDisplay[0]
-
-
-
-    return vkGetRandROutputDisplayEXT
-def _wrap_vkAcquireWinrtDisplayNV(fn):
-    def vkAcquireWinrtDisplayNV(
-    physicalDevice
-            ,display=None
-            ,):
-
-        custom_return = True
-        if not display:
-            display = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,display)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return display
-
-        return display[0]
-
-
-
-    return vkAcquireWinrtDisplayNV
-def _wrap_vkGetWinrtDisplayNV(fn):
-    def vkGetWinrtDisplayNV(
-    physicalDevice
-            ,deviceRelativeId
-            ,pDisplay=None
-            ,):
-
-        custom_return = True
-        if not pDisplay:
-            pDisplay = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,deviceRelativeId,pDisplay)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDisplay
-
-        return pDisplay[0]
-
-
-
-    return vkGetWinrtDisplayNV
-def _wrap_vkDisplayPowerControlEXT(fn):
-    def vkDisplayPowerControlEXT(
-    device
-            ,display
-            ,pDisplayPowerInfo
-            ,):
-        result = _callApi(fn, device,display,pDisplayPowerInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkDisplayPowerControlEXT
-def _wrap_vkRegisterDeviceEventEXT(fn):
-    def vkRegisterDeviceEventEXT(
-    device
-            ,pDeviceEventInfo
-            ,pAllocator
-            ,pFence
-            ,):
-        result = _callApi(fn, device,pDeviceEventInfo,pAllocator,pFence)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkRegisterDeviceEventEXT
-def _wrap_vkRegisterDisplayEventEXT(fn):
-    def vkRegisterDisplayEventEXT(
-    device
-            ,display
-            ,pDisplayEventInfo
-            ,pAllocator
-            ,pFence
-            ,):
-        result = _callApi(fn, device,display,pDisplayEventInfo,pAllocator,pFence)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkRegisterDisplayEventEXT
-def _wrap_vkGetSwapchainCounterEXT(fn):
-    def vkGetSwapchainCounterEXT(
-    device
-            ,swapchain
-            ,counter
-            ,pCounterValue=None
-            ,):
-
-        custom_return = True
-        if not pCounterValue:
-            pCounterValue = ffi.new('uint64_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,swapchain,counter,pCounterValue)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCounterValue
-
-        return pCounterValue[0]
-
-
-
-    return vkGetSwapchainCounterEXT
-def _wrap_vkGetPhysicalDeviceSurfaceCapabilities2EXT(fn):
-    def vkGetPhysicalDeviceSurfaceCapabilities2EXT(
-    physicalDevice
-            ,surface
-            ,pSurfaceCapabilities=None
-            ,):
-
-        custom_return = True
-        if not pSurfaceCapabilities:
-            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilities2EXT*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,surface,pSurfaceCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurfaceCapabilities
-
-        return pSurfaceCapabilities[0]
-
-
-
-    return vkGetPhysicalDeviceSurfaceCapabilities2EXT
-def vkEnumeratePhysicalDeviceGroups(
-instance
-        ,):
-
-    pPhysicalDeviceGroupCount = ffi.new('uint32_t*')
-    pPhysicalDeviceGroupProperties = ffi.NULL
-
-    result = _callApi(lib.vkEnumeratePhysicalDeviceGroups, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    pPhysicalDeviceGroupProperties = ffi.new('VkPhysicalDeviceGroupProperties[]', pPhysicalDeviceGroupCount[0])
-    result = _callApi(lib.vkEnumeratePhysicalDeviceGroups, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    return pPhysicalDeviceGroupProperties
-
-
-def _wrap_vkEnumeratePhysicalDeviceGroups(fn):
-    def vkEnumeratePhysicalDeviceGroups(
-    instance
-            ,):
-
-        pPhysicalDeviceGroupCount = ffi.new('uint32_t*')
-        pPhysicalDeviceGroupProperties = ffi.NULL
-
-        result = _callApi(fn, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pPhysicalDeviceGroupProperties = ffi.new('VkPhysicalDeviceGroupProperties[]', pPhysicalDeviceGroupCount[0])
-        result = _callApi(fn, instance,pPhysicalDeviceGroupCount,pPhysicalDeviceGroupProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pPhysicalDeviceGroupProperties
-
-
-    return vkEnumeratePhysicalDeviceGroups
-def vkGetDeviceGroupPeerMemoryFeatures(
-device
-        ,heapIndex
-        ,localDeviceIndex
-        ,remoteDeviceIndex
-        ,pPeerMemoryFeatures=None
-        ,):
-
-    custom_return = True
-    if not pPeerMemoryFeatures:
-        pPeerMemoryFeatures = ffi.new('VkPeerMemoryFeatureFlags*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDeviceGroupPeerMemoryFeatures, device,heapIndex,localDeviceIndex,remoteDeviceIndex,pPeerMemoryFeatures)
-
-    if custom_return:
-        return pPeerMemoryFeatures
-
-    return pPeerMemoryFeatures[0]
-
-
-
-def _wrap_vkGetDeviceGroupPeerMemoryFeatures(fn):
-    def vkGetDeviceGroupPeerMemoryFeatures(
-    device
-            ,heapIndex
-            ,localDeviceIndex
-            ,remoteDeviceIndex
-            ,pPeerMemoryFeatures=None
-            ,):
-
-        custom_return = True
-        if not pPeerMemoryFeatures:
-            pPeerMemoryFeatures = ffi.new('VkPeerMemoryFeatureFlags*')
-            custom_return = False
-
-        result = _callApi(fn, device,heapIndex,localDeviceIndex,remoteDeviceIndex,pPeerMemoryFeatures)
-
-        if custom_return:
-            return pPeerMemoryFeatures
-
-        return pPeerMemoryFeatures[0]
-
-
-
-    return vkGetDeviceGroupPeerMemoryFeatures
-def vkBindBufferMemory2(
-device
-        ,bindInfoCount
-        ,pBindInfos
-        ,):
-    result = _callApi(lib.vkBindBufferMemory2, device,bindInfoCount,pBindInfos)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkBindBufferMemory2(fn):
-    def vkBindBufferMemory2(
-    device
-            ,bindInfoCount
-            ,pBindInfos
-            ,):
-        result = _callApi(fn, device,bindInfoCount,pBindInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBindBufferMemory2
-def vkBindImageMemory2(
-device
-        ,bindInfoCount
-        ,pBindInfos
-        ,):
-    result = _callApi(lib.vkBindImageMemory2, device,bindInfoCount,pBindInfos)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkBindImageMemory2(fn):
-    def vkBindImageMemory2(
-    device
-            ,bindInfoCount
-            ,pBindInfos
-            ,):
-        result = _callApi(fn, device,bindInfoCount,pBindInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBindImageMemory2
-def vkCmdSetDeviceMask(
-commandBuffer
-        ,deviceMask
-        ,):
-    result = _callApi(lib.vkCmdSetDeviceMask, commandBuffer,deviceMask)
-
-
-def _wrap_vkCmdSetDeviceMask(fn):
-    def vkCmdSetDeviceMask(
-    commandBuffer
-            ,deviceMask
-            ,):
-        result = _callApi(fn, commandBuffer,deviceMask)
-
-
-    return vkCmdSetDeviceMask
-def _wrap_vkGetDeviceGroupPresentCapabilitiesKHR(fn):
-    def vkGetDeviceGroupPresentCapabilitiesKHR(
-    device
-            ,pDeviceGroupPresentCapabilities=None
-            ,):
-
-        custom_return = True
-        if not pDeviceGroupPresentCapabilities:
-            pDeviceGroupPresentCapabilities = ffi.new('VkDeviceGroupPresentCapabilitiesKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pDeviceGroupPresentCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDeviceGroupPresentCapabilities
-
-        return pDeviceGroupPresentCapabilities[0]
-
-
-
-    return vkGetDeviceGroupPresentCapabilitiesKHR
-def _wrap_vkGetDeviceGroupSurfacePresentModesKHR(fn):
-    def vkGetDeviceGroupSurfacePresentModesKHR(
-    device
-            ,surface
-            ,pModes=None
-            ,):
-
-        custom_return = True
-        if not pModes:
-            pModes = ffi.new('VkDeviceGroupPresentModeFlagsKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,surface,pModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pModes
-
-        return pModes[0]
-
-
-
-    return vkGetDeviceGroupSurfacePresentModesKHR
-def _wrap_vkAcquireNextImage2KHR(fn):
-    def vkAcquireNextImage2KHR(
-    device
-            ,):
-
-        pAcquireInfo = ffi.new('VkAcquireNextImageInfoKHR*')
-        pImageIndex = ffi.NULL
-
-        result = _callApi(fn, device,pAcquireInfo,pImageIndex)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pImageIndex = ffi.new('uint32_t[]', pAcquireInfo[0])
-        result = _callApi(fn, device,pAcquireInfo,pImageIndex)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pImageIndex
-
-
-    return vkAcquireNextImage2KHR
-def vkCmdDispatchBase(
-commandBuffer
-        ,baseGroupX
-        ,baseGroupY
-        ,baseGroupZ
-        ,groupCountX
-        ,groupCountY
-        ,groupCountZ
-        ,):
-    result = _callApi(lib.vkCmdDispatchBase, commandBuffer,baseGroupX,baseGroupY,baseGroupZ,groupCountX,groupCountY,groupCountZ)
-
-
-def _wrap_vkCmdDispatchBase(fn):
-    def vkCmdDispatchBase(
-    commandBuffer
-            ,baseGroupX
-            ,baseGroupY
-            ,baseGroupZ
-            ,groupCountX
-            ,groupCountY
-            ,groupCountZ
-            ,):
-        result = _callApi(fn, commandBuffer,baseGroupX,baseGroupY,baseGroupZ,groupCountX,groupCountY,groupCountZ)
-
-
-    return vkCmdDispatchBase
-def _wrap_vkGetPhysicalDevicePresentRectanglesKHR(fn):
-    def vkGetPhysicalDevicePresentRectanglesKHR(
-    physicalDevice
-            ,surface
-            ,):
-
-        pRectCount = ffi.new('uint32_t*')
-        pRects = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,surface,pRectCount,pRects)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pRects = ffi.new('VkRect2D[]', pRectCount[0])
-        result = _callApi(fn, physicalDevice,surface,pRectCount,pRects)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pRects
-
-
-    return vkGetPhysicalDevicePresentRectanglesKHR
-def vkCreateDescriptorUpdateTemplate(
-device
-        ,pCreateInfo
-        ,pAllocator
-        ,pDescriptorUpdateTemplate=None
-        ,):
-
-    custom_return = True
-    if not pDescriptorUpdateTemplate:
-        pDescriptorUpdateTemplate = ffi.new('VkDescriptorUpdateTemplate*')
-        custom_return = False
-
-    result = _callApi(lib.vkCreateDescriptorUpdateTemplate, device,pCreateInfo,pAllocator,pDescriptorUpdateTemplate)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    if custom_return:
-        return pDescriptorUpdateTemplate
-
-    return pDescriptorUpdateTemplate[0]
-
-
-
-def _wrap_vkCreateDescriptorUpdateTemplate(fn):
-    def vkCreateDescriptorUpdateTemplate(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pDescriptorUpdateTemplate=None
-            ,):
-
-        custom_return = True
-        if not pDescriptorUpdateTemplate:
-            pDescriptorUpdateTemplate = ffi.new('VkDescriptorUpdateTemplate*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pDescriptorUpdateTemplate)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDescriptorUpdateTemplate
-
-        return pDescriptorUpdateTemplate[0]
-
-
-
-    return vkCreateDescriptorUpdateTemplate
-def vkDestroyDescriptorUpdateTemplate(
-device
-        ,descriptorUpdateTemplate
-        ,pAllocator
-        ,):
-    result = _callApi(lib.vkDestroyDescriptorUpdateTemplate, device,descriptorUpdateTemplate,pAllocator)
-
-
-def _wrap_vkDestroyDescriptorUpdateTemplate(fn):
-    def vkDestroyDescriptorUpdateTemplate(
-    device
-            ,descriptorUpdateTemplate
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,descriptorUpdateTemplate,pAllocator)
-
-
-    return vkDestroyDescriptorUpdateTemplate
-def vkUpdateDescriptorSetWithTemplate(
-device
-        ,descriptorSet
-        ,descriptorUpdateTemplate
-        ,pData
-        ,):
-    result = _callApi(lib.vkUpdateDescriptorSetWithTemplate, device,descriptorSet,descriptorUpdateTemplate,pData)
-
-
-def _wrap_vkUpdateDescriptorSetWithTemplate(fn):
-    def vkUpdateDescriptorSetWithTemplate(
-    device
-            ,descriptorSet
-            ,descriptorUpdateTemplate
-            ,pData
-            ,):
-        result = _callApi(fn, device,descriptorSet,descriptorUpdateTemplate,pData)
-
-
-    return vkUpdateDescriptorSetWithTemplate
-def _wrap_vkCmdPushDescriptorSetWithTemplateKHR(fn):
-    def vkCmdPushDescriptorSetWithTemplateKHR(
-    commandBuffer
-            ,descriptorUpdateTemplate
-            ,layout
-            ,set
-            ,pData
-            ,):
-        result = _callApi(fn, commandBuffer,descriptorUpdateTemplate,layout,set,pData)
-
-
-    return vkCmdPushDescriptorSetWithTemplateKHR
-def _wrap_vkSetHdrMetadataEXT(fn):
-    def vkSetHdrMetadataEXT(
-    device
-            ,swapchainCount
-            ,pSwapchains
-            ,pMetadata
-            ,):
-        result = _callApi(fn, device,swapchainCount,pSwapchains,pMetadata)
-
-
-    return vkSetHdrMetadataEXT
-def _wrap_vkGetSwapchainStatusKHR(fn):
-    def vkGetSwapchainStatusKHR(
-    device
-            ,swapchain=None
-            ,):
-
-        custom_return = True
-        if not swapchain:
-            swapchain = ffi.new('VkSwapchainKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,swapchain)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return swapchain
-
-        return swapchain[0]
-
-
-
-    return vkGetSwapchainStatusKHR
-def _wrap_vkGetRefreshCycleDurationGOOGLE(fn):
-    def vkGetRefreshCycleDurationGOOGLE(
-    device
-            ,swapchain
-            ,pDisplayTimingProperties=None
-            ,):
-
-        custom_return = True
-        if not pDisplayTimingProperties:
-            pDisplayTimingProperties = ffi.new('VkRefreshCycleDurationGOOGLE*')
-            custom_return = False
-
-        result = _callApi(fn, device,swapchain,pDisplayTimingProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDisplayTimingProperties
-
-        return pDisplayTimingProperties[0]
-
-
-
-    return vkGetRefreshCycleDurationGOOGLE
-def _wrap_vkGetPastPresentationTimingGOOGLE(fn):
-    def vkGetPastPresentationTimingGOOGLE(
-    device
-            ,swapchain
-            ,):
-
-        pPresentationTimingCount = ffi.new('uint32_t*')
-        pPresentationTimings = ffi.NULL
-
-        result = _callApi(fn, device,swapchain,pPresentationTimingCount,pPresentationTimings)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pPresentationTimings = ffi.new('VkPastPresentationTimingGOOGLE[]', pPresentationTimingCount[0])
-        result = _callApi(fn, device,swapchain,pPresentationTimingCount,pPresentationTimings)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pPresentationTimings
-
-
-    return vkGetPastPresentationTimingGOOGLE
-def _wrap_vkCreateIOSSurfaceMVK(fn):
-    def vkCreateIOSSurfaceMVK(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
-
-        return pSurface[0]
-
-
-
-    return vkCreateIOSSurfaceMVK
-def _wrap_vkCreateMacOSSurfaceMVK(fn):
-    def vkCreateMacOSSurfaceMVK(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
-
-        return pSurface[0]
-
-
-
-    return vkCreateMacOSSurfaceMVK
-def _wrap_vkCreateMetalSurfaceEXT(fn):
-    def vkCreateMetalSurfaceEXT(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
-
-        return pSurface[0]
-
-
-
-    return vkCreateMetalSurfaceEXT
-def _wrap_vkCmdSetViewportWScalingNV(fn):
-    def vkCmdSetViewportWScalingNV(
-    commandBuffer
-            ,firstViewport
-            ,viewportCount
-            ,pViewportWScalings
-            ,):
-        result = _callApi(fn, commandBuffer,firstViewport,viewportCount,pViewportWScalings)
-
-
-    return vkCmdSetViewportWScalingNV
-def _wrap_vkCmdSetDiscardRectangleEXT(fn):
-    def vkCmdSetDiscardRectangleEXT(
-    commandBuffer
-            ,firstDiscardRectangle
-            ,discardRectangleCount
-            ,pDiscardRectangles
-            ,):
-        result = _callApi(fn, commandBuffer,firstDiscardRectangle,discardRectangleCount,pDiscardRectangles)
-
-
-    return vkCmdSetDiscardRectangleEXT
-def _wrap_vkCmdSetDiscardRectangleEnableEXT(fn):
-    def vkCmdSetDiscardRectangleEnableEXT(
-    commandBuffer
-            ,discardRectangleEnable
-            ,):
-        result = _callApi(fn, commandBuffer,discardRectangleEnable)
-
-
-    return vkCmdSetDiscardRectangleEnableEXT
-def _wrap_vkCmdSetDiscardRectangleModeEXT(fn):
-    def vkCmdSetDiscardRectangleModeEXT(
-    commandBuffer
-            ,discardRectangleMode
-            ,):
-        result = _callApi(fn, commandBuffer,discardRectangleMode)
-
-
-    return vkCmdSetDiscardRectangleModeEXT
-def _wrap_vkCmdSetSampleLocationsEXT(fn):
-    def vkCmdSetSampleLocationsEXT(
-    commandBuffer
-            ,pSampleLocationsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pSampleLocationsInfo)
-
-
-    return vkCmdSetSampleLocationsEXT
-def _wrap_vkGetPhysicalDeviceMultisamplePropertiesEXT(fn):
-    def vkGetPhysicalDeviceMultisamplePropertiesEXT(
-    physicalDevice
-            ,samples
-            ,pMultisampleProperties=None
-            ,):
-
-        custom_return = True
-        if not pMultisampleProperties:
-            pMultisampleProperties = ffi.new('VkMultisamplePropertiesEXT*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,samples,pMultisampleProperties)
-
-        if custom_return:
-            return pMultisampleProperties
-
-        return pMultisampleProperties[0]
-
-
-
-    return vkGetPhysicalDeviceMultisamplePropertiesEXT
-def _wrap_vkGetPhysicalDeviceSurfaceCapabilities2KHR(fn):
-    def vkGetPhysicalDeviceSurfaceCapabilities2KHR(
-    physicalDevice
-            ,pSurfaceInfo
-            ,pSurfaceCapabilities=None
-            ,):
-
-        custom_return = True
-        if not pSurfaceCapabilities:
-            pSurfaceCapabilities = ffi.new('VkSurfaceCapabilities2KHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pSurfaceInfo,pSurfaceCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurfaceCapabilities
-
-        return pSurfaceCapabilities[0]
-
-
-
-    return vkGetPhysicalDeviceSurfaceCapabilities2KHR
-def _wrap_vkGetPhysicalDeviceSurfaceFormats2KHR(fn):
-    def vkGetPhysicalDeviceSurfaceFormats2KHR(
-    physicalDevice
-            ,pSurfaceInfo
-            ,):
-
-        pSurfaceFormatCount = ffi.new('uint32_t*')
-        pSurfaceFormats = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pSurfaceInfo,pSurfaceFormatCount,pSurfaceFormats)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pSurfaceFormats = ffi.new('VkSurfaceFormat2KHR[]', pSurfaceFormatCount[0])
-        result = _callApi(fn, physicalDevice,pSurfaceInfo,pSurfaceFormatCount,pSurfaceFormats)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pSurfaceFormats
-
-
-    return vkGetPhysicalDeviceSurfaceFormats2KHR
-def _wrap_vkGetPhysicalDeviceDisplayProperties2KHR(fn):
-    def vkGetPhysicalDeviceDisplayProperties2KHR(
-    physicalDevice
-            ,):
-
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkDisplayProperties2KHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pProperties
-
-
-    return vkGetPhysicalDeviceDisplayProperties2KHR
-def _wrap_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(fn):
-    def vkGetPhysicalDeviceDisplayPlaneProperties2KHR(
-    physicalDevice
-            ,):
-
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkDisplayPlaneProperties2KHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pProperties
-
-
-    return vkGetPhysicalDeviceDisplayPlaneProperties2KHR
-def _wrap_vkGetDisplayModeProperties2KHR(fn):
-    def vkGetDisplayModeProperties2KHR(
-    physicalDevice
-            ,display
-            ,):
-
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,display,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkDisplayModeProperties2KHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,display,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pProperties
-
-
-    return vkGetDisplayModeProperties2KHR
-def _wrap_vkGetDisplayPlaneCapabilities2KHR(fn):
-    def vkGetDisplayPlaneCapabilities2KHR(
-    physicalDevice
-            ,pDisplayPlaneInfo
-            ,pCapabilities=None
-            ,):
-
-        custom_return = True
-        if not pCapabilities:
-            pCapabilities = ffi.new('VkDisplayPlaneCapabilities2KHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pDisplayPlaneInfo,pCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCapabilities
-
-        return pCapabilities[0]
-
-
-
-    return vkGetDisplayPlaneCapabilities2KHR
-def vkGetBufferMemoryRequirements2(
-device
-        ,pInfo
-        ,pMemoryRequirements=None
-        ,):
-
-    custom_return = True
-    if not pMemoryRequirements:
-        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetBufferMemoryRequirements2, device,pInfo,pMemoryRequirements)
-
-    if custom_return:
-        return pMemoryRequirements
-
-    return pMemoryRequirements[0]
-
-
-
-def _wrap_vkGetBufferMemoryRequirements2(fn):
-    def vkGetBufferMemoryRequirements2(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetBufferMemoryRequirements2
-def vkGetImageMemoryRequirements2(
-device
-        ,pInfo
-        ,pMemoryRequirements=None
-        ,):
-
-    custom_return = True
-    if not pMemoryRequirements:
-        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetImageMemoryRequirements2, device,pInfo,pMemoryRequirements)
-
-    if custom_return:
-        return pMemoryRequirements
-
-    return pMemoryRequirements[0]
-
-
-
-def _wrap_vkGetImageMemoryRequirements2(fn):
-    def vkGetImageMemoryRequirements2(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetImageMemoryRequirements2
-def vkGetImageSparseMemoryRequirements2(
-device
-        ,pInfo
-        ,):
-
-    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
-    pSparseMemoryRequirements = ffi.NULL
-
-    result = _callApi(lib.vkGetImageSparseMemoryRequirements2, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-    pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
-    result = _callApi(lib.vkGetImageSparseMemoryRequirements2, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-    return pSparseMemoryRequirements
-
-
-def _wrap_vkGetImageSparseMemoryRequirements2(fn):
-    def vkGetImageSparseMemoryRequirements2(
-    device
-            ,pInfo
-            ,):
-
-        pSparseMemoryRequirementCount = ffi.new('uint32_t*')
-        pSparseMemoryRequirements = ffi.NULL
-
-        result = _callApi(fn, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-        pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
-        result = _callApi(fn, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-        return pSparseMemoryRequirements
-
-
-    return vkGetImageSparseMemoryRequirements2
-def vkGetDeviceBufferMemoryRequirements(
-device
-        ,pInfo
-        ,pMemoryRequirements=None
-        ,):
-
-    custom_return = True
-    if not pMemoryRequirements:
-        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDeviceBufferMemoryRequirements, device,pInfo,pMemoryRequirements)
-
-    if custom_return:
-        return pMemoryRequirements
-
-    return pMemoryRequirements[0]
-
-
-
-def _wrap_vkGetDeviceBufferMemoryRequirements(fn):
-    def vkGetDeviceBufferMemoryRequirements(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetDeviceBufferMemoryRequirements
-def vkGetDeviceImageMemoryRequirements(
-device
-        ,pInfo
-        ,pMemoryRequirements=None
-        ,):
-
-    custom_return = True
-    if not pMemoryRequirements:
-        pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDeviceImageMemoryRequirements, device,pInfo,pMemoryRequirements)
-
-    if custom_return:
-        return pMemoryRequirements
-
-    return pMemoryRequirements[0]
-
-
-
-def _wrap_vkGetDeviceImageMemoryRequirements(fn):
-    def vkGetDeviceImageMemoryRequirements(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetDeviceImageMemoryRequirements
-def vkGetDeviceImageSparseMemoryRequirements(
-device
-        ,pInfo
-        ,):
-
-    pSparseMemoryRequirementCount = ffi.new('uint32_t*')
-    pSparseMemoryRequirements = ffi.NULL
-
-    result = _callApi(lib.vkGetDeviceImageSparseMemoryRequirements, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-    pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
-    result = _callApi(lib.vkGetDeviceImageSparseMemoryRequirements, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-    return pSparseMemoryRequirements
-
-
-def _wrap_vkGetDeviceImageSparseMemoryRequirements(fn):
-    def vkGetDeviceImageSparseMemoryRequirements(
-    device
-            ,pInfo
-            ,):
-
-        pSparseMemoryRequirementCount = ffi.new('uint32_t*')
-        pSparseMemoryRequirements = ffi.NULL
-
-        result = _callApi(fn, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-        pSparseMemoryRequirements = ffi.new('VkSparseImageMemoryRequirements2[]', pSparseMemoryRequirementCount[0])
-        result = _callApi(fn, device,pInfo,pSparseMemoryRequirementCount,pSparseMemoryRequirements)
-
-        return pSparseMemoryRequirements
-
-
-    return vkGetDeviceImageSparseMemoryRequirements
-def vkCreateSamplerYcbcrConversion(
-device
-        ,pCreateInfo
-        ,pAllocator
-        ,pYcbcrConversion=None
-        ,):
-
-    custom_return = True
-    if not pYcbcrConversion:
-        pYcbcrConversion = ffi.new('VkSamplerYcbcrConversion*')
-        custom_return = False
-
-    result = _callApi(lib.vkCreateSamplerYcbcrConversion, device,pCreateInfo,pAllocator,pYcbcrConversion)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    if custom_return:
-        return pYcbcrConversion
-
-    return pYcbcrConversion[0]
-
-
-
-def _wrap_vkCreateSamplerYcbcrConversion(fn):
-    def vkCreateSamplerYcbcrConversion(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pYcbcrConversion=None
-            ,):
-
-        custom_return = True
-        if not pYcbcrConversion:
-            pYcbcrConversion = ffi.new('VkSamplerYcbcrConversion*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pYcbcrConversion)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pYcbcrConversion
-
-        return pYcbcrConversion[0]
-
-
-
-    return vkCreateSamplerYcbcrConversion
-def vkDestroySamplerYcbcrConversion(
-device
-        ,ycbcrConversion
-        ,pAllocator
-        ,):
-    result = _callApi(lib.vkDestroySamplerYcbcrConversion, device,ycbcrConversion,pAllocator)
-
-
-def _wrap_vkDestroySamplerYcbcrConversion(fn):
-    def vkDestroySamplerYcbcrConversion(
-    device
-            ,ycbcrConversion
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,ycbcrConversion,pAllocator)
-
-
-    return vkDestroySamplerYcbcrConversion
-def vkGetDeviceQueue2(
-device
-        ,pQueueInfo
-        ,pQueue=None
-        ,):
-
-    custom_return = True
-    if not pQueue:
-        pQueue = ffi.new('VkQueue*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDeviceQueue2, device,pQueueInfo,pQueue)
-
-    if custom_return:
-        return pQueue
-
-    return pQueue[0]
-
-
-
-def _wrap_vkCreateValidationCacheEXT(fn):
-    def vkCreateValidationCacheEXT(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pValidationCache=None
-            ,):
-
-        custom_return = True
-        if not pValidationCache:
-            pValidationCache = ffi.new('VkValidationCacheEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pValidationCache)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pValidationCache
-
-        return pValidationCache[0]
-
-
-
-    return vkCreateValidationCacheEXT
-def _wrap_vkDestroyValidationCacheEXT(fn):
-    def vkDestroyValidationCacheEXT(
-    device
-            ,validationCache
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,validationCache,pAllocator)
-
-
-    return vkDestroyValidationCacheEXT
-def _wrap_vkGetValidationCacheDataEXT(fn):
-    def vkGetValidationCacheDataEXT(
-    device
-            ,validationCache
-            ,pDataSize
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void[%d]' % pDataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,validationCache,pDataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData
-
-
-
-    return vkGetValidationCacheDataEXT
-def _wrap_vkMergeValidationCachesEXT(fn):
-    def vkMergeValidationCachesEXT(
-    device
-            ,dstCache
-            ,srcCacheCount
-            ,pSrcCaches
-            ,):
-        result = _callApi(fn, device,dstCache,srcCacheCount,pSrcCaches)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkMergeValidationCachesEXT
-def vkGetDescriptorSetLayoutSupport(
-device
-        ,pCreateInfo
-        ,pSupport=None
-        ,):
-
-    custom_return = True
-    if not pSupport:
-        pSupport = ffi.new('VkDescriptorSetLayoutSupport*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDescriptorSetLayoutSupport, device,pCreateInfo,pSupport)
-
-    if custom_return:
-        return pSupport
-
-    return pSupport[0]
-
-
-
-def _wrap_vkGetDescriptorSetLayoutSupport(fn):
-    def vkGetDescriptorSetLayoutSupport(
-    device
-            ,pCreateInfo
-            ,pSupport=None
-            ,):
-
-        custom_return = True
-        if not pSupport:
-            pSupport = ffi.new('VkDescriptorSetLayoutSupport*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pSupport)
-
-        if custom_return:
-            return pSupport
-
-        return pSupport[0]
-
-
-
-    return vkGetDescriptorSetLayoutSupport
-def _wrap_vkGetSwapchainGrallocUsageANDROID(fn):
-    def vkGetSwapchainGrallocUsageANDROID(
-    device
-            ,format
-            ,imageUsage
-            ,grallocUsage=None
-            ,):
-
-        custom_return = True
-        if not grallocUsage:
-            grallocUsage = ffi.new('int*')
-            custom_return = False
-
-        result = _callApi(fn, device,format,imageUsage,grallocUsage)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return grallocUsage
-
-        return grallocUsage[0]
-
-
-
-    return vkGetSwapchainGrallocUsageANDROID
-def _wrap_vkGetSwapchainGrallocUsage2ANDROID(fn):
-    def vkGetSwapchainGrallocUsage2ANDROID(
-    device
-            ,format
-            ,imageUsage
-            ,swapchainImageUsage
-            ,grallocConsumerUsage
-            ,grallocProducerUsage=None
-            ,):
-
-        custom_return = True
-        if not grallocProducerUsage:
-            grallocProducerUsage = ffi.new('uint64_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,format,imageUsage,swapchainImageUsage,grallocConsumerUsage,grallocProducerUsage)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return grallocProducerUsage
-
-        return grallocProducerUsage[0]
-
-
-
-    return vkGetSwapchainGrallocUsage2ANDROID
-def _wrap_vkAcquireImageANDROID(fn):
-    def vkAcquireImageANDROID(
-    device
-            ,image
-            ,nativeFenceFd
-            ,semaphore
-            ,fence=None
-            ,):
-
-        custom_return = True
-        if not fence:
-            fence = ffi.new('VkFence*')
-            custom_return = False
-
-        result = _callApi(fn, device,image,nativeFenceFd,semaphore,fence)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return fence
-
-        return fence[0]
-
-
-
-    return vkAcquireImageANDROID
-def _wrap_vkQueueSignalReleaseImageANDROID(fn):
-    def vkQueueSignalReleaseImageANDROID(
-    queue
-            ,waitSemaphoreCount
-            ,pWaitSemaphores
-            ,image
-            ,pNativeFenceFd
-            ,):
-        result = _callApi(fn, queue,waitSemaphoreCount,pWaitSemaphores,image,pNativeFenceFd)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkQueueSignalReleaseImageANDROID
-def _wrap_vkGetShaderInfoAMD(fn):
-    def vkGetShaderInfoAMD(
-    device
-            ,pipeline
-            ,shaderStage
-            ,infoType
-            ,pInfoSize
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('void[%d]' % pInfoSize)
-            custom_return = False
-
-        result = _callApi(fn, device,pipeline,shaderStage,infoType,pInfoSize,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pInfo
-
-        return pInfo
-
-
-
-    return vkGetShaderInfoAMD
-def _wrap_vkSetLocalDimmingAMD(fn):
-    def vkSetLocalDimmingAMD(
-    device
-            ,swapChain
-            ,localDimmingEnable
-            ,):
-        result = _callApi(fn, device,swapChain,localDimmingEnable)
-
-
-    return vkSetLocalDimmingAMD
-def _wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR(fn):
-    def vkGetPhysicalDeviceCalibrateableTimeDomainsKHR(
-    physicalDevice
-            ,):
-
-        pTimeDomainCount = ffi.new('uint32_t*')
-        pTimeDomains = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pTimeDomainCount,pTimeDomains)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pTimeDomains = ffi.new('VkTimeDomainKHR[]', pTimeDomainCount[0])
-        result = _callApi(fn, physicalDevice,pTimeDomainCount,pTimeDomains)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pTimeDomains
-
-
-    return vkGetPhysicalDeviceCalibrateableTimeDomainsKHR
-def _wrap_vkGetCalibratedTimestampsKHR(fn):
-    def vkGetCalibratedTimestampsKHR(
-    device
-            ,timestampCount
-            ,pTimestampInfos
-            ,pTimestamps
-            ,pMaxDeviation=None
-            ,):
-
-        custom_return = True
-        if not pMaxDeviation:
-            pMaxDeviation = ffi.new('uint64_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,timestampCount,pTimestampInfos,pTimestamps,pMaxDeviation)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMaxDeviation
-
-        return pMaxDeviation[0]
-
-
-
-    return vkGetCalibratedTimestampsKHR
-def _wrap_vkSetDebugUtilsObjectNameEXT(fn):
-    def vkSetDebugUtilsObjectNameEXT(
-    device
-            ,pNameInfo
-            ,):
-        result = _callApi(fn, device,pNameInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSetDebugUtilsObjectNameEXT
-def _wrap_vkSetDebugUtilsObjectTagEXT(fn):
-    def vkSetDebugUtilsObjectTagEXT(
-    device
-            ,pTagInfo
-            ,):
-        result = _callApi(fn, device,pTagInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSetDebugUtilsObjectTagEXT
-def _wrap_vkQueueBeginDebugUtilsLabelEXT(fn):
-    def vkQueueBeginDebugUtilsLabelEXT(
-    queue
-            ,pLabelInfo
-            ,):
-        result = _callApi(fn, queue,pLabelInfo)
-
-
-    return vkQueueBeginDebugUtilsLabelEXT
-def _wrap_vkQueueEndDebugUtilsLabelEXT(fn):
-    def vkQueueEndDebugUtilsLabelEXT(
-    queue
-            ,):
-        result = _callApi(fn, queue)
-
-
-    return vkQueueEndDebugUtilsLabelEXT
-def _wrap_vkQueueInsertDebugUtilsLabelEXT(fn):
-    def vkQueueInsertDebugUtilsLabelEXT(
-    queue
-            ,pLabelInfo
-            ,):
-        result = _callApi(fn, queue,pLabelInfo)
-
-
-    return vkQueueInsertDebugUtilsLabelEXT
-def _wrap_vkCmdBeginDebugUtilsLabelEXT(fn):
-    def vkCmdBeginDebugUtilsLabelEXT(
-    commandBuffer
-            ,pLabelInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pLabelInfo)
-
-
-    return vkCmdBeginDebugUtilsLabelEXT
-def _wrap_vkCmdEndDebugUtilsLabelEXT(fn):
-    def vkCmdEndDebugUtilsLabelEXT(
-    commandBuffer
-            ,):
-        result = _callApi(fn, commandBuffer)
-
-
-    return vkCmdEndDebugUtilsLabelEXT
-def _wrap_vkCmdInsertDebugUtilsLabelEXT(fn):
-    def vkCmdInsertDebugUtilsLabelEXT(
-    commandBuffer
-            ,pLabelInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pLabelInfo)
-
-
-    return vkCmdInsertDebugUtilsLabelEXT
-def _wrap_vkCreateDebugUtilsMessengerEXT(fn):
-    def vkCreateDebugUtilsMessengerEXT(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pMessenger=None
-            ,):
-
-        custom_return = True
-        if not pMessenger:
-            pMessenger = ffi.new('VkDebugUtilsMessengerEXT*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pMessenger)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMessenger
-
-        return pMessenger[0]
-
-
-
-    return vkCreateDebugUtilsMessengerEXT
-def _wrap_vkDestroyDebugUtilsMessengerEXT(fn):
-    def vkDestroyDebugUtilsMessengerEXT(
-    instance
-            ,messenger
-            ,pAllocator
-            ,):
-        result = _callApi(fn, instance,messenger,pAllocator)
-
-
-    return vkDestroyDebugUtilsMessengerEXT
-def _wrap_vkSubmitDebugUtilsMessageEXT(fn):
-    def vkSubmitDebugUtilsMessageEXT(
-    instance
-            ,messageSeverity
-            ,messageTypes
-            ,pCallbackData
-            ,):
-        result = _callApi(fn, instance,messageSeverity,messageTypes,pCallbackData)
-
-
-    return vkSubmitDebugUtilsMessageEXT
-def _wrap_vkGetMemoryHostPointerPropertiesEXT(fn):
-    def vkGetMemoryHostPointerPropertiesEXT(
-    device
-            ,handleType
-            ,pHostPointer
-            ,pMemoryHostPointerProperties=None
-            ,):
-
-        custom_return = True
-        if not pMemoryHostPointerProperties:
-            pMemoryHostPointerProperties = ffi.new('VkMemoryHostPointerPropertiesEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,handleType,pHostPointer,pMemoryHostPointerProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMemoryHostPointerProperties
-
-        return pMemoryHostPointerProperties[0]
-
-
-
-    return vkGetMemoryHostPointerPropertiesEXT
-def _wrap_vkCmdWriteBufferMarkerAMD(fn):
-    def vkCmdWriteBufferMarkerAMD(
-    commandBuffer
-            ,pipelineStage
-            ,dstBuffer
-            ,dstOffset
-            ,marker
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineStage,dstBuffer,dstOffset,marker)
-
-
-    return vkCmdWriteBufferMarkerAMD
-def vkCreateRenderPass2(
-device
-        ,pCreateInfo
-        ,pAllocator
-        ,pRenderPass=None
-        ,):
-
-    custom_return = True
-    if not pRenderPass:
-        pRenderPass = ffi.new('VkRenderPass*')
-        custom_return = False
-
-    result = _callApi(lib.vkCreateRenderPass2, device,pCreateInfo,pAllocator,pRenderPass)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    if custom_return:
-        return pRenderPass
-
-    return pRenderPass[0]
-
-
-
-def _wrap_vkCreateRenderPass2(fn):
-    def vkCreateRenderPass2(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pRenderPass=None
-            ,):
-
-        custom_return = True
-        if not pRenderPass:
-            pRenderPass = ffi.new('VkRenderPass*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pRenderPass)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pRenderPass
-
-        return pRenderPass[0]
-
-
-
-    return vkCreateRenderPass2
-def vkCmdBeginRenderPass2(
-commandBuffer
-        ,pRenderPassBegin
-        ,pSubpassBeginInfo
-        ,):
-    result = _callApi(lib.vkCmdBeginRenderPass2, commandBuffer,pRenderPassBegin,pSubpassBeginInfo)
-
-
-def _wrap_vkCmdBeginRenderPass2(fn):
-    def vkCmdBeginRenderPass2(
-    commandBuffer
-            ,pRenderPassBegin
-            ,pSubpassBeginInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pRenderPassBegin,pSubpassBeginInfo)
-
-
-    return vkCmdBeginRenderPass2
-def vkCmdNextSubpass2(
-commandBuffer
-        ,pSubpassBeginInfo
-        ,pSubpassEndInfo
-        ,):
-    result = _callApi(lib.vkCmdNextSubpass2, commandBuffer,pSubpassBeginInfo,pSubpassEndInfo)
-
-
-def _wrap_vkCmdNextSubpass2(fn):
-    def vkCmdNextSubpass2(
-    commandBuffer
-            ,pSubpassBeginInfo
-            ,pSubpassEndInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pSubpassBeginInfo,pSubpassEndInfo)
-
-
-    return vkCmdNextSubpass2
-def vkCmdEndRenderPass2(
-commandBuffer
-        ,pSubpassEndInfo
-        ,):
-    result = _callApi(lib.vkCmdEndRenderPass2, commandBuffer,pSubpassEndInfo)
-
-
-def _wrap_vkCmdEndRenderPass2(fn):
-    def vkCmdEndRenderPass2(
-    commandBuffer
-            ,pSubpassEndInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pSubpassEndInfo)
-
-
-    return vkCmdEndRenderPass2
-def vkGetSemaphoreCounterValue(
-device
-        ,semaphore
-        ,pValue=None
-        ,):
-
-    custom_return = True
-    if not pValue:
-        pValue = ffi.new('uint64_t*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetSemaphoreCounterValue, device,semaphore,pValue)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    if custom_return:
-        return pValue
-
-    return pValue[0]
-
-
-
-def _wrap_vkGetSemaphoreCounterValue(fn):
-    def vkGetSemaphoreCounterValue(
-    device
-            ,semaphore
-            ,pValue=None
-            ,):
-
-        custom_return = True
-        if not pValue:
-            pValue = ffi.new('uint64_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,semaphore,pValue)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pValue
-
-        return pValue[0]
-
-
-
-    return vkGetSemaphoreCounterValue
-def vkWaitSemaphores(
-device
-        ,pWaitInfo
-        ,timeout
-        ,):
-    result = _callApi(lib.vkWaitSemaphores, device,pWaitInfo,timeout)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkWaitSemaphores(fn):
-    def vkWaitSemaphores(
-    device
-            ,pWaitInfo
-            ,timeout
-            ,):
-        result = _callApi(fn, device,pWaitInfo,timeout)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkWaitSemaphores
-def vkSignalSemaphore(
-device
-        ,pSignalInfo
-        ,):
-    result = _callApi(lib.vkSignalSemaphore, device,pSignalInfo)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkSignalSemaphore(fn):
-    def vkSignalSemaphore(
-    device
-            ,pSignalInfo
-            ,):
-        result = _callApi(fn, device,pSignalInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSignalSemaphore
-def _wrap_vkGetAndroidHardwareBufferPropertiesANDROID(fn):
-    def vkGetAndroidHardwareBufferPropertiesANDROID(
-    device
-            ,buffer
-            ,pProperties=None
-            ,):
-
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkAndroidHardwareBufferPropertiesANDROID*')
-            custom_return = False
-
-        result = _callApi(fn, device,buffer,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pProperties
-
-        return pProperties[0]
-
-
-
-    return vkGetAndroidHardwareBufferPropertiesANDROID
-def _wrap_vkGetMemoryAndroidHardwareBufferANDROID(fn):
-    def vkGetMemoryAndroidHardwareBufferANDROID(
-    device
-            ,pInfo
-            ,pBuffer=None
-            ,):
-
-        custom_return = True
-        if not pBuffer:
-            pBuffer = ffi.new('AHardwareBuffer*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pBuffer)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pBuffer
-
-        return pBuffer[0]
-
-
-
-    return vkGetMemoryAndroidHardwareBufferANDROID
-def vkCmdDrawIndirectCount(
-commandBuffer
-        ,buffer
-        ,offset
-        ,countBuffer
-        ,countBufferOffset
-        ,maxDrawCount
-        ,stride
-        ,):
-    result = _callApi(lib.vkCmdDrawIndirectCount, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-def _wrap_vkCmdDrawIndirectCount(fn):
-    def vkCmdDrawIndirectCount(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,countBuffer
-            ,countBufferOffset
-            ,maxDrawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-    return vkCmdDrawIndirectCount
-def vkCmdDrawIndexedIndirectCount(
-commandBuffer
-        ,buffer
-        ,offset
-        ,countBuffer
-        ,countBufferOffset
-        ,maxDrawCount
-        ,stride
-        ,):
-    result = _callApi(lib.vkCmdDrawIndexedIndirectCount, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-def _wrap_vkCmdDrawIndexedIndirectCount(fn):
-    def vkCmdDrawIndexedIndirectCount(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,countBuffer
-            ,countBufferOffset
-            ,maxDrawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-    return vkCmdDrawIndexedIndirectCount
-def _wrap_vkCmdSetCheckpointNV(fn):
-    def vkCmdSetCheckpointNV(
-    commandBuffer
-            ,pCheckpointMarker
-            ,):
-        result = _callApi(fn, commandBuffer,pCheckpointMarker)
-
-
-    return vkCmdSetCheckpointNV
-def _wrap_vkGetQueueCheckpointDataNV(fn):
-    def vkGetQueueCheckpointDataNV(
-    queue
-            ,):
-
-        pCheckpointDataCount = ffi.new('uint32_t*')
-        pCheckpointData = ffi.NULL
-
-        result = _callApi(fn, queue,pCheckpointDataCount,pCheckpointData)
-
-        pCheckpointData = ffi.new('VkCheckpointDataNV[]', pCheckpointDataCount[0])
-        result = _callApi(fn, queue,pCheckpointDataCount,pCheckpointData)
-
-        return pCheckpointData
-
-
-    return vkGetQueueCheckpointDataNV
-def _wrap_vkCmdBindTransformFeedbackBuffersEXT(fn):
-    def vkCmdBindTransformFeedbackBuffersEXT(
-    commandBuffer
-            ,firstBinding
-            ,bindingCount
-            ,pBuffers
-            ,pOffsets
-            ,pSizes
-            ,):
-        result = _callApi(fn, commandBuffer,firstBinding,bindingCount,pBuffers,pOffsets,pSizes)
-
-
-    return vkCmdBindTransformFeedbackBuffersEXT
-def _wrap_vkCmdBeginTransformFeedbackEXT(fn):
-    def vkCmdBeginTransformFeedbackEXT(
-    commandBuffer
-            ,firstCounterBuffer
-            ,counterBufferCount
-            ,pCounterBuffers
-            ,pCounterBufferOffsets
-            ,):
-        result = _callApi(fn, commandBuffer,firstCounterBuffer,counterBufferCount,pCounterBuffers,pCounterBufferOffsets)
-
-
-    return vkCmdBeginTransformFeedbackEXT
-def _wrap_vkCmdEndTransformFeedbackEXT(fn):
-    def vkCmdEndTransformFeedbackEXT(
-    commandBuffer
-            ,firstCounterBuffer
-            ,counterBufferCount
-            ,pCounterBuffers
-            ,pCounterBufferOffsets
-            ,):
-        result = _callApi(fn, commandBuffer,firstCounterBuffer,counterBufferCount,pCounterBuffers,pCounterBufferOffsets)
-
-
-    return vkCmdEndTransformFeedbackEXT
-def _wrap_vkCmdBeginQueryIndexedEXT(fn):
-    def vkCmdBeginQueryIndexedEXT(
-    commandBuffer
-            ,queryPool
-            ,query
-            ,flags
-            ,index
-            ,):
-        result = _callApi(fn, commandBuffer,queryPool,query,flags,index)
-
-
-    return vkCmdBeginQueryIndexedEXT
-def _wrap_vkCmdEndQueryIndexedEXT(fn):
-    def vkCmdEndQueryIndexedEXT(
-    commandBuffer
-            ,queryPool
-            ,query
-            ,index
-            ,):
-        result = _callApi(fn, commandBuffer,queryPool,query,index)
-
-
-    return vkCmdEndQueryIndexedEXT
-def _wrap_vkCmdDrawIndirectByteCountEXT(fn):
-    def vkCmdDrawIndirectByteCountEXT(
-    commandBuffer
-            ,instanceCount
-            ,firstInstance
-            ,counterBuffer
-            ,counterBufferOffset
-            ,counterOffset
-            ,vertexStride
-            ,):
-        result = _callApi(fn, commandBuffer,instanceCount,firstInstance,counterBuffer,counterBufferOffset,counterOffset,vertexStride)
-
-
-    return vkCmdDrawIndirectByteCountEXT
-def _wrap_vkCmdSetExclusiveScissorNV(fn):
-    def vkCmdSetExclusiveScissorNV(
-    commandBuffer
-            ,firstExclusiveScissor
-            ,exclusiveScissorCount
-            ,pExclusiveScissors
-            ,):
-        result = _callApi(fn, commandBuffer,firstExclusiveScissor,exclusiveScissorCount,pExclusiveScissors)
-
-
-    return vkCmdSetExclusiveScissorNV
-def _wrap_vkCmdSetExclusiveScissorEnableNV(fn):
-    def vkCmdSetExclusiveScissorEnableNV(
-    commandBuffer
-            ,firstExclusiveScissor
-            ,exclusiveScissorCount
-            ,pExclusiveScissorEnables
-            ,):
-        result = _callApi(fn, commandBuffer,firstExclusiveScissor,exclusiveScissorCount,pExclusiveScissorEnables)
-
-
-    return vkCmdSetExclusiveScissorEnableNV
-def _wrap_vkCmdBindShadingRateImageNV(fn):
-    def vkCmdBindShadingRateImageNV(
-    commandBuffer
-            ,imageView
-            ,imageLayout
-            ,):
-        result = _callApi(fn, commandBuffer,imageView,imageLayout)
-
-
-    return vkCmdBindShadingRateImageNV
-def _wrap_vkCmdSetViewportShadingRatePaletteNV(fn):
-    def vkCmdSetViewportShadingRatePaletteNV(
-    commandBuffer
-            ,firstViewport
-            ,viewportCount
-            ,pShadingRatePalettes
-            ,):
-        result = _callApi(fn, commandBuffer,firstViewport,viewportCount,pShadingRatePalettes)
-
-
-    return vkCmdSetViewportShadingRatePaletteNV
-def _wrap_vkCmdSetCoarseSampleOrderNV(fn):
-    def vkCmdSetCoarseSampleOrderNV(
-    commandBuffer
-            ,sampleOrderType
-            ,customSampleOrderCount
-            ,pCustomSampleOrders
-            ,):
-        result = _callApi(fn, commandBuffer,sampleOrderType,customSampleOrderCount,pCustomSampleOrders)
-
-
-    return vkCmdSetCoarseSampleOrderNV
-def _wrap_vkCmdDrawMeshTasksNV(fn):
-    def vkCmdDrawMeshTasksNV(
-    commandBuffer
-            ,taskCount
-            ,firstTask
-            ,):
-        result = _callApi(fn, commandBuffer,taskCount,firstTask)
-
-
-    return vkCmdDrawMeshTasksNV
-def _wrap_vkCmdDrawMeshTasksIndirectNV(fn):
-    def vkCmdDrawMeshTasksIndirectNV(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,drawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,drawCount,stride)
-
-
-    return vkCmdDrawMeshTasksIndirectNV
-def _wrap_vkCmdDrawMeshTasksIndirectCountNV(fn):
-    def vkCmdDrawMeshTasksIndirectCountNV(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,countBuffer
-            ,countBufferOffset
-            ,maxDrawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-    return vkCmdDrawMeshTasksIndirectCountNV
-def _wrap_vkCmdDrawMeshTasksEXT(fn):
-    def vkCmdDrawMeshTasksEXT(
-    commandBuffer
-            ,groupCountX
-            ,groupCountY
-            ,groupCountZ
-            ,):
-        result = _callApi(fn, commandBuffer,groupCountX,groupCountY,groupCountZ)
-
-
-    return vkCmdDrawMeshTasksEXT
-def _wrap_vkCmdDrawMeshTasksIndirectEXT(fn):
-    def vkCmdDrawMeshTasksIndirectEXT(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,drawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,drawCount,stride)
-
-
-    return vkCmdDrawMeshTasksIndirectEXT
-def _wrap_vkCmdDrawMeshTasksIndirectCountEXT(fn):
-    def vkCmdDrawMeshTasksIndirectCountEXT(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,countBuffer
-            ,countBufferOffset
-            ,maxDrawCount
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,countBuffer,countBufferOffset,maxDrawCount,stride)
-
-
-    return vkCmdDrawMeshTasksIndirectCountEXT
-def _wrap_vkCompileDeferredNV(fn):
-    def vkCompileDeferredNV(
-    device
-            ,pipeline
-            ,shader
-            ,):
-        result = _callApi(fn, device,pipeline,shader)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCompileDeferredNV
-def _wrap_vkCreateAccelerationStructureNV(fn):
-    def vkCreateAccelerationStructureNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pAccelerationStructure=None
-            ,):
-
-        custom_return = True
-        if not pAccelerationStructure:
-            pAccelerationStructure = ffi.new('VkAccelerationStructureNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pAccelerationStructure)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pAccelerationStructure
-
-        return pAccelerationStructure[0]
-
-
-
-    return vkCreateAccelerationStructureNV
-def _wrap_vkCmdBindInvocationMaskHUAWEI(fn):
-    def vkCmdBindInvocationMaskHUAWEI(
-    commandBuffer
-            ,imageView
-            ,imageLayout
-            ,):
-        result = _callApi(fn, commandBuffer,imageView,imageLayout)
-
-
-    return vkCmdBindInvocationMaskHUAWEI
-def _wrap_vkDestroyAccelerationStructureKHR(fn):
-    def vkDestroyAccelerationStructureKHR(
-    device
-            ,accelerationStructure
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,accelerationStructure,pAllocator)
-
-
-    return vkDestroyAccelerationStructureKHR
-def _wrap_vkDestroyAccelerationStructureNV(fn):
-    def vkDestroyAccelerationStructureNV(
-    device
-            ,accelerationStructure
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,accelerationStructure,pAllocator)
-
-
-    return vkDestroyAccelerationStructureNV
-def _wrap_vkGetAccelerationStructureMemoryRequirementsNV(fn):
-    def vkGetAccelerationStructureMemoryRequirementsNV(
-    device
-            ,pInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2KHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetAccelerationStructureMemoryRequirementsNV
-def _wrap_vkBindAccelerationStructureMemoryNV(fn):
-    def vkBindAccelerationStructureMemoryNV(
-    device
-            ,bindInfoCount
-            ,pBindInfos
-            ,):
-        result = _callApi(fn, device,bindInfoCount,pBindInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBindAccelerationStructureMemoryNV
-def _wrap_vkCmdCopyAccelerationStructureNV(fn):
-    def vkCmdCopyAccelerationStructureNV(
-    commandBuffer
-            ,dst
-            ,src
-            ,mode
-            ,):
-        result = _callApi(fn, commandBuffer,dst,src,mode)
-
-
-    return vkCmdCopyAccelerationStructureNV
-def _wrap_vkCmdCopyAccelerationStructureKHR(fn):
-    def vkCmdCopyAccelerationStructureKHR(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyAccelerationStructureKHR
-def _wrap_vkCopyAccelerationStructureKHR(fn):
-    def vkCopyAccelerationStructureKHR(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyAccelerationStructureKHR
-def _wrap_vkCmdCopyAccelerationStructureToMemoryKHR(fn):
-    def vkCmdCopyAccelerationStructureToMemoryKHR(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyAccelerationStructureToMemoryKHR
-def _wrap_vkCopyAccelerationStructureToMemoryKHR(fn):
-    def vkCopyAccelerationStructureToMemoryKHR(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyAccelerationStructureToMemoryKHR
-def _wrap_vkCmdCopyMemoryToAccelerationStructureKHR(fn):
-    def vkCmdCopyMemoryToAccelerationStructureKHR(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyMemoryToAccelerationStructureKHR
-def _wrap_vkCopyMemoryToAccelerationStructureKHR(fn):
-    def vkCopyMemoryToAccelerationStructureKHR(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyMemoryToAccelerationStructureKHR
-def _wrap_vkCmdWriteAccelerationStructuresPropertiesKHR(fn):
-    def vkCmdWriteAccelerationStructuresPropertiesKHR(
-    commandBuffer
-            ,accelerationStructureCount
-            ,pAccelerationStructures
-            ,queryType
-            ,queryPool
-            ,firstQuery
-            ,):
-        result = _callApi(fn, commandBuffer,accelerationStructureCount,pAccelerationStructures,queryType,queryPool,firstQuery)
-
-
-    return vkCmdWriteAccelerationStructuresPropertiesKHR
-def _wrap_vkCmdWriteAccelerationStructuresPropertiesNV(fn):
-    def vkCmdWriteAccelerationStructuresPropertiesNV(
-    commandBuffer
-            ,accelerationStructureCount
-            ,pAccelerationStructures
-            ,queryType
-            ,queryPool
-            ,firstQuery
-            ,):
-        result = _callApi(fn, commandBuffer,accelerationStructureCount,pAccelerationStructures,queryType,queryPool,firstQuery)
-
-
-    return vkCmdWriteAccelerationStructuresPropertiesNV
-def _wrap_vkCmdBuildAccelerationStructureNV(fn):
-    def vkCmdBuildAccelerationStructureNV(
-    commandBuffer
-            ,pInfo
-            ,instanceData
-            ,instanceOffset
-            ,update
-            ,dst
-            ,src
-            ,scratch
-            ,scratchOffset
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo,instanceData,instanceOffset,update,dst,src,scratch,scratchOffset)
-
-
-    return vkCmdBuildAccelerationStructureNV
-def _wrap_vkWriteAccelerationStructuresPropertiesKHR(fn):
-    def vkWriteAccelerationStructuresPropertiesKHR(
-    device
-            ,accelerationStructureCount
-            ,pAccelerationStructures
-            ,queryType
-            ,dataSize
-            ,pData
-            ,stride
-            ,):
-        result = _callApi(fn, device,accelerationStructureCount,pAccelerationStructures,queryType,dataSize,pData,stride)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkWriteAccelerationStructuresPropertiesKHR
-def _wrap_vkCmdTraceRaysKHR(fn):
-    def vkCmdTraceRaysKHR(
-    commandBuffer
-            ,pRaygenShaderBindingTable
-            ,pMissShaderBindingTable
-            ,pHitShaderBindingTable
-            ,pCallableShaderBindingTable
-            ,width
-            ,height
-            ,depth
-            ,):
-        result = _callApi(fn, commandBuffer,pRaygenShaderBindingTable,pMissShaderBindingTable,pHitShaderBindingTable,pCallableShaderBindingTable,width,height,depth)
-
-
-    return vkCmdTraceRaysKHR
-def _wrap_vkCmdTraceRaysNV(fn):
-    def vkCmdTraceRaysNV(
-    commandBuffer
-            ,raygenShaderBindingTableBuffer
-            ,raygenShaderBindingOffset
-            ,missShaderBindingTableBuffer
-            ,missShaderBindingOffset
-            ,missShaderBindingStride
-            ,hitShaderBindingTableBuffer
-            ,hitShaderBindingOffset
-            ,hitShaderBindingStride
-            ,callableShaderBindingTableBuffer
-            ,callableShaderBindingOffset
-            ,callableShaderBindingStride
-            ,width
-            ,height
-            ,depth
-            ,):
-        result = _callApi(fn, commandBuffer,raygenShaderBindingTableBuffer,raygenShaderBindingOffset,missShaderBindingTableBuffer,missShaderBindingOffset,missShaderBindingStride,hitShaderBindingTableBuffer,hitShaderBindingOffset,hitShaderBindingStride,callableShaderBindingTableBuffer,callableShaderBindingOffset,callableShaderBindingStride,width,height,depth)
-
-
-    return vkCmdTraceRaysNV
-def _wrap_vkGetRayTracingShaderGroupHandlesKHR(fn):
-    def vkGetRayTracingShaderGroupHandlesKHR(
-    device
-            ,pipeline
-            ,firstGroup
-            ,groupCount
-            ,dataSize
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('uint64_t[%d]' % dataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,pipeline,firstGroup,groupCount,dataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData
-
-
-
-    return vkGetRayTracingShaderGroupHandlesKHR
-def _wrap_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(fn):
-    def vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(
-    device
-            ,pipeline
-            ,firstGroup
-            ,groupCount
-            ,dataSize
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('uint64_t[%d]' % dataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,pipeline,firstGroup,groupCount,dataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData
-
-
-
-    return vkGetRayTracingCaptureReplayShaderGroupHandlesKHR
-def _wrap_vkGetAccelerationStructureHandleNV(fn):
-    def vkGetAccelerationStructureHandleNV(
-    device
-            ,accelerationStructure
-            ,dataSize
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('uint64_t[%d]' % dataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,accelerationStructure,dataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData
-
-
-
-    return vkGetAccelerationStructureHandleNV
-def _wrap_vkCreateRayTracingPipelinesNV(fn):
-    def vkCreateRayTracingPipelinesNV(
-    device
-            ,pipelineCache
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pPipelines=None
-            ,):
-
-        custom_return = True
-        if not pPipelines:
-            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
-            custom_return = False
-
-        result = _callApi(fn, device,pipelineCache,createInfoCount,pCreateInfos,pAllocator,pPipelines)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPipelines
-
-        return pPipelines
-
-
-
-    return vkCreateRayTracingPipelinesNV
-def _wrap_vkCreateRayTracingPipelinesNV(fn):
-    def vkCreateRayTracingPipelinesNV(
-    device
-            ,pipelineCache
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pPipelines=None
-            ,):
-
-        custom_return = True
-        if not pPipelines:
-            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
-            custom_return = False
-
-        result = _callApi(fn, device,pipelineCache,createInfoCount,pCreateInfos,pAllocator,pPipelines)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPipelines
-
-        return pPipelines
-
-
-
-    return vkCreateRayTracingPipelinesNV
-def _wrap_vkCreateRayTracingPipelinesKHR(fn):
-    def vkCreateRayTracingPipelinesKHR(
-    device
-            ,deferredOperation
-            ,pipelineCache
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pPipelines=None
-            ,):
-
-        custom_return = True
-        if not pPipelines:
-            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
-            custom_return = False
-
-        result = _callApi(fn, device,deferredOperation,pipelineCache,createInfoCount,pCreateInfos,pAllocator,pPipelines)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPipelines
-
-        return pPipelines
-
-
-
-    return vkCreateRayTracingPipelinesKHR
-def _wrap_vkCreateRayTracingPipelinesKHR(fn):
-    def vkCreateRayTracingPipelinesKHR(
-    device
-            ,deferredOperation
-            ,pipelineCache
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pPipelines=None
-            ,):
-
-        custom_return = True
-        if not pPipelines:
-            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
-            custom_return = False
-
-        result = _callApi(fn, device,deferredOperation,pipelineCache,createInfoCount,pCreateInfos,pAllocator,pPipelines)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPipelines
-
-        return pPipelines
-
-
-
-    return vkCreateRayTracingPipelinesKHR
-def _wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(fn):
-    def vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(
-    physicalDevice
-            ,):
-
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkCooperativeMatrixPropertiesNV[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pProperties
-
-
-    return vkGetPhysicalDeviceCooperativeMatrixPropertiesNV
-def _wrap_vkCmdTraceRaysIndirectKHR(fn):
-    def vkCmdTraceRaysIndirectKHR(
-    commandBuffer
-            ,pRaygenShaderBindingTable
-            ,pMissShaderBindingTable
-            ,pHitShaderBindingTable
-            ,pCallableShaderBindingTable
-            ,indirectDeviceAddress
-            ,):
-        result = _callApi(fn, commandBuffer,pRaygenShaderBindingTable,pMissShaderBindingTable,pHitShaderBindingTable,pCallableShaderBindingTable,indirectDeviceAddress)
-
-
-    return vkCmdTraceRaysIndirectKHR
-def _wrap_vkCmdTraceRaysIndirect2KHR(fn):
-    def vkCmdTraceRaysIndirect2KHR(
-    commandBuffer
-            ,indirectDeviceAddress
-            ,):
-        result = _callApi(fn, commandBuffer,indirectDeviceAddress)
-
-
-    return vkCmdTraceRaysIndirect2KHR
-def _wrap_vkGetDeviceAccelerationStructureCompatibilityKHR(fn):
-    def vkGetDeviceAccelerationStructureCompatibilityKHR(
-    device
-            ,pVersionInfo
-            ,pCompatibility=None
-            ,):
-
-        custom_return = True
-        if not pCompatibility:
-            pCompatibility = ffi.new('VkAccelerationStructureCompatibilityKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pVersionInfo,pCompatibility)
-
-        if custom_return:
-            return pCompatibility
-
-        return pCompatibility[0]
-
-
-
-    return vkGetDeviceAccelerationStructureCompatibilityKHR
-def _wrap_vkGetRayTracingShaderGroupStackSizeKHR(fn):
-    def vkGetRayTracingShaderGroupStackSizeKHR(
-    device
-            ,pipeline
-            ,group
-            ,groupShader=None
-            ,):
-
-        custom_return = True
-        if not groupShader:
-            groupShader = ffi.new('VkShaderGroupShaderKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pipeline,group,groupShader)
-
-        if custom_return:
-            return groupShader
-
-        return groupShader[0]
-
-
-
-    return vkGetRayTracingShaderGroupStackSizeKHR
-def _wrap_vkCmdSetRayTracingPipelineStackSizeKHR(fn):
-    def vkCmdSetRayTracingPipelineStackSizeKHR(
-    commandBuffer
-            ,pipelineStackSize
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineStackSize)
-
-
-    return vkCmdSetRayTracingPipelineStackSizeKHR
-def _wrap_vkGetImageViewHandleNVX(fn):
-    def vkGetImageViewHandleNVX(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkImageViewHandleInfoNVX*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetImageViewHandleNVX
-def _wrap_vkGetImageViewAddressNVX(fn):
-    def vkGetImageViewAddressNVX(
-    device
-            ,imageView
-            ,pProperties=None
-            ,):
-
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkImageViewAddressPropertiesNVX*')
-            custom_return = False
-
-        result = _callApi(fn, device,imageView,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pProperties
-
-        return pProperties[0]
-
-
-
-    return vkGetImageViewAddressNVX
-def _wrap_vkGetPhysicalDeviceSurfacePresentModes2EXT(fn):
-    def vkGetPhysicalDeviceSurfacePresentModes2EXT(
-    physicalDevice
-            ,pSurfaceInfo
-            ,):
-
-        pPresentModeCount = ffi.new('uint32_t*')
-        pPresentModes = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pSurfaceInfo,pPresentModeCount,pPresentModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pPresentModes = ffi.new('VkPresentModeKHR[]', pPresentModeCount[0])
-        result = _callApi(fn, physicalDevice,pSurfaceInfo,pPresentModeCount,pPresentModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pPresentModes
-
-
-    return vkGetPhysicalDeviceSurfacePresentModes2EXT
-def _wrap_vkGetDeviceGroupSurfacePresentModes2EXT(fn):
-    def vkGetDeviceGroupSurfacePresentModes2EXT(
-    device
-            ,pSurfaceInfo
-            ,pModes=None
-            ,):
-
-        custom_return = True
-        if not pModes:
-            pModes = ffi.new('VkDeviceGroupPresentModeFlagsKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pSurfaceInfo,pModes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pModes
-
-        return pModes[0]
-
-
-
-    return vkGetDeviceGroupSurfacePresentModes2EXT
-def _wrap_vkAcquireFullScreenExclusiveModeEXT(fn):
-    def vkAcquireFullScreenExclusiveModeEXT(
-    device
-            ,swapchain=None
-            ,):
-
-        custom_return = True
-        if not swapchain:
-            swapchain = ffi.new('VkSwapchainKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,swapchain)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return swapchain
-
-        return swapchain[0]
-
-
-
-    return vkAcquireFullScreenExclusiveModeEXT
-def _wrap_vkReleaseFullScreenExclusiveModeEXT(fn):
-    def vkReleaseFullScreenExclusiveModeEXT(
-    device
-            ,swapchain
-            ,):
-        result = _callApi(fn, device,swapchain)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkReleaseFullScreenExclusiveModeEXT
-def _wrap_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(fn):
-    def vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(
-    physicalDevice
-            ,queueFamilyIndex
-            ,pCounterCount
-            ,):
-
-        pCounters = ffi.new('VkPerformanceCounterKHR*')
-        pCounterDescriptions = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,pCounterCount,pCounters,pCounterDescriptions)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pCounterDescriptions = ffi.new('VkPerformanceCounterDescriptionKHR[]', pCounters[0])
-        result = _callApi(fn, physicalDevice,queueFamilyIndex,pCounterCount,pCounters,pCounterDescriptions)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        result = (StrWrap(x) for x in pCounterDescriptions)
-        _weakkey_dict[result] = pCounterDescriptions
-        return result
-
-
-    return vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR
-def _wrap_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(fn):
-    def vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(
-    physicalDevice
-            ,):
-
-        pPerformanceQueryCreateInfo = ffi.new('VkQueryPoolPerformanceCreateInfoKHR*')
-        pNumPasses = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pPerformanceQueryCreateInfo,pNumPasses)
-
-        pNumPasses = ffi.new('uint32_t[]', pPerformanceQueryCreateInfo[0])
-        result = _callApi(fn, physicalDevice,pPerformanceQueryCreateInfo,pNumPasses)
-
-        return pNumPasses
-
-
-    return vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR
-def _wrap_vkAcquireProfilingLockKHR(fn):
-    def vkAcquireProfilingLockKHR(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkAcquireProfilingLockInfoKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkAcquireProfilingLockKHR
-def _wrap_vkReleaseProfilingLockKHR(fn):
-    def vkReleaseProfilingLockKHR(
-    device
-            ,):
-        result = _callApi(fn, device)
-
-
-    return vkReleaseProfilingLockKHR
-def _wrap_vkGetImageDrmFormatModifierPropertiesEXT(fn):
-    def vkGetImageDrmFormatModifierPropertiesEXT(
-    device
-            ,image
-            ,pProperties=None
-            ,):
-
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkImageDrmFormatModifierPropertiesEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,image,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pProperties
-
-        return pProperties[0]
-
-
-
-    return vkGetImageDrmFormatModifierPropertiesEXT
-def vkGetBufferOpaqueCaptureAddress(
-device
-        ,pInfo=None
-        ,):
-
-    custom_return = True
-    if not pInfo:
-        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetBufferOpaqueCaptureAddress, device,pInfo)
-
-    if custom_return:
-        return pInfo
-
-    return pInfo[0]
-
-
-
-def _wrap_vkGetBufferOpaqueCaptureAddress(fn):
-    def vkGetBufferOpaqueCaptureAddress(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkBufferDeviceAddressInfo*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetBufferOpaqueCaptureAddress
-def vkGetBufferDeviceAddress(
-device
-        ,pInfo=None
-        ,):
-
-    custom_return = True
-    if not pInfo:
-        pInfo = ffi.new('VkBufferDeviceAddressInfo*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetBufferDeviceAddress, device,pInfo)
-
-    if custom_return:
-        return pInfo
-
-    return pInfo[0]
-
-
-
-def _wrap_vkGetBufferDeviceAddress(fn):
-    def vkGetBufferDeviceAddress(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkBufferDeviceAddressInfo*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetBufferDeviceAddress
-def _wrap_vkCreateHeadlessSurfaceEXT(fn):
-    def vkCreateHeadlessSurfaceEXT(
-    instance
-            ,pCreateInfo
-            ,pAllocator
-            ,pSurface=None
-            ,):
-
-        custom_return = True
-        if not pSurface:
-            pSurface = ffi.new('VkSurfaceKHR*')
-            custom_return = False
-
-        result = _callApi(fn, instance,pCreateInfo,pAllocator,pSurface)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pSurface
-
-        return pSurface[0]
-
-
-
-    return vkCreateHeadlessSurfaceEXT
-def _wrap_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(fn):
-    def vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(
-    physicalDevice
-            ,):
-
-        pCombinationCount = ffi.new('uint32_t*')
-        pCombinations = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pCombinationCount,pCombinations)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pCombinations = ffi.new('VkFramebufferMixedSamplesCombinationNV[]', pCombinationCount[0])
-        result = _callApi(fn, physicalDevice,pCombinationCount,pCombinations)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pCombinations
-
-
-    return vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV
-def _wrap_vkInitializePerformanceApiINTEL(fn):
-    def vkInitializePerformanceApiINTEL(
-    device
-            ,pInitializeInfo
-            ,):
-        result = _callApi(fn, device,pInitializeInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkInitializePerformanceApiINTEL
-def _wrap_vkUninitializePerformanceApiINTEL(fn):
-    def vkUninitializePerformanceApiINTEL(
-    device
-            ,):
-        result = _callApi(fn, device)
-
-
-    return vkUninitializePerformanceApiINTEL
-def _wrap_vkCmdSetPerformanceMarkerINTEL(fn):
-    def vkCmdSetPerformanceMarkerINTEL(
-    commandBuffer
-            ,pMarkerInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pMarkerInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCmdSetPerformanceMarkerINTEL
-def _wrap_vkCmdSetPerformanceStreamMarkerINTEL(fn):
-    def vkCmdSetPerformanceStreamMarkerINTEL(
-    commandBuffer
-            ,pMarkerInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pMarkerInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCmdSetPerformanceStreamMarkerINTEL
-def _wrap_vkCmdSetPerformanceOverrideINTEL(fn):
-    def vkCmdSetPerformanceOverrideINTEL(
-    commandBuffer
-            ,pOverrideInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pOverrideInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCmdSetPerformanceOverrideINTEL
-def _wrap_vkAcquirePerformanceConfigurationINTEL(fn):
-    def vkAcquirePerformanceConfigurationINTEL(
-    device
-            ,pAcquireInfo
-            ,pConfiguration=None
-            ,):
-
-        custom_return = True
-        if not pConfiguration:
-            pConfiguration = ffi.new('VkPerformanceConfigurationINTEL*')
-            custom_return = False
-
-        result = _callApi(fn, device,pAcquireInfo,pConfiguration)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pConfiguration
-
-        return pConfiguration[0]
-
-
-
-    return vkAcquirePerformanceConfigurationINTEL
-def _wrap_vkReleasePerformanceConfigurationINTEL(fn):
-    def vkReleasePerformanceConfigurationINTEL(
-    device
-            ,configuration
-            ,):
-        result = _callApi(fn, device,configuration)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkReleasePerformanceConfigurationINTEL
-def _wrap_vkQueueSetPerformanceConfigurationINTEL(fn):
-    def vkQueueSetPerformanceConfigurationINTEL(
-    queue
-            ,configuration
-            ,):
-        result = _callApi(fn, queue,configuration)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkQueueSetPerformanceConfigurationINTEL
-def _wrap_vkGetPerformanceParameterINTEL(fn):
-    def vkGetPerformanceParameterINTEL(
-    device
-            ,parameter
-            ,pValue=None
-            ,):
-
-        custom_return = True
-        if not pValue:
-            pValue = ffi.new('VkPerformanceValueINTEL*')
-            custom_return = False
-
-        result = _callApi(fn, device,parameter,pValue)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pValue
-
-        return pValue[0]
-
-
-
-    return vkGetPerformanceParameterINTEL
-def vkGetDeviceMemoryOpaqueCaptureAddress(
-device
-        ,pInfo=None
-        ,):
-
-    custom_return = True
-    if not pInfo:
-        pInfo = ffi.new('VkDeviceMemoryOpaqueCaptureAddressInfo*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetDeviceMemoryOpaqueCaptureAddress, device,pInfo)
-
-    if custom_return:
-        return pInfo
-
-    return pInfo[0]
-
-
-
-def _wrap_vkGetDeviceMemoryOpaqueCaptureAddress(fn):
-    def vkGetDeviceMemoryOpaqueCaptureAddress(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkDeviceMemoryOpaqueCaptureAddressInfo*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetDeviceMemoryOpaqueCaptureAddress
-def _wrap_vkGetPipelineExecutablePropertiesKHR(fn):
-    def vkGetPipelineExecutablePropertiesKHR(
-    device
-            ,pPipelineInfo
-            ,):
-
-        pExecutableCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, device,pPipelineInfo,pExecutableCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkPipelineExecutablePropertiesKHR[]', pExecutableCount[0])
-        result = _callApi(fn, device,pPipelineInfo,pExecutableCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        result = (StrWrap(x) for x in pProperties)
-        _weakkey_dict[result] = pProperties
-        return result
-
-
-    return vkGetPipelineExecutablePropertiesKHR
-def _wrap_vkGetPipelineExecutableStatisticsKHR(fn):
-    def vkGetPipelineExecutableStatisticsKHR(
-    device
-            ,pExecutableInfo
-            ,):
-
-        pStatisticCount = ffi.new('uint32_t*')
-        pStatistics = ffi.NULL
-
-        result = _callApi(fn, device,pExecutableInfo,pStatisticCount,pStatistics)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pStatistics = ffi.new('VkPipelineExecutableStatisticKHR[]', pStatisticCount[0])
-        result = _callApi(fn, device,pExecutableInfo,pStatisticCount,pStatistics)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        result = (StrWrap(x) for x in pStatistics)
-        _weakkey_dict[result] = pStatistics
-        return result
-
-
-    return vkGetPipelineExecutableStatisticsKHR
-def _wrap_vkGetPipelineExecutableInternalRepresentationsKHR(fn):
-    def vkGetPipelineExecutableInternalRepresentationsKHR(
-    device
-            ,pExecutableInfo
-            ,):
-
-        pInternalRepresentationCount = ffi.new('uint32_t*')
-        pInternalRepresentations = ffi.NULL
-
-        result = _callApi(fn, device,pExecutableInfo,pInternalRepresentationCount,pInternalRepresentations)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pInternalRepresentations = ffi.new('VkPipelineExecutableInternalRepresentationKHR[]', pInternalRepresentationCount[0])
-        result = _callApi(fn, device,pExecutableInfo,pInternalRepresentationCount,pInternalRepresentations)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        result = (StrWrap(x) for x in pInternalRepresentations)
-        _weakkey_dict[result] = pInternalRepresentations
-        return result
-
-
-    return vkGetPipelineExecutableInternalRepresentationsKHR
-def _wrap_vkCmdSetLineStippleEXT(fn):
-    def vkCmdSetLineStippleEXT(
-    commandBuffer
-            ,lineStippleFactor
-            ,lineStipplePattern
-            ,):
-        result = _callApi(fn, commandBuffer,lineStippleFactor,lineStipplePattern)
-
-
-    return vkCmdSetLineStippleEXT
-def vkGetFaultData(
-device
-        ,faultQueryBehavior
-        ,pUnrecordedFaults
-        ,):
-
-    pFaultCount = ffi.new('uint32_t*')
-    pFaults = ffi.NULL
-
-    result = _callApi(lib.vkGetFaultData, device,faultQueryBehavior,pUnrecordedFaults,pFaultCount,pFaults)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    pFaults = ffi.new('VkFaultData[]', pFaultCount[0])
-    result = _callApi(lib.vkGetFaultData, device,faultQueryBehavior,pUnrecordedFaults,pFaultCount,pFaults)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    return pFaults
-
-
-def vkGetPhysicalDeviceToolProperties(
-physicalDevice
-        ,):
-
-    pToolCount = ffi.new('uint32_t*')
-    pToolProperties = ffi.NULL
-
-    result = _callApi(lib.vkGetPhysicalDeviceToolProperties, physicalDevice,pToolCount,pToolProperties)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    pToolProperties = ffi.new('VkPhysicalDeviceToolProperties[]', pToolCount[0])
-    result = _callApi(lib.vkGetPhysicalDeviceToolProperties, physicalDevice,pToolCount,pToolProperties)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    result = (StrWrap(x) for x in pToolProperties)
-    _weakkey_dict[result] = pToolProperties
-    return result
-
-
-def _wrap_vkGetPhysicalDeviceToolProperties(fn):
-    def vkGetPhysicalDeviceToolProperties(
-    physicalDevice
-            ,):
-
-        pToolCount = ffi.new('uint32_t*')
-        pToolProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pToolCount,pToolProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pToolProperties = ffi.new('VkPhysicalDeviceToolProperties[]', pToolCount[0])
-        result = _callApi(fn, physicalDevice,pToolCount,pToolProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        result = (StrWrap(x) for x in pToolProperties)
-        _weakkey_dict[result] = pToolProperties
-        return result
-
-
-    return vkGetPhysicalDeviceToolProperties
-def _wrap_vkCreateAccelerationStructureKHR(fn):
-    def vkCreateAccelerationStructureKHR(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pAccelerationStructure=None
-            ,):
-
-        custom_return = True
-        if not pAccelerationStructure:
-            pAccelerationStructure = ffi.new('VkAccelerationStructureKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pAccelerationStructure)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pAccelerationStructure
-
-        return pAccelerationStructure[0]
-
-
-
-    return vkCreateAccelerationStructureKHR
-def _wrap_vkCmdBuildAccelerationStructuresKHR(fn):
-    def vkCmdBuildAccelerationStructuresKHR(
-    commandBuffer
-            ,infoCount
-            ,pInfos
-            ,ppBuildRangeInfos
-            ,):
-        result = _callApi(fn, commandBuffer,infoCount,pInfos,ppBuildRangeInfos)
-
-
-    return vkCmdBuildAccelerationStructuresKHR
-def _wrap_vkCmdBuildAccelerationStructuresIndirectKHR(fn):
-    def vkCmdBuildAccelerationStructuresIndirectKHR(
-    commandBuffer
-            ,infoCount
-            ,pInfos
-            ,pIndirectDeviceAddresses
-            ,pIndirectStrides
-            ,ppMaxPrimitiveCounts
-            ,):
-        result = _callApi(fn, commandBuffer,infoCount,pInfos,pIndirectDeviceAddresses,pIndirectStrides,ppMaxPrimitiveCounts)
-
-
-    return vkCmdBuildAccelerationStructuresIndirectKHR
-def _wrap_vkBuildAccelerationStructuresKHR(fn):
-    def vkBuildAccelerationStructuresKHR(
-    device
-            ,deferredOperation
-            ,infoCount
-            ,pInfos
-            ,ppBuildRangeInfos
-            ,):
-        result = _callApi(fn, device,deferredOperation,infoCount,pInfos,ppBuildRangeInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBuildAccelerationStructuresKHR
-def _wrap_vkGetAccelerationStructureDeviceAddressKHR(fn):
-    def vkGetAccelerationStructureDeviceAddressKHR(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkAccelerationStructureDeviceAddressInfoKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetAccelerationStructureDeviceAddressKHR
-def _wrap_vkCreateDeferredOperationKHR(fn):
-    def vkCreateDeferredOperationKHR(
-    device
-            ,pAllocator
-            ,pDeferredOperation=None
-            ,):
-
-        custom_return = True
-        if not pDeferredOperation:
-            pDeferredOperation = ffi.new('VkDeferredOperationKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pAllocator,pDeferredOperation)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pDeferredOperation
-
-        return pDeferredOperation[0]
-
-
-
-    return vkCreateDeferredOperationKHR
-def _wrap_vkDestroyDeferredOperationKHR(fn):
-    def vkDestroyDeferredOperationKHR(
-    device
-            ,operation
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,operation,pAllocator)
-
-
-    return vkDestroyDeferredOperationKHR
-def _wrap_vkGetDeferredOperationMaxConcurrencyKHR(fn):
-    def vkGetDeferredOperationMaxConcurrencyKHR(
-    device
-            ,operation=None
-            ,):
-
-        custom_return = True
-        if not operation:
-            operation = ffi.new('VkDeferredOperationKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,operation)
-
-        if custom_return:
-            return operation
-
-        return operation[0]
-
-
-
-    return vkGetDeferredOperationMaxConcurrencyKHR
-def _wrap_vkGetDeferredOperationResultKHR(fn):
-    def vkGetDeferredOperationResultKHR(
-    device
-            ,operation=None
-            ,):
-
-        custom_return = True
-        if not operation:
-            operation = ffi.new('VkDeferredOperationKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,operation)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return operation
-
-        return operation[0]
-
-
-
-    return vkGetDeferredOperationResultKHR
-def _wrap_vkDeferredOperationJoinKHR(fn):
-    def vkDeferredOperationJoinKHR(
-    device
-            ,operation
-            ,):
-        result = _callApi(fn, device,operation)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkDeferredOperationJoinKHR
-def _wrap_vkGetPipelineIndirectMemoryRequirementsNV(fn):
-    def vkGetPipelineIndirectMemoryRequirementsNV(
-    device
-            ,pCreateInfo
-            ,pMemoryRequirements=None
-            ,):
-
-        custom_return = True
-        if not pMemoryRequirements:
-            pMemoryRequirements = ffi.new('VkMemoryRequirements2*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pMemoryRequirements)
-
-        if custom_return:
-            return pMemoryRequirements
-
-        return pMemoryRequirements[0]
-
-
-
-    return vkGetPipelineIndirectMemoryRequirementsNV
-def _wrap_vkGetPipelineIndirectDeviceAddressNV(fn):
-    def vkGetPipelineIndirectDeviceAddressNV(
-    device
-            ,pInfo=None
-            ,):
-
-        custom_return = True
-        if not pInfo:
-            pInfo = ffi.new('VkPipelineIndirectDeviceAddressInfoNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo)
-
-        if custom_return:
-            return pInfo
-
-        return pInfo[0]
-
-
-
-    return vkGetPipelineIndirectDeviceAddressNV
-def vkCmdSetCullMode(
-commandBuffer
-        ,cullMode
-        ,):
-    result = _callApi(lib.vkCmdSetCullMode, commandBuffer,cullMode)
-
-
-def _wrap_vkCmdSetCullMode(fn):
-    def vkCmdSetCullMode(
-    commandBuffer
-            ,cullMode
-            ,):
-        result = _callApi(fn, commandBuffer,cullMode)
-
-
-    return vkCmdSetCullMode
-def vkCmdSetFrontFace(
-commandBuffer
-        ,frontFace
-        ,):
-    result = _callApi(lib.vkCmdSetFrontFace, commandBuffer,frontFace)
-
-
-def _wrap_vkCmdSetFrontFace(fn):
-    def vkCmdSetFrontFace(
-    commandBuffer
-            ,frontFace
-            ,):
-        result = _callApi(fn, commandBuffer,frontFace)
-
-
-    return vkCmdSetFrontFace
-def vkCmdSetPrimitiveTopology(
-commandBuffer
-        ,primitiveTopology
-        ,):
-    result = _callApi(lib.vkCmdSetPrimitiveTopology, commandBuffer,primitiveTopology)
-
-
-def _wrap_vkCmdSetPrimitiveTopology(fn):
-    def vkCmdSetPrimitiveTopology(
-    commandBuffer
-            ,primitiveTopology
-            ,):
-        result = _callApi(fn, commandBuffer,primitiveTopology)
-
-
-    return vkCmdSetPrimitiveTopology
-def vkCmdSetViewportWithCount(
-commandBuffer
-        ,viewportCount
-        ,pViewports
-        ,):
-    result = _callApi(lib.vkCmdSetViewportWithCount, commandBuffer,viewportCount,pViewports)
-
-
-def _wrap_vkCmdSetViewportWithCount(fn):
-    def vkCmdSetViewportWithCount(
-    commandBuffer
-            ,viewportCount
-            ,pViewports
-            ,):
-        result = _callApi(fn, commandBuffer,viewportCount,pViewports)
-
-
-    return vkCmdSetViewportWithCount
-def vkCmdSetScissorWithCount(
-commandBuffer
-        ,scissorCount
-        ,pScissors
-        ,):
-    result = _callApi(lib.vkCmdSetScissorWithCount, commandBuffer,scissorCount,pScissors)
-
-
-def _wrap_vkCmdSetScissorWithCount(fn):
-    def vkCmdSetScissorWithCount(
-    commandBuffer
-            ,scissorCount
-            ,pScissors
-            ,):
-        result = _callApi(fn, commandBuffer,scissorCount,pScissors)
-
-
-    return vkCmdSetScissorWithCount
-def _wrap_vkCmdBindIndexBuffer2KHR(fn):
-    def vkCmdBindIndexBuffer2KHR(
-    commandBuffer
-            ,buffer
-            ,offset
-            ,size
-            ,indexType
-            ,):
-        result = _callApi(fn, commandBuffer,buffer,offset,size,indexType)
-
-
-    return vkCmdBindIndexBuffer2KHR
-def vkCmdBindVertexBuffers2(
-commandBuffer
-        ,firstBinding
-        ,bindingCount
-        ,pBuffers
-        ,pOffsets
-        ,pSizes
-        ,pStrides
-        ,):
-    result = _callApi(lib.vkCmdBindVertexBuffers2, commandBuffer,firstBinding,bindingCount,pBuffers,pOffsets,pSizes,pStrides)
-
-
-def _wrap_vkCmdBindVertexBuffers2(fn):
-    def vkCmdBindVertexBuffers2(
-    commandBuffer
-            ,firstBinding
-            ,bindingCount
-            ,pBuffers
-            ,pOffsets
-            ,pSizes
-            ,pStrides
-            ,):
-        result = _callApi(fn, commandBuffer,firstBinding,bindingCount,pBuffers,pOffsets,pSizes,pStrides)
-
-
-    return vkCmdBindVertexBuffers2
-def vkCmdSetDepthTestEnable(
-commandBuffer
-        ,depthTestEnable
-        ,):
-    result = _callApi(lib.vkCmdSetDepthTestEnable, commandBuffer,depthTestEnable)
-
-
-def _wrap_vkCmdSetDepthTestEnable(fn):
-    def vkCmdSetDepthTestEnable(
-    commandBuffer
-            ,depthTestEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthTestEnable)
-
-
-    return vkCmdSetDepthTestEnable
-def vkCmdSetDepthWriteEnable(
-commandBuffer
-        ,depthWriteEnable
-        ,):
-    result = _callApi(lib.vkCmdSetDepthWriteEnable, commandBuffer,depthWriteEnable)
-
-
-def _wrap_vkCmdSetDepthWriteEnable(fn):
-    def vkCmdSetDepthWriteEnable(
-    commandBuffer
-            ,depthWriteEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthWriteEnable)
-
-
-    return vkCmdSetDepthWriteEnable
-def vkCmdSetDepthCompareOp(
-commandBuffer
-        ,depthCompareOp
-        ,):
-    result = _callApi(lib.vkCmdSetDepthCompareOp, commandBuffer,depthCompareOp)
-
-
-def _wrap_vkCmdSetDepthCompareOp(fn):
-    def vkCmdSetDepthCompareOp(
-    commandBuffer
-            ,depthCompareOp
-            ,):
-        result = _callApi(fn, commandBuffer,depthCompareOp)
-
-
-    return vkCmdSetDepthCompareOp
-def vkCmdSetDepthBoundsTestEnable(
-commandBuffer
-        ,depthBoundsTestEnable
-        ,):
-    result = _callApi(lib.vkCmdSetDepthBoundsTestEnable, commandBuffer,depthBoundsTestEnable)
-
-
-def _wrap_vkCmdSetDepthBoundsTestEnable(fn):
-    def vkCmdSetDepthBoundsTestEnable(
-    commandBuffer
-            ,depthBoundsTestEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthBoundsTestEnable)
-
-
-    return vkCmdSetDepthBoundsTestEnable
-def vkCmdSetStencilTestEnable(
-commandBuffer
-        ,stencilTestEnable
-        ,):
-    result = _callApi(lib.vkCmdSetStencilTestEnable, commandBuffer,stencilTestEnable)
-
-
-def _wrap_vkCmdSetStencilTestEnable(fn):
-    def vkCmdSetStencilTestEnable(
-    commandBuffer
-            ,stencilTestEnable
-            ,):
-        result = _callApi(fn, commandBuffer,stencilTestEnable)
-
-
-    return vkCmdSetStencilTestEnable
-def vkCmdSetStencilOp(
-commandBuffer
-        ,faceMask
-        ,failOp
-        ,passOp
-        ,depthFailOp
-        ,compareOp
-        ,):
-    result = _callApi(lib.vkCmdSetStencilOp, commandBuffer,faceMask,failOp,passOp,depthFailOp,compareOp)
-
-
-def _wrap_vkCmdSetStencilOp(fn):
-    def vkCmdSetStencilOp(
-    commandBuffer
-            ,faceMask
-            ,failOp
-            ,passOp
-            ,depthFailOp
-            ,compareOp
-            ,):
-        result = _callApi(fn, commandBuffer,faceMask,failOp,passOp,depthFailOp,compareOp)
-
-
-    return vkCmdSetStencilOp
-def _wrap_vkCmdSetPatchControlPointsEXT(fn):
-    def vkCmdSetPatchControlPointsEXT(
-    commandBuffer
-            ,patchControlPoints
-            ,):
-        result = _callApi(fn, commandBuffer,patchControlPoints)
-
-
-    return vkCmdSetPatchControlPointsEXT
-def vkCmdSetRasterizerDiscardEnable(
-commandBuffer
-        ,rasterizerDiscardEnable
-        ,):
-    result = _callApi(lib.vkCmdSetRasterizerDiscardEnable, commandBuffer,rasterizerDiscardEnable)
-
-
-def _wrap_vkCmdSetRasterizerDiscardEnable(fn):
-    def vkCmdSetRasterizerDiscardEnable(
-    commandBuffer
-            ,rasterizerDiscardEnable
-            ,):
-        result = _callApi(fn, commandBuffer,rasterizerDiscardEnable)
-
-
-    return vkCmdSetRasterizerDiscardEnable
-def vkCmdSetDepthBiasEnable(
-commandBuffer
-        ,depthBiasEnable
-        ,):
-    result = _callApi(lib.vkCmdSetDepthBiasEnable, commandBuffer,depthBiasEnable)
-
-
-def _wrap_vkCmdSetDepthBiasEnable(fn):
-    def vkCmdSetDepthBiasEnable(
-    commandBuffer
-            ,depthBiasEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthBiasEnable)
-
-
-    return vkCmdSetDepthBiasEnable
-def _wrap_vkCmdSetLogicOpEXT(fn):
-    def vkCmdSetLogicOpEXT(
-    commandBuffer
-            ,logicOp
-            ,):
-        result = _callApi(fn, commandBuffer,logicOp)
-
-
-    return vkCmdSetLogicOpEXT
-def vkCmdSetPrimitiveRestartEnable(
-commandBuffer
-        ,primitiveRestartEnable
-        ,):
-    result = _callApi(lib.vkCmdSetPrimitiveRestartEnable, commandBuffer,primitiveRestartEnable)
-
-
-def _wrap_vkCmdSetPrimitiveRestartEnable(fn):
-    def vkCmdSetPrimitiveRestartEnable(
-    commandBuffer
-            ,primitiveRestartEnable
-            ,):
-        result = _callApi(fn, commandBuffer,primitiveRestartEnable)
-
-
-    return vkCmdSetPrimitiveRestartEnable
-def _wrap_vkCmdSetTessellationDomainOriginEXT(fn):
-    def vkCmdSetTessellationDomainOriginEXT(
-    commandBuffer
-            ,domainOrigin
-            ,):
-        result = _callApi(fn, commandBuffer,domainOrigin)
-
-
-    return vkCmdSetTessellationDomainOriginEXT
-def _wrap_vkCmdSetDepthClampEnableEXT(fn):
-    def vkCmdSetDepthClampEnableEXT(
-    commandBuffer
-            ,depthClampEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthClampEnable)
-
-
-    return vkCmdSetDepthClampEnableEXT
-def _wrap_vkCmdSetPolygonModeEXT(fn):
-    def vkCmdSetPolygonModeEXT(
-    commandBuffer
-            ,polygonMode
-            ,):
-        result = _callApi(fn, commandBuffer,polygonMode)
-
-
-    return vkCmdSetPolygonModeEXT
-def _wrap_vkCmdSetRasterizationSamplesEXT(fn):
-    def vkCmdSetRasterizationSamplesEXT(
-    commandBuffer
-            ,rasterizationSamples
-            ,):
-        result = _callApi(fn, commandBuffer,rasterizationSamples)
-
-
-    return vkCmdSetRasterizationSamplesEXT
-def _wrap_vkCmdSetSampleMaskEXT(fn):
-    def vkCmdSetSampleMaskEXT(
-    commandBuffer
-            ,samples
-            ,pSampleMask
-            ,):
-        result = _callApi(fn, commandBuffer,samples,pSampleMask)
-
-
-    return vkCmdSetSampleMaskEXT
-def _wrap_vkCmdSetAlphaToCoverageEnableEXT(fn):
-    def vkCmdSetAlphaToCoverageEnableEXT(
-    commandBuffer
-            ,alphaToCoverageEnable
-            ,):
-        result = _callApi(fn, commandBuffer,alphaToCoverageEnable)
-
-
-    return vkCmdSetAlphaToCoverageEnableEXT
-def _wrap_vkCmdSetAlphaToOneEnableEXT(fn):
-    def vkCmdSetAlphaToOneEnableEXT(
-    commandBuffer
-            ,alphaToOneEnable
-            ,):
-        result = _callApi(fn, commandBuffer,alphaToOneEnable)
-
-
-    return vkCmdSetAlphaToOneEnableEXT
-def _wrap_vkCmdSetLogicOpEnableEXT(fn):
-    def vkCmdSetLogicOpEnableEXT(
-    commandBuffer
-            ,logicOpEnable
-            ,):
-        result = _callApi(fn, commandBuffer,logicOpEnable)
-
-
-    return vkCmdSetLogicOpEnableEXT
-def _wrap_vkCmdSetColorBlendEnableEXT(fn):
-    def vkCmdSetColorBlendEnableEXT(
-    commandBuffer
-            ,firstAttachment
-            ,attachmentCount
-            ,pColorBlendEnables
-            ,):
-        result = _callApi(fn, commandBuffer,firstAttachment,attachmentCount,pColorBlendEnables)
-
-
-    return vkCmdSetColorBlendEnableEXT
-def _wrap_vkCmdSetColorBlendEquationEXT(fn):
-    def vkCmdSetColorBlendEquationEXT(
-    commandBuffer
-            ,firstAttachment
-            ,attachmentCount
-            ,pColorBlendEquations
-            ,):
-        result = _callApi(fn, commandBuffer,firstAttachment,attachmentCount,pColorBlendEquations)
-
-
-    return vkCmdSetColorBlendEquationEXT
-def _wrap_vkCmdSetColorWriteMaskEXT(fn):
-    def vkCmdSetColorWriteMaskEXT(
-    commandBuffer
-            ,firstAttachment
-            ,attachmentCount
-            ,pColorWriteMasks
-            ,):
-        result = _callApi(fn, commandBuffer,firstAttachment,attachmentCount,pColorWriteMasks)
-
-
-    return vkCmdSetColorWriteMaskEXT
-def _wrap_vkCmdSetRasterizationStreamEXT(fn):
-    def vkCmdSetRasterizationStreamEXT(
-    commandBuffer
-            ,rasterizationStream
-            ,):
-        result = _callApi(fn, commandBuffer,rasterizationStream)
-
-
-    return vkCmdSetRasterizationStreamEXT
-def _wrap_vkCmdSetConservativeRasterizationModeEXT(fn):
-    def vkCmdSetConservativeRasterizationModeEXT(
-    commandBuffer
-            ,conservativeRasterizationMode
-            ,):
-        result = _callApi(fn, commandBuffer,conservativeRasterizationMode)
-
-
-    return vkCmdSetConservativeRasterizationModeEXT
-def _wrap_vkCmdSetExtraPrimitiveOverestimationSizeEXT(fn):
-    def vkCmdSetExtraPrimitiveOverestimationSizeEXT(
-    commandBuffer
-            ,extraPrimitiveOverestimationSize
-            ,):
-        result = _callApi(fn, commandBuffer,extraPrimitiveOverestimationSize)
-
-
-    return vkCmdSetExtraPrimitiveOverestimationSizeEXT
-def _wrap_vkCmdSetDepthClipEnableEXT(fn):
-    def vkCmdSetDepthClipEnableEXT(
-    commandBuffer
-            ,depthClipEnable
-            ,):
-        result = _callApi(fn, commandBuffer,depthClipEnable)
-
-
-    return vkCmdSetDepthClipEnableEXT
-def _wrap_vkCmdSetSampleLocationsEnableEXT(fn):
-    def vkCmdSetSampleLocationsEnableEXT(
-    commandBuffer
-            ,sampleLocationsEnable
-            ,):
-        result = _callApi(fn, commandBuffer,sampleLocationsEnable)
-
-
-    return vkCmdSetSampleLocationsEnableEXT
-def _wrap_vkCmdSetColorBlendAdvancedEXT(fn):
-    def vkCmdSetColorBlendAdvancedEXT(
-    commandBuffer
-            ,firstAttachment
-            ,attachmentCount
-            ,pColorBlendAdvanced
-            ,):
-        result = _callApi(fn, commandBuffer,firstAttachment,attachmentCount,pColorBlendAdvanced)
-
-
-    return vkCmdSetColorBlendAdvancedEXT
-def _wrap_vkCmdSetProvokingVertexModeEXT(fn):
-    def vkCmdSetProvokingVertexModeEXT(
-    commandBuffer
-            ,provokingVertexMode
-            ,):
-        result = _callApi(fn, commandBuffer,provokingVertexMode)
-
-
-    return vkCmdSetProvokingVertexModeEXT
-def _wrap_vkCmdSetLineRasterizationModeEXT(fn):
-    def vkCmdSetLineRasterizationModeEXT(
-    commandBuffer
-            ,lineRasterizationMode
-            ,):
-        result = _callApi(fn, commandBuffer,lineRasterizationMode)
-
-
-    return vkCmdSetLineRasterizationModeEXT
-def _wrap_vkCmdSetLineStippleEnableEXT(fn):
-    def vkCmdSetLineStippleEnableEXT(
-    commandBuffer
-            ,stippledLineEnable
-            ,):
-        result = _callApi(fn, commandBuffer,stippledLineEnable)
-
-
-    return vkCmdSetLineStippleEnableEXT
-def _wrap_vkCmdSetDepthClipNegativeOneToOneEXT(fn):
-    def vkCmdSetDepthClipNegativeOneToOneEXT(
-    commandBuffer
-            ,negativeOneToOne
-            ,):
-        result = _callApi(fn, commandBuffer,negativeOneToOne)
-
-
-    return vkCmdSetDepthClipNegativeOneToOneEXT
-def _wrap_vkCmdSetViewportWScalingEnableNV(fn):
-    def vkCmdSetViewportWScalingEnableNV(
-    commandBuffer
-            ,viewportWScalingEnable
-            ,):
-        result = _callApi(fn, commandBuffer,viewportWScalingEnable)
-
-
-    return vkCmdSetViewportWScalingEnableNV
-def _wrap_vkCmdSetViewportSwizzleNV(fn):
-    def vkCmdSetViewportSwizzleNV(
-    commandBuffer
-            ,firstViewport
-            ,viewportCount
-            ,pViewportSwizzles
-            ,):
-        result = _callApi(fn, commandBuffer,firstViewport,viewportCount,pViewportSwizzles)
-
-
-    return vkCmdSetViewportSwizzleNV
-def _wrap_vkCmdSetCoverageToColorEnableNV(fn):
-    def vkCmdSetCoverageToColorEnableNV(
-    commandBuffer
-            ,coverageToColorEnable
-            ,):
-        result = _callApi(fn, commandBuffer,coverageToColorEnable)
-
-
-    return vkCmdSetCoverageToColorEnableNV
-def _wrap_vkCmdSetCoverageToColorLocationNV(fn):
-    def vkCmdSetCoverageToColorLocationNV(
-    commandBuffer
-            ,coverageToColorLocation
-            ,):
-        result = _callApi(fn, commandBuffer,coverageToColorLocation)
-
-
-    return vkCmdSetCoverageToColorLocationNV
-def _wrap_vkCmdSetCoverageModulationModeNV(fn):
-    def vkCmdSetCoverageModulationModeNV(
-    commandBuffer
-            ,coverageModulationMode
-            ,):
-        result = _callApi(fn, commandBuffer,coverageModulationMode)
-
-
-    return vkCmdSetCoverageModulationModeNV
-def _wrap_vkCmdSetCoverageModulationTableEnableNV(fn):
-    def vkCmdSetCoverageModulationTableEnableNV(
-    commandBuffer
-            ,coverageModulationTableEnable
-            ,):
-        result = _callApi(fn, commandBuffer,coverageModulationTableEnable)
-
-
-    return vkCmdSetCoverageModulationTableEnableNV
-def _wrap_vkCmdSetCoverageModulationTableNV(fn):
-    def vkCmdSetCoverageModulationTableNV(
-    commandBuffer
-            ,coverageModulationTableCount
-            ,pCoverageModulationTable
-            ,):
-        result = _callApi(fn, commandBuffer,coverageModulationTableCount,pCoverageModulationTable)
-
-
-    return vkCmdSetCoverageModulationTableNV
-def _wrap_vkCmdSetShadingRateImageEnableNV(fn):
-    def vkCmdSetShadingRateImageEnableNV(
-    commandBuffer
-            ,shadingRateImageEnable
-            ,):
-        result = _callApi(fn, commandBuffer,shadingRateImageEnable)
-
-
-    return vkCmdSetShadingRateImageEnableNV
-def _wrap_vkCmdSetCoverageReductionModeNV(fn):
-    def vkCmdSetCoverageReductionModeNV(
-    commandBuffer
-            ,coverageReductionMode
-            ,):
-        result = _callApi(fn, commandBuffer,coverageReductionMode)
-
-
-    return vkCmdSetCoverageReductionModeNV
-def _wrap_vkCmdSetRepresentativeFragmentTestEnableNV(fn):
-    def vkCmdSetRepresentativeFragmentTestEnableNV(
-    commandBuffer
-            ,representativeFragmentTestEnable
-            ,):
-        result = _callApi(fn, commandBuffer,representativeFragmentTestEnable)
-
-
-    return vkCmdSetRepresentativeFragmentTestEnableNV
-def vkCreatePrivateDataSlot(
-device
-        ,pCreateInfo
-        ,pAllocator
-        ,pPrivateDataSlot=None
-        ,):
-
-    custom_return = True
-    if not pPrivateDataSlot:
-        pPrivateDataSlot = ffi.new('VkPrivateDataSlot*')
-        custom_return = False
-
-    result = _callApi(lib.vkCreatePrivateDataSlot, device,pCreateInfo,pAllocator,pPrivateDataSlot)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-    if custom_return:
-        return pPrivateDataSlot
-
-    return pPrivateDataSlot[0]
-
-
-
-def _wrap_vkCreatePrivateDataSlot(fn):
-    def vkCreatePrivateDataSlot(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pPrivateDataSlot=None
-            ,):
-
-        custom_return = True
-        if not pPrivateDataSlot:
-            pPrivateDataSlot = ffi.new('VkPrivateDataSlot*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pPrivateDataSlot)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPrivateDataSlot
-
-        return pPrivateDataSlot[0]
-
-
-
-    return vkCreatePrivateDataSlot
-def vkDestroyPrivateDataSlot(
-device
-        ,privateDataSlot
-        ,pAllocator
-        ,):
-    result = _callApi(lib.vkDestroyPrivateDataSlot, device,privateDataSlot,pAllocator)
-
-
-def _wrap_vkDestroyPrivateDataSlot(fn):
-    def vkDestroyPrivateDataSlot(
-    device
-            ,privateDataSlot
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,privateDataSlot,pAllocator)
-
-
-    return vkDestroyPrivateDataSlot
-def vkSetPrivateData(
-device
-        ,objectType
-        ,objectHandle
-        ,privateDataSlot
-        ,data
-        ,):
-    result = _callApi(lib.vkSetPrivateData, device,objectType,objectHandle,privateDataSlot,data)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkSetPrivateData(fn):
-    def vkSetPrivateData(
-    device
-            ,objectType
-            ,objectHandle
-            ,privateDataSlot
-            ,data
-            ,):
-        result = _callApi(fn, device,objectType,objectHandle,privateDataSlot,data)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSetPrivateData
-def vkGetPrivateData(
-device
-        ,objectType
-        ,objectHandle
-        ,privateDataSlot
-        ,pData=None
-        ,):
-
-    custom_return = True
-    if not pData:
-        pData = ffi.new('uint64_t*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetPrivateData, device,objectType,objectHandle,privateDataSlot,pData)
-
-    if custom_return:
-        return pData
-
-    return pData[0]
-
-
-
-def _wrap_vkGetPrivateData(fn):
-    def vkGetPrivateData(
-    device
-            ,objectType
-            ,objectHandle
-            ,privateDataSlot
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('uint64_t*')
-            custom_return = False
-
-        result = _callApi(fn, device,objectType,objectHandle,privateDataSlot,pData)
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetPrivateData
-def vkCmdCopyBuffer2(
-commandBuffer
-        ,pCopyBufferInfo
-        ,):
-    result = _callApi(lib.vkCmdCopyBuffer2, commandBuffer,pCopyBufferInfo)
-
-
-def _wrap_vkCmdCopyBuffer2(fn):
-    def vkCmdCopyBuffer2(
-    commandBuffer
-            ,pCopyBufferInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pCopyBufferInfo)
-
-
-    return vkCmdCopyBuffer2
-def vkCmdCopyImage2(
-commandBuffer
-        ,pCopyImageInfo
-        ,):
-    result = _callApi(lib.vkCmdCopyImage2, commandBuffer,pCopyImageInfo)
-
-
-def _wrap_vkCmdCopyImage2(fn):
-    def vkCmdCopyImage2(
-    commandBuffer
-            ,pCopyImageInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pCopyImageInfo)
-
-
-    return vkCmdCopyImage2
-def vkCmdBlitImage2(
-commandBuffer
-        ,pBlitImageInfo
-        ,):
-    result = _callApi(lib.vkCmdBlitImage2, commandBuffer,pBlitImageInfo)
-
-
-def _wrap_vkCmdBlitImage2(fn):
-    def vkCmdBlitImage2(
-    commandBuffer
-            ,pBlitImageInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pBlitImageInfo)
-
-
-    return vkCmdBlitImage2
-def vkCmdCopyBufferToImage2(
-commandBuffer
-        ,pCopyBufferToImageInfo
-        ,):
-    result = _callApi(lib.vkCmdCopyBufferToImage2, commandBuffer,pCopyBufferToImageInfo)
-
-
-def _wrap_vkCmdCopyBufferToImage2(fn):
-    def vkCmdCopyBufferToImage2(
-    commandBuffer
-            ,pCopyBufferToImageInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pCopyBufferToImageInfo)
-
-
-    return vkCmdCopyBufferToImage2
-def vkCmdCopyImageToBuffer2(
-commandBuffer
-        ,pCopyImageToBufferInfo
-        ,):
-    result = _callApi(lib.vkCmdCopyImageToBuffer2, commandBuffer,pCopyImageToBufferInfo)
-
-
-def _wrap_vkCmdCopyImageToBuffer2(fn):
-    def vkCmdCopyImageToBuffer2(
-    commandBuffer
-            ,pCopyImageToBufferInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pCopyImageToBufferInfo)
-
-
-    return vkCmdCopyImageToBuffer2
-def vkCmdResolveImage2(
-commandBuffer
-        ,pResolveImageInfo
-        ,):
-    result = _callApi(lib.vkCmdResolveImage2, commandBuffer,pResolveImageInfo)
-
-
-def _wrap_vkCmdResolveImage2(fn):
-    def vkCmdResolveImage2(
-    commandBuffer
-            ,pResolveImageInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pResolveImageInfo)
-
-
-    return vkCmdResolveImage2
-def _wrap_vkCmdRefreshObjectsKHR(fn):
-    def vkCmdRefreshObjectsKHR(
-    commandBuffer
-            ,pRefreshObjects
-            ,):
-        result = _callApi(fn, commandBuffer,pRefreshObjects)
-
-
-    return vkCmdRefreshObjectsKHR
-def _wrap_vkGetPhysicalDeviceRefreshableObjectTypesKHR(fn):
-    def vkGetPhysicalDeviceRefreshableObjectTypesKHR(
-    physicalDevice
-            ,):
-
-        pRefreshableObjectTypeCount = ffi.new('uint32_t*')
-        pRefreshableObjectTypes = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pRefreshableObjectTypeCount,pRefreshableObjectTypes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pRefreshableObjectTypes = ffi.new('VkObjectType[]', pRefreshableObjectTypeCount[0])
-        result = _callApi(fn, physicalDevice,pRefreshableObjectTypeCount,pRefreshableObjectTypes)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pRefreshableObjectTypes
-
-
-    return vkGetPhysicalDeviceRefreshableObjectTypesKHR
-def _wrap_vkCmdSetFragmentShadingRateKHR(fn):
-    def vkCmdSetFragmentShadingRateKHR(
-    commandBuffer
-            ,pFragmentSize
-            ,combinerOps
-            ,):
-        result = _callApi(fn, commandBuffer,pFragmentSize,combinerOps)
-
-
-    return vkCmdSetFragmentShadingRateKHR
-def _wrap_vkGetPhysicalDeviceFragmentShadingRatesKHR(fn):
-    def vkGetPhysicalDeviceFragmentShadingRatesKHR(
-    physicalDevice
-            ,):
-
-        pFragmentShadingRateCount = ffi.new('uint32_t*')
-        pFragmentShadingRates = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pFragmentShadingRateCount,pFragmentShadingRates)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pFragmentShadingRates = ffi.new('VkPhysicalDeviceFragmentShadingRateKHR[]', pFragmentShadingRateCount[0])
-        result = _callApi(fn, physicalDevice,pFragmentShadingRateCount,pFragmentShadingRates)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pFragmentShadingRates
-
-
-    return vkGetPhysicalDeviceFragmentShadingRatesKHR
-def _wrap_vkCmdSetFragmentShadingRateEnumNV(fn):
-    def vkCmdSetFragmentShadingRateEnumNV(
-    commandBuffer
-            ,shadingRate
-            ,combinerOps
-            ,):
-        result = _callApi(fn, commandBuffer,shadingRate,combinerOps)
-
-
-    return vkCmdSetFragmentShadingRateEnumNV
-def _wrap_vkGetAccelerationStructureBuildSizesKHR(fn):
-    def vkGetAccelerationStructureBuildSizesKHR(
-    device
-            ,buildType
-            ,pBuildInfo
-            ,pMaxPrimitiveCounts
-            ,pSizeInfo=None
-            ,):
-
-        custom_return = True
-        if not pSizeInfo:
-            pSizeInfo = ffi.new('VkAccelerationStructureBuildSizesInfoKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,buildType,pBuildInfo,pMaxPrimitiveCounts,pSizeInfo)
-
-        if custom_return:
-            return pSizeInfo
-
-        return pSizeInfo[0]
-
-
-
-    return vkGetAccelerationStructureBuildSizesKHR
-def _wrap_vkCmdSetVertexInputEXT(fn):
-    def vkCmdSetVertexInputEXT(
-    commandBuffer
-            ,vertexBindingDescriptionCount
-            ,pVertexBindingDescriptions
-            ,vertexAttributeDescriptionCount
-            ,pVertexAttributeDescriptions
-            ,):
-        result = _callApi(fn, commandBuffer,vertexBindingDescriptionCount,pVertexBindingDescriptions,vertexAttributeDescriptionCount,pVertexAttributeDescriptions)
-
-
-    return vkCmdSetVertexInputEXT
-def _wrap_vkCmdSetColorWriteEnableEXT(fn):
-    def vkCmdSetColorWriteEnableEXT(
-    commandBuffer
-            ,attachmentCount
-            ,pColorWriteEnables
-            ,):
-        result = _callApi(fn, commandBuffer,attachmentCount,pColorWriteEnables)
-
-
-    return vkCmdSetColorWriteEnableEXT
-def vkCmdSetEvent2(
-commandBuffer
-        ,event
-        ,pDependencyInfo
-        ,):
-    result = _callApi(lib.vkCmdSetEvent2, commandBuffer,event,pDependencyInfo)
-
-
-def _wrap_vkCmdSetEvent2(fn):
-    def vkCmdSetEvent2(
-    commandBuffer
-            ,event
-            ,pDependencyInfo
-            ,):
-        result = _callApi(fn, commandBuffer,event,pDependencyInfo)
-
-
-    return vkCmdSetEvent2
-def vkCmdResetEvent2(
-commandBuffer
-        ,event
-        ,stageMask
-        ,):
-    result = _callApi(lib.vkCmdResetEvent2, commandBuffer,event,stageMask)
-
-
-def _wrap_vkCmdResetEvent2(fn):
-    def vkCmdResetEvent2(
-    commandBuffer
-            ,event
-            ,stageMask
-            ,):
-        result = _callApi(fn, commandBuffer,event,stageMask)
-
-
-    return vkCmdResetEvent2
-def vkCmdWaitEvents2(
-commandBuffer
-        ,eventCount
-        ,pEvents
-        ,pDependencyInfos
-        ,):
-    result = _callApi(lib.vkCmdWaitEvents2, commandBuffer,eventCount,pEvents,pDependencyInfos)
-
-
-def _wrap_vkCmdWaitEvents2(fn):
-    def vkCmdWaitEvents2(
-    commandBuffer
-            ,eventCount
-            ,pEvents
-            ,pDependencyInfos
-            ,):
-        result = _callApi(fn, commandBuffer,eventCount,pEvents,pDependencyInfos)
-
-
-    return vkCmdWaitEvents2
-def vkCmdPipelineBarrier2(
-commandBuffer
-        ,pDependencyInfo
-        ,):
-    result = _callApi(lib.vkCmdPipelineBarrier2, commandBuffer,pDependencyInfo)
-
-
-def _wrap_vkCmdPipelineBarrier2(fn):
-    def vkCmdPipelineBarrier2(
-    commandBuffer
-            ,pDependencyInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pDependencyInfo)
-
-
-    return vkCmdPipelineBarrier2
-def vkQueueSubmit2(
-queue
-        ,submitCount
-        ,pSubmits
-        ,fence
-        ,):
-    result = _callApi(lib.vkQueueSubmit2, queue,submitCount,pSubmits,fence)
-    if result != VK_SUCCESS:
-        raise exception_codes[result]
-
-
-def _wrap_vkQueueSubmit2(fn):
-    def vkQueueSubmit2(
-    queue
-            ,submitCount
-            ,pSubmits
-            ,fence
-            ,):
-        result = _callApi(fn, queue,submitCount,pSubmits,fence)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkQueueSubmit2
-def vkCmdWriteTimestamp2(
-commandBuffer
-        ,stage
-        ,queryPool
-        ,query
-        ,):
-    result = _callApi(lib.vkCmdWriteTimestamp2, commandBuffer,stage,queryPool,query)
-
-
-def _wrap_vkCmdWriteTimestamp2(fn):
-    def vkCmdWriteTimestamp2(
-    commandBuffer
-            ,stage
-            ,queryPool
-            ,query
-            ,):
-        result = _callApi(fn, commandBuffer,stage,queryPool,query)
-
-
-    return vkCmdWriteTimestamp2
-def _wrap_vkCmdWriteBufferMarker2AMD(fn):
-    def vkCmdWriteBufferMarker2AMD(
-    commandBuffer
-            ,stage
-            ,dstBuffer
-            ,dstOffset
-            ,marker
-            ,):
-        result = _callApi(fn, commandBuffer,stage,dstBuffer,dstOffset,marker)
-
-
-    return vkCmdWriteBufferMarker2AMD
-def _wrap_vkGetQueueCheckpointData2NV(fn):
-    def vkGetQueueCheckpointData2NV(
-    queue
-            ,):
-
-        pCheckpointDataCount = ffi.new('uint32_t*')
-        pCheckpointData = ffi.NULL
-
-        result = _callApi(fn, queue,pCheckpointDataCount,pCheckpointData)
-
-        pCheckpointData = ffi.new('VkCheckpointData2NV[]', pCheckpointDataCount[0])
-        result = _callApi(fn, queue,pCheckpointDataCount,pCheckpointData)
-
-        return pCheckpointData
-
-
-    return vkGetQueueCheckpointData2NV
-def _wrap_vkCopyMemoryToImageEXT(fn):
-    def vkCopyMemoryToImageEXT(
-    device
-            ,pCopyMemoryToImageInfo
-            ,):
-        result = _callApi(fn, device,pCopyMemoryToImageInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyMemoryToImageEXT
-def _wrap_vkCopyImageToMemoryEXT(fn):
-    def vkCopyImageToMemoryEXT(
-    device
-            ,pCopyImageToMemoryInfo
-            ,):
-        result = _callApi(fn, device,pCopyImageToMemoryInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyImageToMemoryEXT
-def _wrap_vkCopyImageToImageEXT(fn):
-    def vkCopyImageToImageEXT(
-    device
-            ,pCopyImageToImageInfo
-            ,):
-        result = _callApi(fn, device,pCopyImageToImageInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyImageToImageEXT
-def _wrap_vkTransitionImageLayoutEXT(fn):
-    def vkTransitionImageLayoutEXT(
-    device
-            ,transitionCount
-            ,pTransitions
-            ,):
-        result = _callApi(fn, device,transitionCount,pTransitions)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkTransitionImageLayoutEXT
-def vkGetCommandPoolMemoryConsumption(
-device
-        ,commandPool
-        ,commandBuffer
-        ,pConsumption=None
-        ,):
-
-    custom_return = True
-    if not pConsumption:
-        pConsumption = ffi.new('VkCommandPoolMemoryConsumption*')
-        custom_return = False
-
-    result = _callApi(lib.vkGetCommandPoolMemoryConsumption, device,commandPool,commandBuffer,pConsumption)
-
-    if custom_return:
-        return pConsumption
-
-    return pConsumption[0]
-
-
-
-def _wrap_vkGetPhysicalDeviceVideoCapabilitiesKHR(fn):
-    def vkGetPhysicalDeviceVideoCapabilitiesKHR(
-    physicalDevice
-            ,pVideoProfile
-            ,pCapabilities=None
-            ,):
-
-        custom_return = True
-        if not pCapabilities:
-            pCapabilities = ffi.new('VkVideoCapabilitiesKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pVideoProfile,pCapabilities)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCapabilities
-
-        return pCapabilities[0]
-
-
-
-    return vkGetPhysicalDeviceVideoCapabilitiesKHR
-def _wrap_vkGetPhysicalDeviceVideoFormatPropertiesKHR(fn):
-    def vkGetPhysicalDeviceVideoFormatPropertiesKHR(
-    physicalDevice
-            ,pVideoFormatInfo
-            ,):
-
-        pVideoFormatPropertyCount = ffi.new('uint32_t*')
-        pVideoFormatProperties = ffi.NULL
-
-        result = _callApi(fn, physicalDevice,pVideoFormatInfo,pVideoFormatPropertyCount,pVideoFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pVideoFormatProperties = ffi.new('VkVideoFormatPropertiesKHR[]', pVideoFormatPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pVideoFormatInfo,pVideoFormatPropertyCount,pVideoFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pVideoFormatProperties
-
-
-    return vkGetPhysicalDeviceVideoFormatPropertiesKHR
-def _wrap_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR(fn):
-    def vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR(
-    physicalDevice
-            ,pQualityLevelInfo
-            ,pQualityLevelProperties=None
-            ,):
-
-        custom_return = True
-        if not pQualityLevelProperties:
-            pQualityLevelProperties = ffi.new('VkVideoEncodeQualityLevelPropertiesKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,pQualityLevelInfo,pQualityLevelProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pQualityLevelProperties
-
-        return pQualityLevelProperties[0]
-
-
-
-    return vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR
-def _wrap_vkCreateVideoSessionKHR(fn):
-    def vkCreateVideoSessionKHR(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pVideoSession=None
-            ,):
-
-        custom_return = True
-        if not pVideoSession:
-            pVideoSession = ffi.new('VkVideoSessionKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pVideoSession)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pVideoSession
-
-        return pVideoSession[0]
-
-
-
-    return vkCreateVideoSessionKHR
-def _wrap_vkDestroyVideoSessionKHR(fn):
-    def vkDestroyVideoSessionKHR(
-    device
-            ,videoSession
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,videoSession,pAllocator)
-
-
-    return vkDestroyVideoSessionKHR
-def _wrap_vkCreateVideoSessionParametersKHR(fn):
-    def vkCreateVideoSessionParametersKHR(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pVideoSessionParameters=None
-            ,):
-
-        custom_return = True
-        if not pVideoSessionParameters:
-            pVideoSessionParameters = ffi.new('VkVideoSessionParametersKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pVideoSessionParameters)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pVideoSessionParameters
-
-        return pVideoSessionParameters[0]
-
-
-
-    return vkCreateVideoSessionParametersKHR
-def _wrap_vkUpdateVideoSessionParametersKHR(fn):
-    def vkUpdateVideoSessionParametersKHR(
-    device
-            ,videoSessionParameters
-            ,pUpdateInfo
-            ,):
-        result = _callApi(fn, device,videoSessionParameters,pUpdateInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkUpdateVideoSessionParametersKHR
-def _wrap_vkGetEncodedVideoSessionParametersKHR(fn):
-    def vkGetEncodedVideoSessionParametersKHR(
-    device
-            ,pVideoSessionParametersInfo
-            ,pFeedbackInfo
-            ,pDataSize
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void[%d]' % pDataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,pVideoSessionParametersInfo,pFeedbackInfo,pDataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData
-
-
-
-    return vkGetEncodedVideoSessionParametersKHR
-def _wrap_vkDestroyVideoSessionParametersKHR(fn):
-    def vkDestroyVideoSessionParametersKHR(
-    device
-            ,videoSessionParameters
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,videoSessionParameters,pAllocator)
-
-
-    return vkDestroyVideoSessionParametersKHR
-def _wrap_vkGetVideoSessionMemoryRequirementsKHR(fn):
-    def vkGetVideoSessionMemoryRequirementsKHR(
-    device
-            ,videoSession
-            ,):
-
-        pMemoryRequirementsCount = ffi.new('uint32_t*')
-        pMemoryRequirements = ffi.NULL
-
-        result = _callApi(fn, device,videoSession,pMemoryRequirementsCount,pMemoryRequirements)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pMemoryRequirements = ffi.new('VkVideoSessionMemoryRequirementsKHR[]', pMemoryRequirementsCount[0])
-        result = _callApi(fn, device,videoSession,pMemoryRequirementsCount,pMemoryRequirements)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        return pMemoryRequirements
-
-
-    return vkGetVideoSessionMemoryRequirementsKHR
-def _wrap_vkBindVideoSessionMemoryKHR(fn):
-    def vkBindVideoSessionMemoryKHR(
-    device
-            ,videoSession
-            ,bindSessionMemoryInfoCount
-            ,pBindSessionMemoryInfos
-            ,):
-        result = _callApi(fn, device,videoSession,bindSessionMemoryInfoCount,pBindSessionMemoryInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBindVideoSessionMemoryKHR
-def _wrap_vkCmdDecodeVideoKHR(fn):
-    def vkCmdDecodeVideoKHR(
-    commandBuffer
-            ,pDecodeInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pDecodeInfo)
-
-
-    return vkCmdDecodeVideoKHR
-def _wrap_vkCmdBeginVideoCodingKHR(fn):
-    def vkCmdBeginVideoCodingKHR(
-    commandBuffer
-            ,pBeginInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pBeginInfo)
-
-
-    return vkCmdBeginVideoCodingKHR
-def _wrap_vkCmdControlVideoCodingKHR(fn):
-    def vkCmdControlVideoCodingKHR(
-    commandBuffer
-            ,pCodingControlInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pCodingControlInfo)
-
-
-    return vkCmdControlVideoCodingKHR
-def _wrap_vkCmdEndVideoCodingKHR(fn):
-    def vkCmdEndVideoCodingKHR(
-    commandBuffer
-            ,pEndCodingInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pEndCodingInfo)
-
-
-    return vkCmdEndVideoCodingKHR
-def _wrap_vkCmdEncodeVideoKHR(fn):
-    def vkCmdEncodeVideoKHR(
-    commandBuffer
-            ,pEncodeInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pEncodeInfo)
-
-
-    return vkCmdEncodeVideoKHR
-def _wrap_vkCmdDecompressMemoryNV(fn):
-    def vkCmdDecompressMemoryNV(
-    commandBuffer
-            ,decompressRegionCount
-            ,pDecompressMemoryRegions
-            ,):
-        result = _callApi(fn, commandBuffer,decompressRegionCount,pDecompressMemoryRegions)
-
-
-    return vkCmdDecompressMemoryNV
-def _wrap_vkCmdDecompressMemoryIndirectCountNV(fn):
-    def vkCmdDecompressMemoryIndirectCountNV(
-    commandBuffer
-            ,indirectCommandsAddress
-            ,indirectCommandsCountAddress
-            ,stride
-            ,):
-        result = _callApi(fn, commandBuffer,indirectCommandsAddress,indirectCommandsCountAddress,stride)
-
-
-    return vkCmdDecompressMemoryIndirectCountNV
-def _wrap_vkCreateCuModuleNVX(fn):
-    def vkCreateCuModuleNVX(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pModule=None
-            ,):
-
-        custom_return = True
-        if not pModule:
-            pModule = ffi.new('VkCuModuleNVX*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pModule)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pModule
-
-        return pModule[0]
-
-
-
-    return vkCreateCuModuleNVX
-def _wrap_vkCreateCuFunctionNVX(fn):
-    def vkCreateCuFunctionNVX(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pFunction=None
-            ,):
-
-        custom_return = True
-        if not pFunction:
-            pFunction = ffi.new('VkCuFunctionNVX*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pFunction)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pFunction
-
-        return pFunction[0]
-
-
-
-    return vkCreateCuFunctionNVX
-def _wrap_vkDestroyCuModuleNVX(fn):
-    def vkDestroyCuModuleNVX(
-    device
-            ,module
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,module,pAllocator)
-
-
-    return vkDestroyCuModuleNVX
-def _wrap_vkDestroyCuFunctionNVX(fn):
-    def vkDestroyCuFunctionNVX(
-    device
-            ,function
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,function,pAllocator)
-
-
-    return vkDestroyCuFunctionNVX
-def _wrap_vkCmdCuLaunchKernelNVX(fn):
-    def vkCmdCuLaunchKernelNVX(
-    commandBuffer
-            ,pLaunchInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pLaunchInfo)
-
-
-    return vkCmdCuLaunchKernelNVX
-def _wrap_vkGetDescriptorSetLayoutSizeEXT(fn):
-    def vkGetDescriptorSetLayoutSizeEXT(
-    device
-            ,layout
-            ,pLayoutSizeInBytes=None
-            ,):
-
-        custom_return = True
-        if not pLayoutSizeInBytes:
-            pLayoutSizeInBytes = ffi.new('VkDeviceSize*')
-            custom_return = False
-
-        result = _callApi(fn, device,layout,pLayoutSizeInBytes)
-
-        if custom_return:
-            return pLayoutSizeInBytes
-
-        return pLayoutSizeInBytes[0]
-
-
-
-    return vkGetDescriptorSetLayoutSizeEXT
-def _wrap_vkGetDescriptorSetLayoutBindingOffsetEXT(fn):
-    def vkGetDescriptorSetLayoutBindingOffsetEXT(
-    device
-            ,layout
-            ,binding
-            ,pOffset=None
-            ,):
-
-        custom_return = True
-        if not pOffset:
-            pOffset = ffi.new('VkDeviceSize*')
-            custom_return = False
-
-        result = _callApi(fn, device,layout,binding,pOffset)
-
-        if custom_return:
-            return pOffset
-
-        return pOffset[0]
-
-
-
-    return vkGetDescriptorSetLayoutBindingOffsetEXT
-def _wrap_vkGetDescriptorEXT(fn):
-    def vkGetDescriptorEXT(
-    device
-            ,pDescriptorInfo
-            ,dataSize
-            ,pDescriptor=None
-            ,):
-
-        custom_return = True
-        if not pDescriptor:
-            pDescriptor = ffi.new('uint64_t[%d]' % dataSize)
-            custom_return = False
-
-        result = _callApi(fn, device,pDescriptorInfo,dataSize,pDescriptor)
-
-        if custom_return:
-            return pDescriptor
-
-        return pDescriptor
-
-
-
-    return vkGetDescriptorEXT
-def _wrap_vkCmdBindDescriptorBuffersEXT(fn):
-    def vkCmdBindDescriptorBuffersEXT(
-    commandBuffer
-            ,bufferCount
-            ,pBindingInfos
-            ,):
-        result = _callApi(fn, commandBuffer,bufferCount,pBindingInfos)
-
-
-    return vkCmdBindDescriptorBuffersEXT
-def _wrap_vkCmdSetDescriptorBufferOffsetsEXT(fn):
-    def vkCmdSetDescriptorBufferOffsetsEXT(
-    commandBuffer
-            ,pipelineBindPoint
-            ,layout
-            ,firstSet
-            ,setCount
-            ,pBufferIndices
-            ,pOffsets
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineBindPoint,layout,firstSet,setCount,pBufferIndices,pOffsets)
-
-
-    return vkCmdSetDescriptorBufferOffsetsEXT
-def _wrap_vkCmdBindDescriptorBufferEmbeddedSamplersEXT(fn):
-    def vkCmdBindDescriptorBufferEmbeddedSamplersEXT(
-    commandBuffer
-            ,pipelineBindPoint
-            ,layout
-            ,set
-            ,):
-        result = _callApi(fn, commandBuffer,pipelineBindPoint,layout,set)
-
-
-    return vkCmdBindDescriptorBufferEmbeddedSamplersEXT
-def _wrap_vkGetBufferOpaqueCaptureDescriptorDataEXT(fn):
-    def vkGetBufferOpaqueCaptureDescriptorDataEXT(
-    device
-            ,pInfo
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetBufferOpaqueCaptureDescriptorDataEXT
-def _wrap_vkGetImageOpaqueCaptureDescriptorDataEXT(fn):
-    def vkGetImageOpaqueCaptureDescriptorDataEXT(
-    device
-            ,pInfo
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetImageOpaqueCaptureDescriptorDataEXT
-def _wrap_vkGetImageViewOpaqueCaptureDescriptorDataEXT(fn):
-    def vkGetImageViewOpaqueCaptureDescriptorDataEXT(
-    device
-            ,pInfo
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetImageViewOpaqueCaptureDescriptorDataEXT
-def _wrap_vkGetSamplerOpaqueCaptureDescriptorDataEXT(fn):
-    def vkGetSamplerOpaqueCaptureDescriptorDataEXT(
-    device
-            ,pInfo
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetSamplerOpaqueCaptureDescriptorDataEXT
-def _wrap_vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT(fn):
-    def vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT(
-    device
-            ,pInfo
-            ,pData=None
-            ,):
-
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,pInfo,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pData
-
-        return pData[0]
-
-
-
-    return vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT
-def _wrap_vkSetDeviceMemoryPriorityEXT(fn):
-    def vkSetDeviceMemoryPriorityEXT(
-    device
-            ,memory
-            ,priority
-            ,):
-        result = _callApi(fn, device,memory,priority)
-
-
-    return vkSetDeviceMemoryPriorityEXT
-def _wrap_vkAcquireDrmDisplayEXT(fn):
-    def vkAcquireDrmDisplayEXT(
-    physicalDevice
-            ,drmFd
-            ,display=None
-            ,):
-
-        custom_return = True
-        if not display:
-            display = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,drmFd,display)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return display
-
-        return display[0]
-
-
-
-    return vkAcquireDrmDisplayEXT
-def _wrap_vkGetDrmDisplayEXT(fn):
-    def vkGetDrmDisplayEXT(
-    physicalDevice
-            ,drmFd
-            ,connectorId
-            ,display=None
-            ,):
-
-        custom_return = True
-        if not display:
-            display = ffi.new('VkDisplayKHR*')
-            custom_return = False
-
-        result = _callApi(fn, physicalDevice,drmFd,connectorId,display)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return display
-
-        return display[0]
-
-
-
-    return vkGetDrmDisplayEXT
-def _wrap_vkWaitForPresentKHR(fn):
-    def vkWaitForPresentKHR(
-    device
-            ,swapchain
-            ,presentId
-            ,timeout
-            ,):
-        result = _callApi(fn, device,swapchain,presentId,timeout)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkWaitForPresentKHR
-def _wrap_vkCreateBufferCollectionFUCHSIA(fn):
-    def vkCreateBufferCollectionFUCHSIA(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pCollection=None
-            ,):
-
-        custom_return = True
-        if not pCollection:
-            pCollection = ffi.new('VkBufferCollectionFUCHSIA*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pCollection)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCollection
-
-        return pCollection[0]
-
-
-
-    return vkCreateBufferCollectionFUCHSIA
-def _wrap_vkSetBufferCollectionBufferConstraintsFUCHSIA(fn):
-    def vkSetBufferCollectionBufferConstraintsFUCHSIA(
-    device
-            ,collection
-            ,pBufferConstraintsInfo
-            ,):
-        result = _callApi(fn, device,collection,pBufferConstraintsInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSetBufferCollectionBufferConstraintsFUCHSIA
-def _wrap_vkSetBufferCollectionImageConstraintsFUCHSIA(fn):
-    def vkSetBufferCollectionImageConstraintsFUCHSIA(
-    device
-            ,collection
-            ,pImageConstraintsInfo
-            ,):
-        result = _callApi(fn, device,collection,pImageConstraintsInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkSetBufferCollectionImageConstraintsFUCHSIA
-def _wrap_vkDestroyBufferCollectionFUCHSIA(fn):
-    def vkDestroyBufferCollectionFUCHSIA(
-    device
-            ,collection
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,collection,pAllocator)
-
-
-    return vkDestroyBufferCollectionFUCHSIA
-def _wrap_vkGetBufferCollectionPropertiesFUCHSIA(fn):
-    def vkGetBufferCollectionPropertiesFUCHSIA(
-    device
-            ,collection
-            ,pProperties=None
-            ,):
-
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkBufferCollectionPropertiesFUCHSIA*')
-            custom_return = False
-
-        result = _callApi(fn, device,collection,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pProperties
-
-        return pProperties[0]
-
-
-
-    return vkGetBufferCollectionPropertiesFUCHSIA
-def _wrap_vkCreateCudaModuleNV(fn):
-    def vkCreateCudaModuleNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pModule=None
-            ,):
-
-        custom_return = True
-        if not pModule:
-            pModule = ffi.new('VkCudaModuleNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pModule)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pModule
-
-        return pModule[0]
-
-
-
-    return vkCreateCudaModuleNV
-def _wrap_vkGetCudaModuleCacheNV(fn):
-    def vkGetCudaModuleCacheNV(
-    device
-            ,module
-            ,pCacheSize
-            ,pCacheData=None
-            ,):
-
-        custom_return = True
-        if not pCacheData:
-            pCacheData = ffi.new('void[%d]' % pCacheSize)
-            custom_return = False
-
-        result = _callApi(fn, device,module,pCacheSize,pCacheData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pCacheData
-
-        return pCacheData
-
-
-
-    return vkGetCudaModuleCacheNV
-def _wrap_vkCreateCudaFunctionNV(fn):
-    def vkCreateCudaFunctionNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pFunction=None
-            ,):
-
-        custom_return = True
-        if not pFunction:
-            pFunction = ffi.new('VkCudaFunctionNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pFunction)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pFunction
-
-        return pFunction[0]
-
-
-
-    return vkCreateCudaFunctionNV
-def _wrap_vkDestroyCudaModuleNV(fn):
-    def vkDestroyCudaModuleNV(
-    device
-            ,module
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,module,pAllocator)
-
-
-    return vkDestroyCudaModuleNV
-def _wrap_vkDestroyCudaFunctionNV(fn):
-    def vkDestroyCudaFunctionNV(
-    device
-            ,function
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,function,pAllocator)
-
-
-    return vkDestroyCudaFunctionNV
-def _wrap_vkCmdCudaLaunchKernelNV(fn):
-    def vkCmdCudaLaunchKernelNV(
-    commandBuffer
-            ,pLaunchInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pLaunchInfo)
-
-
-    return vkCmdCudaLaunchKernelNV
-def vkCmdBeginRendering(
+def vkCmdSetDepthTestEnable(
 commandBuffer
-        ,pRenderingInfo
+        ,depthTestEnable
         ,):
-    result = _callApi(lib.vkCmdBeginRendering, commandBuffer,pRenderingInfo)
-
-
-def _wrap_vkCmdBeginRendering(fn):
-    def vkCmdBeginRendering(
-    commandBuffer
-            ,pRenderingInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pRenderingInfo)
+    result = _callApi(lib.vkCmdSetDepthTestEnable, commandBuffer,depthTestEnable)
 
 
-    return vkCmdBeginRendering
-def vkCmdEndRendering(
+def vkCmdSetDepthWriteEnable(
 commandBuffer
+        ,depthWriteEnable
         ,):
-    result = _callApi(lib.vkCmdEndRendering, commandBuffer)
-
-
-def _wrap_vkCmdEndRendering(fn):
-    def vkCmdEndRendering(
-    commandBuffer
-            ,):
-        result = _callApi(fn, commandBuffer)
-
-
-    return vkCmdEndRendering
-def _wrap_vkGetDescriptorSetLayoutHostMappingInfoVALVE(fn):
-    def vkGetDescriptorSetLayoutHostMappingInfoVALVE(
-    device
-            ,pBindingReference
-            ,pHostMapping=None
-            ,):
-
-        custom_return = True
-        if not pHostMapping:
-            pHostMapping = ffi.new('VkDescriptorSetLayoutHostMappingInfoVALVE*')
-            custom_return = False
-
-        result = _callApi(fn, device,pBindingReference,pHostMapping)
-
-        if custom_return:
-            return pHostMapping
-
-        return pHostMapping[0]
-
-
-
-    return vkGetDescriptorSetLayoutHostMappingInfoVALVE
-def _wrap_vkGetDescriptorSetHostMappingVALVE(fn):
-    def vkGetDescriptorSetHostMappingVALVE(
-    device
-            ,descriptorSet
-            ,ppData=None
-            ,):
-
-        custom_return = True
-        if not ppData:
-            ppData = ffi.new('void*')
-            custom_return = False
-
-        result = _callApi(fn, device,descriptorSet,ppData)
-
-        if custom_return:
-            return ppData
-
-        return ppData[0]
-
-
-
-    return vkGetDescriptorSetHostMappingVALVE
-def _wrap_vkCreateMicromapEXT(fn):
-    def vkCreateMicromapEXT(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pMicromap=None
-            ,):
-
-        custom_return = True
-        if not pMicromap:
-            pMicromap = ffi.new('VkMicromapEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pMicromap)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pMicromap
-
-        return pMicromap[0]
-
-
-
-    return vkCreateMicromapEXT
-def _wrap_vkCmdBuildMicromapsEXT(fn):
-    def vkCmdBuildMicromapsEXT(
-    commandBuffer
-            ,infoCount
-            ,pInfos
-            ,):
-        result = _callApi(fn, commandBuffer,infoCount,pInfos)
-
-
-    return vkCmdBuildMicromapsEXT
-def _wrap_vkBuildMicromapsEXT(fn):
-    def vkBuildMicromapsEXT(
-    device
-            ,deferredOperation
-            ,infoCount
-            ,pInfos
-            ,):
-        result = _callApi(fn, device,deferredOperation,infoCount,pInfos)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkBuildMicromapsEXT
-def _wrap_vkDestroyMicromapEXT(fn):
-    def vkDestroyMicromapEXT(
-    device
-            ,micromap
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,micromap,pAllocator)
-
-
-    return vkDestroyMicromapEXT
-def _wrap_vkCmdCopyMicromapEXT(fn):
-    def vkCmdCopyMicromapEXT(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyMicromapEXT
-def _wrap_vkCopyMicromapEXT(fn):
-    def vkCopyMicromapEXT(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyMicromapEXT
-def _wrap_vkCmdCopyMicromapToMemoryEXT(fn):
-    def vkCmdCopyMicromapToMemoryEXT(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyMicromapToMemoryEXT
-def _wrap_vkCopyMicromapToMemoryEXT(fn):
-    def vkCopyMicromapToMemoryEXT(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyMicromapToMemoryEXT
-def _wrap_vkCmdCopyMemoryToMicromapEXT(fn):
-    def vkCmdCopyMemoryToMicromapEXT(
-    commandBuffer
-            ,pInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pInfo)
-
-
-    return vkCmdCopyMemoryToMicromapEXT
-def _wrap_vkCopyMemoryToMicromapEXT(fn):
-    def vkCopyMemoryToMicromapEXT(
-    device
-            ,deferredOperation
-            ,pInfo
-            ,):
-        result = _callApi(fn, device,deferredOperation,pInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkCopyMemoryToMicromapEXT
-def _wrap_vkCmdWriteMicromapsPropertiesEXT(fn):
-    def vkCmdWriteMicromapsPropertiesEXT(
-    commandBuffer
-            ,micromapCount
-            ,pMicromaps
-            ,queryType
-            ,queryPool
-            ,firstQuery
-            ,):
-        result = _callApi(fn, commandBuffer,micromapCount,pMicromaps,queryType,queryPool,firstQuery)
-
-
-    return vkCmdWriteMicromapsPropertiesEXT
-def _wrap_vkWriteMicromapsPropertiesEXT(fn):
-    def vkWriteMicromapsPropertiesEXT(
-    device
-            ,micromapCount
-            ,pMicromaps
-            ,queryType
-            ,dataSize
-            ,pData
-            ,stride
-            ,):
-        result = _callApi(fn, device,micromapCount,pMicromaps,queryType,dataSize,pData,stride)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-
-    return vkWriteMicromapsPropertiesEXT
-def _wrap_vkGetDeviceMicromapCompatibilityEXT(fn):
-    def vkGetDeviceMicromapCompatibilityEXT(
-    device
-            ,pVersionInfo
-            ,pCompatibility=None
-            ,):
-
-        custom_return = True
-        if not pCompatibility:
-            pCompatibility = ffi.new('VkAccelerationStructureCompatibilityKHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,pVersionInfo,pCompatibility)
-
-        if custom_return:
-            return pCompatibility
-
-        return pCompatibility[0]
-
-
-
-    return vkGetDeviceMicromapCompatibilityEXT
-def _wrap_vkGetMicromapBuildSizesEXT(fn):
-    def vkGetMicromapBuildSizesEXT(
-    device
-            ,buildType
-            ,pBuildInfo
-            ,pSizeInfo=None
-            ,):
-
-        custom_return = True
-        if not pSizeInfo:
-            pSizeInfo = ffi.new('VkMicromapBuildSizesInfoEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,buildType,pBuildInfo,pSizeInfo)
-
-        if custom_return:
-            return pSizeInfo
-
-        return pSizeInfo[0]
-
-
-
-    return vkGetMicromapBuildSizesEXT
-def _wrap_vkGetShaderModuleIdentifierEXT(fn):
-    def vkGetShaderModuleIdentifierEXT(
-    device
-            ,shaderModule
-            ,pIdentifier=None
-            ,):
-
-        custom_return = True
-        if not pIdentifier:
-            pIdentifier = ffi.new('VkShaderModuleIdentifierEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,shaderModule,pIdentifier)
-
-        if custom_return:
-            return pIdentifier
-
-        return pIdentifier[0]
-
-
-
-    return vkGetShaderModuleIdentifierEXT
-def _wrap_vkGetShaderModuleCreateInfoIdentifierEXT(fn):
-    def vkGetShaderModuleCreateInfoIdentifierEXT(
-    device
-            ,pCreateInfo
-            ,pIdentifier=None
-            ,):
-
-        custom_return = True
-        if not pIdentifier:
-            pIdentifier = ffi.new('VkShaderModuleIdentifierEXT*')
-            custom_return = False
-
-        result = _callApi(fn, device,pCreateInfo,pIdentifier)
-
-        if custom_return:
-            return pIdentifier
-
-        return pIdentifier[0]
-
-
-
-    return vkGetShaderModuleCreateInfoIdentifierEXT
-def _wrap_vkGetImageSubresourceLayout2KHR(fn):
-    def vkGetImageSubresourceLayout2KHR(
-    device
-            ,image
-            ,pSubresource
-            ,pLayout=None
-            ,):
-
-        custom_return = True
-        if not pLayout:
-            pLayout = ffi.new('VkSubresourceLayout2KHR*')
-            custom_return = False
-
-        result = _callApi(fn, device,image,pSubresource,pLayout)
-
-        if custom_return:
-            return pLayout
-
-        return pLayout[0]
-
-
-
-    return vkGetImageSubresourceLayout2KHR
-def _wrap_vkGetPipelinePropertiesEXT(fn):
-    def vkGetPipelinePropertiesEXT(
-    device
-            ,pPipelineInfo
-            ,pPipelineProperties=None
-            ,):
-
-        custom_return = True
-        if not pPipelineProperties:
-            pPipelineProperties = ffi.new('VkBaseOutStructure*')
-            custom_return = False
-
-        result = _callApi(fn, device,pPipelineInfo,pPipelineProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        if custom_return:
-            return pPipelineProperties
-
-        return pPipelineProperties[0]
-
-
-
-    return vkGetPipelinePropertiesEXT
-def _wrap_vkExportMetalObjectsEXT(fn):
-    def vkExportMetalObjectsEXT(
-    device
-            ,pMetalObjectsInfo
-            ,):
-        result = _callApi(fn, device,pMetalObjectsInfo)
-
-
-    return vkExportMetalObjectsEXT
-def _wrap_vkGetFramebufferTilePropertiesQCOM(fn):
-    def vkGetFramebufferTilePropertiesQCOM(
-    device
-            ,framebuffer
-            ,):
-
-        pPropertiesCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
-
-        result = _callApi(fn, device,framebuffer,pPropertiesCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
-
-        pProperties = ffi.new('VkTilePropertiesQCOM[]', pPropertiesCount[0])
-        result = _callApi(fn, device,framebuffer,pPropertiesCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkCmdSetDepthWriteEnable, commandBuffer,depthWriteEnable)
 
-        return pProperties
 
+def vkCmdSetDepthCompareOp(
+commandBuffer
+        ,depthCompareOp
+        ,):
+    result = _callApi(lib.vkCmdSetDepthCompareOp, commandBuffer,depthCompareOp)
 
-    return vkGetFramebufferTilePropertiesQCOM
-def _wrap_vkGetDynamicRenderingTilePropertiesQCOM(fn):
-    def vkGetDynamicRenderingTilePropertiesQCOM(
-    device
-            ,pRenderingInfo
-            ,pProperties=None
-            ,):
 
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkTilePropertiesQCOM*')
-            custom_return = False
+def vkCmdSetDepthBoundsTestEnable(
+commandBuffer
+        ,depthBoundsTestEnable
+        ,):
+    result = _callApi(lib.vkCmdSetDepthBoundsTestEnable, commandBuffer,depthBoundsTestEnable)
 
-        result = _callApi(fn, device,pRenderingInfo,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pProperties
+def vkCmdSetStencilTestEnable(
+commandBuffer
+        ,stencilTestEnable
+        ,):
+    result = _callApi(lib.vkCmdSetStencilTestEnable, commandBuffer,stencilTestEnable)
 
-        return pProperties[0]
 
+def vkCmdSetStencilOp(
+commandBuffer
+        ,faceMask
+        ,failOp
+        ,passOp
+        ,depthFailOp
+        ,compareOp
+        ,):
+    result = _callApi(lib.vkCmdSetStencilOp, commandBuffer,faceMask,failOp,passOp,depthFailOp,compareOp)
 
 
-    return vkGetDynamicRenderingTilePropertiesQCOM
-def _wrap_vkGetPhysicalDeviceOpticalFlowImageFormatsNV(fn):
-    def vkGetPhysicalDeviceOpticalFlowImageFormatsNV(
-    physicalDevice
-            ,pOpticalFlowImageFormatInfo
-            ,):
+def vkCmdSetRasterizerDiscardEnable(
+commandBuffer
+        ,rasterizerDiscardEnable
+        ,):
+    result = _callApi(lib.vkCmdSetRasterizerDiscardEnable, commandBuffer,rasterizerDiscardEnable)
 
-        pFormatCount = ffi.new('uint32_t*')
-        pImageFormatProperties = ffi.NULL
 
-        result = _callApi(fn, physicalDevice,pOpticalFlowImageFormatInfo,pFormatCount,pImageFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkCmdSetDepthBiasEnable(
+commandBuffer
+        ,depthBiasEnable
+        ,):
+    result = _callApi(lib.vkCmdSetDepthBiasEnable, commandBuffer,depthBiasEnable)
 
-        pImageFormatProperties = ffi.new('VkOpticalFlowImageFormatPropertiesNV[]', pFormatCount[0])
-        result = _callApi(fn, physicalDevice,pOpticalFlowImageFormatInfo,pFormatCount,pImageFormatProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        return pImageFormatProperties
+def vkCmdSetPrimitiveRestartEnable(
+commandBuffer
+        ,primitiveRestartEnable
+        ,):
+    result = _callApi(lib.vkCmdSetPrimitiveRestartEnable, commandBuffer,primitiveRestartEnable)
 
 
-    return vkGetPhysicalDeviceOpticalFlowImageFormatsNV
-def _wrap_vkCreateOpticalFlowSessionNV(fn):
-    def vkCreateOpticalFlowSessionNV(
-    device
-            ,pCreateInfo
-            ,pAllocator
-            ,pSession=None
-            ,):
+def vkCreatePrivateDataSlot(
+device
+        ,pCreateInfo
+        ,pAllocator
+        ,pPrivateDataSlot=None
+        ,):
 
-        custom_return = True
-        if not pSession:
-            pSession = ffi.new('VkOpticalFlowSessionNV*')
-            custom_return = False
+    custom_return = True
+    if not pPrivateDataSlot:
+        pPrivateDataSlot = ffi.new('VkPrivateDataSlot*')
+        custom_return = False
 
-        result = _callApi(fn, device,pCreateInfo,pAllocator,pSession)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    result = _callApi(lib.vkCreatePrivateDataSlot, device,pCreateInfo,pAllocator,pPrivateDataSlot)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
-        if custom_return:
-            return pSession
+    if custom_return:
+        return pPrivateDataSlot
 
-        return pSession[0]
+    return pPrivateDataSlot[0]
 
 
 
-    return vkCreateOpticalFlowSessionNV
-def _wrap_vkDestroyOpticalFlowSessionNV(fn):
-    def vkDestroyOpticalFlowSessionNV(
-    device
-            ,session
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,session,pAllocator)
+def vkDestroyPrivateDataSlot(
+device
+        ,privateDataSlot
+        ,pAllocator
+        ,):
+    result = _callApi(lib.vkDestroyPrivateDataSlot, device,privateDataSlot,pAllocator)
 
 
-    return vkDestroyOpticalFlowSessionNV
-def _wrap_vkBindOpticalFlowSessionImageNV(fn):
-    def vkBindOpticalFlowSessionImageNV(
-    device
-            ,session
-            ,bindingPoint
-            ,view
-            ,layout
-            ,):
-        result = _callApi(fn, device,session,bindingPoint,view,layout)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkSetPrivateData(
+device
+        ,objectType
+        ,objectHandle
+        ,privateDataSlot
+        ,data
+        ,):
+    result = _callApi(lib.vkSetPrivateData, device,objectType,objectHandle,privateDataSlot,data)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
 
-    return vkBindOpticalFlowSessionImageNV
-def _wrap_vkCmdOpticalFlowExecuteNV(fn):
-    def vkCmdOpticalFlowExecuteNV(
-    commandBuffer
-            ,session
-            ,pExecuteInfo
-            ,):
-        result = _callApi(fn, commandBuffer,session,pExecuteInfo)
+def vkGetPrivateData(
+device
+        ,objectType
+        ,objectHandle
+        ,privateDataSlot
+        ,pData=None
+        ,):
 
+    custom_return = True
+    if not pData:
+        pData = ffi.new('uint64_t*')
+        custom_return = False
 
-    return vkCmdOpticalFlowExecuteNV
-def _wrap_vkGetDeviceFaultInfoEXT(fn):
-    def vkGetDeviceFaultInfoEXT(
-    device
-            ,pFaultCounts
-            ,pFaultInfo=None
-            ,):
+    result = _callApi(lib.vkGetPrivateData, device,objectType,objectHandle,privateDataSlot,pData)
 
-        custom_return = True
-        if not pFaultInfo:
-            pFaultInfo = ffi.new('VkDeviceFaultInfoEXT*')
-            custom_return = False
+    if custom_return:
+        return pData
 
-        result = _callApi(fn, device,pFaultCounts,pFaultInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    return pData[0]
 
-        if custom_return:
-            return pFaultInfo
 
-        return StrWrap(pFaultInfo[0])
 
+def vkCmdCopyBuffer2(
+commandBuffer
+        ,pCopyBufferInfo
+        ,):
+    result = _callApi(lib.vkCmdCopyBuffer2, commandBuffer,pCopyBufferInfo)
 
 
-    return vkGetDeviceFaultInfoEXT
-def _wrap_vkCmdSetDepthBias2EXT(fn):
-    def vkCmdSetDepthBias2EXT(
-    commandBuffer
-            ,pDepthBiasInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pDepthBiasInfo)
+def vkCmdCopyImage2(
+commandBuffer
+        ,pCopyImageInfo
+        ,):
+    result = _callApi(lib.vkCmdCopyImage2, commandBuffer,pCopyImageInfo)
 
 
-    return vkCmdSetDepthBias2EXT
-def _wrap_vkReleaseSwapchainImagesEXT(fn):
-    def vkReleaseSwapchainImagesEXT(
-    device
-            ,pReleaseInfo
-            ,):
-        result = _callApi(fn, device,pReleaseInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkCmdBlitImage2(
+commandBuffer
+        ,pBlitImageInfo
+        ,):
+    result = _callApi(lib.vkCmdBlitImage2, commandBuffer,pBlitImageInfo)
 
 
-    return vkReleaseSwapchainImagesEXT
-def _wrap_vkGetDeviceImageSubresourceLayoutKHR(fn):
-    def vkGetDeviceImageSubresourceLayoutKHR(
-    device
-            ,pInfo
-            ,pLayout=None
-            ,):
+def vkCmdCopyBufferToImage2(
+commandBuffer
+        ,pCopyBufferToImageInfo
+        ,):
+    result = _callApi(lib.vkCmdCopyBufferToImage2, commandBuffer,pCopyBufferToImageInfo)
 
-        custom_return = True
-        if not pLayout:
-            pLayout = ffi.new('VkSubresourceLayout2KHR*')
-            custom_return = False
 
-        result = _callApi(fn, device,pInfo,pLayout)
+def vkCmdCopyImageToBuffer2(
+commandBuffer
+        ,pCopyImageToBufferInfo
+        ,):
+    result = _callApi(lib.vkCmdCopyImageToBuffer2, commandBuffer,pCopyImageToBufferInfo)
 
-        if custom_return:
-            return pLayout
 
-        return pLayout[0]
+def vkCmdResolveImage2(
+commandBuffer
+        ,pResolveImageInfo
+        ,):
+    result = _callApi(lib.vkCmdResolveImage2, commandBuffer,pResolveImageInfo)
 
 
+def vkCmdSetEvent2(
+commandBuffer
+        ,event
+        ,pDependencyInfo
+        ,):
+    result = _callApi(lib.vkCmdSetEvent2, commandBuffer,event,pDependencyInfo)
 
-    return vkGetDeviceImageSubresourceLayoutKHR
-def _wrap_vkMapMemory2KHR(fn):
-    def vkMapMemory2KHR(
-    device
-            ,pMemoryMapInfo
-            ,ppData=None
-            ,):
 
-        custom_return = True
-        if not ppData:
-            ppData = ffi.new('void*')
-            custom_return = False
+def vkCmdResetEvent2(
+commandBuffer
+        ,event
+        ,stageMask
+        ,):
+    result = _callApi(lib.vkCmdResetEvent2, commandBuffer,event,stageMask)
 
-        result = _callApi(fn, device,pMemoryMapInfo,ppData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return ppData
+def vkCmdWaitEvents2(
+commandBuffer
+        ,eventCount
+        ,pEvents
+        ,pDependencyInfos
+        ,):
+    result = _callApi(lib.vkCmdWaitEvents2, commandBuffer,eventCount,pEvents,pDependencyInfos)
 
-        return ppData[0]
 
+def vkCmdPipelineBarrier2(
+commandBuffer
+        ,pDependencyInfo
+        ,):
+    result = _callApi(lib.vkCmdPipelineBarrier2, commandBuffer,pDependencyInfo)
 
 
-    return vkMapMemory2KHR
-def _wrap_vkUnmapMemory2KHR(fn):
-    def vkUnmapMemory2KHR(
-    device
-            ,pMemoryUnmapInfo
-            ,):
-        result = _callApi(fn, device,pMemoryUnmapInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkQueueSubmit2(
+queue
+        ,submitCount
+        ,pSubmits
+        ,fence
+        ,):
+    result = _callApi(lib.vkQueueSubmit2, queue,submitCount,pSubmits,fence)
+    if result != VK_SUCCESS:
+        raise exception_codes[result]
 
 
-    return vkUnmapMemory2KHR
-def _wrap_vkCreateShadersEXT(fn):
-    def vkCreateShadersEXT(
-    device
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pShaders=None
-            ,):
+def vkCmdWriteTimestamp2(
+commandBuffer
+        ,stage
+        ,queryPool
+        ,query
+        ,):
+    result = _callApi(lib.vkCmdWriteTimestamp2, commandBuffer,stage,queryPool,query)
 
-        custom_return = True
-        if not pShaders:
-            pShaders = ffi.new('VkShaderEXT[%d]' % createInfoCount)
-            custom_return = False
 
-        result = _callApi(fn, device,createInfoCount,pCreateInfos,pAllocator,pShaders)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkGetCommandPoolMemoryConsumption(
+device
+        ,commandPool
+        ,commandBuffer
+        ,pConsumption=None
+        ,):
 
-        if custom_return:
-            return pShaders
+    custom_return = True
+    if not pConsumption:
+        pConsumption = ffi.new('VkCommandPoolMemoryConsumption*')
+        custom_return = False
 
-        return pShaders
+    result = _callApi(lib.vkGetCommandPoolMemoryConsumption, device,commandPool,commandBuffer,pConsumption)
 
+    if custom_return:
+        return pConsumption
 
+    return pConsumption[0]
 
-    return vkCreateShadersEXT
-def _wrap_vkDestroyShaderEXT(fn):
-    def vkDestroyShaderEXT(
-    device
-            ,shader
-            ,pAllocator
-            ,):
-        result = _callApi(fn, device,shader,pAllocator)
 
 
-    return vkDestroyShaderEXT
-def _wrap_vkGetShaderBinaryDataEXT(fn):
-    def vkGetShaderBinaryDataEXT(
-    device
-            ,shader
-            ,pDataSize
-            ,pData=None
-            ,):
+def vkCmdBeginRendering(
+commandBuffer
+        ,pRenderingInfo
+        ,):
+    result = _callApi(lib.vkCmdBeginRendering, commandBuffer,pRenderingInfo)
 
-        custom_return = True
-        if not pData:
-            pData = ffi.new('void[%d]' % pDataSize)
-            custom_return = False
 
-        result = _callApi(fn, device,shader,pDataSize,pData)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkCmdEndRendering(
+commandBuffer
+        ,):
+    result = _callApi(lib.vkCmdEndRendering, commandBuffer)
 
-        if custom_return:
-            return pData
 
-        return pData
 
 
 
-    return vkGetShaderBinaryDataEXT
-def _wrap_vkCmdBindShadersEXT(fn):
-    def vkCmdBindShadersEXT(
-    commandBuffer
-            ,stageCount
-            ,pStages
-            ,pShaders
-            ,):
-        result = _callApi(fn, commandBuffer,stageCount,pStages,pShaders)
 
 
-    return vkCmdBindShadersEXT
-def _wrap_vkGetScreenBufferPropertiesQNX(fn):
-    def vkGetScreenBufferPropertiesQNX(
-    device
-            ,buffer
-            ,pProperties=None
-            ,):
+def _instance_proc_addr(instance, pName):
+    fn = _callApi(lib.vkGetInstanceProcAddr, instance, pName)
+    if fn == ffi.NULL:
+        raise ProcedureNotFoundError()
+    return ffi.cast('PFN_' + pName, fn)
 
-        custom_return = True
-        if not pProperties:
-            pProperties = ffi.new('VkScreenBufferPropertiesQNX*')
-            custom_return = False
 
-        result = _callApi(fn, device,buffer,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def _device_proc_addr(device, pName):
+    fn = _callApi(lib.vkGetDeviceProcAddr, device, pName)
+    if fn == ffi.NULL:
+        raise ProcedureNotFoundError()
+    return ffi.cast('PFN_' + pName, fn)
 
-        if custom_return:
-            return pProperties
 
-        return pProperties[0]
+def vkGetInstanceProcAddr(instance, pName):
+    fn = _instance_proc_addr(instance, pName)
+    # extension wrappers are only loaded once something asks for them
+    from vkproject.graphics.vulkan._vulkan_ext import _instance_ext_funcs
+    if not pName in _instance_ext_funcs:
+        raise ExtensionNotSupportedError()
+    return _instance_ext_funcs[pName](fn)
 
 
+def vkGetDeviceProcAddr(device, pName):
+    fn = _device_proc_addr(device, pName)
+    from vkproject.graphics.vulkan._vulkan_ext import _device_ext_funcs
+    if not pName in _device_ext_funcs:
+        raise ExtensionNotSupportedError()
+    return _device_ext_funcs[pName](fn)
 
-    return vkGetScreenBufferPropertiesQNX
-def _wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR(fn):
-    def vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR(
-    physicalDevice
-            ,):
 
-        pPropertyCount = ffi.new('uint32_t*')
-        pProperties = ffi.NULL
+class EnumerationBuffer(object):
+    """Reusable output array for the two-call enumerate/query functions
 
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    capacity is a hint for how many elements to expect. When it is large
+    enough the query is a single call into the driver with no allocation,
+    otherwise the array grows to what the driver reports and is kept for
+    the next call. Views returned by enumerate_into point into the array,
+    so they are only valid as long as the buffer is alive and hasn't grown.
+    """
 
-        pProperties = ffi.new('VkCooperativeMatrixPropertiesKHR[]', pPropertyCount[0])
-        result = _callApi(fn, physicalDevice,pPropertyCount,pProperties)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    def __init__(self, ctype, capacity=0):
+        self.ctype = ctype
+        self.capacity = 0
+        self.count = ffi.new('uint32_t*')
+        self.array = ffi.NULL
+        self.reserve(capacity)
 
-        return pProperties
+    def reserve(self, capacity):
+        if capacity > self.capacity:
+            self.array = ffi.new(self.ctype + '[]', capacity)
+            self.capacity = capacity
 
+    def view(self):
+        if not self.count[0]:
+            return ()
+        return self.array[0:self.count[0]]
 
-    return vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR
-def _wrap_vkGetExecutionGraphPipelineScratchSizeAMDX(fn):
-    def vkGetExecutionGraphPipelineScratchSizeAMDX(
-    device
-            ,executionGraph
-            ,pSizeInfo=None
-            ,):
 
-        custom_return = True
-        if not pSizeInfo:
-            pSizeInfo = ffi.new('VkExecutionGraphPipelineScratchSizeAMDX*')
-            custom_return = False
+def _check_enumerate(result):
+    if result is not None and result != VK_SUCCESS and result != VK_INCOMPLETE:
+        raise exception_codes[result]
 
-        result = _callApi(fn, device,executionGraph,pSizeInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pSizeInfo
+def enumerate_into(fn, out, *args):
+    """Run a two-call enumeration of fn(*args, pCount, pArray) into out
 
-        return pSizeInfo[0]
+    Returns a view of the filled part of the output array.
+    """
+    count = out.count
+    if out.capacity:
+        count[0] = out.capacity
+        result = _callApi(fn, *args, count, out.array)
+        _check_enumerate(result)
+        # void queries (queue families) can't report truncation, a full array is checked below
+        if result == VK_SUCCESS or (result is None and count[0] < out.capacity):
+            return out.view()
 
+    while True:
+        result = _callApi(fn, *args, count, ffi.NULL)
+        _check_enumerate(result)
+        if not count[0]:
+            return ()
 
+        out.reserve(count[0])
+        result = _callApi(fn, *args, count, out.array)
+        _check_enumerate(result)
+        # the count can grow between the two calls
+        if result != VK_INCOMPLETE:
+            return out.view()
 
-    return vkGetExecutionGraphPipelineScratchSizeAMDX
-def _wrap_vkGetExecutionGraphPipelineNodeIndexAMDX(fn):
-    def vkGetExecutionGraphPipelineNodeIndexAMDX(
-    device
-            ,executionGraph
-            ,):
 
-        pNodeInfo = ffi.new('VkPipelineShaderStageNodeCreateInfoAMDX*')
-        pNodeIndex = ffi.NULL
+def vkEnumeratePhysicalDevicesInto(instance, out):
+    return enumerate_into(lib.vkEnumeratePhysicalDevices, out, instance)
 
-        result = _callApi(fn, device,executionGraph,pNodeInfo,pNodeIndex)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        pNodeIndex = ffi.new('uint32_t[]', pNodeInfo[0])
-        result = _callApi(fn, device,executionGraph,pNodeInfo,pNodeIndex)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def vkEnumerateDeviceExtensionPropertiesInto(physicalDevice, pLayerName, out):
+    return enumerate_into(lib.vkEnumerateDeviceExtensionProperties, out, physicalDevice, pLayerName)
 
-        return pNodeIndex
 
+def vkGetPhysicalDeviceQueueFamilyPropertiesInto(physicalDevice, out):
+    return enumerate_into(lib.vkGetPhysicalDeviceQueueFamilyProperties, out, physicalDevice)
 
-    return vkGetExecutionGraphPipelineNodeIndexAMDX
-def _wrap_vkCreateExecutionGraphPipelinesAMDX(fn):
-    def vkCreateExecutionGraphPipelinesAMDX(
-    device
-            ,pipelineCache
-            ,createInfoCount
-            ,pCreateInfos
-            ,pAllocator
-            ,pPipelines=None
-            ,):
 
-        custom_return = True
-        if not pPipelines:
-            pPipelines = ffi.new('VkPipeline[%d]' % createInfoCount)
-            custom_return = False
+def vkEnumerateInstanceLayerPropertiesInto(out):
+    return enumerate_into(lib.vkEnumerateInstanceLayerProperties, out)
 
-        result = _callApi(fn, device,pipelineCache,createInfoCount,pCreateInfos,pAllocator,pPipelines)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
 
-        if custom_return:
-            return pPipelines
+def vkEnumerateInstanceExtensionPropertiesInto(pLayerName, out):
+    return enumerate_into(lib.vkEnumerateInstanceExtensionProperties, out, pLayerName)
 
-        return pPipelines
 
+_name_layouts = {}
 
 
-    return vkCreateExecutionGraphPipelinesAMDX
-def _wrap_vkCmdInitializeGraphScratchMemoryAMDX(fn):
-    def vkCmdInitializeGraphScratchMemoryAMDX(
-    commandBuffer
-            ,scratch
-            ,):
-        result = _callApi(fn, commandBuffer,scratch)
-
-
-    return vkCmdInitializeGraphScratchMemoryAMDX
-def _wrap_vkCmdDispatchGraphAMDX(fn):
-    def vkCmdDispatchGraphAMDX(
-    commandBuffer
-            ,scratch
-            ,pCountInfo
-            ,):
-        result = _callApi(fn, commandBuffer,scratch,pCountInfo)
-
-
-    return vkCmdDispatchGraphAMDX
-def _wrap_vkCmdDispatchGraphIndirectAMDX(fn):
-    def vkCmdDispatchGraphIndirectAMDX(
-    commandBuffer
-            ,scratch
-            ,pCountInfo
-            ,):
-        result = _callApi(fn, commandBuffer,scratch,pCountInfo)
-
-
-    return vkCmdDispatchGraphIndirectAMDX
-def _wrap_vkCmdDispatchGraphIndirectCountAMDX(fn):
-    def vkCmdDispatchGraphIndirectCountAMDX(
-    commandBuffer
-            ,scratch
-            ,countInfo
-            ,):
-        result = _callApi(fn, commandBuffer,scratch,countInfo)
-
-
-    return vkCmdDispatchGraphIndirectCountAMDX
-def _wrap_vkCmdBindDescriptorSets2KHR(fn):
-    def vkCmdBindDescriptorSets2KHR(
-    commandBuffer
-            ,pBindDescriptorSetsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pBindDescriptorSetsInfo)
-
-
-    return vkCmdBindDescriptorSets2KHR
-def _wrap_vkCmdPushConstants2KHR(fn):
-    def vkCmdPushConstants2KHR(
-    commandBuffer
-            ,pPushConstantsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pPushConstantsInfo)
-
-
-    return vkCmdPushConstants2KHR
-def _wrap_vkCmdPushDescriptorSet2KHR(fn):
-    def vkCmdPushDescriptorSet2KHR(
-    commandBuffer
-            ,pPushDescriptorSetInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pPushDescriptorSetInfo)
-
-
-    return vkCmdPushDescriptorSet2KHR
-def _wrap_vkCmdPushDescriptorSetWithTemplate2KHR(fn):
-    def vkCmdPushDescriptorSetWithTemplate2KHR(
-    commandBuffer
-            ,pPushDescriptorSetWithTemplateInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pPushDescriptorSetWithTemplateInfo)
-
-
-    return vkCmdPushDescriptorSetWithTemplate2KHR
-def _wrap_vkCmdSetDescriptorBufferOffsets2EXT(fn):
-    def vkCmdSetDescriptorBufferOffsets2EXT(
-    commandBuffer
-            ,pSetDescriptorBufferOffsetsInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pSetDescriptorBufferOffsetsInfo)
-
-
-    return vkCmdSetDescriptorBufferOffsets2EXT
-def _wrap_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT(fn):
-    def vkCmdBindDescriptorBufferEmbeddedSamplers2EXT(
-    commandBuffer
-            ,pBindDescriptorBufferEmbeddedSamplersInfo
-            ,):
-        result = _callApi(fn, commandBuffer,pBindDescriptorBufferEmbeddedSamplersInfo)
-
-
-    return vkCmdBindDescriptorBufferEmbeddedSamplers2EXT
-def _wrap_vkSetLatencySleepModeNV(fn):
-    def vkSetLatencySleepModeNV(
-    device
-            ,swapchain
-            ,pSleepModeInfo
-            ,):
-        result = _callApi(fn, device,swapchain,pSleepModeInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+def _decode_names(properties, field):
+    """Decode one char[] field of every element of a struct array in one pass
 
+    struct unpacks the field straight out of the array memory, instead of
+    building a cdata and a StrWrap per element.
+    """
+    if not len(properties):
+        return frozenset()
 
-    return vkSetLatencySleepModeNV
-def _wrap_vkLatencySleepNV(fn):
-    def vkLatencySleepNV(
-    device
-            ,swapchain
-            ,pSleepInfo
-            ,):
-        result = _callApi(fn, device,swapchain,pSleepInfo)
-        if result != VK_SUCCESS:
-            raise exception_codes[result]
+    item = ffi.typeof(properties).item
+    layout = _name_layouts.get((item, field))
+    if layout is None:
+        stride = ffi.sizeof(item)
+        offset = ffi.offsetof(item, field)
+        length = dict(item.fields)[field].type.length
+        layout = _name_layouts[(item, field)] = _struct.Struct('%dx%ds%dx' % (offset, length, stride - offset - length))
 
+    buf = ffi.buffer(properties, layout.size * len(properties))
+    return frozenset([name.partition(b'\0')[0].decode('utf-8') for name, in layout.iter_unpack(buf)])
 
-    return vkLatencySleepNV
-def _wrap_vkSetLatencyMarkerNV(fn):
-    def vkSetLatencyMarkerNV(
-    device
-            ,swapchain
-            ,pLatencyMarkerInfo
-            ,):
-        result = _callApi(fn, device,swapchain,pLatencyMarkerInfo)
-
-
-    return vkSetLatencyMarkerNV
-def _wrap_vkGetLatencyTimingsNV(fn):
-    def vkGetLatencyTimingsNV(
-    device
-            ,swapchain
-            ,pLatencyMarkerInfo=None
-            ,):
-
-        custom_return = True
-        if not pLatencyMarkerInfo:
-            pLatencyMarkerInfo = ffi.new('VkGetLatencyMarkerInfoNV*')
-            custom_return = False
-
-        result = _callApi(fn, device,swapchain,pLatencyMarkerInfo)
-
-        if custom_return:
-            return pLatencyMarkerInfo
-
-        return pLatencyMarkerInfo[0]
-
-
-
-    return vkGetLatencyTimingsNV
-def _wrap_vkQueueNotifyOutOfBandNV(fn):
-    def vkQueueNotifyOutOfBandNV(
-    queue
-            ,pQueueTypeInfo
-            ,):
-        result = _callApi(fn, queue,pQueueTypeInfo)
-
-
-    return vkQueueNotifyOutOfBandNV
-
-_instance_ext_funcs = {
-    'vkDestroySurfaceKHR':_wrap_vkDestroySurfaceKHR,
-    'vkGetPhysicalDeviceSurfaceSupportKHR':_wrap_vkGetPhysicalDeviceSurfaceSupportKHR,
-    'vkGetPhysicalDeviceSurfaceCapabilitiesKHR':_wrap_vkGetPhysicalDeviceSurfaceCapabilitiesKHR,
-    'vkGetPhysicalDeviceSurfaceFormatsKHR':_wrap_vkGetPhysicalDeviceSurfaceFormatsKHR,
-    'vkGetPhysicalDeviceSurfacePresentModesKHR':_wrap_vkGetPhysicalDeviceSurfacePresentModesKHR,
-    'vkGetPhysicalDeviceDisplayPropertiesKHR':_wrap_vkGetPhysicalDeviceDisplayPropertiesKHR,
-    'vkGetPhysicalDeviceDisplayPlanePropertiesKHR':_wrap_vkGetPhysicalDeviceDisplayPlanePropertiesKHR,
-    'vkGetDisplayPlaneSupportedDisplaysKHR':_wrap_vkGetDisplayPlaneSupportedDisplaysKHR,
-    'vkGetDisplayModePropertiesKHR':_wrap_vkGetDisplayModePropertiesKHR,
-    'vkCreateDisplayModeKHR':_wrap_vkCreateDisplayModeKHR,
-    'vkGetDisplayPlaneCapabilitiesKHR':_wrap_vkGetDisplayPlaneCapabilitiesKHR,
-    'vkCreateDisplayPlaneSurfaceKHR':_wrap_vkCreateDisplayPlaneSurfaceKHR,
-    'vkCreateXlibSurfaceKHR':_wrap_vkCreateXlibSurfaceKHR,
-    'vkGetPhysicalDeviceXlibPresentationSupportKHR':_wrap_vkGetPhysicalDeviceXlibPresentationSupportKHR,
-    'vkCreateXcbSurfaceKHR':_wrap_vkCreateXcbSurfaceKHR,
-    'vkGetPhysicalDeviceXcbPresentationSupportKHR':_wrap_vkGetPhysicalDeviceXcbPresentationSupportKHR,
-    'vkCreateWaylandSurfaceKHR':_wrap_vkCreateWaylandSurfaceKHR,
-    'vkGetPhysicalDeviceWaylandPresentationSupportKHR':_wrap_vkGetPhysicalDeviceWaylandPresentationSupportKHR,
-    'vkCreateAndroidSurfaceKHR':_wrap_vkCreateAndroidSurfaceKHR,
-    'vkCreateWin32SurfaceKHR':_wrap_vkCreateWin32SurfaceKHR,
-    'vkGetPhysicalDeviceWin32PresentationSupportKHR':_wrap_vkGetPhysicalDeviceWin32PresentationSupportKHR,
-    'vkCreateDebugReportCallbackEXT':_wrap_vkCreateDebugReportCallbackEXT,
-    'vkDestroyDebugReportCallbackEXT':_wrap_vkDestroyDebugReportCallbackEXT,
-    'vkDebugReportMessageEXT':_wrap_vkDebugReportMessageEXT,
-    'vkCreateStreamDescriptorSurfaceGGP':_wrap_vkCreateStreamDescriptorSurfaceGGP,
-    'vkGetPhysicalDeviceExternalImageFormatPropertiesNV':_wrap_vkGetPhysicalDeviceExternalImageFormatPropertiesNV,
-    'vkGetPhysicalDeviceFeatures2KHR':_wrap_vkGetPhysicalDeviceFeatures2,
-    'vkGetPhysicalDeviceProperties2KHR':_wrap_vkGetPhysicalDeviceProperties2,
-    'vkGetPhysicalDeviceFormatProperties2KHR':_wrap_vkGetPhysicalDeviceFormatProperties2,
-    'vkGetPhysicalDeviceImageFormatProperties2KHR':_wrap_vkGetPhysicalDeviceImageFormatProperties2,
-    'vkGetPhysicalDeviceQueueFamilyProperties2KHR':_wrap_vkGetPhysicalDeviceQueueFamilyProperties2,
-    'vkGetPhysicalDeviceMemoryProperties2KHR':_wrap_vkGetPhysicalDeviceMemoryProperties2,
-    'vkGetPhysicalDeviceSparseImageFormatProperties2KHR':_wrap_vkGetPhysicalDeviceSparseImageFormatProperties2,
-    'vkCreateViSurfaceNN':_wrap_vkCreateViSurfaceNN,
-    'vkEnumeratePhysicalDeviceGroupsKHR':_wrap_vkEnumeratePhysicalDeviceGroups,
-    'vkGetPhysicalDeviceExternalBufferPropertiesKHR':_wrap_vkGetPhysicalDeviceExternalBufferProperties,
-    'vkGetPhysicalDeviceExternalSemaphorePropertiesKHR':_wrap_vkGetPhysicalDeviceExternalSemaphoreProperties,
-    'vkReleaseDisplayEXT':_wrap_vkReleaseDisplayEXT,
-    'vkAcquireXlibDisplayEXT':_wrap_vkAcquireXlibDisplayEXT,
-    'vkGetRandROutputDisplayEXT':_wrap_vkGetRandROutputDisplayEXT,
-    'vkGetPhysicalDeviceSurfaceCapabilities2EXT':_wrap_vkGetPhysicalDeviceSurfaceCapabilities2EXT,
-    'vkGetPhysicalDeviceExternalFencePropertiesKHR':_wrap_vkGetPhysicalDeviceExternalFenceProperties,
-    'vkGetPhysicalDeviceSurfaceCapabilities2KHR':_wrap_vkGetPhysicalDeviceSurfaceCapabilities2KHR,
-    'vkGetPhysicalDeviceSurfaceFormats2KHR':_wrap_vkGetPhysicalDeviceSurfaceFormats2KHR,
-    'vkGetPhysicalDeviceDisplayProperties2KHR':_wrap_vkGetPhysicalDeviceDisplayProperties2KHR,
-    'vkGetPhysicalDeviceDisplayPlaneProperties2KHR':_wrap_vkGetPhysicalDeviceDisplayPlaneProperties2KHR,
-    'vkGetDisplayModeProperties2KHR':_wrap_vkGetDisplayModeProperties2KHR,
-    'vkGetDisplayPlaneCapabilities2KHR':_wrap_vkGetDisplayPlaneCapabilities2KHR,
-    'vkCreateIOSSurfaceMVK':_wrap_vkCreateIOSSurfaceMVK,
-    'vkCreateMacOSSurfaceMVK':_wrap_vkCreateMacOSSurfaceMVK,
-    'vkSetDebugUtilsObjectNameEXT':_wrap_vkSetDebugUtilsObjectNameEXT,
-    'vkSetDebugUtilsObjectTagEXT':_wrap_vkSetDebugUtilsObjectTagEXT,
-    'vkQueueBeginDebugUtilsLabelEXT':_wrap_vkQueueBeginDebugUtilsLabelEXT,
-    'vkQueueEndDebugUtilsLabelEXT':_wrap_vkQueueEndDebugUtilsLabelEXT,
-    'vkQueueInsertDebugUtilsLabelEXT':_wrap_vkQueueInsertDebugUtilsLabelEXT,
-    'vkCmdBeginDebugUtilsLabelEXT':_wrap_vkCmdBeginDebugUtilsLabelEXT,
-    'vkCmdEndDebugUtilsLabelEXT':_wrap_vkCmdEndDebugUtilsLabelEXT,
-    'vkCmdInsertDebugUtilsLabelEXT':_wrap_vkCmdInsertDebugUtilsLabelEXT,
-    'vkCreateDebugUtilsMessengerEXT':_wrap_vkCreateDebugUtilsMessengerEXT,
-    'vkDestroyDebugUtilsMessengerEXT':_wrap_vkDestroyDebugUtilsMessengerEXT,
-    'vkSubmitDebugUtilsMessageEXT':_wrap_vkSubmitDebugUtilsMessageEXT,
-    'vkCreateImagePipeSurfaceFUCHSIA':_wrap_vkCreateImagePipeSurfaceFUCHSIA,
-    'vkCreateMetalSurfaceEXT':_wrap_vkCreateMetalSurfaceEXT,
-    'vkCreateHeadlessSurfaceEXT':_wrap_vkCreateHeadlessSurfaceEXT,
-    'vkAcquireDrmDisplayEXT':_wrap_vkAcquireDrmDisplayEXT,
-    'vkGetDrmDisplayEXT':_wrap_vkGetDrmDisplayEXT,
-    'vkCreateDirectFBSurfaceEXT':_wrap_vkCreateDirectFBSurfaceEXT,
-    'vkGetPhysicalDeviceDirectFBPresentationSupportEXT':_wrap_vkGetPhysicalDeviceDirectFBPresentationSupportEXT,
-    'vkCreateScreenSurfaceQNX':_wrap_vkCreateScreenSurfaceQNX,
-    'vkGetPhysicalDeviceScreenPresentationSupportQNX':_wrap_vkGetPhysicalDeviceScreenPresentationSupportQNX,
-    'vkCreateSwapchainKHR':_wrap_vkCreateSwapchainKHR,
-    'vkDestroySwapchainKHR':_wrap_vkDestroySwapchainKHR,
-    'vkGetSwapchainImagesKHR':_wrap_vkGetSwapchainImagesKHR,
-    'vkAcquireNextImageKHR':_wrap_vkAcquireNextImageKHR,
-    'vkQueuePresentKHR':_wrap_vkQueuePresentKHR,
-    'vkGetDeviceGroupPresentCapabilitiesKHR':_wrap_vkGetDeviceGroupPresentCapabilitiesKHR,
-    'vkGetDeviceGroupSurfacePresentModesKHR':_wrap_vkGetDeviceGroupSurfacePresentModesKHR,
-    'vkGetPhysicalDevicePresentRectanglesKHR':_wrap_vkGetPhysicalDevicePresentRectanglesKHR,
-    'vkAcquireNextImage2KHR':_wrap_vkAcquireNextImage2KHR,
-    'vkCreateSharedSwapchainsKHR':_wrap_vkCreateSharedSwapchainsKHR,
-    'vkGetSwapchainGrallocUsageANDROID':_wrap_vkGetSwapchainGrallocUsageANDROID,
-    'vkAcquireImageANDROID':_wrap_vkAcquireImageANDROID,
-    'vkQueueSignalReleaseImageANDROID':_wrap_vkQueueSignalReleaseImageANDROID,
-    'vkGetSwapchainGrallocUsage2ANDROID':_wrap_vkGetSwapchainGrallocUsage2ANDROID,
-    'vkDebugMarkerSetObjectTagEXT':_wrap_vkDebugMarkerSetObjectTagEXT,
-    'vkDebugMarkerSetObjectNameEXT':_wrap_vkDebugMarkerSetObjectNameEXT,
-    'vkCmdDebugMarkerBeginEXT':_wrap_vkCmdDebugMarkerBeginEXT,
-    'vkCmdDebugMarkerEndEXT':_wrap_vkCmdDebugMarkerEndEXT,
-    'vkCmdDebugMarkerInsertEXT':_wrap_vkCmdDebugMarkerInsertEXT,
-    'vkGetPhysicalDeviceVideoCapabilitiesKHR':_wrap_vkGetPhysicalDeviceVideoCapabilitiesKHR,
-    'vkGetPhysicalDeviceVideoFormatPropertiesKHR':_wrap_vkGetPhysicalDeviceVideoFormatPropertiesKHR,
-    'vkCreateVideoSessionKHR':_wrap_vkCreateVideoSessionKHR,
-    'vkDestroyVideoSessionKHR':_wrap_vkDestroyVideoSessionKHR,
-    'vkGetVideoSessionMemoryRequirementsKHR':_wrap_vkGetVideoSessionMemoryRequirementsKHR,
-    'vkBindVideoSessionMemoryKHR':_wrap_vkBindVideoSessionMemoryKHR,
-    'vkCreateVideoSessionParametersKHR':_wrap_vkCreateVideoSessionParametersKHR,
-    'vkUpdateVideoSessionParametersKHR':_wrap_vkUpdateVideoSessionParametersKHR,
-    'vkDestroyVideoSessionParametersKHR':_wrap_vkDestroyVideoSessionParametersKHR,
-    'vkCmdBeginVideoCodingKHR':_wrap_vkCmdBeginVideoCodingKHR,
-    'vkCmdEndVideoCodingKHR':_wrap_vkCmdEndVideoCodingKHR,
-    'vkCmdControlVideoCodingKHR':_wrap_vkCmdControlVideoCodingKHR,
-    'vkCmdDecodeVideoKHR':_wrap_vkCmdDecodeVideoKHR,
-    'vkCmdBindTransformFeedbackBuffersEXT':_wrap_vkCmdBindTransformFeedbackBuffersEXT,
-    'vkCmdBeginTransformFeedbackEXT':_wrap_vkCmdBeginTransformFeedbackEXT,
-    'vkCmdEndTransformFeedbackEXT':_wrap_vkCmdEndTransformFeedbackEXT,
-    'vkCmdBeginQueryIndexedEXT':_wrap_vkCmdBeginQueryIndexedEXT,
-    'vkCmdEndQueryIndexedEXT':_wrap_vkCmdEndQueryIndexedEXT,
-    'vkCmdDrawIndirectByteCountEXT':_wrap_vkCmdDrawIndirectByteCountEXT,
-    'vkCreateCuModuleNVX':_wrap_vkCreateCuModuleNVX,
-    'vkCreateCuFunctionNVX':_wrap_vkCreateCuFunctionNVX,
-    'vkDestroyCuModuleNVX':_wrap_vkDestroyCuModuleNVX,
-    'vkDestroyCuFunctionNVX':_wrap_vkDestroyCuFunctionNVX,
-    'vkCmdCuLaunchKernelNVX':_wrap_vkCmdCuLaunchKernelNVX,
-    'vkGetImageViewHandleNVX':_wrap_vkGetImageViewHandleNVX,
-    'vkGetImageViewAddressNVX':_wrap_vkGetImageViewAddressNVX,
-    'vkCmdDrawIndirectCountAMD':_wrap_vkCmdDrawIndirectCount,
-    'vkCmdDrawIndexedIndirectCountAMD':_wrap_vkCmdDrawIndexedIndirectCount,
-    'vkGetShaderInfoAMD':_wrap_vkGetShaderInfoAMD,
-    'vkCmdBeginRenderingKHR':_wrap_vkCmdBeginRendering,
-    'vkCmdEndRenderingKHR':_wrap_vkCmdEndRendering,
-    'vkGetMemoryWin32HandleNV':_wrap_vkGetMemoryWin32HandleNV,
-    'vkGetDeviceGroupPeerMemoryFeaturesKHR':_wrap_vkGetDeviceGroupPeerMemoryFeatures,
-    'vkCmdSetDeviceMaskKHR':_wrap_vkCmdSetDeviceMask,
-    'vkCmdDispatchBaseKHR':_wrap_vkCmdDispatchBase,
-    'vkTrimCommandPoolKHR':_wrap_vkTrimCommandPool,
-    'vkGetMemoryWin32HandleKHR':_wrap_vkGetMemoryWin32HandleKHR,
-    'vkGetMemoryWin32HandlePropertiesKHR':_wrap_vkGetMemoryWin32HandlePropertiesKHR,
-    'vkGetMemoryFdKHR':_wrap_vkGetMemoryFdKHR,
-    'vkGetMemoryFdPropertiesKHR':_wrap_vkGetMemoryFdPropertiesKHR,
-    'vkImportSemaphoreWin32HandleKHR':_wrap_vkImportSemaphoreWin32HandleKHR,
-    'vkGetSemaphoreWin32HandleKHR':_wrap_vkGetSemaphoreWin32HandleKHR,
-    'vkImportSemaphoreFdKHR':_wrap_vkImportSemaphoreFdKHR,
-    'vkGetSemaphoreFdKHR':_wrap_vkGetSemaphoreFdKHR,
-    'vkCmdPushDescriptorSetKHR':_wrap_vkCmdPushDescriptorSetKHR,
-    'vkCmdPushDescriptorSetWithTemplateKHR':_wrap_vkCmdPushDescriptorSetWithTemplateKHR,
-    'vkCmdBeginConditionalRenderingEXT':_wrap_vkCmdBeginConditionalRenderingEXT,
-    'vkCmdEndConditionalRenderingEXT':_wrap_vkCmdEndConditionalRenderingEXT,
-    'vkCreateDescriptorUpdateTemplateKHR':_wrap_vkCreateDescriptorUpdateTemplate,
-    'vkDestroyDescriptorUpdateTemplateKHR':_wrap_vkDestroyDescriptorUpdateTemplate,
-    'vkUpdateDescriptorSetWithTemplateKHR':_wrap_vkUpdateDescriptorSetWithTemplate,
-    'vkCmdSetViewportWScalingNV':_wrap_vkCmdSetViewportWScalingNV,
-    'vkDisplayPowerControlEXT':_wrap_vkDisplayPowerControlEXT,
-    'vkRegisterDeviceEventEXT':_wrap_vkRegisterDeviceEventEXT,
-    'vkRegisterDisplayEventEXT':_wrap_vkRegisterDisplayEventEXT,
-    'vkGetSwapchainCounterEXT':_wrap_vkGetSwapchainCounterEXT,
-    'vkGetRefreshCycleDurationGOOGLE':_wrap_vkGetRefreshCycleDurationGOOGLE,
-    'vkGetPastPresentationTimingGOOGLE':_wrap_vkGetPastPresentationTimingGOOGLE,
-    'vkCmdSetDiscardRectangleEXT':_wrap_vkCmdSetDiscardRectangleEXT,
-    'vkCmdSetDiscardRectangleEnableEXT':_wrap_vkCmdSetDiscardRectangleEnableEXT,
-    'vkCmdSetDiscardRectangleModeEXT':_wrap_vkCmdSetDiscardRectangleModeEXT,
-    'vkSetHdrMetadataEXT':_wrap_vkSetHdrMetadataEXT,
-    'vkCreateRenderPass2KHR':_wrap_vkCreateRenderPass2,
-    'vkCmdBeginRenderPass2KHR':_wrap_vkCmdBeginRenderPass2,
-    'vkCmdNextSubpass2KHR':_wrap_vkCmdNextSubpass2,
-    'vkCmdEndRenderPass2KHR':_wrap_vkCmdEndRenderPass2,
-    'vkGetSwapchainStatusKHR':_wrap_vkGetSwapchainStatusKHR,
-    'vkImportFenceWin32HandleKHR':_wrap_vkImportFenceWin32HandleKHR,
-    'vkGetFenceWin32HandleKHR':_wrap_vkGetFenceWin32HandleKHR,
-    'vkImportFenceFdKHR':_wrap_vkImportFenceFdKHR,
-    'vkGetFenceFdKHR':_wrap_vkGetFenceFdKHR,
-    'vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR':_wrap_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR,
-    'vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR':_wrap_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR,
-    'vkAcquireProfilingLockKHR':_wrap_vkAcquireProfilingLockKHR,
-    'vkReleaseProfilingLockKHR':_wrap_vkReleaseProfilingLockKHR,
-    'vkGetAndroidHardwareBufferPropertiesANDROID':_wrap_vkGetAndroidHardwareBufferPropertiesANDROID,
-    'vkGetMemoryAndroidHardwareBufferANDROID':_wrap_vkGetMemoryAndroidHardwareBufferANDROID,
-    'vkCreateExecutionGraphPipelinesAMDX':_wrap_vkCreateExecutionGraphPipelinesAMDX,
-    'vkGetExecutionGraphPipelineScratchSizeAMDX':_wrap_vkGetExecutionGraphPipelineScratchSizeAMDX,
-    'vkGetExecutionGraphPipelineNodeIndexAMDX':_wrap_vkGetExecutionGraphPipelineNodeIndexAMDX,
-    'vkCmdInitializeGraphScratchMemoryAMDX':_wrap_vkCmdInitializeGraphScratchMemoryAMDX,
-    'vkCmdDispatchGraphAMDX':_wrap_vkCmdDispatchGraphAMDX,
-    'vkCmdDispatchGraphIndirectAMDX':_wrap_vkCmdDispatchGraphIndirectAMDX,
-    'vkCmdDispatchGraphIndirectCountAMDX':_wrap_vkCmdDispatchGraphIndirectCountAMDX,
-    'vkCmdSetSampleLocationsEXT':_wrap_vkCmdSetSampleLocationsEXT,
-    'vkGetPhysicalDeviceMultisamplePropertiesEXT':_wrap_vkGetPhysicalDeviceMultisamplePropertiesEXT,
-    'vkGetImageMemoryRequirements2KHR':_wrap_vkGetImageMemoryRequirements2,
-    'vkGetBufferMemoryRequirements2KHR':_wrap_vkGetBufferMemoryRequirements2,
-    'vkGetImageSparseMemoryRequirements2KHR':_wrap_vkGetImageSparseMemoryRequirements2,
-    'vkCreateAccelerationStructureKHR':_wrap_vkCreateAccelerationStructureKHR,
-    'vkDestroyAccelerationStructureKHR':_wrap_vkDestroyAccelerationStructureKHR,
-    'vkCmdBuildAccelerationStructuresKHR':_wrap_vkCmdBuildAccelerationStructuresKHR,
-    'vkCmdBuildAccelerationStructuresIndirectKHR':_wrap_vkCmdBuildAccelerationStructuresIndirectKHR,
-    'vkBuildAccelerationStructuresKHR':_wrap_vkBuildAccelerationStructuresKHR,
-    'vkCopyAccelerationStructureKHR':_wrap_vkCopyAccelerationStructureKHR,
-    'vkCopyAccelerationStructureToMemoryKHR':_wrap_vkCopyAccelerationStructureToMemoryKHR,
-    'vkCopyMemoryToAccelerationStructureKHR':_wrap_vkCopyMemoryToAccelerationStructureKHR,
-    'vkWriteAccelerationStructuresPropertiesKHR':_wrap_vkWriteAccelerationStructuresPropertiesKHR,
-    'vkCmdCopyAccelerationStructureKHR':_wrap_vkCmdCopyAccelerationStructureKHR,
-    'vkCmdCopyAccelerationStructureToMemoryKHR':_wrap_vkCmdCopyAccelerationStructureToMemoryKHR,
-    'vkCmdCopyMemoryToAccelerationStructureKHR':_wrap_vkCmdCopyMemoryToAccelerationStructureKHR,
-    'vkGetAccelerationStructureDeviceAddressKHR':_wrap_vkGetAccelerationStructureDeviceAddressKHR,
-    'vkCmdWriteAccelerationStructuresPropertiesKHR':_wrap_vkCmdWriteAccelerationStructuresPropertiesKHR,
-    'vkGetDeviceAccelerationStructureCompatibilityKHR':_wrap_vkGetDeviceAccelerationStructureCompatibilityKHR,
-    'vkGetAccelerationStructureBuildSizesKHR':_wrap_vkGetAccelerationStructureBuildSizesKHR,
-    'vkCmdTraceRaysKHR':_wrap_vkCmdTraceRaysKHR,
-    'vkCreateRayTracingPipelinesKHR':_wrap_vkCreateRayTracingPipelinesKHR,
-    'vkGetRayTracingShaderGroupHandlesKHR':_wrap_vkGetRayTracingShaderGroupHandlesKHR,
-    'vkGetRayTracingCaptureReplayShaderGroupHandlesKHR':_wrap_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR,
-    'vkCmdTraceRaysIndirectKHR':_wrap_vkCmdTraceRaysIndirectKHR,
-    'vkGetRayTracingShaderGroupStackSizeKHR':_wrap_vkGetRayTracingShaderGroupStackSizeKHR,
-    'vkCmdSetRayTracingPipelineStackSizeKHR':_wrap_vkCmdSetRayTracingPipelineStackSizeKHR,
-    'vkCreateSamplerYcbcrConversionKHR':_wrap_vkCreateSamplerYcbcrConversion,
-    'vkDestroySamplerYcbcrConversionKHR':_wrap_vkDestroySamplerYcbcrConversion,
-    'vkBindBufferMemory2KHR':_wrap_vkBindBufferMemory2,
-    'vkBindImageMemory2KHR':_wrap_vkBindImageMemory2,
-    'vkGetImageDrmFormatModifierPropertiesEXT':_wrap_vkGetImageDrmFormatModifierPropertiesEXT,
-    'vkCreateValidationCacheEXT':_wrap_vkCreateValidationCacheEXT,
-    'vkDestroyValidationCacheEXT':_wrap_vkDestroyValidationCacheEXT,
-    'vkMergeValidationCachesEXT':_wrap_vkMergeValidationCachesEXT,
-    'vkGetValidationCacheDataEXT':_wrap_vkGetValidationCacheDataEXT,
-    'vkCmdBindShadingRateImageNV':_wrap_vkCmdBindShadingRateImageNV,
-    'vkCmdSetViewportShadingRatePaletteNV':_wrap_vkCmdSetViewportShadingRatePaletteNV,
-    'vkCmdSetCoarseSampleOrderNV':_wrap_vkCmdSetCoarseSampleOrderNV,
-    'vkCreateAccelerationStructureNV':_wrap_vkCreateAccelerationStructureNV,
-    'vkDestroyAccelerationStructureNV':_wrap_vkDestroyAccelerationStructureNV,
-    'vkGetAccelerationStructureMemoryRequirementsNV':_wrap_vkGetAccelerationStructureMemoryRequirementsNV,
-    'vkBindAccelerationStructureMemoryNV':_wrap_vkBindAccelerationStructureMemoryNV,
-    'vkCmdBuildAccelerationStructureNV':_wrap_vkCmdBuildAccelerationStructureNV,
-    'vkCmdCopyAccelerationStructureNV':_wrap_vkCmdCopyAccelerationStructureNV,
-    'vkCmdTraceRaysNV':_wrap_vkCmdTraceRaysNV,
-    'vkCreateRayTracingPipelinesNV':_wrap_vkCreateRayTracingPipelinesNV,
-    'vkGetRayTracingShaderGroupHandlesNV':_wrap_vkGetRayTracingShaderGroupHandlesKHR,
-    'vkGetAccelerationStructureHandleNV':_wrap_vkGetAccelerationStructureHandleNV,
-    'vkCmdWriteAccelerationStructuresPropertiesNV':_wrap_vkCmdWriteAccelerationStructuresPropertiesNV,
-    'vkCompileDeferredNV':_wrap_vkCompileDeferredNV,
-    'vkGetDescriptorSetLayoutSupportKHR':_wrap_vkGetDescriptorSetLayoutSupport,
-    'vkCmdDrawIndirectCountKHR':_wrap_vkCmdDrawIndirectCount,
-    'vkCmdDrawIndexedIndirectCountKHR':_wrap_vkCmdDrawIndexedIndirectCount,
-    'vkGetMemoryHostPointerPropertiesEXT':_wrap_vkGetMemoryHostPointerPropertiesEXT,
-    'vkCmdWriteBufferMarkerAMD':_wrap_vkCmdWriteBufferMarkerAMD,
-    'vkGetPhysicalDeviceCalibrateableTimeDomainsEXT':_wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR,
-    'vkGetCalibratedTimestampsEXT':_wrap_vkGetCalibratedTimestampsKHR,
-    'vkCmdDrawMeshTasksNV':_wrap_vkCmdDrawMeshTasksNV,
-    'vkCmdDrawMeshTasksIndirectNV':_wrap_vkCmdDrawMeshTasksIndirectNV,
-    'vkCmdDrawMeshTasksIndirectCountNV':_wrap_vkCmdDrawMeshTasksIndirectCountNV,
-    'vkCmdSetExclusiveScissorEnableNV':_wrap_vkCmdSetExclusiveScissorEnableNV,
-    'vkCmdSetExclusiveScissorNV':_wrap_vkCmdSetExclusiveScissorNV,
-    'vkCmdSetCheckpointNV':_wrap_vkCmdSetCheckpointNV,
-    'vkGetQueueCheckpointDataNV':_wrap_vkGetQueueCheckpointDataNV,
-    'vkGetSemaphoreCounterValueKHR':_wrap_vkGetSemaphoreCounterValue,
-    'vkWaitSemaphoresKHR':_wrap_vkWaitSemaphores,
-    'vkSignalSemaphoreKHR':_wrap_vkSignalSemaphore,
-    'vkInitializePerformanceApiINTEL':_wrap_vkInitializePerformanceApiINTEL,
-    'vkUninitializePerformanceApiINTEL':_wrap_vkUninitializePerformanceApiINTEL,
-    'vkCmdSetPerformanceMarkerINTEL':_wrap_vkCmdSetPerformanceMarkerINTEL,
-    'vkCmdSetPerformanceStreamMarkerINTEL':_wrap_vkCmdSetPerformanceStreamMarkerINTEL,
-    'vkCmdSetPerformanceOverrideINTEL':_wrap_vkCmdSetPerformanceOverrideINTEL,
-    'vkAcquirePerformanceConfigurationINTEL':_wrap_vkAcquirePerformanceConfigurationINTEL,
-    'vkReleasePerformanceConfigurationINTEL':_wrap_vkReleasePerformanceConfigurationINTEL,
-    'vkQueueSetPerformanceConfigurationINTEL':_wrap_vkQueueSetPerformanceConfigurationINTEL,
-    'vkGetPerformanceParameterINTEL':_wrap_vkGetPerformanceParameterINTEL,
-    'vkSetLocalDimmingAMD':_wrap_vkSetLocalDimmingAMD,
-    'vkGetPhysicalDeviceFragmentShadingRatesKHR':_wrap_vkGetPhysicalDeviceFragmentShadingRatesKHR,
-    'vkCmdSetFragmentShadingRateKHR':_wrap_vkCmdSetFragmentShadingRateKHR,
-    'vkGetBufferDeviceAddressEXT':_wrap_vkGetBufferDeviceAddress,
-    'vkGetPhysicalDeviceToolPropertiesEXT':_wrap_vkGetPhysicalDeviceToolProperties,
-    'vkWaitForPresentKHR':_wrap_vkWaitForPresentKHR,
-    'vkGetPhysicalDeviceCooperativeMatrixPropertiesNV':_wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV,
-    'vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV':_wrap_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV,
-    'vkGetPhysicalDeviceSurfacePresentModes2EXT':_wrap_vkGetPhysicalDeviceSurfacePresentModes2EXT,
-    'vkAcquireFullScreenExclusiveModeEXT':_wrap_vkAcquireFullScreenExclusiveModeEXT,
-    'vkReleaseFullScreenExclusiveModeEXT':_wrap_vkReleaseFullScreenExclusiveModeEXT,
-    'vkGetDeviceGroupSurfacePresentModes2EXT':_wrap_vkGetDeviceGroupSurfacePresentModes2EXT,
-    'vkGetBufferDeviceAddressKHR':_wrap_vkGetBufferDeviceAddress,
-    'vkGetBufferOpaqueCaptureAddressKHR':_wrap_vkGetBufferOpaqueCaptureAddress,
-    'vkGetDeviceMemoryOpaqueCaptureAddressKHR':_wrap_vkGetDeviceMemoryOpaqueCaptureAddress,
-    'vkCmdSetLineStippleEXT':_wrap_vkCmdSetLineStippleEXT,
-    'vkResetQueryPoolEXT':_wrap_vkResetQueryPool,
-    'vkCmdSetCullModeEXT':_wrap_vkCmdSetCullMode,
-    'vkCmdSetFrontFaceEXT':_wrap_vkCmdSetFrontFace,
-    'vkCmdSetPrimitiveTopologyEXT':_wrap_vkCmdSetPrimitiveTopology,
-    'vkCmdSetViewportWithCountEXT':_wrap_vkCmdSetViewportWithCount,
-    'vkCmdSetScissorWithCountEXT':_wrap_vkCmdSetScissorWithCount,
-    'vkCmdBindVertexBuffers2EXT':_wrap_vkCmdBindVertexBuffers2,
-    'vkCmdSetDepthTestEnableEXT':_wrap_vkCmdSetDepthTestEnable,
-    'vkCmdSetDepthWriteEnableEXT':_wrap_vkCmdSetDepthWriteEnable,
-    'vkCmdSetDepthCompareOpEXT':_wrap_vkCmdSetDepthCompareOp,
-    'vkCmdSetDepthBoundsTestEnableEXT':_wrap_vkCmdSetDepthBoundsTestEnable,
-    'vkCmdSetStencilTestEnableEXT':_wrap_vkCmdSetStencilTestEnable,
-    'vkCmdSetStencilOpEXT':_wrap_vkCmdSetStencilOp,
-    'vkCreateDeferredOperationKHR':_wrap_vkCreateDeferredOperationKHR,
-    'vkDestroyDeferredOperationKHR':_wrap_vkDestroyDeferredOperationKHR,
-    'vkGetDeferredOperationMaxConcurrencyKHR':_wrap_vkGetDeferredOperationMaxConcurrencyKHR,
-    'vkGetDeferredOperationResultKHR':_wrap_vkGetDeferredOperationResultKHR,
-    'vkDeferredOperationJoinKHR':_wrap_vkDeferredOperationJoinKHR,
-    'vkGetPipelineExecutablePropertiesKHR':_wrap_vkGetPipelineExecutablePropertiesKHR,
-    'vkGetPipelineExecutableStatisticsKHR':_wrap_vkGetPipelineExecutableStatisticsKHR,
-    'vkGetPipelineExecutableInternalRepresentationsKHR':_wrap_vkGetPipelineExecutableInternalRepresentationsKHR,
-    'vkCopyMemoryToImageEXT':_wrap_vkCopyMemoryToImageEXT,
-    'vkCopyImageToMemoryEXT':_wrap_vkCopyImageToMemoryEXT,
-    'vkCopyImageToImageEXT':_wrap_vkCopyImageToImageEXT,
-    'vkTransitionImageLayoutEXT':_wrap_vkTransitionImageLayoutEXT,
-    'vkGetImageSubresourceLayout2EXT':_wrap_vkGetImageSubresourceLayout2KHR,
-    'vkMapMemory2KHR':_wrap_vkMapMemory2KHR,
-    'vkUnmapMemory2KHR':_wrap_vkUnmapMemory2KHR,
-    'vkReleaseSwapchainImagesEXT':_wrap_vkReleaseSwapchainImagesEXT,
-    'vkGetGeneratedCommandsMemoryRequirementsNV':_wrap_vkGetGeneratedCommandsMemoryRequirementsNV,
-    'vkCmdPreprocessGeneratedCommandsNV':_wrap_vkCmdPreprocessGeneratedCommandsNV,
-    'vkCmdExecuteGeneratedCommandsNV':_wrap_vkCmdExecuteGeneratedCommandsNV,
-    'vkCmdBindPipelineShaderGroupNV':_wrap_vkCmdBindPipelineShaderGroupNV,
-    'vkCreateIndirectCommandsLayoutNV':_wrap_vkCreateIndirectCommandsLayoutNV,
-    'vkDestroyIndirectCommandsLayoutNV':_wrap_vkDestroyIndirectCommandsLayoutNV,
-    'vkCmdSetDepthBias2EXT':_wrap_vkCmdSetDepthBias2EXT,
-    'vkCreatePrivateDataSlotEXT':_wrap_vkCreatePrivateDataSlot,
-    'vkDestroyPrivateDataSlotEXT':_wrap_vkDestroyPrivateDataSlot,
-    'vkSetPrivateDataEXT':_wrap_vkSetPrivateData,
-    'vkGetPrivateDataEXT':_wrap_vkGetPrivateData,
-    'vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR':_wrap_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR,
-    'vkGetEncodedVideoSessionParametersKHR':_wrap_vkGetEncodedVideoSessionParametersKHR,
-    'vkCmdEncodeVideoKHR':_wrap_vkCmdEncodeVideoKHR,
-    'vkCreateCudaModuleNV':_wrap_vkCreateCudaModuleNV,
-    'vkGetCudaModuleCacheNV':_wrap_vkGetCudaModuleCacheNV,
-    'vkCreateCudaFunctionNV':_wrap_vkCreateCudaFunctionNV,
-    'vkDestroyCudaModuleNV':_wrap_vkDestroyCudaModuleNV,
-    'vkDestroyCudaFunctionNV':_wrap_vkDestroyCudaFunctionNV,
-    'vkCmdCudaLaunchKernelNV':_wrap_vkCmdCudaLaunchKernelNV,
-    'vkCmdRefreshObjectsKHR':_wrap_vkCmdRefreshObjectsKHR,
-    'vkGetPhysicalDeviceRefreshableObjectTypesKHR':_wrap_vkGetPhysicalDeviceRefreshableObjectTypesKHR,
-    'vkExportMetalObjectsEXT':_wrap_vkExportMetalObjectsEXT,
-    'vkCmdSetEvent2KHR':_wrap_vkCmdSetEvent2,
-    'vkCmdResetEvent2KHR':_wrap_vkCmdResetEvent2,
-    'vkCmdWaitEvents2KHR':_wrap_vkCmdWaitEvents2,
-    'vkCmdPipelineBarrier2KHR':_wrap_vkCmdPipelineBarrier2,
-    'vkCmdWriteTimestamp2KHR':_wrap_vkCmdWriteTimestamp2,
-    'vkQueueSubmit2KHR':_wrap_vkQueueSubmit2,
-    'vkCmdWriteBufferMarker2AMD':_wrap_vkCmdWriteBufferMarker2AMD,
-    'vkGetQueueCheckpointData2NV':_wrap_vkGetQueueCheckpointData2NV,
-    'vkGetDescriptorSetLayoutSizeEXT':_wrap_vkGetDescriptorSetLayoutSizeEXT,
-    'vkGetDescriptorSetLayoutBindingOffsetEXT':_wrap_vkGetDescriptorSetLayoutBindingOffsetEXT,
-    'vkGetDescriptorEXT':_wrap_vkGetDescriptorEXT,
-    'vkCmdBindDescriptorBuffersEXT':_wrap_vkCmdBindDescriptorBuffersEXT,
-    'vkCmdSetDescriptorBufferOffsetsEXT':_wrap_vkCmdSetDescriptorBufferOffsetsEXT,
-    'vkCmdBindDescriptorBufferEmbeddedSamplersEXT':_wrap_vkCmdBindDescriptorBufferEmbeddedSamplersEXT,
-    'vkGetBufferOpaqueCaptureDescriptorDataEXT':_wrap_vkGetBufferOpaqueCaptureDescriptorDataEXT,
-    'vkGetImageOpaqueCaptureDescriptorDataEXT':_wrap_vkGetImageOpaqueCaptureDescriptorDataEXT,
-    'vkGetImageViewOpaqueCaptureDescriptorDataEXT':_wrap_vkGetImageViewOpaqueCaptureDescriptorDataEXT,
-    'vkGetSamplerOpaqueCaptureDescriptorDataEXT':_wrap_vkGetSamplerOpaqueCaptureDescriptorDataEXT,
-    'vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT':_wrap_vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT,
-    'vkCmdSetFragmentShadingRateEnumNV':_wrap_vkCmdSetFragmentShadingRateEnumNV,
-    'vkCmdDrawMeshTasksEXT':_wrap_vkCmdDrawMeshTasksEXT,
-    'vkCmdDrawMeshTasksIndirectEXT':_wrap_vkCmdDrawMeshTasksIndirectEXT,
-    'vkCmdDrawMeshTasksIndirectCountEXT':_wrap_vkCmdDrawMeshTasksIndirectCountEXT,
-    'vkCmdCopyBuffer2KHR':_wrap_vkCmdCopyBuffer2,
-    'vkCmdCopyImage2KHR':_wrap_vkCmdCopyImage2,
-    'vkCmdCopyBufferToImage2KHR':_wrap_vkCmdCopyBufferToImage2,
-    'vkCmdCopyImageToBuffer2KHR':_wrap_vkCmdCopyImageToBuffer2,
-    'vkCmdBlitImage2KHR':_wrap_vkCmdBlitImage2,
-    'vkCmdResolveImage2KHR':_wrap_vkCmdResolveImage2,
-    'vkGetDeviceFaultInfoEXT':_wrap_vkGetDeviceFaultInfoEXT,
-    'vkAcquireWinrtDisplayNV':_wrap_vkAcquireWinrtDisplayNV,
-    'vkGetWinrtDisplayNV':_wrap_vkGetWinrtDisplayNV,
-    'vkCmdSetVertexInputEXT':_wrap_vkCmdSetVertexInputEXT,
-    'vkGetMemoryZirconHandleFUCHSIA':_wrap_vkGetMemoryZirconHandleFUCHSIA,
-    'vkGetMemoryZirconHandlePropertiesFUCHSIA':_wrap_vkGetMemoryZirconHandlePropertiesFUCHSIA,
-    'vkImportSemaphoreZirconHandleFUCHSIA':_wrap_vkImportSemaphoreZirconHandleFUCHSIA,
-    'vkGetSemaphoreZirconHandleFUCHSIA':_wrap_vkGetSemaphoreZirconHandleFUCHSIA,
-    'vkCreateBufferCollectionFUCHSIA':_wrap_vkCreateBufferCollectionFUCHSIA,
-    'vkSetBufferCollectionImageConstraintsFUCHSIA':_wrap_vkSetBufferCollectionImageConstraintsFUCHSIA,
-    'vkSetBufferCollectionBufferConstraintsFUCHSIA':_wrap_vkSetBufferCollectionBufferConstraintsFUCHSIA,
-    'vkDestroyBufferCollectionFUCHSIA':_wrap_vkDestroyBufferCollectionFUCHSIA,
-    'vkGetBufferCollectionPropertiesFUCHSIA':_wrap_vkGetBufferCollectionPropertiesFUCHSIA,
-    'vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI':_wrap_vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI,
-    'vkCmdSubpassShadingHUAWEI':_wrap_vkCmdSubpassShadingHUAWEI,
-    'vkCmdBindInvocationMaskHUAWEI':_wrap_vkCmdBindInvocationMaskHUAWEI,
-    'vkGetMemoryRemoteAddressNV':_wrap_vkGetMemoryRemoteAddressNV,
-    'vkGetPipelinePropertiesEXT':_wrap_vkGetPipelinePropertiesEXT,
-    'vkGetFenceSciSyncFenceNV':_wrap_vkGetFenceSciSyncFenceNV,
-    'vkGetFenceSciSyncObjNV':_wrap_vkGetFenceSciSyncObjNV,
-    'vkImportFenceSciSyncFenceNV':_wrap_vkImportFenceSciSyncFenceNV,
-    'vkImportFenceSciSyncObjNV':_wrap_vkImportFenceSciSyncObjNV,
-    'vkGetPhysicalDeviceSciSyncAttributesNV':_wrap_vkGetPhysicalDeviceSciSyncAttributesNV,
-    'vkGetSemaphoreSciSyncObjNV':_wrap_vkGetSemaphoreSciSyncObjNV,
-    'vkImportSemaphoreSciSyncObjNV':_wrap_vkImportSemaphoreSciSyncObjNV,
-    'vkGetMemorySciBufNV':_wrap_vkGetMemorySciBufNV,
-    'vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV':_wrap_vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV,
-    'vkGetPhysicalDeviceSciBufAttributesNV':_wrap_vkGetPhysicalDeviceSciBufAttributesNV,
-    'vkCmdSetPatchControlPointsEXT':_wrap_vkCmdSetPatchControlPointsEXT,
-    'vkCmdSetRasterizerDiscardEnableEXT':_wrap_vkCmdSetRasterizerDiscardEnable,
-    'vkCmdSetDepthBiasEnableEXT':_wrap_vkCmdSetDepthBiasEnable,
-    'vkCmdSetLogicOpEXT':_wrap_vkCmdSetLogicOpEXT,
-    'vkCmdSetPrimitiveRestartEnableEXT':_wrap_vkCmdSetPrimitiveRestartEnable,
-    'vkCmdSetColorWriteEnableEXT':_wrap_vkCmdSetColorWriteEnableEXT,
-    'vkCmdTraceRaysIndirect2KHR':_wrap_vkCmdTraceRaysIndirect2KHR,
-    'vkCmdDrawMultiEXT':_wrap_vkCmdDrawMultiEXT,
-    'vkCmdDrawMultiIndexedEXT':_wrap_vkCmdDrawMultiIndexedEXT,
-    'vkCreateMicromapEXT':_wrap_vkCreateMicromapEXT,
-    'vkDestroyMicromapEXT':_wrap_vkDestroyMicromapEXT,
-    'vkCmdBuildMicromapsEXT':_wrap_vkCmdBuildMicromapsEXT,
-    'vkBuildMicromapsEXT':_wrap_vkBuildMicromapsEXT,
-    'vkCopyMicromapEXT':_wrap_vkCopyMicromapEXT,
-    'vkCopyMicromapToMemoryEXT':_wrap_vkCopyMicromapToMemoryEXT,
-    'vkCopyMemoryToMicromapEXT':_wrap_vkCopyMemoryToMicromapEXT,
-    'vkWriteMicromapsPropertiesEXT':_wrap_vkWriteMicromapsPropertiesEXT,
-    'vkCmdCopyMicromapEXT':_wrap_vkCmdCopyMicromapEXT,
-    'vkCmdCopyMicromapToMemoryEXT':_wrap_vkCmdCopyMicromapToMemoryEXT,
-    'vkCmdCopyMemoryToMicromapEXT':_wrap_vkCmdCopyMemoryToMicromapEXT,
-    'vkCmdWriteMicromapsPropertiesEXT':_wrap_vkCmdWriteMicromapsPropertiesEXT,
-    'vkGetDeviceMicromapCompatibilityEXT':_wrap_vkGetDeviceMicromapCompatibilityEXT,
-    'vkGetMicromapBuildSizesEXT':_wrap_vkGetMicromapBuildSizesEXT,
-    'vkCmdDrawClusterHUAWEI':_wrap_vkCmdDrawClusterHUAWEI,
-    'vkCmdDrawClusterIndirectHUAWEI':_wrap_vkCmdDrawClusterIndirectHUAWEI,
-    'vkSetDeviceMemoryPriorityEXT':_wrap_vkSetDeviceMemoryPriorityEXT,
-    'vkGetDeviceBufferMemoryRequirementsKHR':_wrap_vkGetDeviceBufferMemoryRequirements,
-    'vkGetDeviceImageMemoryRequirementsKHR':_wrap_vkGetDeviceImageMemoryRequirements,
-    'vkGetDeviceImageSparseMemoryRequirementsKHR':_wrap_vkGetDeviceImageSparseMemoryRequirements,
-    'vkGetDescriptorSetLayoutHostMappingInfoVALVE':_wrap_vkGetDescriptorSetLayoutHostMappingInfoVALVE,
-    'vkGetDescriptorSetHostMappingVALVE':_wrap_vkGetDescriptorSetHostMappingVALVE,
-    'vkCmdCopyMemoryIndirectNV':_wrap_vkCmdCopyMemoryIndirectNV,
-    'vkCmdCopyMemoryToImageIndirectNV':_wrap_vkCmdCopyMemoryToImageIndirectNV,
-    'vkCmdDecompressMemoryNV':_wrap_vkCmdDecompressMemoryNV,
-    'vkCmdDecompressMemoryIndirectCountNV':_wrap_vkCmdDecompressMemoryIndirectCountNV,
-    'vkGetPipelineIndirectMemoryRequirementsNV':_wrap_vkGetPipelineIndirectMemoryRequirementsNV,
-    'vkCmdUpdatePipelineIndirectBufferNV':_wrap_vkCmdUpdatePipelineIndirectBufferNV,
-    'vkGetPipelineIndirectDeviceAddressNV':_wrap_vkGetPipelineIndirectDeviceAddressNV,
-    'vkCmdSetTessellationDomainOriginEXT':_wrap_vkCmdSetTessellationDomainOriginEXT,
-    'vkCmdSetDepthClampEnableEXT':_wrap_vkCmdSetDepthClampEnableEXT,
-    'vkCmdSetPolygonModeEXT':_wrap_vkCmdSetPolygonModeEXT,
-    'vkCmdSetRasterizationSamplesEXT':_wrap_vkCmdSetRasterizationSamplesEXT,
-    'vkCmdSetSampleMaskEXT':_wrap_vkCmdSetSampleMaskEXT,
-    'vkCmdSetAlphaToCoverageEnableEXT':_wrap_vkCmdSetAlphaToCoverageEnableEXT,
-    'vkCmdSetAlphaToOneEnableEXT':_wrap_vkCmdSetAlphaToOneEnableEXT,
-    'vkCmdSetLogicOpEnableEXT':_wrap_vkCmdSetLogicOpEnableEXT,
-    'vkCmdSetColorBlendEnableEXT':_wrap_vkCmdSetColorBlendEnableEXT,
-    'vkCmdSetColorBlendEquationEXT':_wrap_vkCmdSetColorBlendEquationEXT,
-    'vkCmdSetColorWriteMaskEXT':_wrap_vkCmdSetColorWriteMaskEXT,
-    'vkCmdSetRasterizationStreamEXT':_wrap_vkCmdSetRasterizationStreamEXT,
-    'vkCmdSetConservativeRasterizationModeEXT':_wrap_vkCmdSetConservativeRasterizationModeEXT,
-    'vkCmdSetExtraPrimitiveOverestimationSizeEXT':_wrap_vkCmdSetExtraPrimitiveOverestimationSizeEXT,
-    'vkCmdSetDepthClipEnableEXT':_wrap_vkCmdSetDepthClipEnableEXT,
-    'vkCmdSetSampleLocationsEnableEXT':_wrap_vkCmdSetSampleLocationsEnableEXT,
-    'vkCmdSetColorBlendAdvancedEXT':_wrap_vkCmdSetColorBlendAdvancedEXT,
-    'vkCmdSetProvokingVertexModeEXT':_wrap_vkCmdSetProvokingVertexModeEXT,
-    'vkCmdSetLineRasterizationModeEXT':_wrap_vkCmdSetLineRasterizationModeEXT,
-    'vkCmdSetLineStippleEnableEXT':_wrap_vkCmdSetLineStippleEnableEXT,
-    'vkCmdSetDepthClipNegativeOneToOneEXT':_wrap_vkCmdSetDepthClipNegativeOneToOneEXT,
-    'vkCmdSetViewportWScalingEnableNV':_wrap_vkCmdSetViewportWScalingEnableNV,
-    'vkCmdSetViewportSwizzleNV':_wrap_vkCmdSetViewportSwizzleNV,
-    'vkCmdSetCoverageToColorEnableNV':_wrap_vkCmdSetCoverageToColorEnableNV,
-    'vkCmdSetCoverageToColorLocationNV':_wrap_vkCmdSetCoverageToColorLocationNV,
-    'vkCmdSetCoverageModulationModeNV':_wrap_vkCmdSetCoverageModulationModeNV,
-    'vkCmdSetCoverageModulationTableEnableNV':_wrap_vkCmdSetCoverageModulationTableEnableNV,
-    'vkCmdSetCoverageModulationTableNV':_wrap_vkCmdSetCoverageModulationTableNV,
-    'vkCmdSetShadingRateImageEnableNV':_wrap_vkCmdSetShadingRateImageEnableNV,
-    'vkCmdSetRepresentativeFragmentTestEnableNV':_wrap_vkCmdSetRepresentativeFragmentTestEnableNV,
-    'vkCmdSetCoverageReductionModeNV':_wrap_vkCmdSetCoverageReductionModeNV,
-    'vkGetShaderModuleIdentifierEXT':_wrap_vkGetShaderModuleIdentifierEXT,
-    'vkGetShaderModuleCreateInfoIdentifierEXT':_wrap_vkGetShaderModuleCreateInfoIdentifierEXT,
-    'vkGetPhysicalDeviceOpticalFlowImageFormatsNV':_wrap_vkGetPhysicalDeviceOpticalFlowImageFormatsNV,
-    'vkCreateOpticalFlowSessionNV':_wrap_vkCreateOpticalFlowSessionNV,
-    'vkDestroyOpticalFlowSessionNV':_wrap_vkDestroyOpticalFlowSessionNV,
-    'vkBindOpticalFlowSessionImageNV':_wrap_vkBindOpticalFlowSessionImageNV,
-    'vkCmdOpticalFlowExecuteNV':_wrap_vkCmdOpticalFlowExecuteNV,
-    'vkCmdBindIndexBuffer2KHR':_wrap_vkCmdBindIndexBuffer2KHR,
-    'vkGetRenderingAreaGranularityKHR':_wrap_vkGetRenderingAreaGranularityKHR,
-    'vkGetDeviceImageSubresourceLayoutKHR':_wrap_vkGetDeviceImageSubresourceLayoutKHR,
-    'vkGetImageSubresourceLayout2KHR':_wrap_vkGetImageSubresourceLayout2KHR,
-    'vkCreateShadersEXT':_wrap_vkCreateShadersEXT,
-    'vkDestroyShaderEXT':_wrap_vkDestroyShaderEXT,
-    'vkGetShaderBinaryDataEXT':_wrap_vkGetShaderBinaryDataEXT,
-    'vkCmdBindShadersEXT':_wrap_vkCmdBindShadersEXT,
-    'vkGetFramebufferTilePropertiesQCOM':_wrap_vkGetFramebufferTilePropertiesQCOM,
-    'vkGetDynamicRenderingTilePropertiesQCOM':_wrap_vkGetDynamicRenderingTilePropertiesQCOM,
-    'vkCreateSemaphoreSciSyncPoolNV':_wrap_vkCreateSemaphoreSciSyncPoolNV,
-    'vkDestroySemaphoreSciSyncPoolNV':_wrap_vkDestroySemaphoreSciSyncPoolNV,
-    'vkSetLatencySleepModeNV':_wrap_vkSetLatencySleepModeNV,
-    'vkLatencySleepNV':_wrap_vkLatencySleepNV,
-    'vkSetLatencyMarkerNV':_wrap_vkSetLatencyMarkerNV,
-    'vkGetLatencyTimingsNV':_wrap_vkGetLatencyTimingsNV,
-    'vkQueueNotifyOutOfBandNV':_wrap_vkQueueNotifyOutOfBandNV,
-    'vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR':_wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR,
-    'vkCmdSetAttachmentFeedbackLoopEnableEXT':_wrap_vkCmdSetAttachmentFeedbackLoopEnableEXT,
-    'vkGetScreenBufferPropertiesQNX':_wrap_vkGetScreenBufferPropertiesQNX,
-    'vkGetPhysicalDeviceCalibrateableTimeDomainsKHR':_wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR,
-    'vkGetCalibratedTimestampsKHR':_wrap_vkGetCalibratedTimestampsKHR,
-    'vkCmdBindDescriptorSets2KHR':_wrap_vkCmdBindDescriptorSets2KHR,
-    'vkCmdPushConstants2KHR':_wrap_vkCmdPushConstants2KHR,
-    'vkCmdPushDescriptorSet2KHR':_wrap_vkCmdPushDescriptorSet2KHR,
-    'vkCmdPushDescriptorSetWithTemplate2KHR':_wrap_vkCmdPushDescriptorSetWithTemplate2KHR,
-    'vkCmdSetDescriptorBufferOffsets2EXT':_wrap_vkCmdSetDescriptorBufferOffsets2EXT,
-    'vkCmdBindDescriptorBufferEmbeddedSamplers2EXT':_wrap_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT,
-}
 
+def extension_names(properties):
+    """Names of a VkExtensionProperties[] as a frozenset"""
+    return _decode_names(properties, 'extensionName')
 
-_device_ext_funcs = {
-    'vkCreateSwapchainKHR':_wrap_vkCreateSwapchainKHR,
-    'vkDestroySwapchainKHR':_wrap_vkDestroySwapchainKHR,
-    'vkGetSwapchainImagesKHR':_wrap_vkGetSwapchainImagesKHR,
-    'vkAcquireNextImageKHR':_wrap_vkAcquireNextImageKHR,
-    'vkQueuePresentKHR':_wrap_vkQueuePresentKHR,
-    'vkGetDeviceGroupPresentCapabilitiesKHR':_wrap_vkGetDeviceGroupPresentCapabilitiesKHR,
-    'vkGetDeviceGroupSurfacePresentModesKHR':_wrap_vkGetDeviceGroupSurfacePresentModesKHR,
-    'vkGetPhysicalDevicePresentRectanglesKHR':_wrap_vkGetPhysicalDevicePresentRectanglesKHR,
-    'vkAcquireNextImage2KHR':_wrap_vkAcquireNextImage2KHR,
-    'vkCreateSharedSwapchainsKHR':_wrap_vkCreateSharedSwapchainsKHR,
-    'vkGetSwapchainGrallocUsageANDROID':_wrap_vkGetSwapchainGrallocUsageANDROID,
-    'vkAcquireImageANDROID':_wrap_vkAcquireImageANDROID,
-    'vkQueueSignalReleaseImageANDROID':_wrap_vkQueueSignalReleaseImageANDROID,
-    'vkGetSwapchainGrallocUsage2ANDROID':_wrap_vkGetSwapchainGrallocUsage2ANDROID,
-    'vkDebugMarkerSetObjectTagEXT':_wrap_vkDebugMarkerSetObjectTagEXT,
-    'vkDebugMarkerSetObjectNameEXT':_wrap_vkDebugMarkerSetObjectNameEXT,
-    'vkCmdDebugMarkerBeginEXT':_wrap_vkCmdDebugMarkerBeginEXT,
-    'vkCmdDebugMarkerEndEXT':_wrap_vkCmdDebugMarkerEndEXT,
-    'vkCmdDebugMarkerInsertEXT':_wrap_vkCmdDebugMarkerInsertEXT,
-    'vkGetPhysicalDeviceVideoCapabilitiesKHR':_wrap_vkGetPhysicalDeviceVideoCapabilitiesKHR,
-    'vkGetPhysicalDeviceVideoFormatPropertiesKHR':_wrap_vkGetPhysicalDeviceVideoFormatPropertiesKHR,
-    'vkCreateVideoSessionKHR':_wrap_vkCreateVideoSessionKHR,
-    'vkDestroyVideoSessionKHR':_wrap_vkDestroyVideoSessionKHR,
-    'vkGetVideoSessionMemoryRequirementsKHR':_wrap_vkGetVideoSessionMemoryRequirementsKHR,
-    'vkBindVideoSessionMemoryKHR':_wrap_vkBindVideoSessionMemoryKHR,
-    'vkCreateVideoSessionParametersKHR':_wrap_vkCreateVideoSessionParametersKHR,
-    'vkUpdateVideoSessionParametersKHR':_wrap_vkUpdateVideoSessionParametersKHR,
-    'vkDestroyVideoSessionParametersKHR':_wrap_vkDestroyVideoSessionParametersKHR,
-    'vkCmdBeginVideoCodingKHR':_wrap_vkCmdBeginVideoCodingKHR,
-    'vkCmdEndVideoCodingKHR':_wrap_vkCmdEndVideoCodingKHR,
-    'vkCmdControlVideoCodingKHR':_wrap_vkCmdControlVideoCodingKHR,
-    'vkCmdDecodeVideoKHR':_wrap_vkCmdDecodeVideoKHR,
-    'vkCmdBindTransformFeedbackBuffersEXT':_wrap_vkCmdBindTransformFeedbackBuffersEXT,
-    'vkCmdBeginTransformFeedbackEXT':_wrap_vkCmdBeginTransformFeedbackEXT,
-    'vkCmdEndTransformFeedbackEXT':_wrap_vkCmdEndTransformFeedbackEXT,
-    'vkCmdBeginQueryIndexedEXT':_wrap_vkCmdBeginQueryIndexedEXT,
-    'vkCmdEndQueryIndexedEXT':_wrap_vkCmdEndQueryIndexedEXT,
-    'vkCmdDrawIndirectByteCountEXT':_wrap_vkCmdDrawIndirectByteCountEXT,
-    'vkCreateCuModuleNVX':_wrap_vkCreateCuModuleNVX,
-    'vkCreateCuFunctionNVX':_wrap_vkCreateCuFunctionNVX,
-    'vkDestroyCuModuleNVX':_wrap_vkDestroyCuModuleNVX,
-    'vkDestroyCuFunctionNVX':_wrap_vkDestroyCuFunctionNVX,
-    'vkCmdCuLaunchKernelNVX':_wrap_vkCmdCuLaunchKernelNVX,
-    'vkGetImageViewHandleNVX':_wrap_vkGetImageViewHandleNVX,
-    'vkGetImageViewAddressNVX':_wrap_vkGetImageViewAddressNVX,
-    'vkCmdDrawIndirectCountAMD':_wrap_vkCmdDrawIndirectCount,
-    'vkCmdDrawIndexedIndirectCountAMD':_wrap_vkCmdDrawIndexedIndirectCount,
-    'vkGetShaderInfoAMD':_wrap_vkGetShaderInfoAMD,
-    'vkCmdBeginRenderingKHR':_wrap_vkCmdBeginRendering,
-    'vkCmdEndRenderingKHR':_wrap_vkCmdEndRendering,
-    'vkGetMemoryWin32HandleNV':_wrap_vkGetMemoryWin32HandleNV,
-    'vkGetDeviceGroupPeerMemoryFeaturesKHR':_wrap_vkGetDeviceGroupPeerMemoryFeatures,
-    'vkCmdSetDeviceMaskKHR':_wrap_vkCmdSetDeviceMask,
-    'vkCmdDispatchBaseKHR':_wrap_vkCmdDispatchBase,
-    'vkTrimCommandPoolKHR':_wrap_vkTrimCommandPool,
-    'vkGetMemoryWin32HandleKHR':_wrap_vkGetMemoryWin32HandleKHR,
-    'vkGetMemoryWin32HandlePropertiesKHR':_wrap_vkGetMemoryWin32HandlePropertiesKHR,
-    'vkGetMemoryFdKHR':_wrap_vkGetMemoryFdKHR,
-    'vkGetMemoryFdPropertiesKHR':_wrap_vkGetMemoryFdPropertiesKHR,
-    'vkImportSemaphoreWin32HandleKHR':_wrap_vkImportSemaphoreWin32HandleKHR,
-    'vkGetSemaphoreWin32HandleKHR':_wrap_vkGetSemaphoreWin32HandleKHR,
-    'vkImportSemaphoreFdKHR':_wrap_vkImportSemaphoreFdKHR,
-    'vkGetSemaphoreFdKHR':_wrap_vkGetSemaphoreFdKHR,
-    'vkCmdPushDescriptorSetKHR':_wrap_vkCmdPushDescriptorSetKHR,
-    'vkCmdPushDescriptorSetWithTemplateKHR':_wrap_vkCmdPushDescriptorSetWithTemplateKHR,
-    'vkCmdBeginConditionalRenderingEXT':_wrap_vkCmdBeginConditionalRenderingEXT,
-    'vkCmdEndConditionalRenderingEXT':_wrap_vkCmdEndConditionalRenderingEXT,
-    'vkCreateDescriptorUpdateTemplateKHR':_wrap_vkCreateDescriptorUpdateTemplate,
-    'vkDestroyDescriptorUpdateTemplateKHR':_wrap_vkDestroyDescriptorUpdateTemplate,
-    'vkUpdateDescriptorSetWithTemplateKHR':_wrap_vkUpdateDescriptorSetWithTemplate,
-    'vkCmdSetViewportWScalingNV':_wrap_vkCmdSetViewportWScalingNV,
-    'vkDisplayPowerControlEXT':_wrap_vkDisplayPowerControlEXT,
-    'vkRegisterDeviceEventEXT':_wrap_vkRegisterDeviceEventEXT,
-    'vkRegisterDisplayEventEXT':_wrap_vkRegisterDisplayEventEXT,
-    'vkGetSwapchainCounterEXT':_wrap_vkGetSwapchainCounterEXT,
-    'vkGetRefreshCycleDurationGOOGLE':_wrap_vkGetRefreshCycleDurationGOOGLE,
-    'vkGetPastPresentationTimingGOOGLE':_wrap_vkGetPastPresentationTimingGOOGLE,
-    'vkCmdSetDiscardRectangleEXT':_wrap_vkCmdSetDiscardRectangleEXT,
-    'vkCmdSetDiscardRectangleEnableEXT':_wrap_vkCmdSetDiscardRectangleEnableEXT,
-    'vkCmdSetDiscardRectangleModeEXT':_wrap_vkCmdSetDiscardRectangleModeEXT,
-    'vkSetHdrMetadataEXT':_wrap_vkSetHdrMetadataEXT,
-    'vkCreateRenderPass2KHR':_wrap_vkCreateRenderPass2,
-    'vkCmdBeginRenderPass2KHR':_wrap_vkCmdBeginRenderPass2,
-    'vkCmdNextSubpass2KHR':_wrap_vkCmdNextSubpass2,
-    'vkCmdEndRenderPass2KHR':_wrap_vkCmdEndRenderPass2,
-    'vkGetSwapchainStatusKHR':_wrap_vkGetSwapchainStatusKHR,
-    'vkImportFenceWin32HandleKHR':_wrap_vkImportFenceWin32HandleKHR,
-    'vkGetFenceWin32HandleKHR':_wrap_vkGetFenceWin32HandleKHR,
-    'vkImportFenceFdKHR':_wrap_vkImportFenceFdKHR,
-    'vkGetFenceFdKHR':_wrap_vkGetFenceFdKHR,
-    'vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR':_wrap_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR,
-    'vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR':_wrap_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR,
-    'vkAcquireProfilingLockKHR':_wrap_vkAcquireProfilingLockKHR,
-    'vkReleaseProfilingLockKHR':_wrap_vkReleaseProfilingLockKHR,
-    'vkGetAndroidHardwareBufferPropertiesANDROID':_wrap_vkGetAndroidHardwareBufferPropertiesANDROID,
-    'vkGetMemoryAndroidHardwareBufferANDROID':_wrap_vkGetMemoryAndroidHardwareBufferANDROID,
-    'vkCreateExecutionGraphPipelinesAMDX':_wrap_vkCreateExecutionGraphPipelinesAMDX,
-    'vkGetExecutionGraphPipelineScratchSizeAMDX':_wrap_vkGetExecutionGraphPipelineScratchSizeAMDX,
-    'vkGetExecutionGraphPipelineNodeIndexAMDX':_wrap_vkGetExecutionGraphPipelineNodeIndexAMDX,
-    'vkCmdInitializeGraphScratchMemoryAMDX':_wrap_vkCmdInitializeGraphScratchMemoryAMDX,
-    'vkCmdDispatchGraphAMDX':_wrap_vkCmdDispatchGraphAMDX,
-    'vkCmdDispatchGraphIndirectAMDX':_wrap_vkCmdDispatchGraphIndirectAMDX,
-    'vkCmdDispatchGraphIndirectCountAMDX':_wrap_vkCmdDispatchGraphIndirectCountAMDX,
-    'vkCmdSetSampleLocationsEXT':_wrap_vkCmdSetSampleLocationsEXT,
-    'vkGetPhysicalDeviceMultisamplePropertiesEXT':_wrap_vkGetPhysicalDeviceMultisamplePropertiesEXT,
-    'vkGetImageMemoryRequirements2KHR':_wrap_vkGetImageMemoryRequirements2,
-    'vkGetBufferMemoryRequirements2KHR':_wrap_vkGetBufferMemoryRequirements2,
-    'vkGetImageSparseMemoryRequirements2KHR':_wrap_vkGetImageSparseMemoryRequirements2,
-    'vkCreateAccelerationStructureKHR':_wrap_vkCreateAccelerationStructureKHR,
-    'vkDestroyAccelerationStructureKHR':_wrap_vkDestroyAccelerationStructureKHR,
-    'vkCmdBuildAccelerationStructuresKHR':_wrap_vkCmdBuildAccelerationStructuresKHR,
-    'vkCmdBuildAccelerationStructuresIndirectKHR':_wrap_vkCmdBuildAccelerationStructuresIndirectKHR,
-    'vkBuildAccelerationStructuresKHR':_wrap_vkBuildAccelerationStructuresKHR,
-    'vkCopyAccelerationStructureKHR':_wrap_vkCopyAccelerationStructureKHR,
-    'vkCopyAccelerationStructureToMemoryKHR':_wrap_vkCopyAccelerationStructureToMemoryKHR,
-    'vkCopyMemoryToAccelerationStructureKHR':_wrap_vkCopyMemoryToAccelerationStructureKHR,
-    'vkWriteAccelerationStructuresPropertiesKHR':_wrap_vkWriteAccelerationStructuresPropertiesKHR,
-    'vkCmdCopyAccelerationStructureKHR':_wrap_vkCmdCopyAccelerationStructureKHR,
-    'vkCmdCopyAccelerationStructureToMemoryKHR':_wrap_vkCmdCopyAccelerationStructureToMemoryKHR,
-    'vkCmdCopyMemoryToAccelerationStructureKHR':_wrap_vkCmdCopyMemoryToAccelerationStructureKHR,
-    'vkGetAccelerationStructureDeviceAddressKHR':_wrap_vkGetAccelerationStructureDeviceAddressKHR,
-    'vkCmdWriteAccelerationStructuresPropertiesKHR':_wrap_vkCmdWriteAccelerationStructuresPropertiesKHR,
-    'vkGetDeviceAccelerationStructureCompatibilityKHR':_wrap_vkGetDeviceAccelerationStructureCompatibilityKHR,
-    'vkGetAccelerationStructureBuildSizesKHR':_wrap_vkGetAccelerationStructureBuildSizesKHR,
-    'vkCmdTraceRaysKHR':_wrap_vkCmdTraceRaysKHR,
-    'vkCreateRayTracingPipelinesKHR':_wrap_vkCreateRayTracingPipelinesKHR,
-    'vkGetRayTracingShaderGroupHandlesKHR':_wrap_vkGetRayTracingShaderGroupHandlesKHR,
-    'vkGetRayTracingCaptureReplayShaderGroupHandlesKHR':_wrap_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR,
-    'vkCmdTraceRaysIndirectKHR':_wrap_vkCmdTraceRaysIndirectKHR,
-    'vkGetRayTracingShaderGroupStackSizeKHR':_wrap_vkGetRayTracingShaderGroupStackSizeKHR,
-    'vkCmdSetRayTracingPipelineStackSizeKHR':_wrap_vkCmdSetRayTracingPipelineStackSizeKHR,
-    'vkCreateSamplerYcbcrConversionKHR':_wrap_vkCreateSamplerYcbcrConversion,
-    'vkDestroySamplerYcbcrConversionKHR':_wrap_vkDestroySamplerYcbcrConversion,
-    'vkBindBufferMemory2KHR':_wrap_vkBindBufferMemory2,
-    'vkBindImageMemory2KHR':_wrap_vkBindImageMemory2,
-    'vkGetImageDrmFormatModifierPropertiesEXT':_wrap_vkGetImageDrmFormatModifierPropertiesEXT,
-    'vkCreateValidationCacheEXT':_wrap_vkCreateValidationCacheEXT,
-    'vkDestroyValidationCacheEXT':_wrap_vkDestroyValidationCacheEXT,
-    'vkMergeValidationCachesEXT':_wrap_vkMergeValidationCachesEXT,
-    'vkGetValidationCacheDataEXT':_wrap_vkGetValidationCacheDataEXT,
-    'vkCmdBindShadingRateImageNV':_wrap_vkCmdBindShadingRateImageNV,
-    'vkCmdSetViewportShadingRatePaletteNV':_wrap_vkCmdSetViewportShadingRatePaletteNV,
-    'vkCmdSetCoarseSampleOrderNV':_wrap_vkCmdSetCoarseSampleOrderNV,
-    'vkCreateAccelerationStructureNV':_wrap_vkCreateAccelerationStructureNV,
-    'vkDestroyAccelerationStructureNV':_wrap_vkDestroyAccelerationStructureNV,
-    'vkGetAccelerationStructureMemoryRequirementsNV':_wrap_vkGetAccelerationStructureMemoryRequirementsNV,
-    'vkBindAccelerationStructureMemoryNV':_wrap_vkBindAccelerationStructureMemoryNV,
-    'vkCmdBuildAccelerationStructureNV':_wrap_vkCmdBuildAccelerationStructureNV,
-    'vkCmdCopyAccelerationStructureNV':_wrap_vkCmdCopyAccelerationStructureNV,
-    'vkCmdTraceRaysNV':_wrap_vkCmdTraceRaysNV,
-    'vkCreateRayTracingPipelinesNV':_wrap_vkCreateRayTracingPipelinesNV,
-    'vkGetRayTracingShaderGroupHandlesNV':_wrap_vkGetRayTracingShaderGroupHandlesKHR,
-    'vkGetAccelerationStructureHandleNV':_wrap_vkGetAccelerationStructureHandleNV,
-    'vkCmdWriteAccelerationStructuresPropertiesNV':_wrap_vkCmdWriteAccelerationStructuresPropertiesNV,
-    'vkCompileDeferredNV':_wrap_vkCompileDeferredNV,
-    'vkGetDescriptorSetLayoutSupportKHR':_wrap_vkGetDescriptorSetLayoutSupport,
-    'vkCmdDrawIndirectCountKHR':_wrap_vkCmdDrawIndirectCount,
-    'vkCmdDrawIndexedIndirectCountKHR':_wrap_vkCmdDrawIndexedIndirectCount,
-    'vkGetMemoryHostPointerPropertiesEXT':_wrap_vkGetMemoryHostPointerPropertiesEXT,
-    'vkCmdWriteBufferMarkerAMD':_wrap_vkCmdWriteBufferMarkerAMD,
-    'vkGetPhysicalDeviceCalibrateableTimeDomainsEXT':_wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR,
-    'vkGetCalibratedTimestampsEXT':_wrap_vkGetCalibratedTimestampsKHR,
-    'vkCmdDrawMeshTasksNV':_wrap_vkCmdDrawMeshTasksNV,
-    'vkCmdDrawMeshTasksIndirectNV':_wrap_vkCmdDrawMeshTasksIndirectNV,
-    'vkCmdDrawMeshTasksIndirectCountNV':_wrap_vkCmdDrawMeshTasksIndirectCountNV,
-    'vkCmdSetExclusiveScissorEnableNV':_wrap_vkCmdSetExclusiveScissorEnableNV,
-    'vkCmdSetExclusiveScissorNV':_wrap_vkCmdSetExclusiveScissorNV,
-    'vkCmdSetCheckpointNV':_wrap_vkCmdSetCheckpointNV,
-    'vkGetQueueCheckpointDataNV':_wrap_vkGetQueueCheckpointDataNV,
-    'vkGetSemaphoreCounterValueKHR':_wrap_vkGetSemaphoreCounterValue,
-    'vkWaitSemaphoresKHR':_wrap_vkWaitSemaphores,
-    'vkSignalSemaphoreKHR':_wrap_vkSignalSemaphore,
-    'vkInitializePerformanceApiINTEL':_wrap_vkInitializePerformanceApiINTEL,
-    'vkUninitializePerformanceApiINTEL':_wrap_vkUninitializePerformanceApiINTEL,
-    'vkCmdSetPerformanceMarkerINTEL':_wrap_vkCmdSetPerformanceMarkerINTEL,
-    'vkCmdSetPerformanceStreamMarkerINTEL':_wrap_vkCmdSetPerformanceStreamMarkerINTEL,
-    'vkCmdSetPerformanceOverrideINTEL':_wrap_vkCmdSetPerformanceOverrideINTEL,
-    'vkAcquirePerformanceConfigurationINTEL':_wrap_vkAcquirePerformanceConfigurationINTEL,
-    'vkReleasePerformanceConfigurationINTEL':_wrap_vkReleasePerformanceConfigurationINTEL,
-    'vkQueueSetPerformanceConfigurationINTEL':_wrap_vkQueueSetPerformanceConfigurationINTEL,
-    'vkGetPerformanceParameterINTEL':_wrap_vkGetPerformanceParameterINTEL,
-    'vkSetLocalDimmingAMD':_wrap_vkSetLocalDimmingAMD,
-    'vkGetPhysicalDeviceFragmentShadingRatesKHR':_wrap_vkGetPhysicalDeviceFragmentShadingRatesKHR,
-    'vkCmdSetFragmentShadingRateKHR':_wrap_vkCmdSetFragmentShadingRateKHR,
-    'vkGetBufferDeviceAddressEXT':_wrap_vkGetBufferDeviceAddress,
-    'vkGetPhysicalDeviceToolPropertiesEXT':_wrap_vkGetPhysicalDeviceToolProperties,
-    'vkWaitForPresentKHR':_wrap_vkWaitForPresentKHR,
-    'vkGetPhysicalDeviceCooperativeMatrixPropertiesNV':_wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV,
-    'vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV':_wrap_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV,
-    'vkGetPhysicalDeviceSurfacePresentModes2EXT':_wrap_vkGetPhysicalDeviceSurfacePresentModes2EXT,
-    'vkAcquireFullScreenExclusiveModeEXT':_wrap_vkAcquireFullScreenExclusiveModeEXT,
-    'vkReleaseFullScreenExclusiveModeEXT':_wrap_vkReleaseFullScreenExclusiveModeEXT,
-    'vkGetDeviceGroupSurfacePresentModes2EXT':_wrap_vkGetDeviceGroupSurfacePresentModes2EXT,
-    'vkGetBufferDeviceAddressKHR':_wrap_vkGetBufferDeviceAddress,
-    'vkGetBufferOpaqueCaptureAddressKHR':_wrap_vkGetBufferOpaqueCaptureAddress,
-    'vkGetDeviceMemoryOpaqueCaptureAddressKHR':_wrap_vkGetDeviceMemoryOpaqueCaptureAddress,
-    'vkCmdSetLineStippleEXT':_wrap_vkCmdSetLineStippleEXT,
-    'vkResetQueryPoolEXT':_wrap_vkResetQueryPool,
-    'vkCmdSetCullModeEXT':_wrap_vkCmdSetCullMode,
-    'vkCmdSetFrontFaceEXT':_wrap_vkCmdSetFrontFace,
-    'vkCmdSetPrimitiveTopologyEXT':_wrap_vkCmdSetPrimitiveTopology,
-    'vkCmdSetViewportWithCountEXT':_wrap_vkCmdSetViewportWithCount,
-    'vkCmdSetScissorWithCountEXT':_wrap_vkCmdSetScissorWithCount,
-    'vkCmdBindVertexBuffers2EXT':_wrap_vkCmdBindVertexBuffers2,
-    'vkCmdSetDepthTestEnableEXT':_wrap_vkCmdSetDepthTestEnable,
-    'vkCmdSetDepthWriteEnableEXT':_wrap_vkCmdSetDepthWriteEnable,
-    'vkCmdSetDepthCompareOpEXT':_wrap_vkCmdSetDepthCompareOp,
-    'vkCmdSetDepthBoundsTestEnableEXT':_wrap_vkCmdSetDepthBoundsTestEnable,
-    'vkCmdSetStencilTestEnableEXT':_wrap_vkCmdSetStencilTestEnable,
-    'vkCmdSetStencilOpEXT':_wrap_vkCmdSetStencilOp,
-    'vkCreateDeferredOperationKHR':_wrap_vkCreateDeferredOperationKHR,
-    'vkDestroyDeferredOperationKHR':_wrap_vkDestroyDeferredOperationKHR,
-    'vkGetDeferredOperationMaxConcurrencyKHR':_wrap_vkGetDeferredOperationMaxConcurrencyKHR,
-    'vkGetDeferredOperationResultKHR':_wrap_vkGetDeferredOperationResultKHR,
-    'vkDeferredOperationJoinKHR':_wrap_vkDeferredOperationJoinKHR,
-    'vkGetPipelineExecutablePropertiesKHR':_wrap_vkGetPipelineExecutablePropertiesKHR,
-    'vkGetPipelineExecutableStatisticsKHR':_wrap_vkGetPipelineExecutableStatisticsKHR,
-    'vkGetPipelineExecutableInternalRepresentationsKHR':_wrap_vkGetPipelineExecutableInternalRepresentationsKHR,
-    'vkCopyMemoryToImageEXT':_wrap_vkCopyMemoryToImageEXT,
-    'vkCopyImageToMemoryEXT':_wrap_vkCopyImageToMemoryEXT,
-    'vkCopyImageToImageEXT':_wrap_vkCopyImageToImageEXT,
-    'vkTransitionImageLayoutEXT':_wrap_vkTransitionImageLayoutEXT,
-    'vkGetImageSubresourceLayout2EXT':_wrap_vkGetImageSubresourceLayout2KHR,
-    'vkMapMemory2KHR':_wrap_vkMapMemory2KHR,
-    'vkUnmapMemory2KHR':_wrap_vkUnmapMemory2KHR,
-    'vkReleaseSwapchainImagesEXT':_wrap_vkReleaseSwapchainImagesEXT,
-    'vkGetGeneratedCommandsMemoryRequirementsNV':_wrap_vkGetGeneratedCommandsMemoryRequirementsNV,
-    'vkCmdPreprocessGeneratedCommandsNV':_wrap_vkCmdPreprocessGeneratedCommandsNV,
-    'vkCmdExecuteGeneratedCommandsNV':_wrap_vkCmdExecuteGeneratedCommandsNV,
-    'vkCmdBindPipelineShaderGroupNV':_wrap_vkCmdBindPipelineShaderGroupNV,
-    'vkCreateIndirectCommandsLayoutNV':_wrap_vkCreateIndirectCommandsLayoutNV,
-    'vkDestroyIndirectCommandsLayoutNV':_wrap_vkDestroyIndirectCommandsLayoutNV,
-    'vkCmdSetDepthBias2EXT':_wrap_vkCmdSetDepthBias2EXT,
-    'vkCreatePrivateDataSlotEXT':_wrap_vkCreatePrivateDataSlot,
-    'vkDestroyPrivateDataSlotEXT':_wrap_vkDestroyPrivateDataSlot,
-    'vkSetPrivateDataEXT':_wrap_vkSetPrivateData,
-    'vkGetPrivateDataEXT':_wrap_vkGetPrivateData,
-    'vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR':_wrap_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR,
-    'vkGetEncodedVideoSessionParametersKHR':_wrap_vkGetEncodedVideoSessionParametersKHR,
-    'vkCmdEncodeVideoKHR':_wrap_vkCmdEncodeVideoKHR,
-    'vkCreateCudaModuleNV':_wrap_vkCreateCudaModuleNV,
-    'vkGetCudaModuleCacheNV':_wrap_vkGetCudaModuleCacheNV,
-    'vkCreateCudaFunctionNV':_wrap_vkCreateCudaFunctionNV,
-    'vkDestroyCudaModuleNV':_wrap_vkDestroyCudaModuleNV,
-    'vkDestroyCudaFunctionNV':_wrap_vkDestroyCudaFunctionNV,
-    'vkCmdCudaLaunchKernelNV':_wrap_vkCmdCudaLaunchKernelNV,
-    'vkCmdRefreshObjectsKHR':_wrap_vkCmdRefreshObjectsKHR,
-    'vkGetPhysicalDeviceRefreshableObjectTypesKHR':_wrap_vkGetPhysicalDeviceRefreshableObjectTypesKHR,
-    'vkExportMetalObjectsEXT':_wrap_vkExportMetalObjectsEXT,
-    'vkCmdSetEvent2KHR':_wrap_vkCmdSetEvent2,
-    'vkCmdResetEvent2KHR':_wrap_vkCmdResetEvent2,
-    'vkCmdWaitEvents2KHR':_wrap_vkCmdWaitEvents2,
-    'vkCmdPipelineBarrier2KHR':_wrap_vkCmdPipelineBarrier2,
-    'vkCmdWriteTimestamp2KHR':_wrap_vkCmdWriteTimestamp2,
-    'vkQueueSubmit2KHR':_wrap_vkQueueSubmit2,
-    'vkCmdWriteBufferMarker2AMD':_wrap_vkCmdWriteBufferMarker2AMD,
-    'vkGetQueueCheckpointData2NV':_wrap_vkGetQueueCheckpointData2NV,
-    'vkGetDescriptorSetLayoutSizeEXT':_wrap_vkGetDescriptorSetLayoutSizeEXT,
-    'vkGetDescriptorSetLayoutBindingOffsetEXT':_wrap_vkGetDescriptorSetLayoutBindingOffsetEXT,
-    'vkGetDescriptorEXT':_wrap_vkGetDescriptorEXT,
-    'vkCmdBindDescriptorBuffersEXT':_wrap_vkCmdBindDescriptorBuffersEXT,
-    'vkCmdSetDescriptorBufferOffsetsEXT':_wrap_vkCmdSetDescriptorBufferOffsetsEXT,
-    'vkCmdBindDescriptorBufferEmbeddedSamplersEXT':_wrap_vkCmdBindDescriptorBufferEmbeddedSamplersEXT,
-    'vkGetBufferOpaqueCaptureDescriptorDataEXT':_wrap_vkGetBufferOpaqueCaptureDescriptorDataEXT,
-    'vkGetImageOpaqueCaptureDescriptorDataEXT':_wrap_vkGetImageOpaqueCaptureDescriptorDataEXT,
-    'vkGetImageViewOpaqueCaptureDescriptorDataEXT':_wrap_vkGetImageViewOpaqueCaptureDescriptorDataEXT,
-    'vkGetSamplerOpaqueCaptureDescriptorDataEXT':_wrap_vkGetSamplerOpaqueCaptureDescriptorDataEXT,
-    'vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT':_wrap_vkGetAccelerationStructureOpaqueCaptureDescriptorDataEXT,
-    'vkCmdSetFragmentShadingRateEnumNV':_wrap_vkCmdSetFragmentShadingRateEnumNV,
-    'vkCmdDrawMeshTasksEXT':_wrap_vkCmdDrawMeshTasksEXT,
-    'vkCmdDrawMeshTasksIndirectEXT':_wrap_vkCmdDrawMeshTasksIndirectEXT,
-    'vkCmdDrawMeshTasksIndirectCountEXT':_wrap_vkCmdDrawMeshTasksIndirectCountEXT,
-    'vkCmdCopyBuffer2KHR':_wrap_vkCmdCopyBuffer2,
-    'vkCmdCopyImage2KHR':_wrap_vkCmdCopyImage2,
-    'vkCmdCopyBufferToImage2KHR':_wrap_vkCmdCopyBufferToImage2,
-    'vkCmdCopyImageToBuffer2KHR':_wrap_vkCmdCopyImageToBuffer2,
-    'vkCmdBlitImage2KHR':_wrap_vkCmdBlitImage2,
-    'vkCmdResolveImage2KHR':_wrap_vkCmdResolveImage2,
-    'vkGetDeviceFaultInfoEXT':_wrap_vkGetDeviceFaultInfoEXT,
-    'vkAcquireWinrtDisplayNV':_wrap_vkAcquireWinrtDisplayNV,
-    'vkGetWinrtDisplayNV':_wrap_vkGetWinrtDisplayNV,
-    'vkCmdSetVertexInputEXT':_wrap_vkCmdSetVertexInputEXT,
-    'vkGetMemoryZirconHandleFUCHSIA':_wrap_vkGetMemoryZirconHandleFUCHSIA,
-    'vkGetMemoryZirconHandlePropertiesFUCHSIA':_wrap_vkGetMemoryZirconHandlePropertiesFUCHSIA,
-    'vkImportSemaphoreZirconHandleFUCHSIA':_wrap_vkImportSemaphoreZirconHandleFUCHSIA,
-    'vkGetSemaphoreZirconHandleFUCHSIA':_wrap_vkGetSemaphoreZirconHandleFUCHSIA,
-    'vkCreateBufferCollectionFUCHSIA':_wrap_vkCreateBufferCollectionFUCHSIA,
-    'vkSetBufferCollectionImageConstraintsFUCHSIA':_wrap_vkSetBufferCollectionImageConstraintsFUCHSIA,
-    'vkSetBufferCollectionBufferConstraintsFUCHSIA':_wrap_vkSetBufferCollectionBufferConstraintsFUCHSIA,
-    'vkDestroyBufferCollectionFUCHSIA':_wrap_vkDestroyBufferCollectionFUCHSIA,
-    'vkGetBufferCollectionPropertiesFUCHSIA':_wrap_vkGetBufferCollectionPropertiesFUCHSIA,
-    'vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI':_wrap_vkGetDeviceSubpassShadingMaxWorkgroupSizeHUAWEI,
-    'vkCmdSubpassShadingHUAWEI':_wrap_vkCmdSubpassShadingHUAWEI,
-    'vkCmdBindInvocationMaskHUAWEI':_wrap_vkCmdBindInvocationMaskHUAWEI,
-    'vkGetMemoryRemoteAddressNV':_wrap_vkGetMemoryRemoteAddressNV,
-    'vkGetPipelinePropertiesEXT':_wrap_vkGetPipelinePropertiesEXT,
-    'vkGetFenceSciSyncFenceNV':_wrap_vkGetFenceSciSyncFenceNV,
-    'vkGetFenceSciSyncObjNV':_wrap_vkGetFenceSciSyncObjNV,
-    'vkImportFenceSciSyncFenceNV':_wrap_vkImportFenceSciSyncFenceNV,
-    'vkImportFenceSciSyncObjNV':_wrap_vkImportFenceSciSyncObjNV,
-    'vkGetPhysicalDeviceSciSyncAttributesNV':_wrap_vkGetPhysicalDeviceSciSyncAttributesNV,
-    'vkGetSemaphoreSciSyncObjNV':_wrap_vkGetSemaphoreSciSyncObjNV,
-    'vkImportSemaphoreSciSyncObjNV':_wrap_vkImportSemaphoreSciSyncObjNV,
-    'vkGetMemorySciBufNV':_wrap_vkGetMemorySciBufNV,
-    'vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV':_wrap_vkGetPhysicalDeviceExternalMemorySciBufPropertiesNV,
-    'vkGetPhysicalDeviceSciBufAttributesNV':_wrap_vkGetPhysicalDeviceSciBufAttributesNV,
-    'vkCmdSetPatchControlPointsEXT':_wrap_vkCmdSetPatchControlPointsEXT,
-    'vkCmdSetRasterizerDiscardEnableEXT':_wrap_vkCmdSetRasterizerDiscardEnable,
-    'vkCmdSetDepthBiasEnableEXT':_wrap_vkCmdSetDepthBiasEnable,
-    'vkCmdSetLogicOpEXT':_wrap_vkCmdSetLogicOpEXT,
-    'vkCmdSetPrimitiveRestartEnableEXT':_wrap_vkCmdSetPrimitiveRestartEnable,
-    'vkCmdSetColorWriteEnableEXT':_wrap_vkCmdSetColorWriteEnableEXT,
-    'vkCmdTraceRaysIndirect2KHR':_wrap_vkCmdTraceRaysIndirect2KHR,
-    'vkCmdDrawMultiEXT':_wrap_vkCmdDrawMultiEXT,
-    'vkCmdDrawMultiIndexedEXT':_wrap_vkCmdDrawMultiIndexedEXT,
-    'vkCreateMicromapEXT':_wrap_vkCreateMicromapEXT,
-    'vkDestroyMicromapEXT':_wrap_vkDestroyMicromapEXT,
-    'vkCmdBuildMicromapsEXT':_wrap_vkCmdBuildMicromapsEXT,
-    'vkBuildMicromapsEXT':_wrap_vkBuildMicromapsEXT,
-    'vkCopyMicromapEXT':_wrap_vkCopyMicromapEXT,
-    'vkCopyMicromapToMemoryEXT':_wrap_vkCopyMicromapToMemoryEXT,
-    'vkCopyMemoryToMicromapEXT':_wrap_vkCopyMemoryToMicromapEXT,
-    'vkWriteMicromapsPropertiesEXT':_wrap_vkWriteMicromapsPropertiesEXT,
-    'vkCmdCopyMicromapEXT':_wrap_vkCmdCopyMicromapEXT,
-    'vkCmdCopyMicromapToMemoryEXT':_wrap_vkCmdCopyMicromapToMemoryEXT,
-    'vkCmdCopyMemoryToMicromapEXT':_wrap_vkCmdCopyMemoryToMicromapEXT,
-    'vkCmdWriteMicromapsPropertiesEXT':_wrap_vkCmdWriteMicromapsPropertiesEXT,
-    'vkGetDeviceMicromapCompatibilityEXT':_wrap_vkGetDeviceMicromapCompatibilityEXT,
-    'vkGetMicromapBuildSizesEXT':_wrap_vkGetMicromapBuildSizesEXT,
-    'vkCmdDrawClusterHUAWEI':_wrap_vkCmdDrawClusterHUAWEI,
-    'vkCmdDrawClusterIndirectHUAWEI':_wrap_vkCmdDrawClusterIndirectHUAWEI,
-    'vkSetDeviceMemoryPriorityEXT':_wrap_vkSetDeviceMemoryPriorityEXT,
-    'vkGetDeviceBufferMemoryRequirementsKHR':_wrap_vkGetDeviceBufferMemoryRequirements,
-    'vkGetDeviceImageMemoryRequirementsKHR':_wrap_vkGetDeviceImageMemoryRequirements,
-    'vkGetDeviceImageSparseMemoryRequirementsKHR':_wrap_vkGetDeviceImageSparseMemoryRequirements,
-    'vkGetDescriptorSetLayoutHostMappingInfoVALVE':_wrap_vkGetDescriptorSetLayoutHostMappingInfoVALVE,
-    'vkGetDescriptorSetHostMappingVALVE':_wrap_vkGetDescriptorSetHostMappingVALVE,
-    'vkCmdCopyMemoryIndirectNV':_wrap_vkCmdCopyMemoryIndirectNV,
-    'vkCmdCopyMemoryToImageIndirectNV':_wrap_vkCmdCopyMemoryToImageIndirectNV,
-    'vkCmdDecompressMemoryNV':_wrap_vkCmdDecompressMemoryNV,
-    'vkCmdDecompressMemoryIndirectCountNV':_wrap_vkCmdDecompressMemoryIndirectCountNV,
-    'vkGetPipelineIndirectMemoryRequirementsNV':_wrap_vkGetPipelineIndirectMemoryRequirementsNV,
-    'vkCmdUpdatePipelineIndirectBufferNV':_wrap_vkCmdUpdatePipelineIndirectBufferNV,
-    'vkGetPipelineIndirectDeviceAddressNV':_wrap_vkGetPipelineIndirectDeviceAddressNV,
-    'vkCmdSetTessellationDomainOriginEXT':_wrap_vkCmdSetTessellationDomainOriginEXT,
-    'vkCmdSetDepthClampEnableEXT':_wrap_vkCmdSetDepthClampEnableEXT,
-    'vkCmdSetPolygonModeEXT':_wrap_vkCmdSetPolygonModeEXT,
-    'vkCmdSetRasterizationSamplesEXT':_wrap_vkCmdSetRasterizationSamplesEXT,
-    'vkCmdSetSampleMaskEXT':_wrap_vkCmdSetSampleMaskEXT,
-    'vkCmdSetAlphaToCoverageEnableEXT':_wrap_vkCmdSetAlphaToCoverageEnableEXT,
-    'vkCmdSetAlphaToOneEnableEXT':_wrap_vkCmdSetAlphaToOneEnableEXT,
-    'vkCmdSetLogicOpEnableEXT':_wrap_vkCmdSetLogicOpEnableEXT,
-    'vkCmdSetColorBlendEnableEXT':_wrap_vkCmdSetColorBlendEnableEXT,
-    'vkCmdSetColorBlendEquationEXT':_wrap_vkCmdSetColorBlendEquationEXT,
-    'vkCmdSetColorWriteMaskEXT':_wrap_vkCmdSetColorWriteMaskEXT,
-    'vkCmdSetRasterizationStreamEXT':_wrap_vkCmdSetRasterizationStreamEXT,
-    'vkCmdSetConservativeRasterizationModeEXT':_wrap_vkCmdSetConservativeRasterizationModeEXT,
-    'vkCmdSetExtraPrimitiveOverestimationSizeEXT':_wrap_vkCmdSetExtraPrimitiveOverestimationSizeEXT,
-    'vkCmdSetDepthClipEnableEXT':_wrap_vkCmdSetDepthClipEnableEXT,
-    'vkCmdSetSampleLocationsEnableEXT':_wrap_vkCmdSetSampleLocationsEnableEXT,
-    'vkCmdSetColorBlendAdvancedEXT':_wrap_vkCmdSetColorBlendAdvancedEXT,
-    'vkCmdSetProvokingVertexModeEXT':_wrap_vkCmdSetProvokingVertexModeEXT,
-    'vkCmdSetLineRasterizationModeEXT':_wrap_vkCmdSetLineRasterizationModeEXT,
-    'vkCmdSetLineStippleEnableEXT':_wrap_vkCmdSetLineStippleEnableEXT,
-    'vkCmdSetDepthClipNegativeOneToOneEXT':_wrap_vkCmdSetDepthClipNegativeOneToOneEXT,
-    'vkCmdSetViewportWScalingEnableNV':_wrap_vkCmdSetViewportWScalingEnableNV,
-    'vkCmdSetViewportSwizzleNV':_wrap_vkCmdSetViewportSwizzleNV,
-    'vkCmdSetCoverageToColorEnableNV':_wrap_vkCmdSetCoverageToColorEnableNV,
-    'vkCmdSetCoverageToColorLocationNV':_wrap_vkCmdSetCoverageToColorLocationNV,
-    'vkCmdSetCoverageModulationModeNV':_wrap_vkCmdSetCoverageModulationModeNV,
-    'vkCmdSetCoverageModulationTableEnableNV':_wrap_vkCmdSetCoverageModulationTableEnableNV,
-    'vkCmdSetCoverageModulationTableNV':_wrap_vkCmdSetCoverageModulationTableNV,
-    'vkCmdSetShadingRateImageEnableNV':_wrap_vkCmdSetShadingRateImageEnableNV,
-    'vkCmdSetRepresentativeFragmentTestEnableNV':_wrap_vkCmdSetRepresentativeFragmentTestEnableNV,
-    'vkCmdSetCoverageReductionModeNV':_wrap_vkCmdSetCoverageReductionModeNV,
-    'vkGetShaderModuleIdentifierEXT':_wrap_vkGetShaderModuleIdentifierEXT,
-    'vkGetShaderModuleCreateInfoIdentifierEXT':_wrap_vkGetShaderModuleCreateInfoIdentifierEXT,
-    'vkGetPhysicalDeviceOpticalFlowImageFormatsNV':_wrap_vkGetPhysicalDeviceOpticalFlowImageFormatsNV,
-    'vkCreateOpticalFlowSessionNV':_wrap_vkCreateOpticalFlowSessionNV,
-    'vkDestroyOpticalFlowSessionNV':_wrap_vkDestroyOpticalFlowSessionNV,
-    'vkBindOpticalFlowSessionImageNV':_wrap_vkBindOpticalFlowSessionImageNV,
-    'vkCmdOpticalFlowExecuteNV':_wrap_vkCmdOpticalFlowExecuteNV,
-    'vkCmdBindIndexBuffer2KHR':_wrap_vkCmdBindIndexBuffer2KHR,
-    'vkGetRenderingAreaGranularityKHR':_wrap_vkGetRenderingAreaGranularityKHR,
-    'vkGetDeviceImageSubresourceLayoutKHR':_wrap_vkGetDeviceImageSubresourceLayoutKHR,
-    'vkGetImageSubresourceLayout2KHR':_wrap_vkGetImageSubresourceLayout2KHR,
-    'vkCreateShadersEXT':_wrap_vkCreateShadersEXT,
-    'vkDestroyShaderEXT':_wrap_vkDestroyShaderEXT,
-    'vkGetShaderBinaryDataEXT':_wrap_vkGetShaderBinaryDataEXT,
-    'vkCmdBindShadersEXT':_wrap_vkCmdBindShadersEXT,
-    'vkGetFramebufferTilePropertiesQCOM':_wrap_vkGetFramebufferTilePropertiesQCOM,
-    'vkGetDynamicRenderingTilePropertiesQCOM':_wrap_vkGetDynamicRenderingTilePropertiesQCOM,
-    'vkCreateSemaphoreSciSyncPoolNV':_wrap_vkCreateSemaphoreSciSyncPoolNV,
-    'vkDestroySemaphoreSciSyncPoolNV':_wrap_vkDestroySemaphoreSciSyncPoolNV,
-    'vkSetLatencySleepModeNV':_wrap_vkSetLatencySleepModeNV,
-    'vkLatencySleepNV':_wrap_vkLatencySleepNV,
-    'vkSetLatencyMarkerNV':_wrap_vkSetLatencyMarkerNV,
-    'vkGetLatencyTimingsNV':_wrap_vkGetLatencyTimingsNV,
-    'vkQueueNotifyOutOfBandNV':_wrap_vkQueueNotifyOutOfBandNV,
-    'vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR':_wrap_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR,
-    'vkCmdSetAttachmentFeedbackLoopEnableEXT':_wrap_vkCmdSetAttachmentFeedbackLoopEnableEXT,
-    'vkGetScreenBufferPropertiesQNX':_wrap_vkGetScreenBufferPropertiesQNX,
-    'vkGetPhysicalDeviceCalibrateableTimeDomainsKHR':_wrap_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR,
-    'vkGetCalibratedTimestampsKHR':_wrap_vkGetCalibratedTimestampsKHR,
-    'vkCmdBindDescriptorSets2KHR':_wrap_vkCmdBindDescriptorSets2KHR,
-    'vkCmdPushConstants2KHR':_wrap_vkCmdPushConstants2KHR,
-    'vkCmdPushDescriptorSet2KHR':_wrap_vkCmdPushDescriptorSet2KHR,
-    'vkCmdPushDescriptorSetWithTemplate2KHR':_wrap_vkCmdPushDescriptorSetWithTemplate2KHR,
-    'vkCmdSetDescriptorBufferOffsets2EXT':_wrap_vkCmdSetDescriptorBufferOffsets2EXT,
-    'vkCmdBindDescriptorBufferEmbeddedSamplers2EXT':_wrap_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT,
-}
 
+def layer_names(properties):
+    """Names of a VkLayerProperties[] as a frozenset"""
+    return _decode_names(properties, 'layerName')
 
-def vkGetInstanceProcAddr(instance, pName):
-    fn = _callApi(lib.vkGetInstanceProcAddr, instance, pName)
-    if fn == ffi.NULL:
-        raise ProcedureNotFoundError()
-    if not pName in _instance_ext_funcs:
-        raise ExtensionNotSupportedError()
-    fn = ffi.cast('PFN_' + pName, fn)
-    return _instance_ext_funcs[pName](fn)
 
+def vkGetPipelineCacheData(device, pipelineCache):
+    """Serialized contents of a pipeline cache as bytes"""
+    pDataSize = ffi.new('size_t*')
+    while True:
+        result = _callApi(lib.vkGetPipelineCacheData, device, pipelineCache, pDataSize, ffi.NULL)
+        if result != VK_SUCCESS:
+            raise exception_codes[result]
 
-def vkGetDeviceProcAddr(device, pName):
-    fn = _callApi(lib.vkGetDeviceProcAddr, device, pName)
-    if fn == ffi.NULL:
-        raise ProcedureNotFoundError()
-    if not pName in _device_ext_funcs:
-        raise ExtensionNotSupportedError()
-    fn = ffi.cast('PFN_'+pName, fn)
-    return _device_ext_funcs[pName](fn)
+        pData = ffi.new('char[]', pDataSize[0])
+        result = _callApi(lib.vkGetPipelineCacheData, device, pipelineCache, pDataSize, pData)
+        # the cache can grow between the two calls
+        if result == VK_SUCCESS:
+            return ffi.buffer(pData, pDataSize[0])[:]
+        if result != VK_INCOMPLETE:
+            raise exception_codes[result]
 
 
 def vkMapMemory(device, memory, offset, size, flags):
@@ -0,0 +1,85 @@
+import abc
+from abc import abstractmethod
+
+from vkproject.graphics.vulkan import vkGetInstanceProcAddr, vkGetDeviceProcAddr, ProcedureNotFoundError, ExtensionNotSupportedError
+from vkproject.graphics.vulkan._vulkan import _instance_proc_addr, _device_proc_addr
+
+
+class ExtensionDispatch(abc.ABC):
+    """Extension entry points resolved once for a single VkInstance or VkDevice.
+
+    Every function is looked up through the loader the first time it is requested and kept
+    as a prebuilt callable, available both as an attribute (``table.vkQueuePresentKHR``) and
+    through ``get``. Calls through the table skip the loader string lookup, the pointer cast
+    and the wrapper allocation that ``vkGet*ProcAddr`` performs. Whoever creates the handle
+    owns its table and hands it to the code calling extension functions on it.
+    """
+    def __init__(self, handle):
+        self.handle = handle
+        self._functions = {}
+        self._pointers = {}
+
+    @staticmethod
+    @abstractmethod
+    def _get_proc_addr(handle, name):
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _get_pointer(handle, name):
+        pass
+
+    def load(self, names):
+        for name in names:
+            self.resolve(name)
+
+        return self
+
+    def resolve(self, name):
+        func = self._functions.get(name)
+        if func is None:
+            func = self._get_proc_addr(self.handle, name)
+            self._functions[name] = func
+            setattr(self, name, func)
+
+        return func
+
+    def pointer(self, name):
+        """The raw function pointer, for callers that marshal their own arguments"""
+        fn = self._pointers.get(name)
+        if fn is None:
+            fn = self._get_pointer(self.handle, name)
+            self._pointers[name] = fn
+
+        return fn
+
+    def get(self, name):
+        try:
+            return self.resolve(name)
+        except (ProcedureNotFoundError, ExtensionNotSupportedError):
+            return None
+
+    def __getattr__(self, name):
+        # only reached for functions that haven't been resolved yet
+        if name.startswith("vk"):
+            return self.resolve(name)
+
+        raise AttributeError(name)
+
+class InstanceDispatch(ExtensionDispatch):
+    @staticmethod
+    def _get_proc_addr(handle, name):
+        return vkGetInstanceProcAddr(handle, name)
+
+    @staticmethod
+    def _get_pointer(handle, name):
+        return _instance_proc_addr(handle, name)
+
+class DeviceDispatch(ExtensionDispatch):
+    @staticmethod
+    def _get_proc_addr(handle, name):
+        return vkGetDeviceProcAddr(handle, name)
+
+    @staticmethod
+    def _get_pointer(handle, name):
+        return _device_proc_addr(handle, name)
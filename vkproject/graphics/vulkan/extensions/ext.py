@@ -1,16 +1,23 @@
-from vkproject.graphics.vulkan import vkGetInstanceProcAddr, VK_ERROR_EXTENSION_NOT_PRESENT
+from vkproject.graphics.vulkan import VK_ERROR_EXTENSION_NOT_PRESENT
 
+# only available when VK_EXT_debug_utils is enabled on the instance
+EXT_DEBUG_UTILS_FUNCTIONS = (
+    "vkCreateDebugUtilsMessengerEXT",
+    "vkDestroyDebugUtilsMessengerEXT",
+)
 
-def vkCreateDebugUtilsMessengerEXT(instance, pCreateInfo, pAllocator):
-    func = vkGetInstanceProcAddr(instance, 'vkCreateDebugUtilsMessengerEXT')
+
+# dispatch is the InstanceDispatch of the instance
+def vkCreateDebugUtilsMessengerEXT(dispatch, pCreateInfo, pAllocator):
+    func = dispatch.get('vkCreateDebugUtilsMessengerEXT')
     if func:
-        return func(instance, pCreateInfo, pAllocator)
+        return func(dispatch.handle, pCreateInfo, pAllocator)
     else:
         return VK_ERROR_EXTENSION_NOT_PRESENT
 
-def vkDestroyDebugUtilsMessengerEXT(instance, messenger, pAllocator):
-    func = vkGetInstanceProcAddr(instance, 'vkDestroyDebugUtilsMessengerEXT')
+def vkDestroyDebugUtilsMessengerEXT(dispatch, messenger, pAllocator):
+    func = dispatch.get('vkDestroyDebugUtilsMessengerEXT')
     if func:
-        return func(instance, messenger, pAllocator)
+        return func(dispatch.handle, messenger, pAllocator)
     else:
-        return VK_ERROR_EXTENSION_NOT_PRESENT
\ No newline at end of file
+        return VK_ERROR_EXTENSION_NOT_PRESENT
@@ -1,42 +1,56 @@
-from vkproject.graphics.vulkan import vkGetInstanceProcAddr, vkGetDeviceProcAddr
+from vkproject.graphics.vulkan import enumerate_into
 
+# entry points resolved up front when the instance/device is created
+KHR_INSTANCE_FUNCTIONS = (
+    "vkDestroySurfaceKHR",
+    "vkGetPhysicalDeviceSurfaceSupportKHR",
+    "vkGetPhysicalDeviceSurfaceCapabilitiesKHR",
+    "vkGetPhysicalDeviceSurfaceFormatsKHR",
+    "vkGetPhysicalDeviceSurfacePresentModesKHR",
+)
 
-def vkDestroySurfaceKHR(instance, surface, allocator):
-    func = vkGetInstanceProcAddr(instance, "vkDestroySurfaceKHR")
-    return func(instance, surface, allocator)
+KHR_DEVICE_FUNCTIONS = (
+    "vkCreateSwapchainKHR",
+    "vkDestroySwapchainKHR",
+    "vkGetSwapchainImagesKHR",
+    "vkAcquireNextImageKHR",
+    "vkQueuePresentKHR",
+)
 
-def vkGetPhysicalDeviceSurfaceSupportKHR(instance, device, queue_family_idx, surface):
-    func = vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceSurfaceSupportKHR")
-    return func(device, queue_family_idx, surface)
 
-def vkGetPhysicalDeviceSurfaceCapabilitiesKHR(instance, device, surface):
-    func = vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceSurfaceCapabilitiesKHR")
-    return func(device, surface)
+# dispatch is the InstanceDispatch or DeviceDispatch of the handle the function is called on
+def vkDestroySurfaceKHR(dispatch, surface, allocator):
+    return dispatch.vkDestroySurfaceKHR(dispatch.handle, surface, allocator)
 
-def vkGetPhysicalDeviceSurfaceFormatsKHR(instance, device, surface):
-    func = vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceSurfaceFormatsKHR")
-    return func(device, surface)
+def vkGetPhysicalDeviceSurfaceSupportKHR(dispatch, device, queue_family_idx, surface):
+    return dispatch.vkGetPhysicalDeviceSurfaceSupportKHR(device, queue_family_idx, surface)
 
-def vkGetPhysicalDeviceSurfacePresentModesKHR(instance, device, surface):
-    func = vkGetInstanceProcAddr(instance, "vkGetPhysicalDeviceSurfacePresentModesKHR")
-    return func(device, surface)
+def vkGetPhysicalDeviceSurfaceCapabilitiesKHR(dispatch, device, surface):
+    return dispatch.vkGetPhysicalDeviceSurfaceCapabilitiesKHR(device, surface)
 
-def vkCreateSwapchainKHR(device, pCreateInfo, pAllocator):
-    func = vkGetDeviceProcAddr(device, "vkCreateSwapchainKHR")
-    return func(device, pCreateInfo, pAllocator)
+def vkGetPhysicalDeviceSurfaceFormatsKHR(dispatch, device, surface):
+    return dispatch.vkGetPhysicalDeviceSurfaceFormatsKHR(device, surface)
 
-def vkDestroySwapchainKHR(device, swapchain, allocator):
-    func = vkGetDeviceProcAddr(device, "vkDestroySwapchainKHR")
-    return func(device, swapchain, allocator)
+def vkGetPhysicalDeviceSurfacePresentModesKHR(dispatch, device, surface):
+    return dispatch.vkGetPhysicalDeviceSurfacePresentModesKHR(device, surface)
 
-def vkGetSwapchainImagesKHR(device, swapchain):
-    func = vkGetDeviceProcAddr(device, "vkGetSwapchainImagesKHR")
-    return func(device, swapchain)
+def vkGetPhysicalDeviceSurfaceFormatsKHRInto(dispatch, device, surface, out):
+    return enumerate_into(dispatch.pointer("vkGetPhysicalDeviceSurfaceFormatsKHR"), out, device, surface)
 
-def vkAcquireNextImageKHR(device, swapchain, timeout, semaphore, fence):
-    func = vkGetDeviceProcAddr(device, "vkAcquireNextImageKHR")
-    return func(device, swapchain, timeout, semaphore, fence)
+def vkGetPhysicalDeviceSurfacePresentModesKHRInto(dispatch, device, surface, out):
+    return enumerate_into(dispatch.pointer("vkGetPhysicalDeviceSurfacePresentModesKHR"), out, device, surface)
 
-def vkQueuePresentKHR(device, queue, pPresentInfo):
-    func = vkGetDeviceProcAddr(device, "vkQueuePresentKHR")
-    return func(queue, pPresentInfo)
+def vkCreateSwapchainKHR(dispatch, pCreateInfo, pAllocator):
+    return dispatch.vkCreateSwapchainKHR(dispatch.handle, pCreateInfo, pAllocator)
+
+def vkDestroySwapchainKHR(dispatch, swapchain, allocator):
+    return dispatch.vkDestroySwapchainKHR(dispatch.handle, swapchain, allocator)
+
+def vkGetSwapchainImagesKHR(dispatch, swapchain):
+    return dispatch.vkGetSwapchainImagesKHR(dispatch.handle, swapchain)
+
+def vkAcquireNextImageKHR(dispatch, swapchain, timeout, semaphore, fence):
+    return dispatch.vkAcquireNextImageKHR(dispatch.handle, swapchain, timeout, semaphore, fence)
+
+def vkQueuePresentKHR(dispatch, queue, pPresentInfo):
+    return dispatch.vkQueuePresentKHR(queue, pPresentInfo)
\ No newline at end of file
@@ -1,7 +1,9 @@
-from vkproject.graphics.vulkan import VkViewport, VkRect2D, VkOffset2D, VkExtent2D
+from vkproject.graphics.vulkan import ffi, VkOffset2D, VkExtent2D
 
 
 class Vec2:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -25,30 +27,128 @@ class Vec2:
     def __str__(self):
         return f'Vec2({self.x}, {self.y})'
 
+class _StructVec2(Vec2):
+    """A Vec2 whose x and y are two fields of a C struct, assigning to them writes to the struct"""
+    __slots__ = ('_owner', '_struct', '_x_field', '_y_field')
+
+    def __init__(self, owner, struct, x_field, y_field):
+        # owner is the array struct lives in, kept alive for as long as the view is
+        self._owner = owner
+        self._struct = struct
+        self._x_field = x_field
+        self._y_field = y_field
+
+    @property
+    def x(self):
+        return getattr(self._struct, self._x_field)
+
+    @x.setter
+    def x(self, x):
+        setattr(self._struct, self._x_field, x)
+
+    @property
+    def y(self):
+        return getattr(self._struct, self._y_field)
+
+    @y.setter
+    def y(self, y):
+        setattr(self._struct, self._y_field, y)
+
+# Rect2D and Viewport keep their values in a preallocated one element struct array.
+# vk() returns that struct and vk_array() the array itself, so handing them to
+# vkCmdSetScissor/vkCmdSetViewport doesn't build a new C struct each call.
+# pos and size are views of the struct, rect.pos.x = 5 changes the rect.
+
 class Rect2D:
+    __slots__ = ('_array', '_struct')
+
     def __init__(self, pos: Vec2, size: Vec2):
-        self.pos = pos
-        self.size = size
+        self._array = ffi.new('VkRect2D[1]')
+        self._struct = self._array[0]
+        self.update(pos.x, pos.y, size.x, size.y)
+
+    @property
+    def pos(self):
+        return _StructVec2(self._array, self._struct.offset, 'x', 'y')
+
+    @pos.setter
+    def pos(self, pos: Vec2):
+        self._struct.offset.x = pos.x
+        self._struct.offset.y = pos.y
+
+    @property
+    def size(self):
+        return _StructVec2(self._array, self._struct.extent, 'width', 'height')
+
+    @size.setter
+    def size(self, size: Vec2):
+        self._struct.extent.width = size.x
+        self._struct.extent.height = size.y
+
+    def update(self, x, y, width, height):
+        self._struct.offset.x = x
+        self._struct.offset.y = y
+        self._struct.extent.width = width
+        self._struct.extent.height = height
 
     def vk(self):
-        return VkRect2D(
-            self.pos.vk_offset_2d(),
-            self.size.vk_extent_2d(),
-        )
+        return self._struct
+
+    def vk_array(self):
+        return self._array
 
 class Viewport:
+    __slots__ = ('_array', '_struct')
+
     def __init__(self, pos: Vec2, size: Vec2, min_depth, max_depth):
-        self.pos = pos
-        self.size = size
+        self._array = ffi.new('VkViewport[1]')
+        self._struct = self._array[0]
+        self.update(pos.x, pos.y, size.x, size.y)
         self.min_depth = min_depth
         self.max_depth = max_depth
 
+    @property
+    def pos(self):
+        return _StructVec2(self._array, self._struct, 'x', 'y')
+
+    @pos.setter
+    def pos(self, pos: Vec2):
+        self._struct.x = pos.x
+        self._struct.y = pos.y
+
+    @property
+    def size(self):
+        return _StructVec2(self._array, self._struct, 'width', 'height')
+
+    @size.setter
+    def size(self, size: Vec2):
+        self._struct.width = size.x
+        self._struct.height = size.y
+
+    @property
+    def min_depth(self):
+        return self._struct.minDepth
+
+    @min_depth.setter
+    def min_depth(self, min_depth):
+        self._struct.minDepth = min_depth
+
+    @property
+    def max_depth(self):
+        return self._struct.maxDepth
+
+    @max_depth.setter
+    def max_depth(self, max_depth):
+        self._struct.maxDepth = max_depth
+
+    def update(self, x, y, width, height):
+        self._struct.x = x
+        self._struct.y = y
+        self._struct.width = width
+        self._struct.height = height
+
     def vk(self):
-        return VkViewport(
-            x=self.pos.x,
-            y=self.pos.y,
-            width=self.size.x,
-            height=self.size.y,
-            minDepth=self.min_depth,
-            maxDepth=self.max_depth,
-        )
\ No newline at end of file
+        return self._struct
+
+    def vk_array(self):
+        return self._array
\ No newline at end of file
@@ -1,10 +1,16 @@
 import abc
-import os.path
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Type
 
+from vkproject.resources.manifest import Manifest
+
 
 class ResourceLoader(abc.ABC):
+    # True for loaders whose results outlive the process (baked or imported files), their unchanged files
+    # are skipped on later launches. Others get every file on every launch, and only once per process.
+    incremental = False
+
     @abstractmethod
     def load_resource(self, resource_path, resource_id):
         pass
@@ -13,8 +19,47 @@ class ResourceLoader(abc.ABC):
     def accepts_resource(self, resource_path, resource_id) -> bool:
         pass
 
+class StreamingResourceLoader(ResourceLoader):
+    """A loader whose files are decoded on a ResourceStreamer's pool and finished on the main thread.
+
+    decode does the slow part, reading and parsing. It is a staticmethod and
+    only gets the path and id, on a process pool it runs in another process
+    and the loader, holding GPU objects, is never sent there. finish creates
+    GPU objects, stages their uploads and returns the resource together with
+    the upload id it waits on, None if it is usable right away.
+    """
+    @staticmethod
+    @abstractmethod
+    def decode(resource_path, resource_id):
+        pass
+
+    @abstractmethod
+    def finish(self, decoded, resource_id, streamer):
+        pass
+
+    def load_resource(self, resource_path, resource_id):
+        raise TypeError(f"{type(self).__name__} resources are loaded through Resources.stream()")
+
 class Resources:
+    """Registered loaders and the resource files they were given.
+
+    load() scans a directory in a single pass into a Manifest and hands every
+    new or changed file to the loaders that accept it, on a thread pool, so
+    load_resource has to be safe to call from several threads at once. Files
+    unchanged since the last load() in this process are skipped, and so are
+    files unchanged since the manifest saved by the last launch, for
+    incremental loaders, once manifest_path is set.
+    """
+    DEFAULT_WORKERS = 8
+    # where the manifest of the last launch is kept, Manifest.DEFAULT_PATH for instance.
+    # None loads everything on every launch, nothing is written
+    manifest_path = None
+
     _loaders: list[ResourceLoader] = []
+    # files of streaming loaders found by load(), waiting for stream()
+    _deferred: list[tuple[str, str, StreamingResourceLoader]] = []
+    # directory -> manifest of the files loaded from it in this process
+    _manifests: dict[str, Manifest] = {}
 
     @staticmethod
     def register_loader(loader):
@@ -29,28 +74,54 @@ class Resources:
         return None
 
     @staticmethod
-    def load():
-        Resources._load_dir("res")
+    def load(directory="res", workers=DEFAULT_WORKERS):
+        manifest = Manifest.scan(directory)
+        loaded = Resources._manifests.get(directory)
+        saved = None
+        if loaded is None and Resources.manifest_path is not None:
+            saved = Manifest.read(Resources.manifest_path, directory)
+
+        jobs = []
+        for entry in manifest.entries.values():
+            if loaded is not None and entry.unchanged(loaded.get(entry.path)):
+                continue
+            unchanged = saved is not None and entry.unchanged(saved.get(entry.path))
+
+            for loader in Resources._loaders:
+                if not loader.accepts_resource(entry.path, entry.resource_id):
+                    continue
+                if isinstance(loader, StreamingResourceLoader):
+                    Resources._deferred.append((entry.path, entry.resource_id, loader))
+                elif not (unchanged and loader.incremental):
+                    jobs.append((loader, entry.path, entry.resource_id))
+
+        Resources._run(jobs, workers)
+        Resources._manifests[directory] = manifest
+        previous = loaded or saved
+        if Resources.manifest_path is not None and (previous is None or previous.entries != manifest.entries):
+            manifest.save(Resources.manifest_path)
 
     @staticmethod
-    def _load_file(directory: str, file: str):
-        path = f"{directory}/{file}"
-        resource_id = os.path.splitext((directory + "/" + file).removeprefix("res/"))[0]
-        for loader in Resources._loaders:
-            if loader.accepts_resource(path, resource_id):
-                loader.load_resource(path, resource_id)
+    def _run(jobs, workers):
+        if workers <= 1 or len(jobs) <= 1:
+            Resources._load_all(jobs)
+            return
 
+        # a share of the files per worker rather than a future per file, most loads are short
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vk-load") as pool:
+            futures = [pool.submit(Resources._load_all, jobs[i::workers]) for i in range(min(workers, len(jobs)))]
+        # re-raises the first loader error, after the other workers went through their files
+        for future in futures:
+            future.result()
 
     @staticmethod
-    def _load_dir(directory: str):
-        tree = os.walk(directory)
-        is_root = True
-        for root, dirs, files in tree:
-            if is_root:
-                is_root = False
-                continue
+    def _load_all(jobs):
+        for loader, path, resource_id in jobs:
+            loader.load_resource(path, resource_id)
 
-            for file in files:
-                Resources._load_file(root, file)
-            for sub_dir in dirs:
-                Resources._load_dir(directory + "/" + sub_dir)
+    @staticmethod
+    def stream(streamer) -> list[Future]:
+        """Hand the files load() deferred to a ResourceStreamer, one future per file"""
+        futures = [streamer.request(loader, path, resource_id) for path, resource_id, loader in Resources._deferred]
+        Resources._deferred = []
+        return futures
\ No newline at end of file
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+from typing import NamedTuple
+
+
+class ManifestEntry(NamedTuple):
+    path: str
+    resource_id: str
+    size: int
+    mtime_ns: int
+
+    def unchanged(self, other) -> bool:
+        return other is not None and self.size == other.size and self.mtime_ns == other.mtime_ns
+
+class Manifest:
+    """Every file under a resource directory with its id, size and modification time.
+
+    scan() builds one in a single pass over the tree. Files directly in the
+    root are not resources, only those in its subdirectories. Ids are paths
+    relative to the root without the last extension, with forward slashes.
+    """
+    DEFAULT_PATH = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "vkproject", "resources.json")
+
+    def __init__(self, root, entries=None):
+        self.root = root
+        # path -> ManifestEntry
+        self.entries: dict[str, ManifestEntry] = entries or {}
+
+    @staticmethod
+    def scan(root):
+        manifest = Manifest(root)
+        prefix = len(os.path.join(root, ""))
+        pending = [directory.path for directory in os.scandir(root) if directory.is_dir()]
+        while pending:
+            directory = pending.pop()
+            for entry in os.scandir(directory):
+                if entry.is_dir():
+                    pending.append(entry.path)
+                    continue
+
+                path = entry.path.replace(os.sep, "/")
+                resource_id = os.path.splitext(path[prefix:])[0]
+                stat = entry.stat()
+                manifest.entries[path] = ManifestEntry(path, resource_id, stat.st_size, stat.st_mtime_ns)
+
+        return manifest
+
+    def get(self, path):
+        return self.entries.get(path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def read(path, root):
+        """The manifest saved at path for root, None if there is none or it can't be read"""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                saved = json.load(file)
+            if saved.get("root") != os.path.abspath(root):
+                return None
+            return Manifest(root, {entry_path: ManifestEntry(entry_path, *fields) for entry_path, fields in saved.get("files", {}).items()})
+        # missing, not json, or json of another shape (a list, entries with too few fields...)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+
+    def save(self, path):
+        """Write the manifest atomically, returns False if the directory isn't writable"""
+        saved = {
+            "root": os.path.abspath(self.root),
+            "files": {entry.path: [entry.resource_id, entry.size, entry.mtime_ns] for entry in self.entries.values()},
+        }
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".resources-")
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(saved, file)
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
\ No newline at end of file
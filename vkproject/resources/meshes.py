@@ -0,0 +1,63 @@
+import numpy as np
+
+from vkproject.graphics.buffer import DeviceBuffer
+from vkproject.graphics.vertex import VertexLayout
+from vkproject.graphics.vulkan import VK_BUFFER_USAGE_VERTEX_BUFFER_BIT, VK_BUFFER_USAGE_INDEX_BUFFER_BIT
+
+from vkproject.resources import StreamingResourceLoader
+
+
+class Mesh:
+    def __init__(self, vertices: DeviceBuffer, indices: DeviceBuffer | None, layout: VertexLayout):
+        self.vertices = vertices
+        self.indices = indices
+        self.layout = layout
+
+    def draw(self, renderer, instance_count=1):
+        renderer.draw_mesh(self.vertices, self.indices, instance_count)
+
+    def destroy(self):
+        self.vertices.destroy()
+        if self.indices is not None:
+            self.indices.destroy()
+
+class MeshLoader(StreamingResourceLoader):
+    """Meshes stored as .npz archives, a structured "vertices" array and optionally uint16 or uint32 "indices"
+
+    The vertex dtype becomes the mesh's VertexLayout, field order is shader location order.
+    """
+    def __init__(self):
+        self.meshes: dict[str, Mesh] = dict()
+
+    @staticmethod
+    def decode(resource_path, resource_id):
+        with np.load(resource_path) as archive:
+            vertices = archive["vertices"]
+            indices = archive["indices"] if "indices" in archive.files else None
+
+        return vertices, indices
+
+    def finish(self, decoded, resource_id, streamer):
+        vertices, indices = decoded
+        vertex_buffer = DeviceBuffer(streamer.device, streamer.allocator, vertices.dtype, len(vertices), VK_BUFFER_USAGE_VERTEX_BUFFER_BIT)
+        vertex_buffer.create()
+        upload_id = streamer.uploads.upload_buffer(vertex_buffer, vertices)
+
+        index_buffer = None
+        if indices is not None:
+            index_buffer = DeviceBuffer(streamer.device, streamer.allocator, indices.dtype, len(indices), VK_BUFFER_USAGE_INDEX_BUFFER_BIT)
+            index_buffer.create()
+            # a flush in between puts the indices in a later batch
+            upload_id = max(upload_id, streamer.uploads.upload_buffer(index_buffer, indices))
+
+        mesh = Mesh(vertex_buffer, index_buffer, VertexLayout(vertices.dtype))
+        self.meshes[resource_id] = mesh
+        return mesh, upload_id
+
+    def accepts_resource(self, resource_path, resource_id) -> bool:
+        return resource_path.endswith(".npz")
+
+    def destroy(self):
+        for mesh in self.meshes.values():
+            mesh.destroy()
+        self.meshes = dict()
@@ -1,4 +1,5 @@
 import enum
+import hashlib
 from pathlib import Path
 
 from vkproject.graphics.vulkan import VK_SHADER_STAGE_VERTEX_BIT, VK_SHADER_STAGE_FRAGMENT_BIT
@@ -20,6 +21,13 @@ class Shader:
     def __init__(self, shader_type: ShaderType, data: bytes):
         self.type: ShaderType = shader_type
         self.data: bytes = data
+        self._digest = None
+
+    def digest(self):
+        # identifies the code, two shaders loaded from identical SPIR-V share a module
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self.data, digest_size=16).digest()
+        return self._digest
 
 class ShaderLoader(ResourceLoader):
     def __init__(self):
@@ -0,0 +1,115 @@
+import collections
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class ResourceStreamer:
+    """Loads resources of StreamingResourceLoaders in the background while frames keep rendering.
+
+    request() queues the decode on a thread pool (or a process pool, for
+    decoders that hold the GIL) and returns a Future. update(), called every
+    frame, finishes decoded resources on the main thread within finish_budget
+    seconds and resolves each Future once its upload is usable by the graphics
+    queue. The renderer polls future.done() and starts drawing a resource when
+    it is.
+    """
+    DEFAULT_WORKERS = 4
+    DEFAULT_FINISH_BUDGET = 0.002
+
+    def __init__(self, device, allocator, uploads, workers=DEFAULT_WORKERS, processes=False, finish_budget=DEFAULT_FINISH_BUDGET):
+        self.device = device
+        self.allocator = allocator
+        self.uploads = uploads
+        self.workers = workers
+        self.processes = processes
+        self.finish_budget = finish_budget
+        self._executor = None
+        # (decode future, future, loader, resource id), appended by pool threads as decodes complete
+        self._decoded = collections.deque()
+        # (future, resource, upload id) waiting for the upload to complete
+        self._uploading = []
+        self._requested = 0
+
+    def _pool(self):
+        # threads are only started once something is streamed
+        if self._executor is None:
+            if self.processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vk-stream")
+        return self._executor
+
+    def request(self, loader, resource_path, resource_id) -> Future:
+        future = Future()
+        # the decoder alone goes to the pool, a process pool would have to pickle the whole loader
+        decode = self._pool().submit(type(loader).decode, resource_path, resource_id)
+        decode.add_done_callback(lambda done: self._decoded.append((done, future, loader, resource_id)))
+        # dropping interest in a resource skips its decode if no worker picked it up yet
+        future.add_done_callback(lambda resolved: resolved.cancelled() and decode.cancel())
+        self._requested += 1
+        return future
+
+    def pending(self):
+        return self._requested
+
+    def _resolve(self, future, resource=None, exception=None):
+        self._requested -= 1
+        if future.cancelled():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(resource)
+
+    def update(self):
+        """Finish decoded resources and resolve uploaded ones, returns True if anything happened.
+
+        Fits FramePacer idle work, call it at least once per frame.
+        """
+        progressed = False
+        if self._uploading:
+            waiting = []
+            for future, resource, upload_id in self._uploading:
+                if self.uploads.done(upload_id):
+                    self._resolve(future, resource)
+                    progressed = True
+                else:
+                    waiting.append((future, resource, upload_id))
+            self._uploading = waiting
+
+        deadline = time.perf_counter() + self.finish_budget
+        while self._decoded and time.perf_counter() < deadline:
+            decode, future, loader, resource_id = self._decoded.popleft()
+            progressed = True
+            if decode.cancelled() or future.cancelled():
+                future.cancel()
+                self._requested -= 1
+                continue
+            if decode.exception() is not None:
+                self._resolve(future, exception=decode.exception())
+                continue
+
+            try:
+                resource, upload_id = loader.finish(decode.result(), resource_id, self)
+            except Exception as exception:
+                self._resolve(future, exception=exception)
+                continue
+
+            if upload_id is None or self.uploads.done(upload_id):
+                self._resolve(future, resource)
+            else:
+                self._uploading.append((future, resource, upload_id))
+
+        return progressed
+
+    def destroy(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for _, future, _, _ in self._decoded:
+            future.cancel()
+        for future, _, _ in self._uploading:
+            future.cancel()
+        self._decoded.clear()
+        self._uploading = []
+        self._requested = 0
\ No newline at end of file
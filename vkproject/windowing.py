@@ -1,3 +1,5 @@
+import time
+
 import glfw
 
 
@@ -8,6 +10,11 @@ class Window:
         self._name = name
         self._handle = None
         self._hints: dict[int, int] = dict()
+        self._framebuffer_size = (width, height)
+        self._iconified = False
+        self._resize_listeners = []
+        self._iconify_listeners = []
+        self._events_polled_at = None
 
     def init(self):
         for hint, value in self._hints.items():
@@ -20,6 +27,42 @@ class Window:
         if not self._handle:
             raise RuntimeError("Could not create window")
 
+        self._framebuffer_size = tuple(glfw.get_framebuffer_size(self._handle))
+        glfw.set_framebuffer_size_callback(self._handle, self._on_framebuffer_size)
+        glfw.set_window_iconify_callback(self._handle, self._on_iconify)
+
+    def _on_framebuffer_size(self, _, width, height):
+        self._framebuffer_size = (width, height)
+        for listener in self._resize_listeners:
+            listener(width, height)
+
+    def _on_iconify(self, _, iconified):
+        self._iconified = bool(iconified)
+        for listener in self._iconify_listeners:
+            listener(self._iconified)
+
+    def add_resize_listener(self, listener):
+        """listener(width, height) is called with the new framebuffer size in pixels"""
+        self._resize_listeners.append(listener)
+
+    def remove_resize_listener(self, listener):
+        self._resize_listeners.remove(listener)
+
+    def add_iconify_listener(self, listener):
+        """listener(iconified) is called when the window is minimized or restored"""
+        self._iconify_listeners.append(listener)
+
+    def remove_iconify_listener(self, listener):
+        self._iconify_listeners.remove(listener)
+
+    def framebuffer_size(self):
+        return self._framebuffer_size
+
+    def minimized(self):
+        # some platforms only report a zero sized framebuffer when minimized
+        width, height = self._framebuffer_size
+        return self._iconified or width == 0 or height == 0
+
     def width(self):
         return self._width
 
@@ -59,5 +102,14 @@ class Window:
     def should_close(self):
         return glfw.window_should_close(self._handle)
 
+    def events_polled_at(self):
+        # perf_counter time input was last read, frames drawn after it can show that input
+        return self._events_polled_at
+
     def update(self):
-        glfw.poll_events()
+        if self.minimized():
+            # nothing gets drawn until the window comes back, sleep until there are events
+            glfw.wait_events()
+        else:
+            glfw.poll_events()
+        self._events_polled_at = time.perf_counter()